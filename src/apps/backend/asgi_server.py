@@ -0,0 +1,62 @@
+from dotenv import load_dotenv
+from quart import Quart, jsonify
+from quart.typing import ResponseReturnValue
+from quart_cors import cors
+
+from bin.async_blueprints import async_api_blueprint
+from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
+from modules.application.errors import AppError
+from modules.application.json_provider import FastJSONProvider
+from modules.application.repository import AsyncApplicationRepositoryClient
+from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
+from modules.comment.rest_api.comment_rest_api_server import CommentRestApiServer
+from modules.logger.logger_manager import LoggerManager
+from modules.search.rest_api.search_rest_api_server import SearchRestApiServer
+from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
+from scripts.bootstrap_app import BootstrapApp
+
+# Async variant of server.py serving the REST apis only. The React app, static assets and the Temporal
+# health check worker stay with server.py. Behind a proxy, pass --forwarded-allow-ips to uvicorn instead of ProxyFix.
+
+load_dotenv()
+
+app = cors(Quart(__name__), allow_origin="http://localhost:4001")
+app.json = FastJSONProvider(app)
+
+# Mount deps
+LoggerManager.mount_logger()
+
+# Run bootstrap tasks
+BootstrapApp().run()
+
+# Register authentication apis
+authentication_blueprint = AuthenticationRestApiServer.create_async()
+async_api_blueprint.register_blueprint(authentication_blueprint)
+
+# Register accounts apis
+account_blueprint = AccountRestApiServer.create_async()
+async_api_blueprint.register_blueprint(account_blueprint)
+
+# Register task apis
+task_blueprint = TaskRestApiServer.create_async()
+async_api_blueprint.register_blueprint(task_blueprint)
+
+# Register comment apis
+comment_blueprint = CommentRestApiServer.create_async()
+async_api_blueprint.register_blueprint(comment_blueprint)
+
+# Register search apis
+search_blueprint = SearchRestApiServer.create_async()
+async_api_blueprint.register_blueprint(search_blueprint)
+
+app.register_blueprint(async_api_blueprint)
+
+
+@app.after_serving
+async def close_database_client() -> None:
+    await AsyncApplicationRepositoryClient.close()
+
+
+@app.errorhandler(AppError)
+async def handle_error(exc: AppError) -> ResponseReturnValue:
+    return jsonify({"message": exc.message, "code": exc.code}), exc.http_code or 500
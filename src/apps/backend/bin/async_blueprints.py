@@ -0,0 +1,9 @@
+from quart import Blueprint, Response, jsonify
+
+# Serve Api home page
+async_api_blueprint = Blueprint("api", __name__, url_prefix="/api")
+
+
+@async_api_blueprint.route("/")
+async def serve_api_home() -> Response:
+    return jsonify({"msg": "Start your development..."})
@@ -0,0 +1,10 @@
+import multiprocessing
+
+from gunicorn_config import accesslog, bind, errorlog, keepalive, loglevel, timeout  # noqa: F401
+
+# Each uvicorn worker serves every connection from one event loop, so no request threads are configured and
+# the worker count only needs to cover the cores.
+workers = multiprocessing.cpu_count() + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# uvicorn writes its own access log and ignores gunicorn's access_log_format
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
@@ -56,7 +58,7 @@ class AccountService:
 
     @staticmethod
     def reset_account_password(*, params: ResetPasswordParams) -> Account:
-        account = AccountReader.get_account_by_id(params=AccountSearchByIdParams(id=params.account_id))
+        account = AccountReader.get_account_by_id(params=AccountSearchByIdParams(id=params.account_id, fields=("id",)))
 
         password_reset_token = AuthenticationService.verify_password_reset_token(
             account_id=account.id, token=params.token
@@ -74,6 +76,10 @@ class AccountService:
     def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
         return AccountReader.get_account_by_id(params=params)
 
+    @staticmethod
+    def get_account_version(*, account_id: str) -> Optional[str]:
+        return AccountReader.get_account_version(account_id=account_id)
+
     @staticmethod
     def get_account_by_username(*, username: str) -> Account:
         return AccountReader.get_account_by_username(username=username)
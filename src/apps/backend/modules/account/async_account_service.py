@@ -0,0 +1,91 @@
+import asyncio
+from typing import Optional
+
+from modules.account.account_service import AccountService
+from modules.account.internal.async_account_reader import AsyncAccountReader
+from modules.account.internal.async_account_writer import AsyncAccountWriter
+from modules.account.types import (
+    Account,
+    AccountDeletionResult,
+    AccountSearchByIdParams,
+    AccountSearchParams,
+    CreateAccountByPhoneNumberParams,
+    CreateAccountByUsernameAndPasswordParams,
+    PhoneNumber,
+    ResetPasswordParams,
+    UpdateAccountProfileParams,
+)
+from modules.notification.types import (
+    AccountNotificationPreferences,
+    CreateOrUpdateAccountNotificationPreferencesParams,
+)
+
+
+class AsyncAccountService:
+    """
+    Async counterpart of AccountService. Flows that reach into the notification and authentication modules
+    (OTP delivery, password reset, notification preferences) run the sync service in a worker thread.
+    """
+
+    @staticmethod
+    async def create_account_by_username_and_password(*, params: CreateAccountByUsernameAndPasswordParams) -> Account:
+        account = await AsyncAccountWriter.create_account_by_username_and_password(params=params)
+        await AsyncAccountService.create_or_update_account_notification_preferences(
+            account_id=account.id,
+            preferences=CreateOrUpdateAccountNotificationPreferencesParams(
+                email_enabled=True, push_enabled=True, sms_enabled=True
+            ),
+        )
+        return account
+
+    @staticmethod
+    async def get_account_by_phone_number(*, phone_number: PhoneNumber) -> Account:
+        return await AsyncAccountReader.get_account_by_phone_number(phone_number=phone_number)
+
+    @staticmethod
+    async def get_or_create_account_by_phone_number(*, params: CreateAccountByPhoneNumberParams) -> Account:
+        return await asyncio.to_thread(AccountService.get_or_create_account_by_phone_number, params=params)
+
+    @staticmethod
+    async def reset_account_password(*, params: ResetPasswordParams) -> Account:
+        return await asyncio.to_thread(AccountService.reset_account_password, params=params)
+
+    @staticmethod
+    async def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
+        return await AsyncAccountReader.get_account_by_id(params=params)
+
+    @staticmethod
+    async def get_account_version(*, account_id: str) -> Optional[str]:
+        return await AsyncAccountReader.get_account_version(account_id=account_id)
+
+    @staticmethod
+    async def get_account_by_username(*, username: str) -> Account:
+        return await AsyncAccountReader.get_account_by_username(username=username)
+
+    @staticmethod
+    async def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
+        return await AsyncAccountReader.get_account_by_username_and_password(params=params)
+
+    @staticmethod
+    async def update_account_profile(*, account_id: str, params: UpdateAccountProfileParams) -> Account:
+        return await AsyncAccountWriter.update_account_profile(account_id=account_id, params=params)
+
+    @staticmethod
+    async def create_or_update_account_notification_preferences(
+        *, account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
+    ) -> AccountNotificationPreferences:
+        return await asyncio.to_thread(
+            AccountService.create_or_update_account_notification_preferences,
+            account_id=account_id,
+            preferences=preferences,
+        )
+
+    @staticmethod
+    async def get_account_notification_preferences_by_account_id(*, account_id: str) -> AccountNotificationPreferences:
+        return await asyncio.to_thread(
+            AccountService.get_account_notification_preferences_by_account_id, account_id=account_id
+        )
+
+    @staticmethod
+    async def delete_account(*, account_id: str) -> AccountDeletionResult:
+        return await AsyncAccountWriter.delete_account(account_id=account_id)
@@ -6,7 +6,6 @@ from bson.objectid import ObjectId
 from modules.account.errors import (
     AccountInvalidPasswordError,
     AccountWithIdNotFoundError,
-    AccountWithPhoneNumberExistsError,
     AccountWithPhoneNumberNotFoundError,
     AccountWithUserNameExistsError,
     AccountWithUsernameNotFoundError,
@@ -20,6 +19,7 @@ from modules.account.types import (
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
+from modules.application.common.base_model import BaseModel
 
 
 class AccountReader:
@@ -41,12 +41,25 @@ class AccountReader:
 
     @staticmethod
     def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
-        account_bson = AccountRepository.collection().find_one({"_id": ObjectId(params.id), "active": True})
+        account_bson = AccountRepository.collection().find_one(
+            {"_id": ObjectId(params.id), "active": True}, BaseModel.build_projection(params.fields)
+        )
         if account_bson is None:
             raise AccountWithIdNotFoundError(id=params.id)
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
+    @staticmethod
+    def get_account_version(*, account_id: str) -> Optional[str]:
+        if not ObjectId.is_valid(account_id):
+            return None
+        account_bson = AccountRepository.collection().find_one(
+            {"_id": ObjectId(account_id), "active": True}, {"updated_at": 1}
+        )
+        if account_bson is None:
+            return None
+        return str(account_bson.get("updated_at"))
+
     @staticmethod
     def check_username_not_exist(*, params: CreateAccountByUsernameAndPasswordParams) -> None:
         account_bson = AccountRepository.collection().find_one({"active": True, "username": params.username})
@@ -70,11 +83,3 @@ class AccountReader:
             raise AccountWithPhoneNumberNotFoundError(phone_number=phone_number)
 
         return account
-
-    @staticmethod
-    def check_phone_number_not_exist(*, phone_number: PhoneNumber) -> None:
-        phone_number_dict = asdict(phone_number)
-        account_bson = AccountRepository.collection().find_one({"active": True, "phone_number": phone_number_dict})
-
-        if account_bson:
-            raise AccountWithPhoneNumberExistsError(phone_number=phone_number)
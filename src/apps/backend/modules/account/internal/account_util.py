@@ -4,6 +4,9 @@ import bcrypt
 
 from modules.account.internal.store.account_model import AccountModel
 from modules.account.types import Account
+from modules.application.bson_codec import BsonCodec
+
+ACCOUNT_BSON_DECODER = BsonCodec.get_decoder(AccountModel, Account)
 
 
 class AccountUtil:
@@ -17,12 +20,4 @@ class AccountUtil:
 
     @staticmethod
     def convert_account_bson_to_account(account_bson: dict[str, Any]) -> Account:
-        validated_account_data = AccountModel.from_bson(account_bson)
-        return Account(
-            first_name=validated_account_data.first_name,
-            id=str(validated_account_data.id),
-            last_name=validated_account_data.last_name,
-            hashed_password=validated_account_data.hashed_password,
-            phone_number=validated_account_data.phone_number,
-            username=validated_account_data.username,
-        )
+        return ACCOUNT_BSON_DECODER(account_bson)
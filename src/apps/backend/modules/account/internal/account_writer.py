@@ -1,11 +1,13 @@
 from dataclasses import asdict
 from datetime import datetime
+from typing import Any
 
 from bson.objectid import ObjectId
 from phonenumbers import is_valid_number, parse
 from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from modules.account.errors import AccountWithIdNotFoundError
+from modules.account.errors import AccountWithIdNotFoundError, AccountWithPhoneNumberExistsError
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.store.account_model import AccountModel
@@ -36,8 +38,7 @@ class AccountWriter:
             phone_number=None,
             username=params.username,
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_bson = AccountRepository.insert_document(account_bson)
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
@@ -50,12 +51,14 @@ class AccountWriter:
         if not is_valid_phone_number:
             raise OTPRequestFailedError()
 
-        AccountReader.check_phone_number_not_exist(phone_number=params.phone_number)
         account_bson = AccountModel(
             first_name="", hashed_password="", id=None, last_name="", phone_number=phone_number, username=""
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        try:
+            # The active_phone_number_unique index rejects a second active account with the number
+            account_bson = AccountRepository.insert_document(account_bson)
+        except DuplicateKeyError:
+            raise AccountWithPhoneNumberExistsError(phone_number=phone_number)
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
@@ -74,7 +77,7 @@ class AccountWriter:
 
     @staticmethod
     def update_account_profile(*, account_id: str, params: UpdateAccountProfileParams) -> Account:
-        update_fields = {}
+        update_fields: dict[str, Any] = {}
 
         if params.first_name is not None:
             update_fields["first_name"] = params.first_name
@@ -82,6 +85,7 @@ class AccountWriter:
         if params.last_name is not None:
             update_fields["last_name"] = params.last_name
 
+        update_fields["updated_at"] = datetime.now()
         updated_account = AccountRepository.collection().find_one_and_update(
             {"_id": ObjectId(account_id)}, {"$set": update_fields}, return_document=ReturnDocument.AFTER
         )
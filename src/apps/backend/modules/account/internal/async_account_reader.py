@@ -0,0 +1,94 @@
+import asyncio
+from dataclasses import asdict
+from typing import Optional
+
+from bson.objectid import ObjectId
+
+from modules.account.errors import (
+    AccountInvalidPasswordError,
+    AccountWithIdNotFoundError,
+    AccountWithPhoneNumberNotFoundError,
+    AccountWithUserNameExistsError,
+    AccountWithUsernameNotFoundError,
+)
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import (
+    Account,
+    AccountSearchByIdParams,
+    AccountSearchParams,
+    CreateAccountByUsernameAndPasswordParams,
+    PhoneNumber,
+)
+from modules.application.common.base_model import BaseModel
+
+
+class AsyncAccountReader:
+    @staticmethod
+    async def get_account_by_username(*, username: str) -> Account:
+        account_bson = await AccountRepository.async_collection().find_one({"username": username, "active": True})
+        if account_bson is None:
+            raise AccountWithUsernameNotFoundError(username=username)
+
+        return AccountUtil.convert_account_bson_to_account(account_bson)
+
+    @staticmethod
+    async def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
+        account = await AsyncAccountReader.get_account_by_username(username=params.username)
+
+        # bcrypt holds the CPU for tens of milliseconds, so it runs off the event loop.
+        is_password_valid = await asyncio.to_thread(
+            AccountUtil.compare_password, password=params.password, hashed_password=account.hashed_password
+        )
+        if not is_password_valid:
+            raise AccountInvalidPasswordError()
+        return account
+
+    @staticmethod
+    async def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
+        account_bson = await AccountRepository.async_collection().find_one(
+            {"_id": ObjectId(params.id), "active": True}, BaseModel.build_projection(params.fields)
+        )
+        if account_bson is None:
+            raise AccountWithIdNotFoundError(id=params.id)
+
+        return AccountUtil.convert_account_bson_to_account(account_bson)
+
+    @staticmethod
+    async def get_account_version(*, account_id: str) -> Optional[str]:
+        if not ObjectId.is_valid(account_id):
+            return None
+        account_bson = await AccountRepository.async_collection().find_one(
+            {"_id": ObjectId(account_id), "active": True}, {"updated_at": 1}
+        )
+        if account_bson is None:
+            return None
+        return str(account_bson.get("updated_at"))
+
+    @staticmethod
+    async def check_username_not_exist(*, params: CreateAccountByUsernameAndPasswordParams) -> None:
+        account_bson = await AccountRepository.async_collection().find_one(
+            {"active": True, "username": params.username}
+        )
+
+        if account_bson:
+            raise AccountWithUserNameExistsError(username=params.username)
+
+    @staticmethod
+    async def get_account_by_phone_number_optional(*, phone_number: PhoneNumber) -> Optional[Account]:
+        phone_number_dict = asdict(phone_number)
+        account_bson = await AccountRepository.async_collection().find_one(
+            {"phone_number": phone_number_dict, "active": True}
+        )
+        if account_bson is None:
+            return None
+
+        return AccountUtil.convert_account_bson_to_account(account_bson)
+
+    @staticmethod
+    async def get_account_by_phone_number(*, phone_number: PhoneNumber) -> Account:
+        account = await AsyncAccountReader.get_account_by_phone_number_optional(phone_number=phone_number)
+        if account is None:
+            raise AccountWithPhoneNumberNotFoundError(phone_number=phone_number)
+
+        return account
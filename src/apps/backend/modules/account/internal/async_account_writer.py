@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime
+from typing import Any
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+
+from modules.account.errors import AccountWithIdNotFoundError
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.async_account_reader import AsyncAccountReader
+from modules.account.internal.store.account_model import AccountModel
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import (
+    Account,
+    AccountDeletionResult,
+    CreateAccountByUsernameAndPasswordParams,
+    UpdateAccountProfileParams,
+)
+
+
+class AsyncAccountWriter:
+    @staticmethod
+    async def create_account_by_username_and_password(*, params: CreateAccountByUsernameAndPasswordParams) -> Account:
+        hashed_password = await asyncio.to_thread(AccountUtil.hash_password, password=params.password)
+        await AsyncAccountReader.check_username_not_exist(params=params)
+        account_bson = AccountModel(
+            first_name=params.first_name,
+            hashed_password=hashed_password,
+            id=None,
+            last_name=params.last_name,
+            phone_number=None,
+            username=params.username,
+        ).to_bson()
+        account_bson = await AccountRepository.async_insert_document(account_bson)
+
+        return AccountUtil.convert_account_bson_to_account(account_bson)
+
+    @staticmethod
+    async def update_account_profile(*, account_id: str, params: UpdateAccountProfileParams) -> Account:
+        update_fields: dict[str, Any] = {}
+
+        if params.first_name is not None:
+            update_fields["first_name"] = params.first_name
+
+        if params.last_name is not None:
+            update_fields["last_name"] = params.last_name
+
+        update_fields["updated_at"] = datetime.now()
+        updated_account = await AccountRepository.async_collection().find_one_and_update(
+            {"_id": ObjectId(account_id)}, {"$set": update_fields}, return_document=ReturnDocument.AFTER
+        )
+        if updated_account is None:
+            raise AccountWithIdNotFoundError(id=account_id)
+
+        return AccountUtil.convert_account_bson_to_account(updated_account)
+
+    @staticmethod
+    async def delete_account(*, account_id: str) -> AccountDeletionResult:
+        deletion_time = datetime.now()
+        updated_account = await AccountRepository.async_collection().find_one_and_update(
+            {"_id": ObjectId(account_id), "active": True},
+            {"$set": {"active": False, "updated_at": deletion_time}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if updated_account is None:
+            raise AccountWithIdNotFoundError(id=account_id)
+
+        return AccountDeletionResult(account_id=account_id, deleted_at=deletion_time, success=True)
@@ -1,9 +1,7 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.account.internal.store.account_model import AccountModel
 from modules.application.repository import ApplicationRepository
-from modules.logger.logger import Logger
 
 ACCOUNT_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -31,23 +29,16 @@ ACCOUNT_VALIDATION_SCHEMA = {
 class AccountRepository(ApplicationRepository):
     collection_name = AccountModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index("username")
-        collection.create_index([("active", 1), ("username", 1)], name="active_username_index")
-        collection.create_index([("active", 1), ("phone_number", 1)], name="active_phone_number_index")
-
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": ACCOUNT_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:  # NamespaceNotFound MongoDB error code
-                collection.database.create_collection(cls.collection_name, validator=ACCOUNT_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection accounts: {e.details}")
-        return True
+    indexes = [
+        IndexModel("username", name="username_index"),
+        IndexModel([("active", 1), ("username", 1)], name="active_username_index"),
+        IndexModel([("active", 1), ("phone_number", 1)], name="active_phone_number_index"),
+        # Username accounts store a null phone number, which the partial filter leaves out of the unique index
+        IndexModel(
+            [("active", 1), ("phone_number", 1)],
+            unique=True,
+            partialFilterExpression={"active": True, "phone_number.phone_number": {"$exists": True}},
+            name="active_phone_number_unique",
+        ),
+    ]
+    validator = ACCOUNT_VALIDATION_SCHEMA
@@ -1,4 +1,5 @@
 from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
 
 from modules.account.rest_api.account_router import AccountRouter
 
@@ -8,3 +9,8 @@ class AccountRestApiServer:
     def create() -> Blueprint:
         account_api_blueprint = Blueprint("account", __name__)
         return AccountRouter.create_route(blueprint=account_api_blueprint)
+
+    @staticmethod
+    def create_async() -> AsyncBlueprint:
+        account_api_blueprint = AsyncBlueprint("account", __name__)
+        return AccountRouter.create_async_route(blueprint=account_api_blueprint)
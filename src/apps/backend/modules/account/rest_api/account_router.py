@@ -1,10 +1,13 @@
 from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
 
 from modules.account.rest_api.account_view import AccountView
+from modules.account.rest_api.async_account_view import AsyncAccountView
 
 
 class AccountRouter:
     ACCOUNT_BY_ID_URL = "/accounts/<id>"
+    ACCOUNT_NOTIFICATION_PREFERENCES_URL = "/accounts/<account_id>/notification-preferences"
 
     @staticmethod
     def create_route(*, blueprint: Blueprint) -> Blueprint:
@@ -20,9 +23,30 @@ class AccountRouter:
         )
 
         blueprint.add_url_rule(
-            "/accounts/<account_id>/notification-preferences",
+            AccountRouter.ACCOUNT_NOTIFICATION_PREFERENCES_URL,
             view_func=AccountView.update_account_notification_preferences,
             methods=["PATCH"],
         )
 
         return blueprint
+
+    @staticmethod
+    def create_async_route(*, blueprint: AsyncBlueprint) -> AsyncBlueprint:
+        blueprint.add_url_rule("/accounts", view_func=AsyncAccountView.as_view("account_view"))
+        blueprint.add_url_rule(
+            AccountRouter.ACCOUNT_BY_ID_URL, view_func=AsyncAccountView.as_view("account_view_by_id"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            AccountRouter.ACCOUNT_BY_ID_URL, view_func=AsyncAccountView.as_view("account_update"), methods=["PATCH"]
+        )
+        blueprint.add_url_rule(
+            AccountRouter.ACCOUNT_BY_ID_URL, view_func=AsyncAccountView.as_view("account_delete"), methods=["DELETE"]
+        )
+
+        blueprint.add_url_rule(
+            AccountRouter.ACCOUNT_NOTIFICATION_PREFERENCES_URL,
+            view_func=AsyncAccountView.update_account_notification_preferences,
+            methods=["PATCH"],
+        )
+
+        return blueprint
@@ -1,12 +1,15 @@
-from dataclasses import asdict
+from typing import Optional
 
 from flask import jsonify, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
+from werkzeug.datastructures import MultiDict
 
 from modules.account.account_service import AccountService
 from modules.account.errors import AccountBadRequestError
+from modules.account.rest_api.account_view_util import AccountViewUtil
 from modules.account.types import (
+    Account,
     AccountSearchByIdParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
@@ -15,9 +18,23 @@ from modules.account.types import (
     ResetPasswordParams,
     UpdateAccountProfileParams,
 )
+from modules.application.common.base_model import BaseModel
+from modules.application.response_serializer import ResponseSerializer
+from modules.application.rest_api.conditional_get_middleware import conditional_get_middleware
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
-from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+
+ACCOUNT_PROFILE_FIELDS = ("id", "first_name", "last_name", "phone_number", "username")
+
+# Keeps hashed_password out of every account response, projected or not
+ResponseSerializer.register(Account, fields=ACCOUNT_PROFILE_FIELDS)
+
+
+def get_account_resource_version(*, request_args: MultiDict, id: str) -> Optional[str]:
+    # Notification preferences are stored apart from the account and carry no version of their own
+    if request_args.get("include_notification_preferences", "").lower() == "true":
+        return None
+    return AccountService.get_account_version(account_id=id)
 
 
 class AccountView(MethodView):
@@ -32,14 +49,19 @@ class AccountView(MethodView):
         elif "username" in request_data and "password" in request_data:
             account_params = CreateAccountByUsernameAndPasswordParams(**request_data)
             account = AccountService.create_account_by_username_and_password(params=account_params)
-        account_dict = asdict(account)
+        account_dict = ResponseSerializer.serialize(account)
         return jsonify(account_dict), 201
 
     @access_auth_middleware
+    @conditional_get_middleware(get_account_resource_version)
     def get(self, id: str) -> ResponseReturnValue:
-        account_params = AccountSearchByIdParams(id=id)
+        account_fields = (
+            BaseModel.parse_projection_fields(request.args.get("fields"), ACCOUNT_PROFILE_FIELDS)
+            or ACCOUNT_PROFILE_FIELDS
+        )
+        account_params = AccountSearchByIdParams(id=id, fields=account_fields)
         account = AccountService.get_account_by_id(params=account_params)
-        account_dict = asdict(account)
+        account_dict = ResponseSerializer.serialize(account, account_fields)
 
         include_notification_preferences = request.args.get("include_notification_preferences", "").lower() == "true"
 
@@ -48,7 +70,7 @@ class AccountView(MethodView):
                 notification_preferences = AccountService.get_account_notification_preferences_by_account_id(
                     account_id=account.id
                 )
-                account_dict["notification_preferences"] = asdict(notification_preferences)
+                account_dict["notification_preferences"] = ResponseSerializer.serialize(notification_preferences)
             except AccountNotificationPreferencesNotFoundError:
                 pass
 
@@ -70,7 +92,7 @@ class AccountView(MethodView):
         else:
             raise AccountBadRequestError("Invalid request data")
 
-        account_dict = asdict(account)
+        account_dict = ResponseSerializer.serialize(account)
         return jsonify(account_dict), 200
 
     @access_auth_middleware
@@ -80,35 +102,10 @@ class AccountView(MethodView):
 
     @staticmethod
     def update_account_notification_preferences(account_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise AccountBadRequestError("Request body is required")
-
-        for field in ["email_enabled", "push_enabled", "sms_enabled"]:
-            if field in request_data and not isinstance(request_data[field], bool):
-                raise AccountBadRequestError(f"{field} must be a boolean")
-
-        preferences_kwargs = {}
-
-        if "email_enabled" in request_data:
-            preferences_kwargs["email_enabled"] = request_data["email_enabled"]
-
-        if "push_enabled" in request_data:
-            preferences_kwargs["push_enabled"] = request_data["push_enabled"]
-
-        if "sms_enabled" in request_data:
-            preferences_kwargs["sms_enabled"] = request_data["sms_enabled"]
-
-        if not preferences_kwargs:
-            raise AccountBadRequestError(
-                "At least one preference field (email_enabled, push_enabled, sms_enabled) must be provided"
-            )
-
-        preferences_params = CreateOrUpdateAccountNotificationPreferencesParams(**preferences_kwargs)
+        preferences_params = AccountViewUtil.build_notification_preferences_params(request.get_json())
 
         updated_preferences = AccountService.create_or_update_account_notification_preferences(
             account_id=account_id, preferences=preferences_params
         )
 
-        return jsonify(asdict(updated_preferences)), 200
+        return jsonify(ResponseSerializer.serialize(updated_preferences)), 200
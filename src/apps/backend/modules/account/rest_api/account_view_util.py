@@ -0,0 +1,35 @@
+from typing import Any, Optional
+
+from modules.account.errors import AccountBadRequestError
+from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+
+
+class AccountViewUtil:
+    @staticmethod
+    def build_notification_preferences_params(
+        request_data: Optional[dict[str, Any]]
+    ) -> CreateOrUpdateAccountNotificationPreferencesParams:
+        if request_data is None:
+            raise AccountBadRequestError("Request body is required")
+
+        for field in ["email_enabled", "push_enabled", "sms_enabled"]:
+            if field in request_data and not isinstance(request_data[field], bool):
+                raise AccountBadRequestError(f"{field} must be a boolean")
+
+        preferences_kwargs = {}
+
+        if "email_enabled" in request_data:
+            preferences_kwargs["email_enabled"] = request_data["email_enabled"]
+
+        if "push_enabled" in request_data:
+            preferences_kwargs["push_enabled"] = request_data["push_enabled"]
+
+        if "sms_enabled" in request_data:
+            preferences_kwargs["sms_enabled"] = request_data["sms_enabled"]
+
+        if not preferences_kwargs:
+            raise AccountBadRequestError(
+                "At least one preference field (email_enabled, push_enabled, sms_enabled) must be provided"
+            )
+
+        return CreateOrUpdateAccountNotificationPreferencesParams(**preferences_kwargs)
@@ -0,0 +1,105 @@
+from typing import Optional
+
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+from werkzeug.datastructures import MultiDict
+
+from modules.account.async_account_service import AsyncAccountService
+from modules.account.errors import AccountBadRequestError
+from modules.account.rest_api.account_view import ACCOUNT_PROFILE_FIELDS
+from modules.account.rest_api.account_view_util import AccountViewUtil
+from modules.account.types import (
+    AccountSearchByIdParams,
+    CreateAccountByPhoneNumberParams,
+    CreateAccountByUsernameAndPasswordParams,
+    CreateAccountParams,
+    PhoneNumber,
+    ResetPasswordParams,
+    UpdateAccountProfileParams,
+)
+from modules.application.common.base_model import BaseModel
+from modules.application.response_serializer import ResponseSerializer
+from modules.application.rest_api.async_conditional_get_middleware import async_conditional_get_middleware
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.notification.errors import AccountNotificationPreferencesNotFoundError
+
+
+async def get_account_resource_version(*, request_args: MultiDict, id: str) -> Optional[str]:
+    if request_args.get("include_notification_preferences", "").lower() == "true":
+        return None
+    return await AsyncAccountService.get_account_version(account_id=id)
+
+
+class AsyncAccountView(MethodView):
+    async def post(self) -> ResponseReturnValue:
+        request_data = await request.get_json()
+        account_params: CreateAccountParams
+        if "phone_number" in request_data:
+            phone_number_data = request_data["phone_number"]
+            phone_number_obj = PhoneNumber(**phone_number_data)
+            account_params = CreateAccountByPhoneNumberParams(phone_number=phone_number_obj)
+            account = await AsyncAccountService.get_or_create_account_by_phone_number(params=account_params)
+        elif "username" in request_data and "password" in request_data:
+            account_params = CreateAccountByUsernameAndPasswordParams(**request_data)
+            account = await AsyncAccountService.create_account_by_username_and_password(params=account_params)
+        account_dict = ResponseSerializer.serialize(account)
+        return jsonify(account_dict), 201
+
+    @async_access_auth_middleware
+    @async_conditional_get_middleware(get_account_resource_version)
+    async def get(self, id: str) -> ResponseReturnValue:
+        account_fields = (
+            BaseModel.parse_projection_fields(request.args.get("fields"), ACCOUNT_PROFILE_FIELDS)
+            or ACCOUNT_PROFILE_FIELDS
+        )
+        account_params = AccountSearchByIdParams(id=id, fields=account_fields)
+        account = await AsyncAccountService.get_account_by_id(params=account_params)
+        account_dict = ResponseSerializer.serialize(account, account_fields)
+
+        include_notification_preferences = request.args.get("include_notification_preferences", "").lower() == "true"
+
+        if include_notification_preferences:
+            try:
+                notification_preferences = await AsyncAccountService.get_account_notification_preferences_by_account_id(
+                    account_id=account.id
+                )
+                account_dict["notification_preferences"] = ResponseSerializer.serialize(notification_preferences)
+            except AccountNotificationPreferencesNotFoundError:
+                pass
+
+        return jsonify(account_dict), 200
+
+    async def patch(self, id: str) -> ResponseReturnValue:
+        request_data = await request.get_json()
+
+        if "token" in request_data and "new_password" in request_data:
+            reset_account_params = ResetPasswordParams(account_id=id, **request_data)
+            account = await AsyncAccountService.reset_account_password(params=reset_account_params)
+
+        elif "first_name" in request_data or "last_name" in request_data:
+            update_profile_params = UpdateAccountProfileParams(
+                first_name=request_data.get("first_name"), last_name=request_data.get("last_name")
+            )
+            account = await AsyncAccountService.update_account_profile(account_id=id, params=update_profile_params)
+
+        else:
+            raise AccountBadRequestError("Invalid request data")
+
+        account_dict = ResponseSerializer.serialize(account)
+        return jsonify(account_dict), 200
+
+    @async_access_auth_middleware
+    async def delete(self, id: str) -> ResponseReturnValue:
+        await AsyncAccountService.delete_account(account_id=id)
+        return "", 204
+
+    @staticmethod
+    async def update_account_notification_preferences(account_id: str) -> ResponseReturnValue:
+        preferences_params = AccountViewUtil.build_notification_preferences_params(await request.get_json())
+
+        updated_preferences = await AsyncAccountService.create_or_update_account_notification_preferences(
+            account_id=account_id, preferences=preferences_params
+        )
+
+        return jsonify(ResponseSerializer.serialize(updated_preferences)), 200
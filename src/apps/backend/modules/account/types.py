@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 
 @dataclass(frozen=True)
@@ -12,6 +12,7 @@ class AccountSearchParams:
 @dataclass(frozen=True)
 class AccountSearchByIdParams:
     id: str
+    fields: Optional[Tuple[str, ...]] = None
 
 
 @dataclass(frozen=True)
@@ -1,14 +1,11 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any
 
+from modules.application.bson_codec import BsonCodec
+
 
 @dataclass
 class BaseModel:
 
     def to_bson(self) -> dict[str, Any]:
-        data = asdict(self)
-        if data.get("id") is not None:
-            data["_id"] = data.pop("id")
-        else:
-            data.pop("id", None)
-        return data
+        return BsonCodec.get_encoder(type(self))(self)
@@ -0,0 +1,193 @@
+import typing
+from dataclasses import MISSING
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
+from types import NoneType, UnionType
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import bson
+from bson.raw_bson import RawBSONDocument
+
+T = TypeVar("T")
+
+Decoder = Callable[[dict[str, Any]], T]
+Encoder = Callable[[Any], dict[str, Any]]
+Transcoder = Callable[[Any], dict[str, Any]]
+
+
+class BsonCodec:
+    """
+    Converts between Mongo documents and dataclasses with functions generated once per type, in place of building a
+    model with from_bson only to copy it into a DTO, and of deep copying models with asdict to write them.
+
+    A decoder reads every DTO field straight from the document the way the store model's from_bson does: _id becomes
+    the id string, fields the model defaults fall back to that default, other missing fields to "" (or None for
+    default_factory fields such as created_at), and nested dataclasses such as PhoneNumber are built from their
+    sub-document. A nested dataclass the DTO does not type as Optional is required, as from_bson requires it.
+    JSON transcoders read documents, raw ones included, by the same rules into the dict the DTO would serialize to.
+    """
+
+    _decoders: dict[tuple[type, type], Decoder[Any]] = {}
+    _encoders: dict[type, Encoder] = {}
+    _json_transcoders: dict[tuple[type, type, Optional[Tuple[str, ...]]], Transcoder] = {}
+
+    @staticmethod
+    def get_decoder(model_type: type, dto_type: type[T]) -> Decoder[T]:
+        decoder = BsonCodec._decoders.get((model_type, dto_type))
+        if decoder is None:
+            decoder = BsonCodec._compile_decoder(model_type, dto_type)
+            BsonCodec._decoders[(model_type, dto_type)] = decoder
+        return decoder
+
+    @staticmethod
+    def get_encoder(model_type: type) -> Encoder:
+        encoder = BsonCodec._encoders.get(model_type)
+        if encoder is None:
+            encoder = BsonCodec._compile_encoder(model_type)
+            BsonCodec._encoders[model_type] = encoder
+        return encoder
+
+    @staticmethod
+    def get_json_transcoder(model_type: type, dto_type: type, fields: Optional[Tuple[str, ...]] = None) -> Transcoder:
+        """
+        Returns a function reading a document into the dict ResponseSerializer makes of its DTO, projected to fields.
+        """
+        transcoder = BsonCodec._json_transcoders.get((model_type, dto_type, fields))
+        if transcoder is None:
+            transcoder = BsonCodec._compile_json_transcoder(model_type, dto_type, fields)
+            BsonCodec._json_transcoders[(model_type, dto_type, fields)] = transcoder
+        return transcoder
+
+    @staticmethod
+    def transcode_in_batches(
+        documents: Iterable[Any], transcoder: Transcoder, batch_size: int
+    ) -> Iterator[List[dict[str, Any]]]:
+        """
+        Transcodes documents batch_size at a time. A RawBSONDocument keeps the dict its fields are first read from, so
+        its bytes are decoded into a dict dropped once transcoded instead.
+        """
+        batch = []
+        for document in documents:
+            batch.append(transcoder(bson.decode(document.raw) if isinstance(document, RawBSONDocument) else document))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def encode_value(value: Any) -> Any:
+        if is_dataclass(value) and not isinstance(value, type):
+            return BsonCodec.get_encoder(type(value))(value)
+        if isinstance(value, (list, tuple)):
+            return type(value)(BsonCodec.encode_value(item) for item in value)
+        if isinstance(value, dict):
+            return {key: BsonCodec.encode_value(item) for key, item in value.items()}
+        return value
+
+    @staticmethod
+    def _compile_decoder(model_type: type, dto_type: type[T]) -> Decoder[T]:
+        namespace: dict[str, Any] = {"dto_type": dto_type}
+        arguments = [
+            f"{name}={expression}"
+            for name, expression in BsonCodec._build_field_expressions(model_type, dto_type, None, namespace)
+        ]
+
+        lines = ["def decode(document):", "    get = document.get", f"    return dto_type({', '.join(arguments)})\n"]
+        exec(compile("\n".join(lines), f"<{dto_type.__qualname__} decoder>", "exec"), namespace)
+        return typing.cast(Decoder[T], namespace["decode"])
+
+    @staticmethod
+    def _compile_json_transcoder(model_type: type, dto_type: type, fields: Optional[Tuple[str, ...]]) -> Transcoder:
+        namespace: dict[str, Any] = {"dto_type": dto_type}
+        entries = [
+            f'"{name}": {expression}'
+            for name, expression in BsonCodec._build_field_expressions(
+                model_type, dto_type, fields, namespace, nested_as_dict=True
+            )
+        ]
+
+        lines = ["def transcode(document):", "    get = document.get", f"    return {{{', '.join(entries)}}}\n"]
+        exec(compile("\n".join(lines), f"<{dto_type.__qualname__} JSON transcoder>", "exec"), namespace)
+        return typing.cast(Transcoder, namespace["transcode"])
+
+    @staticmethod
+    def _build_field_expressions(
+        model_type: type,
+        dto_type: type,
+        fields: Optional[Tuple[str, ...]],
+        namespace: dict[str, Any],
+        nested_as_dict: bool = False,
+    ) -> list[tuple[str, str]]:
+        """
+        Returns the expression reading each DTO field, in DTO field order or in the order of fields when given, from a
+        document whose get method is bound to get. Nested dataclasses are built as such, or as dicts of their fields.
+        """
+        model_fields = {field.name: field for field in dataclass_fields(model_type)}
+        dto_field_names = [field.name for field in dataclass_fields(typing.cast(Any, dto_type))]
+        dto_types = typing.get_type_hints(dto_type)
+        namespace.update(require=BsonCodec._require, nested_dict=BsonCodec._build_nested_dict)
+
+        expressions = []
+        for name in dto_field_names if fields is None else [name for name in fields if name in dto_field_names]:
+            if name == "id":
+                expressions.append((name, 'str(get("_id"))'))
+                continue
+
+            model_field = model_fields[name]
+            if model_field.default is not MISSING:
+                namespace[f"{name}_default"] = model_field.default
+            else:
+                namespace[f"{name}_default"] = None if model_field.default_factory is not MISSING else ""
+
+            nested_type, is_optional = BsonCodec._get_nested_dataclass(dto_types[name])
+            if nested_type is None:
+                expressions.append((name, f'get("{name}", {name}_default)'))
+                continue
+
+            namespace[f"{name}_type"] = nested_type
+            value = f'get("{name}")' if is_optional else f'require(get("{name}"), "{name}", dto_type)'
+            expression = f"nested_dict({name}_type, {value})" if nested_as_dict else f"{name}_type(**{value})"
+            expressions.append((name, f'{expression} if get("{name}") else None' if is_optional else expression))
+        return expressions
+
+    @staticmethod
+    def _compile_encoder(model_type: type) -> Encoder:
+        # Like asdict followed by renaming id to _id: _id comes last and is left out while the model has no id yet
+        entries = []
+        has_id = False
+        for field in dataclass_fields(model_type):
+            if field.name == "id":
+                has_id = True
+            else:
+                entries.append(f'"{field.name}": encode_value(model.{field.name})')
+
+        lines = ["def encode(model):", f"    document = {{{', '.join(entries)}}}"]
+        if has_id:
+            lines += ["    if model.id is not None:", '        document["_id"] = model.id']
+        lines.append("    return document\n")
+
+        namespace: dict[str, Any] = {"encode_value": BsonCodec.encode_value}
+        exec(compile("\n".join(lines), f"<{model_type.__qualname__} encoder>", "exec"), namespace)
+        return typing.cast(Encoder, namespace["encode"])
+
+    @staticmethod
+    def _get_nested_dataclass(field_type: Any) -> tuple[Optional[type], bool]:
+        if typing.get_origin(field_type) in (typing.Union, UnionType):
+            arguments = [argument for argument in typing.get_args(field_type) if argument is not NoneType]
+            if len(arguments) == 1 and is_dataclass(arguments[0]):
+                return typing.cast(type, arguments[0]), True
+            return None, False
+        if isinstance(field_type, type) and is_dataclass(field_type):
+            return field_type, False
+        return None, False
+
+    @staticmethod
+    def _build_nested_dict(nested_type: type, value: Any) -> dict[str, Any]:
+        return {field.name: value[field.name] for field in dataclass_fields(nested_type)}
+
+    @staticmethod
+    def _require(value: Any, name: str, dto_type: type) -> Any:
+        if not value:
+            raise ValueError(f"{name} is required for {dto_type.__name__}")
+        return value
@@ -1,9 +1,30 @@
+import base64
+import json
 from dataclasses import asdict, dataclass
-from typing import Any, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence, Tuple, TypeVar
 
+from bson.errors import InvalidId
+from bson.objectid import ObjectId
+from pymongo.asynchronous.cursor import AsyncCursor
 from pymongo.cursor import Cursor
 
-from modules.application.common.types import PaginationParams, SortParams
+from modules.application.common.constants import CURSOR_PAGINATION_SORT, CURSOR_SORT_FIELD
+from modules.application.common.types import (
+    PaginationParams,
+    SortDirection,
+    SortParams,
+    TextSearchPosition,
+    TimestampFilterParams,
+)
+from modules.application.errors import (
+    InvalidFilterParamsError,
+    InvalidPaginationCursorError,
+    InvalidProjectionFieldsError,
+    InvalidSortParamsError,
+)
+
+CursorType = TypeVar("CursorType", Cursor, AsyncCursor)
 
 
 @dataclass
@@ -18,25 +39,218 @@ class BaseModel:
 
     @staticmethod
     def calculate_pagination_values(
-        pagination_params: PaginationParams, total_count: int
-    ) -> Tuple[PaginationParams, int, int]:
+        pagination_params: PaginationParams, total_count: Optional[int]
+    ) -> Tuple[PaginationParams, int, Optional[int]]:
         page = pagination_params.page
         size = pagination_params.size
         offset = pagination_params.offset
 
         skip = (page - 1) * size + offset
 
+        if total_count is None:
+            return pagination_params, skip, None
+
         total_pages = (total_count + size - 1) // size if size > 0 else 0
 
         return pagination_params, skip, total_pages
 
     @staticmethod
-    def apply_sort_params(cursor: Cursor, sort_params: Optional[SortParams]) -> Cursor:
-        if sort_params:
-            return cursor.sort(
-                [
-                    (sort_params.sort_by, sort_params.sort_direction.numeric_value),
-                    ("_id", sort_params.sort_direction.numeric_value),
-                ]
+    def build_sort(sort_params: Optional[SortParams]) -> List[Tuple[str, int]]:
+        """
+        Sorts by the requested field with _id as the tie breaker, or newest first when no sort was requested.
+        """
+        if sort_params is None:
+            return CURSOR_PAGINATION_SORT
+        return [
+            (sort_params.sort_by, sort_params.sort_direction.numeric_value),
+            ("_id", sort_params.sort_direction.numeric_value),
+        ]
+
+    @staticmethod
+    def apply_sort_params(cursor: CursorType, sort_params: Optional[SortParams]) -> CursorType:
+        return cursor.sort(BaseModel.build_sort(sort_params))
+
+    @staticmethod
+    def apply_timestamp_filters(
+        filter_query: dict[str, Any], filter_params: Optional[TimestampFilterParams]
+    ) -> dict[str, Any]:
+        if filter_params is None:
+            return filter_query
+
+        created_at_range = {}
+        if filter_params.created_after is not None:
+            created_at_range["$gt"] = filter_params.created_after
+        if filter_params.created_before is not None:
+            created_at_range["$lt"] = filter_params.created_before
+
+        filtered_query = dict(filter_query)
+        if created_at_range:
+            filtered_query["created_at"] = created_at_range
+        if filter_params.updated_since is not None:
+            filtered_query["updated_at"] = {"$gte": filter_params.updated_since}
+        return filtered_query
+
+    @staticmethod
+    def encode_pagination_cursor(bson_data: dict[str, Any], sort_by: str = CURSOR_SORT_FIELD) -> str:
+        payload = {sort_by: bson_data[sort_by].isoformat(), "id": str(bson_data["_id"])}
+        return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8")
+
+    @staticmethod
+    def decode_pagination_cursor(pagination_cursor: str, sort_by: str = CURSOR_SORT_FIELD) -> Tuple[datetime, ObjectId]:
+        """
+        The cursor stores its value under the sort field name, so a cursor issued for another sort is rejected.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(pagination_cursor.encode("utf-8")))
+            return datetime.fromisoformat(payload[sort_by]), ObjectId(payload["id"])
+        except (ValueError, KeyError, TypeError, InvalidId):
+            raise InvalidPaginationCursorError()
+
+    @staticmethod
+    def apply_pagination_cursor(
+        filter_query: dict[str, Any], pagination_cursor: Optional[str], sort_params: Optional[SortParams] = None
+    ) -> dict[str, Any]:
+        """
+        Narrows filter_query to the documents that sort after the cursor in the (sort field, _id) order of
+        BaseModel.build_sort.
+        """
+        if not pagination_cursor:
+            return filter_query
+
+        ((sort_by, direction), _) = BaseModel.build_sort(sort_params)
+        sort_value, last_id = BaseModel.decode_pagination_cursor(pagination_cursor, sort_by)
+        operator = "$lt" if direction < 0 else "$gt"
+        return {
+            **filter_query,
+            "$or": [{sort_by: {operator: sort_value}}, {sort_by: sort_value, "_id": {operator: last_id}}],
+        }
+
+    @staticmethod
+    def calculate_next_pagination_cursor(
+        documents_bson: List[dict[str, Any]], size: int, sort_params: Optional[SortParams] = None
+    ) -> Tuple[List[dict[str, Any]], Optional[str]]:
+        """
+        Expects up to size + 1 documents; the extra one only signals that another page exists.
+        """
+        if len(documents_bson) <= size:
+            return documents_bson, None
+
+        page_bson = documents_bson[:size]
+        ((sort_by, _), _) = BaseModel.build_sort(sort_params)
+        return page_bson, BaseModel.encode_pagination_cursor(page_bson[-1], sort_by)
+
+    @staticmethod
+    def parse_sort_params(
+        raw_sort: Optional[str], raw_order: Optional[str], allowed_fields: Sequence[str]
+    ) -> Optional[SortParams]:
+        """
+        Parses ?sort=<field>&order=asc|desc. Only fields backed by a compound index may be allowed, so a listing never
+        sorts in memory. The order defaults to desc, and order alone sorts by created_at.
+        """
+        if not raw_sort and not raw_order:
+            return None
+
+        sort_by = raw_sort or CURSOR_SORT_FIELD
+        if sort_by not in allowed_fields:
+            raise InvalidSortParamsError(f"Cannot sort by {sort_by}. Allowed fields are: {', '.join(allowed_fields)}.")
+
+        try:
+            sort_direction = SortDirection.from_string(raw_order or SortDirection.DESC.string_value)
+        except ValueError:
+            raise InvalidSortParamsError("order must be asc or desc")
+
+        return SortParams(sort_by=sort_by, sort_direction=sort_direction)
+
+    @staticmethod
+    def parse_timestamp_filters(
+        raw_created_after: Optional[str], raw_created_before: Optional[str], raw_updated_since: Optional[str]
+    ) -> Optional[TimestampFilterParams]:
+        """
+        Parses ISO 8601 ?created_after=, ?created_before= and ?updated_since= values. Stored timestamps are naive, so
+        offsets are converted to UTC and dropped.
+        """
+        if not (raw_created_after or raw_created_before or raw_updated_since):
+            return None
+
+        filter_params = TimestampFilterParams(
+            created_after=BaseModel._parse_timestamp("created_after", raw_created_after),
+            created_before=BaseModel._parse_timestamp("created_before", raw_created_before),
+            updated_since=BaseModel._parse_timestamp("updated_since", raw_updated_since),
+        )
+        if (
+            filter_params.created_after is not None
+            and filter_params.created_before is not None
+            and filter_params.created_after >= filter_params.created_before
+        ):
+            raise InvalidFilterParamsError("created_after must be earlier than created_before")
+
+        return filter_params
+
+    @staticmethod
+    def _parse_timestamp(name: str, raw_timestamp: Optional[str]) -> Optional[datetime]:
+        if not raw_timestamp:
+            return None
+
+        try:
+            timestamp = datetime.fromisoformat(raw_timestamp)
+        except ValueError:
+            raise InvalidFilterParamsError(f"{name} must be an ISO 8601 timestamp")
+
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        return timestamp
+
+    @staticmethod
+    def build_text_search_pipeline(
+        filter_query: dict[str, Any], text_query: str, after: Optional[TextSearchPosition], limit: int
+    ) -> List[dict[str, Any]]:
+        """
+        Ranks the documents matching filter_query and text_query by relevance, ties broken by _id, and returns the
+        documents that rank after the given position with their score in a text_score field.
+        """
+        pipeline: List[dict[str, Any]] = [
+            {"$match": {**filter_query, "$text": {"$search": text_query}}},
+            {"$addFields": {"text_score": {"$meta": "textScore"}}},
+        ]
+        if after is not None:
+            after_id = ObjectId(after.id)
+            pipeline.append(
+                {
+                    "$match": {
+                        "$or": [
+                            {"text_score": {"$lt": after.score}},
+                            {"text_score": after.score, "_id": {"$lt": after_id}},
+                        ]
+                    }
+                }
             )
-        return cursor
+        pipeline.extend([{"$sort": {"text_score": -1, "_id": -1}}, {"$limit": limit}])
+        return pipeline
+
+    @staticmethod
+    def parse_projection_fields(raw_fields: Optional[str], allowed_fields: Sequence[str]) -> Optional[Tuple[str, ...]]:
+        """
+        Parses a comma separated ?fields= value into a tuple of field names, or None when nothing was requested.
+        """
+        if not raw_fields:
+            return None
+
+        requested_fields = tuple(dict.fromkeys(name.strip() for name in raw_fields.split(",") if name.strip()))
+        invalid_fields = [name for name in requested_fields if name not in allowed_fields]
+        if invalid_fields:
+            raise InvalidProjectionFieldsError(invalid_fields=invalid_fields, allowed_fields=allowed_fields)
+
+        return requested_fields or None
+
+    @staticmethod
+    def build_projection(
+        fields: Optional[Tuple[str, ...]], required_fields: Tuple[str, ...] = ()
+    ) -> Optional[dict[str, int]]:
+        """
+        Maps DTO field names to a Mongo inclusion projection. _id is always returned by Mongo, so id needs no entry.
+        """
+        if fields is None:
+            return None
+
+        projection = {name: 1 for name in (*fields, *required_fields) if name != "id"}
+        return projection or {"_id": 1}
@@ -2,3 +2,24 @@ from modules.application.common.types import PaginationParams
 
 # Default pagination parameters
 DEFAULT_PAGINATION_PARAMS = PaginationParams(page=1, size=10, offset=0)
+
+# Sort order used by keyset pagination, must match the (created_at, _id) compound indexes
+CURSOR_SORT_FIELD = "created_at"
+CURSOR_PAGINATION_SORT = [(CURSOR_SORT_FIELD, -1), ("_id", -1)]
+
+# Fields listings can be sorted by with ?sort=, each backed by a (<field>, _id) compound index
+LISTING_SORT_FIELDS = ("created_at", "updated_at")
+
+# Header carrying the causal consistency token, returned by every response and sent back by clients on later requests
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+
+# Content type of newline delimited JSON bodies, one JSON document per line
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Names of the read preferences configured under mongodb.read_preferences
+LISTING_READ_PREFERENCE = "listing"
+DETAIL_READ_PREFERENCE = "detail"
+
+# Storage backends selectable with mongodb.backend, see ApplicationRepositoryClient.get_backend
+MONGODB_BACKEND = "mongodb"
+IN_MEMORY_BACKEND = "memory"
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
-from typing import Generic, List, TypeVar
+from typing import Any, Generic, Iterator, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -12,6 +13,12 @@ class PaginationParams:
     offset: int = 0
 
 
+@dataclass(frozen=True)
+class CursorPaginationParams:
+    size: int
+    cursor: Optional[str] = None
+
+
 class SortDirection(Enum):
     ASC = ("asc", 1)
     DESC = ("desc", -1)
@@ -34,12 +41,83 @@ class SortParams:
     sort_direction: SortDirection
 
 
+@dataclass(frozen=True)
+class TimestampFilterParams:
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    updated_since: Optional[datetime] = None
+
+
 @dataclass(frozen=True)
 class PaginationResult(Generic[T]):
     items: List[T]
     pagination_params: PaginationParams
-    total_count: int
-    total_pages: int
+    total_count: Optional[int]
+    total_pages: Optional[int]
+
+
+@dataclass(frozen=True)
+class RawPaginationResult:
+    """
+    A page read as raw BSON. Its items are transcoded into JSON-ready dicts one batch at a time as item_batches is
+    iterated, so a listing response can be written without materializing every item first.
+    """
+
+    item_batches: Iterator[List[dict[str, Any]]]
+    pagination_params: PaginationParams
+    total_count: Optional[int]
+    total_pages: Optional[int]
+
+
+@dataclass(frozen=True)
+class CursorPaginationResult(Generic[T]):
+    items: List[T]
+    pagination_params: CursorPaginationParams
+    next_cursor: Optional[str]
+
+
+@dataclass(frozen=True)
+class TextSearchPosition:
+    """
+    The (text_score, _id) of the last hit a text search returned; the next page starts right after it.
+    """
+
+    score: float
+    id: str
+
+
+@dataclass(frozen=True)
+class CounterReconciliationResult:
+    checked_count: int
+    repaired_count: int
+
+
+@dataclass(frozen=True)
+class CollectionProvisioningResult:
+    collection_name: str
+    collection_created: bool
+    validator_changed: bool
+    created_indexes: List[str]
+    recreated_indexes: List[str]
+    undeclared_indexes: List[str]
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.collection_created or self.validator_changed or self.created_indexes or self.recreated_indexes)
+
+
+@dataclass(frozen=True)
+class MongoPoolMetrics:
+    checkouts: int
+    checkout_failures: int
+    connections_in_use: int
+    max_connections_in_use: int
+    total_checkout_wait_ms: float
+    max_checkout_wait_ms: float
+
+    @property
+    def average_checkout_wait_ms(self) -> float:
+        return self.total_checkout_wait_ms / self.checkouts if self.checkouts else 0.0
 
 
 UNSET = object()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, List, Optional, Sequence
 
 
 class AppError(Exception):
@@ -34,6 +34,37 @@ class WorkerErrorCode:
     WORKER_ALREADY_TERMINATED: str = "WORKER_ERR_07"
 
 
+@dataclass(frozen=True)
+class PaginationErrorCode:
+    INVALID_CURSOR: str = "PAGINATION_ERR_01"
+
+
+@dataclass(frozen=True)
+class ProjectionErrorCode:
+    INVALID_FIELDS: str = "PROJECTION_ERR_01"
+
+
+@dataclass(frozen=True)
+class SortErrorCode:
+    INVALID_SORT: str = "SORT_ERR_01"
+
+
+@dataclass(frozen=True)
+class FilterErrorCode:
+    INVALID_FILTER: str = "FILTER_ERR_01"
+
+
+@dataclass(frozen=True)
+class ReadConsistencyErrorCode:
+    INVALID_CONSISTENCY_TOKEN: str = "READ_CONSISTENCY_ERR_01"
+    INVALID_READ_PREFERENCE: str = "READ_CONSISTENCY_ERR_02"
+
+
+@dataclass(frozen=True)
+class RepositoryErrorCode:
+    INVALID_BACKEND: str = "REPOSITORY_ERR_01"
+
+
 class WorkerClientConnectionError(AppError):
     def __init__(self, server_address: str) -> None:
         super().__init__(
@@ -99,3 +130,60 @@ class WorkerAlreadyTerminatedError(AppError):
             http_status_code=400,
             message=f"Worker with id: {worker_id} has already been terminated. Verify the worker ID and try again.",
         )
+
+
+class InvalidPaginationCursorError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=PaginationErrorCode.INVALID_CURSOR,
+            http_status_code=400,
+            message="Pagination cursor is invalid. Use the next_cursor value returned by the previous page.",
+        )
+
+
+class InvalidProjectionFieldsError(AppError):
+    def __init__(self, invalid_fields: List[str], allowed_fields: Sequence[str]) -> None:
+        super().__init__(
+            code=ProjectionErrorCode.INVALID_FIELDS,
+            http_status_code=400,
+            message=f"Unknown fields requested: {', '.join(invalid_fields)}. "
+            f"Allowed fields are: {', '.join(allowed_fields)}.",
+        )
+
+
+class InvalidConsistencyTokenError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=ReadConsistencyErrorCode.INVALID_CONSISTENCY_TOKEN,
+            http_status_code=400,
+            message="Consistency token is invalid. Use the X-Consistency-Token value returned by a previous response.",
+        )
+
+
+class InvalidReadPreferenceError(AppError):
+    def __init__(self, name: str, mode: str) -> None:
+        super().__init__(
+            code=ReadConsistencyErrorCode.INVALID_READ_PREFERENCE,
+            http_status_code=500,
+            message=f"Read preference {name} has unknown mode {mode}. "
+            f"Use primary, primaryPreferred, secondary, secondaryPreferred or nearest.",
+        )
+
+
+class InvalidRepositoryBackendError(AppError):
+    def __init__(self, backend: str) -> None:
+        super().__init__(
+            code=RepositoryErrorCode.INVALID_BACKEND,
+            http_status_code=500,
+            message=f"Repository backend {backend} is unknown. Set mongodb.backend to mongodb or memory.",
+        )
+
+
+class InvalidSortParamsError(AppError):
+    def __init__(self, message: str) -> None:
+        super().__init__(code=SortErrorCode.INVALID_SORT, http_status_code=400, message=message)
+
+
+class InvalidFilterParamsError(AppError):
+    def __init__(self, message: str) -> None:
+        super().__init__(code=FilterErrorCode.INVALID_FILTER, http_status_code=400, message=message)
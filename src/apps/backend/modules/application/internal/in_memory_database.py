@@ -0,0 +1,631 @@
+import copy
+import threading
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, cast
+
+import bson
+from bson.codec_options import DEFAULT_CODEC_OPTIONS, CodecOptions
+from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
+from pymongo import IndexModel, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError, WriteError
+from pymongo.operations import DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+from pymongo.read_preferences import Primary, _ServerMode
+from pymongo.results import BulkWriteResult, DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
+
+from modules.application.internal.in_memory_query_util import MISSING, InMemoryQueryUtil
+from modules.application.internal.index_util import IndexUtil
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+IMMUTABLE_FIELD_ERROR_CODE = 66
+
+
+class InMemoryDatabase:
+    """
+    Process-local stand-in for a Mongo database, used by the in-memory repository backend. Collections are created
+    with their declared indexes on first access, so unique and partial unique indexes are enforced as in Mongo.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._collections: dict[str, InMemoryCollection] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> "InMemoryCollection":
+        return self.get_collection(name)
+
+    def get_collection(self, name: str, indexes: Sequence[IndexModel] = ()) -> "InMemoryCollection":
+        collection = self._collections.get(name)
+        if collection is not None:
+            return collection
+
+        with self._lock:
+            if name not in self._collections:
+                collection = InMemoryCollection(database=self, name=name)
+                if indexes:
+                    collection.create_indexes(list(indexes))
+                self._collections[name] = collection
+
+            return self._collections[name]
+
+    def list_collection_names(self) -> List[str]:
+        return list(self._collections)
+
+    def drop_collection(self, name: str) -> None:
+        with self._lock:
+            self._collections.pop(name, None)
+
+
+class InMemoryCollection:
+    """
+    Implements the subset of pymongo's Collection API the repositories use, returning pymongo's own result and
+    error types. Documents are copied in and out, so callers never share state with the stored documents.
+    Views returned by with_options share the documents and indexes of the collection they came from.
+    """
+
+    def __init__(self, database: InMemoryDatabase, name: str) -> None:
+        self.database = database
+        self.name = name
+        self.full_name = f"{database.name}.{name}"
+        # Kept so callers can compare read preferences as with pymongo; there are no secondaries to route reads to
+        self.read_preference: _ServerMode = Primary()
+        # Only document_class is honoured: RawBSONDocument makes cursors return raw documents as pymongo does
+        self.codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS
+        self._documents: dict[Tuple[Any, ...], dict[str, Any]] = {}
+        self._indexes: dict[str, dict[str, Any]] = {"_id_": {"v": 2, "key": [("_id", 1)]}}
+        self._unique_index_entries: dict[str, dict[Tuple[Any, ...], Tuple[Any, ...]]] = {}
+        self._lock = threading.RLock()
+
+    def with_options(
+        self, read_preference: Optional[_ServerMode] = None, codec_options: Optional[CodecOptions] = None, **kwargs: Any
+    ) -> "InMemoryCollection":
+        collection = copy.copy(self)
+        if read_preference is not None:
+            collection.read_preference = read_preference
+        if codec_options is not None:
+            collection.codec_options = codec_options
+        return collection
+
+    def find(
+        self,
+        filter: Optional[dict[str, Any]] = None,
+        projection: Any = None,
+        *,
+        sort: Any = None,
+        skip: int = 0,
+        limit: int = 0,
+        **kwargs: Any,
+    ) -> "InMemoryCursor":
+        cursor = InMemoryCursor(collection=self, filter_query=filter or {}, projection=projection)
+        if sort:
+            cursor.sort(sort)
+        return cursor.skip(skip).limit(limit)
+
+    def find_one(
+        self, filter: Any = None, projection: Any = None, *, sort: Any = None, **kwargs: Any
+    ) -> Optional[dict[str, Any]]:
+        if filter is not None and not isinstance(filter, dict):
+            filter = {"_id": filter}
+        return next(self.find(filter, projection, sort=sort, limit=1), None)
+
+    def count_documents(self, filter: dict[str, Any], *, skip: int = 0, limit: int = 0, **kwargs: Any) -> int:
+        with self._lock:
+            count = max(len(self._find_matching(filter)) - skip, 0)
+        return min(count, limit) if limit else count
+
+    def estimated_document_count(self, **kwargs: Any) -> int:
+        return len(self._documents)
+
+    def distinct(self, key: str, filter: Optional[dict[str, Any]] = None, **kwargs: Any) -> List[Any]:
+        values: List[Any] = []
+        with self._lock:
+            for document in self._find_matching(filter or {}):
+                value = InMemoryQueryUtil.get_path(document, key)
+                for item in value if isinstance(value, list) else [value]:
+                    if item is not MISSING and item not in values:
+                        values.append(copy.deepcopy(item))
+        return values
+
+    def aggregate(self, pipeline: Sequence[dict[str, Any]], **kwargs: Any) -> "InMemoryCommandCursor":
+        # Runs on snapshots so a $lookup never holds the locks of two collections at once
+        text_index_weights = next((index["weights"] for index in self._indexes.values() if "weights" in index), None)
+        return InMemoryCommandCursor(
+            InMemoryQueryUtil.aggregate(
+                self.snapshot_documents(),
+                pipeline,
+                lambda name: self.database.get_collection(name).snapshot_documents(),
+                text_index_weights,
+            )
+        )
+
+    def snapshot_documents(self) -> List[dict[str, Any]]:
+        with self._lock:
+            return list(self._documents.values())
+
+    def insert_one(self, document: dict[str, Any], **kwargs: Any) -> InsertOneResult:
+        # Like pymongo, the generated _id is added to the caller's document
+        document.setdefault("_id", ObjectId())
+        with self._lock:
+            self._insert(document)
+        return InsertOneResult(document["_id"], True)
+
+    def insert_many(self, documents: Iterable[dict[str, Any]], ordered: bool = True, **kwargs: Any) -> InsertManyResult:
+        documents = list(documents)
+        for document in documents:
+            document.setdefault("_id", ObjectId())
+
+        result = self.bulk_write([InsertOne(document) for document in documents], ordered=ordered)
+        return InsertManyResult([document["_id"] for document in documents][: result.inserted_count], True)
+
+    def update_one(
+        self, filter: dict[str, Any], update: dict[str, Any], upsert: bool = False, **kwargs: Any
+    ) -> UpdateResult:
+        with self._lock:
+            return self._update(filter, update, upsert=upsert, multi=False)
+
+    def update_many(
+        self, filter: dict[str, Any], update: dict[str, Any], upsert: bool = False, **kwargs: Any
+    ) -> UpdateResult:
+        with self._lock:
+            return self._update(filter, update, upsert=upsert, multi=True)
+
+    def find_one_and_update(
+        self,
+        filter: dict[str, Any],
+        update: dict[str, Any],
+        projection: Any = None,
+        sort: Any = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        **kwargs: Any,
+    ) -> Optional[dict[str, Any]]:
+        with self._lock:
+            matched_documents = self._find_matching(filter, sort)
+            result: Optional[dict[str, Any]]
+            if matched_documents:
+                before = matched_documents[0]
+                after = self._update_document(before, update) or before
+                result = after if return_document else before
+            elif upsert:
+                after = self._upsert(filter, update)
+                result = after if return_document else None
+            else:
+                result = None
+
+            return None if result is None else InMemoryQueryUtil.project(result, projection)
+
+    def delete_one(self, filter: dict[str, Any], **kwargs: Any) -> DeleteResult:
+        with self._lock:
+            return DeleteResult({"n": self._delete(filter, multi=False)}, True)
+
+    def delete_many(self, filter: dict[str, Any], **kwargs: Any) -> DeleteResult:
+        with self._lock:
+            return DeleteResult({"n": self._delete(filter, multi=True)}, True)
+
+    def bulk_write(self, requests: Sequence[Any], ordered: bool = True, **kwargs: Any) -> BulkWriteResult:
+        """
+        Applies the requests in order, collecting duplicate key errors into a BulkWriteError as Mongo does. Ordered
+        writes stop at the first error, unordered writes carry on with the remaining requests.
+        """
+        bulk_result: dict[str, Any] = {
+            "writeErrors": [],
+            "writeConcernErrors": [],
+            "nInserted": 0,
+            "nUpserted": 0,
+            "nMatched": 0,
+            "nModified": 0,
+            "nRemoved": 0,
+            "upserted": [],
+        }
+
+        with self._lock:
+            for index, request in enumerate(requests):
+                try:
+                    self._apply_write(request, index, bulk_result)
+                except DuplicateKeyError as e:
+                    bulk_result["writeErrors"].append(
+                        {"index": index, "code": e.code, "errmsg": str(e), **(e.details or {}), "op": request._doc}
+                    )
+                    if ordered:
+                        break
+
+        if bulk_result["writeErrors"]:
+            raise BulkWriteError(bulk_result)
+
+        return BulkWriteResult(bulk_result, True)
+
+    def create_index(self, keys: Any, **kwargs: Any) -> str:
+        return self.create_indexes([IndexModel(keys, **kwargs)])[0]
+
+    def create_indexes(self, indexes: Sequence[IndexModel], **kwargs: Any) -> List[str]:
+        index_names = []
+        with self._lock:
+            for index_model in indexes:
+                index_name = index_model.document["name"]
+                index_keys, index_options = IndexUtil.to_live_index(index_model.document)
+                index = {"v": 2, **index_options, "key": index_keys}
+
+                if index.get("unique"):
+                    unique_index_entries: dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+                    for document_key, document in self._documents.items():
+                        index_key = self._build_unique_index_key(index, document)
+                        if index_key is None:
+                            continue
+                        if index_key in unique_index_entries:
+                            raise self._build_duplicate_key_error(index_name, index, document)
+                        unique_index_entries[index_key] = document_key
+                    self._unique_index_entries[index_name] = unique_index_entries
+
+                self._indexes[index_name] = index
+                index_names.append(index_name)
+
+        return index_names
+
+    def index_information(self, **kwargs: Any) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(self._indexes)
+
+    def drop_index(self, index_name: str, **kwargs: Any) -> None:
+        with self._lock:
+            self._indexes.pop(index_name, None)
+            self._unique_index_entries.pop(index_name, None)
+
+    def drop(self, **kwargs: Any) -> None:
+        self.database.drop_collection(self.name)
+
+    def find_documents(
+        self, filter_query: dict[str, Any], projection: Any, sort_spec: Sequence[Tuple[str, int]], skip: int, limit: int
+    ) -> List[dict[str, Any]]:
+        with self._lock:
+            matched_documents = self._find_matching(filter_query, sort_spec)
+            matched_documents = matched_documents[skip : skip + limit if limit else None]
+            return [InMemoryQueryUtil.project(document, projection) for document in matched_documents]
+
+    @staticmethod
+    def normalize_sort_spec(key_or_list: Any, direction: Optional[int] = None) -> List[Tuple[str, int]]:
+        if isinstance(key_or_list, str):
+            return [(key_or_list, 1 if direction is None else direction)]
+        if isinstance(key_or_list, dict):
+            return list(key_or_list.items())
+        return [(key, key_direction) for key, key_direction in key_or_list]
+
+    def _find_matching(self, filter_query: dict[str, Any], sort: Any = None) -> List[dict[str, Any]]:
+        document_id = filter_query.get("_id", MISSING)
+        if document_id is not MISSING and not InMemoryQueryUtil.is_operator_condition(document_id):
+            # Point lookups by _id skip the collection scan, like the _id index does
+            document = self._documents.get(InMemoryQueryUtil.sort_key(document_id))
+            candidates = [] if document is None else [document]
+        else:
+            candidates = list(self._documents.values())
+
+        matched_documents = [document for document in candidates if InMemoryQueryUtil.matches(document, filter_query)]
+        if sort:
+            InMemoryQueryUtil.sort_documents(matched_documents, InMemoryCollection.normalize_sort_spec(sort))
+        return matched_documents
+
+    def _apply_write(self, request: Any, index: int, bulk_result: dict[str, Any]) -> None:
+        if isinstance(request, InsertOne):
+            request._doc.setdefault("_id", ObjectId())
+            self._insert(request._doc)
+            bulk_result["nInserted"] += 1
+        elif isinstance(request, (UpdateOne, UpdateMany)):
+            result = self._update(
+                dict(request._filter),
+                cast(dict[str, Any], request._doc),
+                upsert=bool(request._upsert),
+                multi=isinstance(request, UpdateMany),
+            )
+            bulk_result["nMatched"] += result.matched_count
+            bulk_result["nModified"] += result.modified_count
+            if result.upserted_id is not None:
+                bulk_result["nUpserted"] += 1
+                bulk_result["upserted"].append({"index": index, "_id": result.upserted_id})
+        elif isinstance(request, (DeleteOne, DeleteMany)):
+            bulk_result["nRemoved"] += self._delete(dict(request._filter), multi=isinstance(request, DeleteMany))
+        else:
+            raise NotImplementedError(f"{type(request).__name__} is not supported by the in-memory backend")
+
+    def _update(self, filter_query: dict[str, Any], update: dict[str, Any], upsert: bool, multi: bool) -> UpdateResult:
+        matched_documents = self._find_matching(filter_query)
+        if not multi:
+            matched_documents = matched_documents[:1]
+
+        if not matched_documents and upsert:
+            upserted_document = self._upsert(filter_query, update)
+            return UpdateResult({"n": 1, "nModified": 0, "upserted": upserted_document["_id"]}, True)
+
+        modified_count = sum(1 for document in matched_documents if self._update_document(document, update))
+        return UpdateResult({"n": len(matched_documents), "nModified": modified_count}, True)
+
+    def _update_document(self, document: dict[str, Any], update: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """
+        Applies the update to a stored document and returns the new version, None when the update changed nothing.
+        """
+        updated_document = copy.deepcopy(document)
+        InMemoryQueryUtil.apply_update(updated_document, update)
+        updated_document = InMemoryCollection._to_stored_value(updated_document)
+        if updated_document == document:
+            return None
+
+        if updated_document.get("_id") != document["_id"]:
+            raise WriteError(
+                "Performing an update on the path '_id' would modify the immutable field '_id'",
+                IMMUTABLE_FIELD_ERROR_CODE,
+            )
+
+        document_key = InMemoryQueryUtil.sort_key(document["_id"])
+        previous_index_keys = self._build_unique_index_keys(document)
+        index_keys = self._build_unique_index_keys(updated_document)
+        self._check_unique_index_keys(index_keys, updated_document, document_key)
+
+        for index_name, index_key in previous_index_keys.items():
+            self._unique_index_entries[index_name].pop(index_key, None)
+        for index_name, index_key in index_keys.items():
+            self._unique_index_entries[index_name][index_key] = document_key
+        self._documents[document_key] = updated_document
+        return updated_document
+
+    def _upsert(self, filter_query: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
+        document = InMemoryQueryUtil.build_upsert_document(filter_query)
+        InMemoryQueryUtil.apply_update(document, update, is_insert=True)
+        document.setdefault("_id", ObjectId())
+        return self._insert(document)
+
+    def _insert(self, document: dict[str, Any]) -> dict[str, Any]:
+        stored_document: dict[str, Any] = InMemoryCollection._to_stored_value(document)
+        document_key = InMemoryQueryUtil.sort_key(stored_document["_id"])
+        if document_key in self._documents:
+            raise self._build_duplicate_key_error("_id_", self._indexes["_id_"], stored_document)
+
+        index_keys = self._build_unique_index_keys(stored_document)
+        self._check_unique_index_keys(index_keys, stored_document, document_key)
+
+        for index_name, index_key in index_keys.items():
+            self._unique_index_entries[index_name][index_key] = document_key
+        self._documents[document_key] = stored_document
+        return stored_document
+
+    def _delete(self, filter_query: dict[str, Any], multi: bool) -> int:
+        matched_documents = self._find_matching(filter_query)
+        if not multi:
+            matched_documents = matched_documents[:1]
+
+        for document in matched_documents:
+            for index_name, index_key in self._build_unique_index_keys(document).items():
+                self._unique_index_entries[index_name].pop(index_key, None)
+            del self._documents[InMemoryQueryUtil.sort_key(document["_id"])]
+
+        return len(matched_documents)
+
+    def _build_unique_index_keys(self, document: dict[str, Any]) -> dict[str, Tuple[Any, ...]]:
+        index_keys = {}
+        for index_name in self._unique_index_entries:
+            index_key = self._build_unique_index_key(self._indexes[index_name], document)
+            if index_key is not None:
+                index_keys[index_name] = index_key
+        return index_keys
+
+    @staticmethod
+    def _build_unique_index_key(index: dict[str, Any], document: dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Returns the entry the document adds to a unique index, None when a partial index does not cover it.
+        Missing fields are indexed as null, so only one document may omit them.
+        """
+        partial_filter = index.get("partialFilterExpression")
+        if partial_filter and not InMemoryQueryUtil.matches(document, partial_filter):
+            return None
+
+        return tuple(
+            InMemoryQueryUtil.sort_key(InMemoryQueryUtil.get_path(document, field)) for field, _ in index["key"]
+        )
+
+    def _check_unique_index_keys(
+        self, index_keys: dict[str, Tuple[Any, ...]], document: dict[str, Any], document_key: Tuple[Any, ...]
+    ) -> None:
+        for index_name, index_key in index_keys.items():
+            owner_key = self._unique_index_entries[index_name].get(index_key)
+            if owner_key is not None and owner_key != document_key:
+                raise self._build_duplicate_key_error(index_name, self._indexes[index_name], document)
+
+    def _build_duplicate_key_error(
+        self, index_name: str, index: dict[str, Any], document: dict[str, Any]
+    ) -> DuplicateKeyError:
+        key_pattern = dict(index["key"])
+        key_value = {}
+        for field in key_pattern:
+            value = InMemoryQueryUtil.get_path(document, field)
+            key_value[field] = None if value is MISSING else value
+
+        message = f"E11000 duplicate key error collection: {self.full_name} index: {index_name} dup key: {key_value}"
+        return DuplicateKeyError(
+            message,
+            DUPLICATE_KEY_ERROR_CODE,
+            {"code": DUPLICATE_KEY_ERROR_CODE, "errmsg": message, "keyPattern": key_pattern, "keyValue": key_value},
+        )
+
+    @staticmethod
+    def _to_stored_value(value: Any) -> Any:
+        """
+        Copies a value the way a BSON round trip would: tuples become lists and datetimes lose their timezone and
+        everything below milliseconds.
+        """
+        if isinstance(value, dict):
+            return {key: InMemoryCollection._to_stored_value(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [InMemoryCollection._to_stored_value(item) for item in value]
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            return value.replace(microsecond=value.microsecond // 1000 * 1000)
+        return value
+
+
+class InMemoryCursor:
+    """
+    Lazily evaluated cursor over an InMemoryCollection; sort, skip and limit apply until iteration starts.
+    """
+
+    def __init__(self, collection: InMemoryCollection, filter_query: dict[str, Any], projection: Any) -> None:
+        self._collection = collection
+        self._filter_query = filter_query
+        self._projection = projection
+        self._sort_spec: List[Tuple[str, int]] = []
+        self._skip = 0
+        self._limit = 0
+        self._results: Optional[Iterator[dict[str, Any]]] = None
+
+    def sort(self, key_or_list: Any, direction: Optional[int] = None) -> "InMemoryCursor":
+        self._sort_spec = InMemoryCollection.normalize_sort_spec(key_or_list, direction)
+        return self
+
+    def skip(self, skip: int) -> "InMemoryCursor":
+        self._skip = skip
+        return self
+
+    def limit(self, limit: int) -> "InMemoryCursor":
+        self._limit = abs(limit)
+        return self
+
+    def batch_size(self, batch_size: int) -> "InMemoryCursor":
+        return self
+
+    def close(self) -> None:
+        self._results = iter(())
+
+    def __iter__(self) -> "InMemoryCursor":
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        if self._results is None:
+            self._results = iter(
+                self._collection.find_documents(
+                    self._filter_query, self._projection, self._sort_spec, self._skip, self._limit
+                )
+            )
+        document = next(self._results)
+        if self._collection.codec_options.document_class is RawBSONDocument:
+            return cast(dict[str, Any], RawBSONDocument(bson.encode(document)))
+        return document
+
+
+class InMemoryCommandCursor:
+    """
+    Result of an in-memory aggregation, exposing what pymongo's CommandCursor offers.
+    """
+
+    def __init__(self, documents: Iterable[dict[str, Any]]) -> None:
+        self._results = iter(documents)
+
+    def close(self) -> None:
+        self._results = iter(())
+
+    def __enter__(self) -> "InMemoryCommandCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> "InMemoryCommandCursor":
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        return next(self._results)
+
+
+class AsyncInMemoryCursor:
+    """
+    Async view of an in-memory cursor or aggregation result, exposing what pymongo's async cursors offer.
+    """
+
+    def __init__(self, results: InMemoryCursor | InMemoryCommandCursor) -> None:
+        self._results = results
+
+    def sort(self, key_or_list: Any, direction: Optional[int] = None) -> "AsyncInMemoryCursor":
+        assert isinstance(self._results, InMemoryCursor)
+        self._results.sort(key_or_list, direction)
+        return self
+
+    def skip(self, skip: int) -> "AsyncInMemoryCursor":
+        assert isinstance(self._results, InMemoryCursor)
+        self._results.skip(skip)
+        return self
+
+    def limit(self, limit: int) -> "AsyncInMemoryCursor":
+        assert isinstance(self._results, InMemoryCursor)
+        self._results.limit(limit)
+        return self
+
+    def batch_size(self, batch_size: int) -> "AsyncInMemoryCursor":
+        return self
+
+    async def close(self) -> None:
+        self._results.close()
+
+    async def to_list(self, length: Optional[int] = None) -> List[dict[str, Any]]:
+        results = list(self._results)
+        return results if length is None else results[:length]
+
+    def __aiter__(self) -> "AsyncInMemoryCursor":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._results)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncInMemoryCollection:
+    """
+    Async view of an InMemoryCollection for the ASGI app. Operations never block on I/O, so they run inline.
+    """
+
+    def __init__(self, collection: InMemoryCollection) -> None:
+        self._collection = collection
+
+    @property
+    def name(self) -> str:
+        return self._collection.name
+
+    @property
+    def read_preference(self) -> _ServerMode:
+        return self._collection.read_preference
+
+    def with_options(self, **kwargs: Any) -> "AsyncInMemoryCollection":
+        return AsyncInMemoryCollection(self._collection.with_options(**kwargs))
+
+    def find(self, *args: Any, **kwargs: Any) -> AsyncInMemoryCursor:
+        return AsyncInMemoryCursor(self._collection.find(*args, **kwargs))
+
+    async def aggregate(self, *args: Any, **kwargs: Any) -> AsyncInMemoryCursor:
+        return AsyncInMemoryCursor(self._collection.aggregate(*args, **kwargs))
+
+    async def find_one(self, *args: Any, **kwargs: Any) -> Optional[dict[str, Any]]:
+        return self._collection.find_one(*args, **kwargs)
+
+    async def count_documents(self, *args: Any, **kwargs: Any) -> int:
+        return self._collection.count_documents(*args, **kwargs)
+
+    async def insert_one(self, *args: Any, **kwargs: Any) -> InsertOneResult:
+        return self._collection.insert_one(*args, **kwargs)
+
+    async def insert_many(self, *args: Any, **kwargs: Any) -> InsertManyResult:
+        return self._collection.insert_many(*args, **kwargs)
+
+    async def update_one(self, *args: Any, **kwargs: Any) -> UpdateResult:
+        return self._collection.update_one(*args, **kwargs)
+
+    async def update_many(self, *args: Any, **kwargs: Any) -> UpdateResult:
+        return self._collection.update_many(*args, **kwargs)
+
+    async def find_one_and_update(self, *args: Any, **kwargs: Any) -> Optional[dict[str, Any]]:
+        return self._collection.find_one_and_update(*args, **kwargs)
+
+    async def delete_one(self, *args: Any, **kwargs: Any) -> DeleteResult:
+        return self._collection.delete_one(*args, **kwargs)
+
+    async def delete_many(self, *args: Any, **kwargs: Any) -> DeleteResult:
+        return self._collection.delete_many(*args, **kwargs)
+
+    async def bulk_write(self, *args: Any, **kwargs: Any) -> BulkWriteResult:
+        return self._collection.bulk_write(*args, **kwargs)
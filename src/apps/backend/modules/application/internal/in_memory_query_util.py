@@ -0,0 +1,537 @@
+import copy
+import re
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from bson.objectid import ObjectId
+from bson.timestamp import Timestamp
+from pymongo.errors import OperationFailure
+
+# Marks a field that is absent from a document, which Mongo treats differently from an explicit null
+MISSING: Any = object()
+
+# Holds the $text relevance of a document during an aggregation; no stored field can start with $
+TEXT_SCORE_FIELD = "$textScore"
+
+# A small part of Mongo's English stop word list, enough that common words do not match every document
+TEXT_STOP_WORDS = {"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or"}
+TEXT_STOP_WORDS |= {"that", "the", "this", "to", "was", "with"}
+
+
+class InMemoryQueryUtil:
+    """
+    Evaluates Mongo filters, updates, projections, sorts and aggregation pipelines against plain dicts for the in-memory
+    repository backend. Only the operators the readers and writers use are supported; any other operator raises
+    NotImplementedError instead of silently matching differently from Mongo.
+    """
+
+    @staticmethod
+    def get_path(document: Any, path: str) -> Any:
+        value = document
+        for part in path.split("."):
+            if isinstance(value, dict):
+                value = value.get(part, MISSING)
+            elif isinstance(value, list) and part.isdigit():
+                value = value[int(part)] if int(part) < len(value) else MISSING
+            elif isinstance(value, list):
+                nested_values = [InMemoryQueryUtil.get_path(element, part) for element in value]
+                value = [nested_value for nested_value in nested_values if nested_value is not MISSING] or MISSING
+            else:
+                return MISSING
+
+            if value is MISSING:
+                return MISSING
+
+        return value
+
+    @staticmethod
+    def set_path(document: dict[str, Any], path: str, value: Any) -> None:
+        *parents, field = path.split(".")
+        for part in parents:
+            document = document.setdefault(part, {})
+        document[field] = value
+
+    @staticmethod
+    def unset_path(document: dict[str, Any], path: str) -> None:
+        *parents, field = path.split(".")
+        for part in parents:
+            document = document.get(part, MISSING)
+            if not isinstance(document, dict):
+                return
+        document.pop(field, None)
+
+    @staticmethod
+    def sort_key(value: Any) -> Tuple[Any, ...]:
+        """
+        Orders values the way Mongo compares BSON types: null, numbers, strings, objects, arrays, binary data,
+        ObjectId, booleans, dates, timestamps.
+        """
+        if value is MISSING or value is None:
+            return (1,)
+        if isinstance(value, bool):
+            return (8, value)
+        if isinstance(value, (int, float)):
+            return (2, value)
+        if isinstance(value, str):
+            return (3, value)
+        if isinstance(value, dict):
+            return (4, tuple((key, InMemoryQueryUtil.sort_key(item)) for key, item in value.items()))
+        if isinstance(value, (list, tuple)):
+            return (5, tuple(InMemoryQueryUtil.sort_key(item) for item in value))
+        if isinstance(value, bytes):
+            return (6, value)
+        if isinstance(value, ObjectId):
+            return (7, value.binary)
+        if isinstance(value, datetime):
+            return (9, value)
+        if isinstance(value, Timestamp):
+            return (10, value.time, value.inc)
+        return (11, repr(value))
+
+    @staticmethod
+    def matches(document: dict[str, Any], filter_query: dict[str, Any]) -> bool:
+        for key, condition in filter_query.items():
+            if key == "$and":
+                if not all(InMemoryQueryUtil.matches(document, query) for query in condition):
+                    return False
+            elif key == "$or":
+                if not any(InMemoryQueryUtil.matches(document, query) for query in condition):
+                    return False
+            elif key == "$nor":
+                if any(InMemoryQueryUtil.matches(document, query) for query in condition):
+                    return False
+            elif key.startswith("$"):
+                raise NotImplementedError(f"Query operator {key} is not supported by the in-memory backend")
+            elif not InMemoryQueryUtil._matches_condition(InMemoryQueryUtil.get_path(document, key), condition):
+                return False
+
+        return True
+
+    @staticmethod
+    def apply_update(document: dict[str, Any], update: dict[str, Any], is_insert: bool = False) -> None:
+        if not update or not all(operator.startswith("$") for operator in update):
+            raise ValueError("update only works with $ operators")
+
+        for operator, fields in update.items():
+            for path, argument in fields.items():
+                current_value = InMemoryQueryUtil.get_path(document, path)
+
+                if operator == "$set" or (operator == "$setOnInsert" and is_insert):
+                    InMemoryQueryUtil.set_path(document, path, copy.deepcopy(argument))
+                elif operator == "$setOnInsert":
+                    continue
+                elif operator == "$unset":
+                    InMemoryQueryUtil.unset_path(document, path)
+                elif operator == "$inc":
+                    InMemoryQueryUtil.set_path(
+                        document, path, (0 if current_value is MISSING else current_value) + argument
+                    )
+                elif operator in ("$min", "$max"):
+                    is_replaced = current_value is MISSING or (
+                        InMemoryQueryUtil.sort_key(argument) < InMemoryQueryUtil.sort_key(current_value)
+                        if operator == "$min"
+                        else InMemoryQueryUtil.sort_key(argument) > InMemoryQueryUtil.sort_key(current_value)
+                    )
+                    if is_replaced:
+                        InMemoryQueryUtil.set_path(document, path, copy.deepcopy(argument))
+                elif operator == "$push":
+                    items = argument["$each"] if isinstance(argument, dict) and "$each" in argument else [argument]
+                    array = [] if current_value is MISSING else list(current_value)
+                    InMemoryQueryUtil.set_path(document, path, array + copy.deepcopy(items))
+                elif operator == "$pull":
+                    if isinstance(current_value, list):
+                        InMemoryQueryUtil.set_path(
+                            document,
+                            path,
+                            [
+                                item
+                                for item in current_value
+                                if not InMemoryQueryUtil._matches_condition(item, argument)
+                            ],
+                        )
+                else:
+                    raise NotImplementedError(f"Update operator {operator} is not supported by the in-memory backend")
+
+    @staticmethod
+    def build_upsert_document(filter_query: dict[str, Any]) -> dict[str, Any]:
+        """
+        Seeds an upserted document with the equality conditions of the filter, as Mongo does.
+        """
+        document: dict[str, Any] = {}
+        for key, condition in filter_query.items():
+            if key.startswith("$"):
+                continue
+
+            if InMemoryQueryUtil.is_operator_condition(condition):
+                if "$eq" in condition:
+                    InMemoryQueryUtil.set_path(document, key, copy.deepcopy(condition["$eq"]))
+                continue
+
+            InMemoryQueryUtil.set_path(document, key, copy.deepcopy(condition))
+
+        return document
+
+    @staticmethod
+    def project(document: dict[str, Any], projection: Any) -> dict[str, Any]:
+        if not projection:
+            return copy.deepcopy(document)
+
+        if not isinstance(projection, dict):
+            projection = {field: 1 for field in projection}
+
+        field_projection = {path: include for path, include in projection.items() if path != "_id"}
+        include_id = bool(projection.get("_id", 1))
+        is_inclusion = any(field_projection.values()) or (not field_projection and "_id" in projection and include_id)
+
+        if is_inclusion:
+            projected_document: dict[str, Any] = {}
+            if include_id and "_id" in document:
+                projected_document["_id"] = copy.deepcopy(document["_id"])
+            for path, include in field_projection.items():
+                value = InMemoryQueryUtil.get_path(document, path)
+                if include and value is not MISSING:
+                    InMemoryQueryUtil.set_path(projected_document, path, copy.deepcopy(value))
+            return projected_document
+
+        projected_document = copy.deepcopy(document)
+        for path in field_projection:
+            InMemoryQueryUtil.unset_path(projected_document, path)
+        if not include_id:
+            projected_document.pop("_id", None)
+        return projected_document
+
+    @staticmethod
+    def sort_documents(documents: List[dict[str, Any]], sort_spec: Sequence[Tuple[str, int]]) -> List[dict[str, Any]]:
+        # Stable sorts applied from the last key to the first give the compound order
+        for key, direction in reversed(sort_spec):
+            documents.sort(key=InMemoryQueryUtil._build_field_sort_key(key), reverse=direction < 0)
+        return documents
+
+    @staticmethod
+    def aggregate(
+        documents: Iterable[dict[str, Any]],
+        pipeline: Sequence[dict[str, Any]],
+        get_collection_documents: Optional[Callable[[str], List[dict[str, Any]]]] = None,
+        text_index_weights: Optional[dict[str, int]] = None,
+    ) -> List[dict[str, Any]]:
+        """
+        get_collection_documents resolves the from collection of a $lookup stage to a snapshot of its documents.
+        text_index_weights are the field weights of the collection's text index, which a $text match searches.
+        """
+        results = [copy.deepcopy(document) for document in documents]
+
+        for stage in pipeline:
+            ((stage_name, stage_spec),) = stage.items()
+            if stage_name == "$match" and "$text" in stage_spec:
+                results = InMemoryQueryUtil._match_text(results, stage_spec, text_index_weights)
+            elif stage_name == "$match":
+                results = [document for document in results if InMemoryQueryUtil.matches(document, stage_spec)]
+            elif stage_name == "$sort":
+                results = InMemoryQueryUtil.sort_documents(results, list(stage_spec.items()))
+            elif stage_name == "$skip":
+                results = results[stage_spec:]
+            elif stage_name == "$limit":
+                results = results[:stage_spec]
+            elif stage_name == "$project":
+                results = [InMemoryQueryUtil.project(document, stage_spec) for document in results]
+            elif stage_name == "$count":
+                results = [{stage_spec: len(results)}] if results else []
+            elif stage_name == "$group":
+                results = InMemoryQueryUtil._group(results, stage_spec)
+            elif stage_name == "$addFields":
+                for document in results:
+                    for path, expression in stage_spec.items():
+                        value = InMemoryQueryUtil.evaluate_expression(document, expression)
+                        InMemoryQueryUtil.set_path(document, path, value)
+            elif stage_name == "$unset":
+                for document in results:
+                    for path in [stage_spec] if isinstance(stage_spec, str) else stage_spec:
+                        InMemoryQueryUtil.unset_path(document, path)
+            elif stage_name == "$lookup":
+                if get_collection_documents is None:
+                    raise NotImplementedError("$lookup needs access to the other collections of the database")
+                results = InMemoryQueryUtil._lookup(results, stage_spec, get_collection_documents)
+            elif stage_name == "$unwind":
+                results = InMemoryQueryUtil._unwind(results, stage_spec)
+            else:
+                raise NotImplementedError(f"Aggregation stage {stage_name} is not supported by the in-memory backend")
+
+        for document in results:
+            document.pop(TEXT_SCORE_FIELD, None)
+        return results
+
+    @staticmethod
+    def evaluate_expression(document: dict[str, Any], expression: Any) -> Any:
+        if isinstance(expression, str) and expression.startswith("$"):
+            value = InMemoryQueryUtil.get_path(document, expression[1:])
+            return None if value is MISSING else value
+
+        if isinstance(expression, dict):
+            if expression == {"$meta": "textScore"}:
+                return document.get(TEXT_SCORE_FIELD)
+            if set(expression) == {"$toString"}:
+                value = InMemoryQueryUtil.evaluate_expression(document, expression["$toString"])
+                if value is not None and not isinstance(value, (str, ObjectId, int, float)):
+                    raise NotImplementedError(
+                        f"$toString of {type(value).__name__} is not supported by the in-memory backend"
+                    )
+                return None if value is None else str(value)
+            if any(key.startswith("$") for key in expression):
+                raise NotImplementedError(f"Expression {expression} is not supported by the in-memory backend")
+            return {key: InMemoryQueryUtil.evaluate_expression(document, value) for key, value in expression.items()}
+
+        return expression
+
+    @staticmethod
+    def _group(documents: List[dict[str, Any]], group_spec: dict[str, Any]) -> List[dict[str, Any]]:
+        groups: dict[Tuple[Any, ...], dict[str, Any]] = {}
+        group_counts: dict[Tuple[Any, ...], int] = {}
+
+        for document in documents:
+            group_id = InMemoryQueryUtil.evaluate_expression(document, group_spec["_id"])
+            group_key = InMemoryQueryUtil.sort_key(group_id)
+            group = groups.setdefault(group_key, {"_id": group_id})
+            group_counts[group_key] = group_counts.get(group_key, 0) + 1
+
+            for field, accumulator in group_spec.items():
+                if field == "_id":
+                    continue
+
+                ((operator, expression),) = accumulator.items()
+                value = InMemoryQueryUtil.evaluate_expression(document, expression)
+                current_value = group.get(field, MISSING)
+
+                if operator in ("$sum", "$avg"):
+                    number = value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
+                    group[field] = (0 if current_value is MISSING else current_value) + number
+                elif operator == "$first":
+                    group.setdefault(field, value)
+                elif operator == "$last":
+                    group[field] = value
+                elif operator == "$push":
+                    group.setdefault(field, []).append(value)
+                elif operator in ("$min", "$max"):
+                    if value is None:
+                        group.setdefault(field, None)
+                    elif current_value in (MISSING, None) or (
+                        InMemoryQueryUtil.sort_key(value) < InMemoryQueryUtil.sort_key(current_value)
+                        if operator == "$min"
+                        else InMemoryQueryUtil.sort_key(value) > InMemoryQueryUtil.sort_key(current_value)
+                    ):
+                        group[field] = value
+                else:
+                    raise NotImplementedError(f"Accumulator {operator} is not supported by the in-memory backend")
+
+        for group_key, group in groups.items():
+            for field, accumulator in group_spec.items():
+                if field != "_id" and "$avg" in accumulator:
+                    group[field] = group[field] / group_counts[group_key]
+
+        return list(groups.values())
+
+    @staticmethod
+    def _match_text(
+        documents: List[dict[str, Any]], match_spec: dict[str, Any], text_index_weights: Optional[dict[str, int]]
+    ) -> List[dict[str, Any]]:
+        """
+        Approximates Mongo's $text: words are lowercased, stop words dropped and common English suffixes stripped, and
+        a document's score is the weighted number of its words that match a search word. Phrases and negated words are
+        not supported.
+        """
+        if text_index_weights is None:
+            raise OperationFailure("text index required for $text query", code=27)
+
+        text_spec = match_spec["$text"]
+        search = text_spec["$search"]
+        if set(text_spec) != {"$search"} or '"' in search or any(word.startswith("-") for word in search.split()):
+            raise NotImplementedError(f"$text query {text_spec} is not supported by the in-memory backend")
+
+        search_words = set(InMemoryQueryUtil._tokenize_text(search))
+        filter_query = {key: value for key, value in match_spec.items() if key != "$text"}
+        matched_documents = []
+        for document in documents:
+            if not InMemoryQueryUtil.matches(document, filter_query):
+                continue
+
+            score = 0
+            for field, weight in text_index_weights.items():
+                value = InMemoryQueryUtil.get_path(document, field)
+                if isinstance(value, str):
+                    score += weight * sum(1 for word in InMemoryQueryUtil._tokenize_text(value) if word in search_words)
+
+            if score:
+                document[TEXT_SCORE_FIELD] = float(score)
+                matched_documents.append(document)
+
+        return matched_documents
+
+    @staticmethod
+    def _tokenize_text(text: str) -> List[str]:
+        words = []
+        for word in re.findall(r"\w+", text.lower()):
+            if word in TEXT_STOP_WORDS:
+                continue
+            for suffix in ("ing", "ed", "es", "s", "e"):
+                if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                    word = word[: -len(suffix)]
+                    break
+            words.append(word)
+        return words
+
+    @staticmethod
+    def _lookup(
+        documents: List[dict[str, Any]],
+        lookup_spec: dict[str, Any],
+        get_collection_documents: Callable[[str], List[dict[str, Any]]],
+    ) -> List[dict[str, Any]]:
+        unsupported_options = set(lookup_spec) - {"from", "localField", "foreignField", "pipeline", "as"}
+        if unsupported_options:
+            raise NotImplementedError(
+                f"$lookup options {sorted(unsupported_options)} are not supported by the in-memory backend"
+            )
+
+        foreign_documents = get_collection_documents(lookup_spec["from"])
+        for document in documents:
+            joined_documents = foreign_documents
+            if "localField" in lookup_spec:
+                local_value = InMemoryQueryUtil.get_path(document, lookup_spec["localField"])
+                joined_documents = [
+                    foreign_document
+                    for foreign_document in foreign_documents
+                    if InMemoryQueryUtil._equals_or_contains(
+                        InMemoryQueryUtil.get_path(foreign_document, lookup_spec["foreignField"]),
+                        None if local_value is MISSING else local_value,
+                    )
+                ]
+            InMemoryQueryUtil.set_path(
+                document,
+                lookup_spec["as"],
+                InMemoryQueryUtil.aggregate(
+                    joined_documents, lookup_spec.get("pipeline", []), get_collection_documents
+                ),
+            )
+
+        return documents
+
+    @staticmethod
+    def _unwind(documents: List[dict[str, Any]], unwind_spec: Any) -> List[dict[str, Any]]:
+        if isinstance(unwind_spec, str):
+            unwind_spec = {"path": unwind_spec}
+        path = unwind_spec["path"][1:]
+        preserve_empty = unwind_spec.get("preserveNullAndEmptyArrays", False)
+
+        unwound_documents = []
+        for document in documents:
+            value = InMemoryQueryUtil.get_path(document, path)
+            if isinstance(value, list) and value:
+                for item in value:
+                    unwound_document = copy.deepcopy(document)
+                    InMemoryQueryUtil.set_path(unwound_document, path, item)
+                    unwound_documents.append(unwound_document)
+            elif isinstance(value, list) or value is MISSING or value is None:
+                if preserve_empty:
+                    # Mongo drops an empty array from the document it preserves but keeps a null
+                    if isinstance(value, list):
+                        InMemoryQueryUtil.unset_path(document, path)
+                    unwound_documents.append(document)
+            else:
+                unwound_documents.append(document)
+
+        return unwound_documents
+
+    @staticmethod
+    def _build_field_sort_key(path: str) -> Callable[[dict[str, Any]], Tuple[Any, ...]]:
+        return lambda document: InMemoryQueryUtil.sort_key(InMemoryQueryUtil.get_path(document, path))
+
+    @staticmethod
+    def is_operator_condition(condition: Any) -> bool:
+        return isinstance(condition, dict) and bool(condition) and all(key.startswith("$") for key in condition)
+
+    @staticmethod
+    def _matches_condition(value: Any, condition: Any) -> bool:
+        if isinstance(condition, re.Pattern):
+            return InMemoryQueryUtil._matches_regex(value, condition)
+
+        if not InMemoryQueryUtil.is_operator_condition(condition):
+            return InMemoryQueryUtil._equals_or_contains(value, condition)
+
+        return all(
+            InMemoryQueryUtil._apply_operator(operator, value, argument, condition)
+            for operator, argument in condition.items()
+            if operator != "$options"
+        )
+
+    @staticmethod
+    def _apply_operator(operator: str, value: Any, argument: Any, condition: dict[str, Any]) -> bool:
+        if operator == "$eq":
+            return InMemoryQueryUtil._equals_or_contains(value, argument)
+        if operator == "$ne":
+            return not InMemoryQueryUtil._equals_or_contains(value, argument)
+        if operator in ("$gt", "$gte", "$lt", "$lte"):
+            candidates = value if isinstance(value, list) else [value]
+            return any(
+                InMemoryQueryUtil._compare(operator, candidate, argument)
+                for candidate in candidates
+                if candidate is not MISSING
+            )
+        if operator == "$in":
+            return any(InMemoryQueryUtil._matches_condition(value, item) for item in argument)
+        if operator == "$nin":
+            return not any(InMemoryQueryUtil._matches_condition(value, item) for item in argument)
+        if operator == "$exists":
+            return (value is not MISSING) == bool(argument)
+        if operator == "$regex":
+            flags = re.IGNORECASE if "i" in condition.get("$options", "") else 0
+            return InMemoryQueryUtil._matches_regex(value, re.compile(argument, flags))
+        if operator == "$not":
+            return not InMemoryQueryUtil._matches_condition(value, argument)
+        if operator == "$size":
+            return isinstance(value, list) and len(value) == argument
+        if operator == "$all":
+            return isinstance(value, list) and all(
+                InMemoryQueryUtil._equals_or_contains(value, item) for item in argument
+            )
+        if operator == "$elemMatch":
+            return isinstance(value, list) and any(
+                (
+                    InMemoryQueryUtil.matches(item, argument)
+                    if isinstance(item, dict)
+                    else InMemoryQueryUtil._matches_condition(item, argument)
+                )
+                for item in value
+            )
+
+        raise NotImplementedError(f"Query operator {operator} is not supported by the in-memory backend")
+
+    @staticmethod
+    def _compare(operator: str, value: Any, argument: Any) -> bool:
+        value_key = InMemoryQueryUtil.sort_key(value)
+        argument_key = InMemoryQueryUtil.sort_key(argument)
+
+        # Mongo only compares values of the same BSON type
+        if value_key[0] != argument_key[0]:
+            return False
+
+        if operator == "$gt":
+            return value_key > argument_key
+        if operator == "$gte":
+            return value_key >= argument_key
+        if operator == "$lt":
+            return value_key < argument_key
+        return value_key <= argument_key
+
+    @staticmethod
+    def _equals_or_contains(value: Any, expected: Any) -> bool:
+        if value is MISSING:
+            return expected is None
+
+        expected_key = InMemoryQueryUtil.sort_key(expected)
+        if InMemoryQueryUtil.sort_key(value) == expected_key:
+            return True
+
+        return isinstance(value, list) and any(InMemoryQueryUtil.sort_key(item) == expected_key for item in value)
+
+    @staticmethod
+    def _matches_regex(value: Any, pattern: re.Pattern) -> bool:
+        candidates = value if isinstance(value, list) else [value]
+        return any(isinstance(candidate, str) and pattern.search(candidate) is not None for candidate in candidates)
@@ -0,0 +1,34 @@
+from typing import Any, List, Tuple
+
+# Options Mongo fills in for a text index when the declaration leaves them out
+TEXT_INDEX_DEFAULT_OPTIONS = {"default_language": "english", "language_override": "language", "textIndexVersion": 3}
+
+
+class IndexUtil:
+    @staticmethod
+    def to_live_index(declared_index: dict[str, Any]) -> Tuple[List[Tuple[str, Any]], dict[str, Any]]:
+        """
+        Returns the keys and options index_information() reports for a declared index document. Mongo stores the
+        fields of a text index as weights under the _fts/_ftsx keys, which sit where the first text field was declared.
+        """
+        keys = list(declared_index["key"].items())
+        options = {name: value for name, value in declared_index.items() if name not in ("key", "name")}
+
+        text_fields = [name for name, kind in keys if kind == "text"]
+        if not text_fields:
+            return keys, options
+
+        first_text_key_index = keys.index((text_fields[0], "text"))
+        live_keys = [
+            *keys[:first_text_key_index],
+            ("_fts", "text"),
+            ("_ftsx", 1),
+            *[key for key in keys[first_text_key_index:] if key[1] != "text"],
+        ]
+        declared_weights = options.get("weights", {})
+        live_options = {
+            **TEXT_INDEX_DEFAULT_OPTIONS,
+            **options,
+            "weights": {name: declared_weights.get(name, 1) for name in text_fields},
+        }
+        return live_keys, live_options
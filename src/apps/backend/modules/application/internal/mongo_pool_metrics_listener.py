@@ -0,0 +1,93 @@
+import threading
+
+from pymongo import monitoring
+
+from modules.application.common.types import MongoPoolMetrics
+from modules.logger.logger import Logger
+
+
+class MongoPoolMetricsListener(monitoring.ConnectionPoolListener):
+    """
+    Tracks how long requests wait to check a connection out of the pool and how many connections are in use.
+    The same listener serves the sync and the async client, so waits come from the event durations rather than
+    from timers kept per thread.
+    """
+
+    def __init__(self, *, slow_checkout_threshold_ms: float) -> None:
+        self.slow_checkout_threshold_ms = slow_checkout_threshold_ms
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._checkout_failures = 0
+        self._connections_in_use = 0
+        self._max_connections_in_use = 0
+        self._total_checkout_wait_ms = 0.0
+        self._max_checkout_wait_ms = 0.0
+
+    def get_metrics(self) -> MongoPoolMetrics:
+        with self._lock:
+            return MongoPoolMetrics(
+                checkouts=self._checkouts,
+                checkout_failures=self._checkout_failures,
+                connections_in_use=self._connections_in_use,
+                max_connections_in_use=self._max_connections_in_use,
+                total_checkout_wait_ms=self._total_checkout_wait_ms,
+                max_checkout_wait_ms=self._max_checkout_wait_ms,
+            )
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        wait_ms = self._get_duration_ms(event)
+        with self._lock:
+            self._checkouts += 1
+            self._connections_in_use += 1
+            self._max_connections_in_use = max(self._max_connections_in_use, self._connections_in_use)
+            self._total_checkout_wait_ms += wait_ms
+            self._max_checkout_wait_ms = max(self._max_checkout_wait_ms, wait_ms)
+            connections_in_use = self._connections_in_use
+
+        if wait_ms >= self.slow_checkout_threshold_ms:
+            Logger.warn(
+                message=f"slow mongodb connection checkout from {event.address} - waited {wait_ms:.1f}ms "
+                f"with {connections_in_use} connections in use"
+            )
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        wait_ms = self._get_duration_ms(event)
+        with self._lock:
+            self._checkout_failures += 1
+            connections_in_use = self._connections_in_use
+
+        Logger.error(
+            message=f"mongodb connection checkout from {event.address} failed ({event.reason}) after {wait_ms:.1f}ms "
+            f"with {connections_in_use} connections in use"
+        )
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._connections_in_use = max(self._connections_in_use - 1, 0)
+
+    @staticmethod
+    def _get_duration_ms(
+        event: monitoring.ConnectionCheckedOutEvent | monitoring.ConnectionCheckOutFailedEvent,
+    ) -> float:
+        return event.duration * 1000 if event.duration is not None else 0.0
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        pass
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        pass
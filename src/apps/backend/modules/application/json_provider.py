@@ -0,0 +1,103 @@
+import dataclasses
+import json
+import re
+from json.encoder import encode_basestring_ascii  # type: ignore[attr-defined]
+from typing import Any, cast
+
+import orjson
+from bson.objectid import ObjectId
+from flask.json.provider import DefaultJSONProvider, _default
+from flask.wrappers import Response
+
+COMPACT_SEPARATORS = (",", ":")
+NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7f]+")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider encoding and decoding with orjson. Dataclasses are read field by field instead of deep copied with
+    asdict, natively when keys are not sorted, since orjson does not sort dataclass fields. Output is byte for byte
+    what DefaultJSONProvider writes for compact responses: keys sorted, datetimes as HTTP dates and non-ASCII text
+    escaped, which orjson does not do, so it is escaped on the orjson output.
+    Floats below 1e-4 or from 1e16 up are written in another, equal notation. ObjectIds are written as strings.
+
+    Formatted (debug mode, compact=False) output and calls with other json.dumps arguments go through json as before.
+    """
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        # Quart apps share this provider and build their own response class from the same arguments
+        return cast(Response, self._app.response_class(self._dumps_compact(obj) + b"\n", mimetype=self.mimetype))
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs == {"separators": COMPACT_SEPARATORS}:
+            return self._dumps_compact(obj).decode("ascii")
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # json accepts NaN and Infinity and raises the errors callers already handle
+            return json.loads(s)
+
+    def _dumps_compact(self, obj: Any) -> bytes:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            encoded = orjson.dumps(obj, default=self.default, option=option)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits and objects no default handles; json either encodes them or raises as before
+            encoded = None
+
+        if encoded is None:
+            return json.dumps(
+                obj,
+                default=self.default,
+                ensure_ascii=self.ensure_ascii,
+                sort_keys=self.sort_keys,
+                separators=COMPACT_SEPARATORS,
+            ).encode()
+        if self.ensure_ascii and not encoded.isascii():
+            return FastJSONProvider._escape_non_ascii(encoded)
+        return encoded
+
+    @staticmethod
+    def _escape_non_ascii(encoded: bytes) -> bytes:
+        # Non-ASCII text only occurs inside strings, so it is escaped piece by piece between quotes instead of
+        # encoding the whole payload again
+        return b'"'.join(FastJSONProvider._escape_non_ascii_piece(piece) for piece in encoded.split(b'"'))
+
+    @staticmethod
+    def _escape_non_ascii_piece(piece: bytes) -> bytes:
+        if piece.isascii():
+            return piece
+        text = piece.decode()
+        if "\\" in text:
+            # A piece holding escapes, such as one cut at an escaped quote, only has its non-ASCII runs escaped
+            return NON_ASCII_PATTERN.sub(FastJSONProvider._escape_non_ascii_match, text).encode()
+        return FastJSONProvider._escape_text(text).encode()
+
+    @staticmethod
+    def _escape_non_ascii_match(match: re.Match[str]) -> str:
+        return FastJSONProvider._escape_text(match.group())
+
+    @staticmethod
+    def _escape_text(text: str) -> str:
+        # Only given text without quotes, backslashes or control characters, so only non-ASCII characters are escaped
+        return cast(str, encode_basestring_ascii(text))[1:-1]
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, ObjectId):
+            return str(o)
+        if dataclasses.is_dataclass(o) and not isinstance(o, type):
+            # Nested dataclasses come back through default, so a shallow dict serializes like asdict
+            return {field.name: getattr(o, field.name) for field in dataclasses.fields(o)}
+        return _default(o)
@@ -0,0 +1,63 @@
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+
+class NDJSONLineSplitter:
+    """
+    Splits an NDJSON body fed in chunks of any size into its lines, newline excluded, so a body can be read as it
+    arrives instead of in full. A line is only held until its newline arrives, and a line longer than max_line_bytes
+    is cut down to max_line_bytes + 1 bytes, the rest of it discarded as it comes in, so callers can reject it by its
+    length without the splitter ever buffering more than one line limit.
+    """
+
+    def __init__(self, max_line_bytes: int) -> None:
+        self._max_line_bytes = max_line_bytes
+        self._buffer = bytearray()
+        self._is_discarding = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        lines = []
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            lines.append(self._take_line(chunk[start:end]))
+            start = end + 1
+        self._append(chunk[start:])
+        return lines
+
+    def finish(self) -> List[bytes]:
+        """
+        Returns the last line of a body that does not end with a newline.
+        """
+        if not self._buffer:
+            return []
+        return [self._take_line(b"")]
+
+    def _take_line(self, line_end: bytes) -> bytes:
+        self._append(line_end)
+        line = bytes(self._buffer) if self._is_discarding else bytes(self._buffer).removesuffix(b"\r")
+        self._buffer.clear()
+        self._is_discarding = False
+        return line
+
+    def _append(self, data: bytes) -> None:
+        if self._is_discarding:
+            return
+        self._buffer += data
+        if len(self._buffer) > self._max_line_bytes:
+            del self._buffer[self._max_line_bytes + 1 :]
+            self._is_discarding = True
+
+
+def split_ndjson_lines(chunks: Iterable[bytes], max_line_bytes: int) -> Iterator[bytes]:
+    splitter = NDJSONLineSplitter(max_line_bytes)
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.finish()
+
+
+async def async_split_ndjson_lines(chunks: AsyncIterable[bytes], max_line_bytes: int) -> AsyncIterator[bytes]:
+    splitter = NDJSONLineSplitter(max_line_bytes)
+    async for chunk in chunks:
+        for line in splitter.feed(chunk):
+            yield line
+    for line in splitter.finish():
+        yield line
@@ -1,63 +1,554 @@
-from abc import ABC, abstractmethod
-from typing import Optional
+import asyncio
+import base64
+import os
+import threading
+from abc import ABC
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterator, List, Optional, cast
 
-from pymongo import MongoClient
+import bson
+from bson.errors import BSONError
+from bson.timestamp import Timestamp
+from pymongo import AsyncMongoClient, IndexModel, MongoClient
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred, _ServerMode
 from pymongo.server_api import ServerApi
 
+from modules.application.common.constants import IN_MEMORY_BACKEND, MONGODB_BACKEND
+from modules.application.common.types import CollectionProvisioningResult, MongoPoolMetrics
+from modules.application.errors import (
+    InvalidConsistencyTokenError,
+    InvalidReadPreferenceError,
+    InvalidRepositoryBackendError,
+)
+from modules.application.internal.in_memory_database import (
+    AsyncInMemoryCollection,
+    InMemoryCollection,
+    InMemoryDatabase,
+)
+from modules.application.internal.index_util import IndexUtil
+from modules.application.internal.mongo_pool_metrics_listener import MongoPoolMetricsListener
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
+SECONDARY_READ_PREFERENCE_MODES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+# The causally consistent session of the request being served, see ApplicationRepositoryClient.start_causal_session
+_causal_session: ContextVar[Optional[ClientSession]] = ContextVar("causal_session", default=None)
+_async_causal_session: ContextVar[Optional[AsyncClientSession]] = ContextVar("async_causal_session", default=None)
+
 
 class ApplicationRepositoryClient:
+    """
+    Owns the single MongoClient (and so the single connection pool) of the current process.
+    MongoClient is not fork-safe, so a client inherited from the parent process is dropped after a fork and the
+    child lazily opens its own. Pool sizing, wait queue timeout and wire compressors come from the mongodb config.
+    With mongodb.backend set to memory no client is opened and repositories use a process-local InMemoryDatabase.
+    """
+
+    _backend: Optional[str] = None
+    _in_memory_database: Optional[InMemoryDatabase] = None
     _client: Optional[MongoClient] = None
+    _client_lock = threading.Lock()
+    _pool_metrics_listener: Optional[MongoPoolMetricsListener] = None
+    _read_preferences: dict[str, _ServerMode] = {}
 
     @classmethod
     def get_client(cls) -> MongoClient:
-        connection_caching = ConfigService[bool].get_value(key="mongodb.connection_caching")
+        client = cls._client
+        if client is not None:
+            return client
 
-        if connection_caching:
+        # gthread workers can race on the first request, so only one of them creates the client
+        with cls._client_lock:
             if cls._client is None:
                 cls._client = cls._create_client()
 
             return cls._client
 
+    @classmethod
+    def get_backend(cls) -> str:
+        if cls._backend is None:
+            backend = ConfigService[str].get_value(key="mongodb.backend", default=MONGODB_BACKEND)
+            if backend not in (MONGODB_BACKEND, IN_MEMORY_BACKEND):
+                raise InvalidRepositoryBackendError(backend=backend)
+            cls._backend = backend
+
+        return cls._backend
+
+    @classmethod
+    def get_in_memory_database(cls) -> InMemoryDatabase:
+        if cls._in_memory_database is None:
+            with cls._client_lock:
+                if cls._in_memory_database is None:
+                    cls._in_memory_database = InMemoryDatabase(name="in-memory")
+
+        return cls._in_memory_database
+
+    @classmethod
+    def get_pool_metrics(cls) -> MongoPoolMetrics:
+        cls.get_client()
+        assert cls._pool_metrics_listener is not None
+        return cls._pool_metrics_listener.get_metrics()
+
+    @classmethod
+    def get_read_preference(cls, name: str) -> _ServerMode:
+        """
+        Returns the read preference configured under mongodb.read_preferences.<name>, primary when none is configured.
+        maxStalenessSeconds bounds how far behind the primary a secondary may be to still serve the read.
+        """
+        read_preference = cls._read_preferences.get(name)
+        if read_preference is not None:
+            return read_preference
+
+        mode = ConfigService[str].get_value(key=f"mongodb.read_preferences.{name}.mode", default="primary")
+        if mode == "primary":
+            read_preference = Primary()
+        elif mode in SECONDARY_READ_PREFERENCE_MODES:
+            max_staleness_seconds = int(
+                ConfigService[int].get_value(key=f"mongodb.read_preferences.{name}.max_staleness_seconds", default=-1)
+            )
+            read_preference = SECONDARY_READ_PREFERENCE_MODES[mode](max_staleness=max_staleness_seconds)
         else:
-            return cls._create_client()
+            raise InvalidReadPreferenceError(name=name, mode=mode)
+
+        cls._read_preferences[name] = read_preference
+        return read_preference
+
+    @classmethod
+    @contextmanager
+    def start_causal_session(cls, consistency_token: Optional[str] = None) -> Iterator[Optional[ClientSession]]:
+        """
+        Runs the enclosed repository operations in one causally consistent session. Reads wait until the node they
+        are routed to has applied every write the consistency token covers, so a client reading from a secondary
+        still sees its own writes. The in-memory backend is always consistent, so it only validates the token and
+        yields no session.
+        """
+        if cls.get_backend() == IN_MEMORY_BACKEND:
+            if consistency_token:
+                cls.decode_consistency_token(consistency_token)
+            yield None
+            return
+
+        session = cls.get_client().start_session(causal_consistency=True)
+        try:
+            if consistency_token:
+                cluster_time, operation_time = cls.decode_consistency_token(consistency_token)
+                session.advance_cluster_time(cluster_time)
+                session.advance_operation_time(operation_time)
+
+            context_token = _causal_session.set(session)
+            try:
+                yield session
+            finally:
+                _causal_session.reset(context_token)
+        finally:
+            session.end_session()
+
+    @staticmethod
+    def get_causal_session() -> Optional[ClientSession]:
+        return _causal_session.get()
 
     @staticmethod
-    def _create_client() -> MongoClient:
+    def get_consistency_token(session: Optional[ClientSession | AsyncClientSession]) -> Optional[str]:
+        """
+        Encodes the operation time reached by the session, None when the server reports none (standalone servers).
+        """
+        if session is None or session.operation_time is None or session.cluster_time is None:
+            return None
+
+        token_document = {"clusterTime": session.cluster_time, "operationTime": session.operation_time}
+        return base64.urlsafe_b64encode(bson.encode(token_document)).decode("utf-8")
+
+    @staticmethod
+    def decode_consistency_token(consistency_token: str) -> tuple[dict[str, Any], Timestamp]:
+        try:
+            token_document = bson.decode(base64.urlsafe_b64decode(consistency_token.encode("utf-8")))
+            cluster_time, operation_time = token_document["clusterTime"], token_document["operationTime"]
+        except (ValueError, KeyError, TypeError, BSONError):
+            raise InvalidConsistencyTokenError()
+
+        if not isinstance(operation_time, Timestamp) or not isinstance(cluster_time, dict):
+            raise InvalidConsistencyTokenError()
+
+        return cluster_time, operation_time
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        # The parent's client shares sockets with the parent, so it is dropped rather than closed
+        cls._client = None
+        cls._client_lock = threading.Lock()
+        cls._pool_metrics_listener = None
+
+    @classmethod
+    def _create_client(cls) -> MongoClient:
         connection_uri = ConfigService[str].get_value(key="mongodb.uri")
+        pool_metrics_listener = cls.create_pool_metrics_listener()
+
         Logger.info(message=f"connecting to database - {connection_uri}")
-        client = MongoClient(connection_uri, server_api=ServerApi("1"))
+        client: MongoClient = MongoClient(
+            connection_uri, server_api=ServerApi("1"), event_listeners=[pool_metrics_listener], **cls.get_pool_options()
+        )
         Logger.info(message=f"connected to database - {connection_uri}")
 
+        cls._pool_metrics_listener = pool_metrics_listener
+        return client
+
+    @staticmethod
+    def create_pool_metrics_listener() -> MongoPoolMetricsListener:
+        return MongoPoolMetricsListener(
+            slow_checkout_threshold_ms=float(
+                ConfigService[float].get_value(key="mongodb.pool.slow_checkout_threshold_ms", default=100)
+            )
+        )
+
+    @staticmethod
+    def get_pool_options() -> dict[str, Any]:
+        pool_options: dict[str, Any] = {
+            "maxPoolSize": int(ConfigService[int].get_value(key="mongodb.pool.max_size", default=100)),
+            "minPoolSize": int(ConfigService[int].get_value(key="mongodb.pool.min_size", default=0)),
+        }
+
+        if ConfigService.has_value("mongodb.pool.wait_queue_timeout_ms"):
+            pool_options["waitQueueTimeoutMS"] = int(
+                ConfigService[int].get_value(key="mongodb.pool.wait_queue_timeout_ms")
+            )
+
+        # Environment variables arrive as strings, hence the casts and the comma separated compressors form
+        compressors = ConfigService[Any].get_value(key="mongodb.compressors", default=[])
+        if isinstance(compressors, str):
+            compressors = [compressor.strip() for compressor in compressors.split(",") if compressor.strip()]
+        if compressors:
+            pool_options["compressors"] = ",".join(compressors)
+
+        return pool_options
+
+
+class AsyncApplicationRepositoryClient:
+    """
+    Owns the AsyncMongoClient used by the ASGI app, configured like the sync client. An AsyncMongoClient belongs to
+    the event loop it was first used on, so a new one is opened when the running loop changes and the previous one
+    is closed.
+    """
+
+    _client: Optional[AsyncMongoClient] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    _pool_metrics_listener: Optional[MongoPoolMetricsListener] = None
+    # Holds the tasks closing clients of previous loops until they finish, the event loop only keeps weak references
+    _closing_tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def get_client(cls) -> AsyncMongoClient:
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client_loop is not loop:
+            if cls._client is not None:
+                cls._close_previous_client(client=cls._client, client_loop=cls._client_loop, loop=loop)
+            cls._client = cls._create_client()
+            cls._client_loop = loop
+
+        return cls._client
+
+    @classmethod
+    def get_pool_metrics(cls) -> MongoPoolMetrics:
+        cls.get_client()
+        assert cls._pool_metrics_listener is not None
+        return cls._pool_metrics_listener.get_metrics()
+
+    @classmethod
+    @asynccontextmanager
+    async def start_causal_session(
+        cls, consistency_token: Optional[str] = None
+    ) -> AsyncIterator[Optional[AsyncClientSession]]:
+        """
+        Async counterpart of ApplicationRepositoryClient.start_causal_session, accepting the same consistency tokens.
+        """
+        if ApplicationRepositoryClient.get_backend() == IN_MEMORY_BACKEND:
+            if consistency_token:
+                ApplicationRepositoryClient.decode_consistency_token(consistency_token)
+            yield None
+            return
+
+        session = cls.get_client().start_session(causal_consistency=True)
+        try:
+            if consistency_token:
+                cluster_time, operation_time = ApplicationRepositoryClient.decode_consistency_token(consistency_token)
+                session.advance_cluster_time(cluster_time)
+                session.advance_operation_time(operation_time)
+
+            context_token = _async_causal_session.set(session)
+            try:
+                yield session
+            finally:
+                _async_causal_session.reset(context_token)
+        finally:
+            await session.end_session()
+
+    @staticmethod
+    def get_causal_session() -> Optional[AsyncClientSession]:
+        return _async_causal_session.get()
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._client is not None:
+            await cls._client.close()
+
+        cls._client = None
+        cls._client_loop = None
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        cls._client = None
+        cls._client_loop = None
+        cls._pool_metrics_listener = None
+
+    @classmethod
+    def _close_previous_client(
+        cls,
+        *,
+        client: AsyncMongoClient,
+        client_loop: Optional[asyncio.AbstractEventLoop],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """
+        Closes the client of a previous event loop on that loop while it still runs. Once it has stopped, the client
+        is closed from the running loop instead, which drops the connections the stopped loop can no longer close.
+        """
+        if client_loop is not None and client_loop.is_running():
+            asyncio.run_coroutine_threadsafe(cls._close_client(client), client_loop)
+            return
+
+        task = loop.create_task(cls._close_client(client))
+        cls._closing_tasks.add(task)
+        task.add_done_callback(cls._closing_tasks.discard)
+
+    @staticmethod
+    async def _close_client(client: AsyncMongoClient) -> None:
+        try:
+            await client.close()
+        except Exception as e:
+            Logger.error(message=f"Could not close the database client of a previous event loop: {e}")
+
+    @classmethod
+    def _create_client(cls) -> AsyncMongoClient:
+        connection_uri = ConfigService[str].get_value(key="mongodb.uri")
+        pool_metrics_listener = ApplicationRepositoryClient.create_pool_metrics_listener()
+
+        Logger.info(message=f"connecting to database asynchronously - {connection_uri}")
+        client: AsyncMongoClient = AsyncMongoClient(
+            connection_uri,
+            server_api=ServerApi("1"),
+            event_listeners=[pool_metrics_listener],
+            **ApplicationRepositoryClient.get_pool_options(),
+        )
+
+        cls._pool_metrics_listener = pool_metrics_listener
         return client
 
 
+os.register_at_fork(after_in_child=ApplicationRepositoryClient.reset_after_fork)
+os.register_at_fork(after_in_child=AsyncApplicationRepositoryClient.reset_after_fork)
+
+
 class ApplicationRepository(ABC):
     _collection: Optional[Collection] = None
+    _async_collection: Optional[AsyncCollection] = None
+
+    # Read preference of reads that do not choose one, see ApplicationRepositoryClient.get_read_preference
+    read_preference: _ServerMode = Primary()
+
+    # Declared indexes and validator, applied ahead of deploys by scripts/provision_collections.py
+    indexes: List[IndexModel] = []
+    validator: Optional[dict[str, Any]] = None
 
-    @property
-    @abstractmethod
-    def collection_name(self) -> str:
-        """Return collection name of the Repository"""
-        pass
+    # Set by every repository; declared as a plain attribute so the typed driver can index databases with it
+    collection_name: str
 
     @classmethod
-    def collection(cls) -> Collection:
-        if cls._collection is None:
-            client = ApplicationRepositoryClient.get_client()
+    def collection(cls, read_preference: Optional[_ServerMode] = None) -> Collection:
+        """
+        Returns the collection bound to the repository's read preference, or to read_preference for a single read.
+        """
+        if ApplicationRepositoryClient.get_backend() == IN_MEMORY_BACKEND:
+            return cast(Collection, cls._get_in_memory_collection(read_preference))
+
+        client = ApplicationRepositoryClient.get_client()
+
+        # A collection cached before a fork belongs to the parent's client, so it is rebound to this process' client
+        if cls._collection is None or cls._collection.database.client is not client:
+            is_first_use = cls._collection is None
             database = client.get_database()
             collection = database[cls.collection_name]
 
-            # init hook
-            cls.on_init_collection(collection)
+            # init hook, only enabled where no provisioning step runs before the app (development and tests)
+            if is_first_use and ConfigService[bool].get_value(
+                key="mongodb.provision_collections_on_init", default=False
+            ):
+                cls.on_init_collection(collection)
+
+            cls._collection = collection.with_options(read_preference=cls.read_preference)
 
-            cls._collection = collection
+        if read_preference is None or read_preference == cls._collection.read_preference:
+            return cls._collection
 
-        return cls._collection
+        return cls._collection.with_options(read_preference=read_preference)
+
+    @classmethod
+    def async_collection(cls, read_preference: Optional[_ServerMode] = None) -> AsyncCollection:
+        """
+        Async counterpart of collection(). Collections are provisioned by the sync client, so no init hook runs here.
+        """
+        if ApplicationRepositoryClient.get_backend() == IN_MEMORY_BACKEND:
+            return cast(AsyncCollection, AsyncInMemoryCollection(cls._get_in_memory_collection(read_preference)))
+
+        client = AsyncApplicationRepositoryClient.get_client()
+
+        if cls._async_collection is None or cls._async_collection.database.client is not client:
+            cls._async_collection = client.get_database()[cls.collection_name].with_options(
+                read_preference=cls.read_preference
+            )
+
+        if read_preference is None or read_preference == cls._async_collection.read_preference:
+            return cls._async_collection
+
+        return cls._async_collection.with_options(read_preference=read_preference)
+
+    @classmethod
+    def _get_in_memory_collection(cls, read_preference: Optional[_ServerMode]) -> InMemoryCollection:
+        # Indexes are created with the collection so unique indexes hold; validators are not enforced in memory
+        collection = ApplicationRepositoryClient.get_in_memory_database().get_collection(
+            cls.collection_name, indexes=cls.indexes
+        )
+        return collection if read_preference is None else collection.with_options(read_preference=read_preference)
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
-        return False
+        try:
+            cls.provision_collection(collection.database)
+        except OperationFailure as e:
+            Logger.error(message=f"OperationFailure occurred for collection {collection.name}: {e.details}")
+            return False
+        return True
+
+    @classmethod
+    def provision_collection(cls, database: Database, dry_run: bool = False) -> CollectionProvisioningResult:
+        """
+        Brings the live collection in line with the declared validator and indexes and reports what differed.
+        Indexes whose definition changed are dropped and recreated; live indexes that are not declared are only
+        reported. With dry_run the differences are reported without touching the database.
+        """
+        collection = database[cls.collection_name]
+        collections_info = list(database.list_collections(filter={"name": collection.name}))
+        collection_created = not collections_info
+        live_validator = collections_info[0].get("options", {}).get("validator") if collections_info else None
+        # A new collection is created with the validator, so only an existing one can report a changed validator
+        validator_changed = not collection_created and cls.validator is not None and live_validator != cls.validator
+
+        if not dry_run:
+            if collection_created:
+                validator_options: dict[str, Any] = (
+                    {"validator": cls.validator, "validationLevel": "strict"} if cls.validator else {}
+                )
+                database.create_collection(collection.name, **validator_options)
+            elif validator_changed:
+                database.command({"collMod": collection.name, "validator": cls.validator, "validationLevel": "strict"})
+
+        live_indexes = {} if collection_created else collection.index_information()
+        created_indexes = []
+        recreated_indexes = []
+
+        for index_model in cls.indexes:
+            index_name = index_model.document["name"]
+            if index_name not in live_indexes:
+                created_indexes.append(index_name)
+            elif not ApplicationRepository._is_index_up_to_date(index_model.document, live_indexes[index_name]):
+                recreated_indexes.append(index_name)
+                if not dry_run:
+                    collection.drop_index(index_name)
+            else:
+                continue
+
+            if not dry_run:
+                collection.create_indexes([index_model])
+
+        declared_index_names = {index_model.document["name"] for index_model in cls.indexes}
+        undeclared_indexes = [name for name in live_indexes if name != "_id_" and name not in declared_index_names]
+
+        return CollectionProvisioningResult(
+            collection_name=collection.name,
+            collection_created=collection_created,
+            validator_changed=validator_changed,
+            created_indexes=created_indexes,
+            recreated_indexes=recreated_indexes,
+            undeclared_indexes=undeclared_indexes,
+        )
+
+    @staticmethod
+    def _is_index_up_to_date(declared_index: dict[str, Any], live_index: dict[str, Any]) -> bool:
+        declared_keys, declared_options = IndexUtil.to_live_index(declared_index)
+        live_keys = [tuple(key) for key in live_index["key"]]
+        live_options = {name: value for name, value in live_index.items() if name not in ("key", "v", "ns")}
+        return declared_keys == live_keys and declared_options == live_options
+
+    @classmethod
+    def insert_document(cls, document: dict[str, Any]) -> dict[str, Any]:
+        """
+        Inserts the document and returns it as it was stored, so writers can build their DTO without reading it back.
+        Mongo keeps datetimes with millisecond precision, so they are truncated to match what a later read returns.
+        """
+        stored_document = ApplicationRepository.to_stored_document(document)
+        result = cls.collection().insert_one(stored_document, session=ApplicationRepositoryClient.get_causal_session())
+        stored_document["_id"] = result.inserted_id
+        return stored_document
+
+    @classmethod
+    async def async_insert_document(cls, document: dict[str, Any]) -> dict[str, Any]:
+        stored_document = ApplicationRepository.to_stored_document(document)
+        result = await cls.async_collection().insert_one(
+            stored_document, session=AsyncApplicationRepositoryClient.get_causal_session()
+        )
+        stored_document["_id"] = result.inserted_id
+        return stored_document
+
+    @classmethod
+    def soft_delete_document(cls, filter_query: dict[str, Any], deleted_at: datetime) -> bool:
+        """
+        Deactivates the active document matching filter_query in a single conditional update.
+        Returns False when no active document matched, which callers report as not found.
+        """
+        result = cls.collection().update_one(
+            {**filter_query, "active": True},
+            {"$set": {"active": False, "updated_at": deleted_at}},
+            session=ApplicationRepositoryClient.get_causal_session(),
+        )
+        return bool(result.matched_count)
+
+    @classmethod
+    async def async_soft_delete_document(cls, filter_query: dict[str, Any], deleted_at: datetime) -> bool:
+        result = await cls.async_collection().update_one(
+            {**filter_query, "active": True},
+            {"$set": {"active": False, "updated_at": deleted_at}},
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        return bool(result.matched_count)
+
+    @staticmethod
+    def to_stored_document(document: dict[str, Any]) -> dict[str, Any]:
+        """
+        The document with its datetimes truncated as Mongo stores them, for writers inserting with insert_many.
+        """
+        return {
+            key: (value.replace(microsecond=value.microsecond // 1000 * 1000) if isinstance(value, datetime) else value)
+            for key, value in document.items()
+        }
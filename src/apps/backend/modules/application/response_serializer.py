@@ -0,0 +1,89 @@
+import typing
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
+from datetime import datetime
+from types import NoneType, UnionType
+from typing import Any, Callable, Optional, Tuple
+
+Serializer = Callable[[Any], dict[str, Any]]
+
+# Field types copied as they are; anything else may hold a dataclass and is walked when serialized
+SCALAR_TYPES = (str, int, float, bool, datetime, NoneType)
+
+# ?fields= projections come from clients, so the number of cached serializers is capped
+MAX_CACHED_SERIALIZERS = 256
+
+
+class ResponseSerializer:
+    """
+    Turns response DTOs into dicts like dataclasses.asdict, from a function generated once per DTO type (and per ?fields=
+    projection) that reads each field directly instead of deep copying every value. Fields typed as scalars are copied
+    as they are; the rest go through serialize_value, which serializes nested dataclasses, lists and dicts.
+
+    A DTO registered with fields only ever has those fields in its output, even when a projection asks for others, so
+    types holding secrets such as Account.hashed_password must be registered before they are returned from a view.
+    """
+
+    _allowed_fields: dict[type, Tuple[str, ...]] = {}
+    _serializers: dict[Tuple[type, Optional[Tuple[str, ...]]], Serializer] = {}
+
+    @staticmethod
+    def register(dto_type: type, *, fields: Tuple[str, ...]) -> None:
+        ResponseSerializer._allowed_fields[dto_type] = fields
+        ResponseSerializer._serializers.clear()
+
+    @staticmethod
+    def serialize(item: Any, fields: Optional[Tuple[str, ...]] = None) -> dict[str, Any]:
+        return ResponseSerializer.get_serializer(type(item), fields)(item)
+
+    @staticmethod
+    def serialize_value(value: Any) -> Any:
+        if is_dataclass(value) and not isinstance(value, type):
+            return ResponseSerializer.get_serializer(type(value))(value)
+        if isinstance(value, (list, tuple)):
+            return type(value)(ResponseSerializer.serialize_value(item) for item in value)
+        if isinstance(value, dict):
+            return {key: ResponseSerializer.serialize_value(item) for key, item in value.items()}
+        return value
+
+    @staticmethod
+    def get_serializer(dto_type: type, fields: Optional[Tuple[str, ...]] = None) -> Serializer:
+        serializer = ResponseSerializer._serializers.get((dto_type, fields))
+        if serializer is None:
+            if len(ResponseSerializer._serializers) >= MAX_CACHED_SERIALIZERS:
+                ResponseSerializer._serializers.clear()
+            serializer = ResponseSerializer._compile(dto_type, fields)
+            ResponseSerializer._serializers[(dto_type, fields)] = serializer
+        return serializer
+
+    @staticmethod
+    def _compile(dto_type: type, fields: Optional[Tuple[str, ...]]) -> Serializer:
+        allowed_fields = ResponseSerializer._allowed_fields.get(dto_type)
+        try:
+            field_types = typing.get_type_hints(dto_type)
+        except (NameError, TypeError):
+            field_types = {}
+
+        field_names = [field.name for field in dataclass_fields(dto_type)]
+        if fields is not None:
+            field_names = [name for name in fields if name in field_names]
+        if allowed_fields is not None:
+            field_names = [name for name in field_names if name in allowed_fields]
+
+        entries = []
+        for name in field_names:
+            value = f"item.{name}"
+            if not ResponseSerializer._is_scalar(field_types.get(name)):
+                value = f"serialize_value({value})"
+            entries.append(f"{name!r}: {value}")
+
+        source = f"def serialize(item):\n    return {{{', '.join(entries)}}}\n"
+        namespace: dict[str, Any] = {"serialize_value": ResponseSerializer.serialize_value}
+        exec(compile(source, f"<{dto_type.__qualname__} serializer>", "exec"), namespace)
+        return typing.cast(Serializer, namespace["serialize"])
+
+    @staticmethod
+    def _is_scalar(field_type: Any) -> bool:
+        if typing.get_origin(field_type) in (typing.Union, UnionType):
+            return all(ResponseSerializer._is_scalar(argument) for argument in typing.get_args(field_type))
+        return field_type in SCALAR_TYPES
@@ -0,0 +1,24 @@
+from functools import wraps
+from typing import Any, Callable
+
+from quart import make_response, request
+
+from modules.application.common.constants import CONSISTENCY_TOKEN_HEADER
+from modules.application.repository import ApplicationRepositoryClient, AsyncApplicationRepositoryClient
+
+
+def async_causal_consistency_middleware(next_func: Callable) -> Callable:
+    @wraps(next_func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        async with AsyncApplicationRepositoryClient.start_causal_session(
+            request.headers.get(CONSISTENCY_TOKEN_HEADER)
+        ) as session:
+            response = await make_response(await next_func(*args, **kwargs))
+
+        consistency_token = ApplicationRepositoryClient.get_consistency_token(session)
+        if consistency_token:
+            response.headers[CONSISTENCY_TOKEN_HEADER] = consistency_token
+
+        return response
+
+    return wrapper
@@ -0,0 +1,33 @@
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional
+
+from quart import make_response, request
+
+from modules.application.rest_api.conditional_get_middleware import CONDITIONAL_GET_CACHE_CONTROL, build_etag
+
+
+def async_conditional_get_middleware(
+    get_version: Callable[..., Awaitable[Optional[str]]]
+) -> Callable[[Callable], Callable]:
+    def decorator(next_func: Callable) -> Callable:
+        @wraps(next_func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            version = await get_version(request_args=request.args, **kwargs)
+            if version is None:
+                return await next_func(*args, **kwargs)
+
+            etag = build_etag(version=version, request_path=request.full_path)
+            if request.if_none_match.contains_weak(etag):
+                response = await make_response("", 304)
+            else:
+                response = await make_response(await next_func(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = CONDITIONAL_GET_CACHE_CONTROL
+            return response
+
+        return wrapper
+
+    return decorator
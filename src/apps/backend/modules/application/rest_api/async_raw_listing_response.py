@@ -0,0 +1,17 @@
+from typing import AsyncIterator
+
+from quart import current_app
+from quart.wrappers import Response
+
+from modules.application.common.types import RawPaginationResult
+from modules.application.rest_api.raw_listing_response import stream_raw_pagination_result
+
+
+def async_raw_listing_response(raw_pagination_result: RawPaginationResult) -> Response:
+    json_provider = current_app.json
+
+    async def generate_body() -> AsyncIterator[bytes]:
+        for chunk in stream_raw_pagination_result(raw_pagination_result, json_provider):
+            yield chunk
+
+    return current_app.response_class(generate_body(), mimetype="application/json")
@@ -0,0 +1,23 @@
+from functools import wraps
+from typing import Any, Callable
+
+from flask import make_response, request
+
+from modules.application.common.constants import CONSISTENCY_TOKEN_HEADER
+from modules.application.repository import ApplicationRepositoryClient
+
+
+def causal_consistency_middleware(next_func: Callable) -> Callable:
+    @wraps(next_func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with ApplicationRepositoryClient.start_causal_session(request.headers.get(CONSISTENCY_TOKEN_HEADER)) as session:
+            response = make_response(next_func(*args, **kwargs))
+
+        # Clients send the token back so their next reads observe this request's writes, even on a secondary
+        consistency_token = ApplicationRepositoryClient.get_consistency_token(session)
+        if consistency_token:
+            response.headers[CONSISTENCY_TOKEN_HEADER] = consistency_token
+
+        return response
+
+    return wrapper
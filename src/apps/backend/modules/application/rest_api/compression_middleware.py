@@ -0,0 +1,231 @@
+import zlib
+from typing import Any, Callable, Iterable, Iterator, Optional, Protocol, cast
+
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header
+
+from modules.config.config_service import ConfigService
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_MIMETYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# Brotli's default quality of 11 costs far more CPU than it saves bytes on API payloads
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
+
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return cast(bytes, self._compressor.process(data))
+
+    def flush(self) -> bytes:
+        return cast(bytes, self._compressor.flush())
+
+    def finish(self) -> bytes:
+        return cast(bytes, self._compressor.finish())
+
+
+class ZstdCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return cast(bytes, self._compressor.compress(data))
+
+    def flush(self) -> bytes:
+        return cast(bytes, self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+
+    def finish(self) -> bytes:
+        return cast(bytes, self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH))
+
+
+# Content-Encoding tokens with an installed codec; br and zstd need the brotli and zstandard packages
+COMPRESSORS: dict[str, Callable[[int], StreamCompressor]] = {
+    "gzip": GzipCompressor,
+    **({"br": BrotliCompressor} if brotli is not None else {}),
+    **({"zstd": ZstdCompressor} if zstandard is not None else {}),
+}
+
+
+class CompressionMiddleware:
+    """
+    WSGI middleware compressing JSON and text responses with the Content-Encoding negotiated from Accept-Encoding.
+    Responses with a Content-Length below minimum_size are sent as they are, and responses without one (generators)
+    are compressed chunk by chunk and flushed after every chunk so streaming still reaches the client as it is produced.
+    ETags of negotiated responses are made weak, since the encoded bytes differ from the identity representation.
+    """
+
+    def __init__(
+        self,
+        app: Callable[..., Iterable[bytes]],
+        *,
+        encodings: Iterable[str],
+        levels: dict[str, int],
+        minimum_size: int,
+    ) -> None:
+        self.app = app
+        self.encodings = [encoding for encoding in encodings if encoding in COMPRESSORS]
+        self.levels = levels
+        self.minimum_size = minimum_size
+
+    @classmethod
+    def from_config(cls, app: Callable[..., Iterable[bytes]]) -> "CompressionMiddleware":
+        # Environment variables arrive as strings, hence the casts and the comma separated encodings form
+        encodings = ConfigService[Any].get_value(key="compression.encodings", default=["gzip"])
+        if isinstance(encodings, str):
+            encodings = [encoding.strip() for encoding in encodings.split(",") if encoding.strip()]
+        levels = ConfigService[dict].get_value(key="compression.levels", default={})
+        return cls(
+            app,
+            encodings=encodings,
+            levels={encoding: int(level) for encoding, level in levels.items()},
+            minimum_size=ConfigService[int].get_value(key="compression.minimum_size", default=1024),
+        )
+
+    def negotiate_encoding(self, accept_encoding: str) -> Optional[str]:
+        """
+        Picks the encoding the client weighs highest, ties going to the order of compression.encodings.
+        """
+        accepted = parse_accept_header(accept_encoding)
+        candidates = [
+            (accepted.quality(encoding), -index)
+            for index, encoding in enumerate(self.encodings)
+            if accepted.quality(encoding) > 0
+        ]
+        if not candidates:
+            return None
+        _, negative_index = max(candidates)
+        return self.encodings[-negative_index]
+
+    def create_compressor(self, encoding: str) -> StreamCompressor:
+        return COMPRESSORS[encoding](self.levels.get(encoding, DEFAULT_COMPRESSION_LEVELS[encoding]))
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+        encoding = (
+            self.negotiate_encoding(environ.get("HTTP_ACCEPT_ENCODING", ""))
+            if environ.get("REQUEST_METHOD") != "HEAD"
+            else None
+        )
+        if encoding is None:
+            return self.app(environ, start_response)
+
+        # Flask and werkzeug call start_response before returning the body, so the headers are known here
+        captured: dict[str, Any] = {}
+
+        def capture_start_response(status: str, headers: list[tuple[str, str]], exc_info: Any = None) -> None:
+            captured.update(status=status, headers=Headers(headers), exc_info=exc_info)
+
+        app_iter = self.app(environ, capture_start_response)
+        status, headers, exc_info = captured["status"], captured["headers"], captured["exc_info"]
+        status_code = int(status.split(" ", 1)[0])
+
+        if status_code == 304:
+            CompressionMiddleware._mark_negotiated(headers)
+        if not CompressionMiddleware._is_compressible(status_code, headers):
+            start_response(status, headers.to_wsgi_list(), exc_info)
+            return app_iter
+
+        CompressionMiddleware._mark_negotiated(headers)
+        content_length = headers.get("Content-Length", type=int)
+        if content_length is not None and content_length < self.minimum_size:
+            start_response(status, headers.to_wsgi_list(), exc_info)
+            return app_iter
+
+        compressor = self.create_compressor(encoding)
+        headers["Content-Encoding"] = encoding
+        if content_length is None:
+            start_response(status, headers.to_wsgi_list(), exc_info)
+            return CompressionMiddleware._stream(app_iter, compressor)
+
+        try:
+            body = b"".join(app_iter)
+        finally:
+            CompressionMiddleware._close(app_iter)
+        compressed_body = compressor.compress(body) + compressor.finish()
+        if len(compressed_body) >= len(body):
+            del headers["Content-Encoding"]
+            start_response(status, headers.to_wsgi_list(), exc_info)
+            return [body]
+
+        headers["Content-Length"] = str(len(compressed_body))
+        start_response(status, headers.to_wsgi_list(), exc_info)
+        return [compressed_body]
+
+    @staticmethod
+    def _is_compressible(status_code: int, headers: Headers) -> bool:
+        mimetype = headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+        return (
+            200 <= status_code < 300
+            and status_code not in (204, 206)
+            and "Content-Encoding" not in headers
+            and "no-transform" not in headers.get("Cache-Control", "")
+            and (mimetype.startswith("text/") or mimetype in COMPRESSIBLE_MIMETYPES)
+        )
+
+    @staticmethod
+    def _mark_negotiated(headers: Headers) -> None:
+        vary = headers.get("Vary")
+        if not vary:
+            headers["Vary"] = "Accept-Encoding"
+        elif vary != "*" and "accept-encoding" not in vary.lower():
+            headers["Vary"] = f"{vary}, Accept-Encoding"
+
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    @staticmethod
+    def _stream(app_iter: Iterable[bytes], compressor: StreamCompressor) -> Iterator[bytes]:
+        try:
+            for chunk in app_iter:
+                compressed_chunk = compressor.compress(chunk) + compressor.flush()
+                if compressed_chunk:
+                    yield compressed_chunk
+            yield compressor.finish()
+        finally:
+            CompressionMiddleware._close(app_iter)
+
+    @staticmethod
+    def _close(app_iter: Iterable[bytes]) -> None:
+        close = getattr(app_iter, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,47 @@
+import hashlib
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from flask import make_response, request
+
+# Clients may keep the representation but must revalidate it with If-None-Match before every use
+CONDITIONAL_GET_CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(*, version: str, request_path: str) -> str:
+    """
+    Strong ETag of one representation of a resource version. The path carries the query string, so ?fields= or a
+    different page of the same version gets its own tag.
+    """
+    return hashlib.sha256(f"{version}|{request_path}".encode("utf-8")).hexdigest()[:32]
+
+
+def conditional_get_middleware(get_version: Callable[..., Optional[str]]) -> Callable[[Callable], Callable]:
+    """
+    Answers a GET whose If-None-Match holds the current ETag with a 304 without running the view. get_version is
+    called with the request args and the view kwargs, and must return a version read without materializing the
+    resource, or None to skip the conditional handling (for example when the resource does not exist).
+    """
+
+    def decorator(next_func: Callable) -> Callable:
+        @wraps(next_func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            version = get_version(request_args=request.args, **kwargs)
+            if version is None:
+                return next_func(*args, **kwargs)
+
+            etag = build_etag(version=version, request_path=request.full_path)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(next_func(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = CONDITIONAL_GET_CACHE_CONTROL
+            return response
+
+        return wrapper
+
+    return decorator
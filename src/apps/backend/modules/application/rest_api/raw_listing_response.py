@@ -0,0 +1,47 @@
+from typing import Iterator
+
+from flask import current_app
+from flask.json.provider import JSONProvider
+from flask.wrappers import Response
+
+from modules.application.common.types import RawPaginationResult
+from modules.application.response_serializer import ResponseSerializer
+from modules.config.config_service import ConfigService
+
+COMPACT_SEPARATORS = (",", ":")
+
+
+def is_raw_listing_enabled() -> bool:
+    return ConfigService[bool].get_value(key="listings.raw_bson_enabled", default=False)
+
+
+def stream_raw_pagination_result(
+    raw_pagination_result: RawPaginationResult, json_provider: JSONProvider
+) -> Iterator[bytes]:
+    """
+    Writes the compact body jsonify writes for the matching PaginationResult, one batch of items at a time. items sorts
+    before the page fields, so they follow the last batch.
+    """
+    yield b'{"items":['
+    separator = b""
+    for item_batch in raw_pagination_result.item_batches:
+        yield separator + json_provider.dumps(item_batch, separators=COMPACT_SEPARATORS)[1:-1].encode()
+        separator = b","
+
+    page_fields = json_provider.dumps(
+        {
+            "pagination_params": ResponseSerializer.serialize(raw_pagination_result.pagination_params),
+            "total_count": raw_pagination_result.total_count,
+            "total_pages": raw_pagination_result.total_pages,
+        },
+        separators=COMPACT_SEPARATORS,
+    )
+    yield f"],{page_fields[1:]}\n".encode()
+
+
+def raw_listing_response(raw_pagination_result: RawPaginationResult) -> Response:
+    # The provider is bound now, since the body is written after the view has returned
+    json_provider = current_app.json
+    return current_app.response_class(
+        stream_raw_pagination_result(raw_pagination_result, json_provider), mimetype="application/json"
+    )
@@ -22,6 +22,8 @@ class BaseWorker(ABC):
     priority: WorkerPriority = WorkerPriority.DEFAULT
     max_execution_time_in_seconds: int = 600
     max_retries: int = 3
+    # Workers that heartbeat their progress set this, so a stalled attempt is retried before its execution time is up
+    heartbeat_timeout_in_seconds: Optional[int] = None
 
     @staticmethod
     @abstractmethod
@@ -39,6 +41,9 @@ class BaseWorker(ABC):
             self.execute,
             args=args,
             start_to_close_timeout=timedelta(seconds=self.max_execution_time_in_seconds),
+            heartbeat_timeout=(
+                timedelta(seconds=self.heartbeat_timeout_in_seconds) if self.heartbeat_timeout_in_seconds else None
+            ),
             retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
         )
 
@@ -2,10 +2,13 @@ import secrets
 import string
 from typing import Any
 
+from modules.application.bson_codec import BsonCodec
 from modules.authentication.internals.otp.store.otp_model import OTPModel
 from modules.authentication.types import OTP
 from modules.config.config_service import ConfigService
 
+OTP_BSON_DECODER = BsonCodec.get_decoder(OTPModel, OTP)
+
 
 class OTPUtil:
 
@@ -18,13 +21,7 @@ class OTPUtil:
 
     @staticmethod
     def convert_otp_bson_to_otp(otp_bson: dict[str, Any]) -> OTP:
-        validated_otp_data = OTPModel.from_bson(otp_bson)
-        return OTP(
-            id=str(validated_otp_data.id),
-            otp_code=validated_otp_data.otp_code,
-            phone_number=validated_otp_data.phone_number,
-            status=validated_otp_data.status,
-        )
+        return OTP_BSON_DECODER(otp_bson)
 
     @staticmethod
     def should_use_default_otp_for_phone_number(phone_number: str) -> bool:
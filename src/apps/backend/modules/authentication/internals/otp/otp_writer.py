@@ -1,4 +1,5 @@
 from dataclasses import asdict
+from datetime import datetime
 
 from pymongo import ReturnDocument
 
@@ -14,11 +15,10 @@ class OTPWriter:
     @staticmethod
     def expire_previous_otps(phone_number: PhoneNumber) -> None:
         phone_number_dict = asdict(phone_number)
-        previous_otps = OTPRepository.collection().find({"active": True, "phone_number": phone_number_dict})
-        for otp in previous_otps:
-            OTPRepository.collection().update_one(
-                {"_id": otp["_id"]}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}}
-            )
+        OTPRepository.collection().update_many(
+            {"active": True, "phone_number": phone_number_dict},
+            {"$set": {"active": False, "status": OTPStatus.EXPIRED, "updated_at": datetime.now()}},
+        )
 
     @staticmethod
     def create_new_otp(*, params: CreateOTPParams) -> OTP:
@@ -28,25 +28,27 @@ class OTPWriter:
         otp_bson = OTPModel(
             active=True, id=None, phone_number=phone_number, otp_code=otp_code, status=str(OTPStatus.PENDING)
         ).to_bson()
-        query = OTPRepository.collection().insert_one(otp_bson)
-        otp_bson = OTPRepository.collection().find_one({"_id": query.inserted_id})
+        otp_bson = OTPRepository.insert_document(otp_bson)
         return OTPUtil.convert_otp_bson_to_otp(otp_bson)
 
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
+        """
+        Checks and consumes the code in one conditional update, so two concurrent verifications of the same code
+        cannot both succeed. The extra lookup only runs for codes that are wrong or no longer active.
+        """
         phone_number_dict = asdict(params.phone_number)
-        otp_bson = OTPRepository.collection().find_one(
-            {"otp_code": params.otp_code, "phone_number": phone_number_dict}, sort=[("_id", -1)]
+        otp_filter = {"phone_number": phone_number_dict, "otp_code": params.otp_code}
+        verified_otp_bson = OTPRepository.collection().find_one_and_update(
+            {**otp_filter, "active": True},
+            {"$set": {"active": False, "status": OTPStatus.SUCCESS, "updated_at": datetime.now()}},
+            sort=[("_id", -1)],
+            return_document=ReturnDocument.AFTER,
         )
-        if otp_bson is None:
-            raise OTPIncorrectError()
+        if verified_otp_bson is not None:
+            return OTPUtil.convert_otp_bson_to_otp(verified_otp_bson)
 
-        if not otp_bson["active"]:
-            raise OTPExpiredError()
+        if OTPRepository.collection().find_one(otp_filter, {"_id": 1}) is None:
+            raise OTPIncorrectError()
 
-        updated_otp_bson = OTPRepository.collection().find_one_and_update(
-            {"_id": otp_bson["_id"]},
-            {"$set": {"active": False, "status": OTPStatus.SUCCESS}},
-            return_document=ReturnDocument.AFTER,
-        )
-        return OTPUtil.convert_otp_bson_to_otp(updated_otp_bson)
+        raise OTPExpiredError()
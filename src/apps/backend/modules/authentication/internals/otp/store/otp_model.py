@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -16,8 +16,8 @@ class OTPModel(BaseModel):
     phone_number: PhoneNumber
     status: str
 
-    created_at: Optional[datetime] = datetime.now()
-    updated_at: Optional[datetime] = datetime.now()
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
 
     @classmethod
     def from_bson(cls, bson_data: dict) -> "OTPModel":
@@ -1,9 +1,10 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.otp.store.otp_model import OTPModel
-from modules.logger.logger import Logger
+
+# OTPs are single use and short lived, so Mongo's TTL monitor removes them a day after they were issued
+OTP_RETENTION_SECONDS = 24 * 60 * 60
 
 OTP_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -33,20 +34,10 @@ OTP_VALIDATION_SCHEMA = {
 class OTPRepository(ApplicationRepository):
     collection_name = OTPModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-
-        collection.create_index("phone_number")
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": OTP_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:  # NamespaceNotFound MongoDB error code
-                collection.database.create_collection(cls.collection_name, validator=OTP_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection otp: {e.details}")
-        return True
+    indexes = [
+        # Backs verify_otp, which consumes the latest OTP for a phone number and code, and through its phone_number
+        # prefix the expiry of a phone number's previous OTPs
+        IndexModel([("phone_number", 1), ("otp_code", 1), ("_id", -1)], name="phone_number_otp_code_id_index"),
+        IndexModel("created_at", name="created_at_ttl_index", expireAfterSeconds=OTP_RETENTION_SECONDS),
+    ]
+    validator = OTP_VALIDATION_SCHEMA
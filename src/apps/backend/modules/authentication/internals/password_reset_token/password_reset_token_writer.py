@@ -21,10 +21,7 @@ class PasswordResetTokenWriter:
             "token": token_hash,
             "is_used": False,
         }
-        created_token = PasswordResetTokenRepository.collection().insert_one(new_token_data)
-        password_reset_token_bson = PasswordResetTokenRepository.collection().find_one(
-            {"_id": created_token.inserted_id}
-        )
+        password_reset_token_bson = PasswordResetTokenRepository.insert_document(new_token_data)
 
         return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(
             password_reset_token_bson
@@ -20,7 +20,7 @@ class PasswordResetTokenModel(BaseModel):
     @classmethod
     def from_bson(cls, bson_data: dict) -> "PasswordResetTokenModel":
         return cls(
-            account=bson_data.get("account"),
+            account=bson_data.get("account", ""),
             expires_at=bson_data.get("expires_at", ""),
             id=bson_data.get("_id"),
             is_used=bson_data.get("is_used", ""),
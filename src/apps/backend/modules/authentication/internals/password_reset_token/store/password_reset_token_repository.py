@@ -1,11 +1,9 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
-from modules.logger.logger import Logger
 
 PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -25,21 +23,9 @@ PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
 class PasswordResetTokenRepository(ApplicationRepository):
     collection_name = PasswordResetTokenModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index("token")
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:  # NamespaceNotFound MongoDB error code
-                collection.database.create_collection(
-                    cls.collection_name, validator=PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA
-                )
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection PasswordResetToken: {e.details}")
-        return True
+    indexes = [
+        IndexModel("token", name="token_index"),
+        # Backs the lookup of an account's latest token
+        IndexModel([("account", 1), ("expires_at", -1)], name="account_expires_at_index"),
+    ]
+    validator = PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA
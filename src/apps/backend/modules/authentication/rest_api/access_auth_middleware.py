@@ -1,5 +1,5 @@
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from flask import request
 
@@ -9,24 +9,29 @@ from modules.authentication.errors import (
     InvalidAuthorizationHeaderError,
     UnauthorizedAccessError,
 )
+from modules.authentication.types import AccessTokenPayload
 
 
-def access_auth_middleware(next_func: Callable) -> Callable:
-    @wraps(next_func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
-            raise AuthorizationHeaderNotFoundError("Authorization header is missing.")
+def verify_authorization_header(auth_header: Optional[str], view_kwargs: dict[str, Any]) -> AccessTokenPayload:
+    if not auth_header:
+        raise AuthorizationHeaderNotFoundError("Authorization header is missing.")
+
+    auth_scheme, auth_token = auth_header.split(" ")
+    if auth_scheme != "Bearer" or not auth_token:
+        raise InvalidAuthorizationHeaderError("Invalid authorization header.")
 
-        auth_scheme, auth_token = auth_header.split(" ")
-        if auth_scheme != "Bearer" or not auth_token:
-            raise InvalidAuthorizationHeaderError("Invalid authorization header.")
+    auth_payload = AuthenticationService.verify_access_token(token=auth_token)
 
-        auth_payload = AuthenticationService.verify_access_token(token=auth_token)
+    if "account_id" in view_kwargs and auth_payload.account_id != view_kwargs["account_id"]:
+        raise UnauthorizedAccessError("Unauthorized access.")
 
-        if "account_id" in kwargs and auth_payload.account_id != kwargs["account_id"]:
-            raise UnauthorizedAccessError("Unauthorized access.")
+    return auth_payload
 
+
+def access_auth_middleware(next_func: Callable) -> Callable:
+    @wraps(next_func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        auth_payload = verify_authorization_header(request.headers.get("Authorization"), kwargs)
         setattr(request, "account_id", auth_payload.account_id)  # Set account_id attribute on request
         return next_func(*args, **kwargs)
 
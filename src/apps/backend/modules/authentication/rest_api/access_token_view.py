@@ -1,11 +1,10 @@
-from dataclasses import asdict
-
 from flask import jsonify, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
 from modules.account.account_service import AccountService
 from modules.account.types import AccountSearchParams
+from modules.application.response_serializer import ResponseSerializer
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import (
     CreateAccessTokenParams,
@@ -35,5 +34,5 @@ class AccessTokenView(MethodView):
                 params=AccountSearchParams(username=access_token_params.username, password=access_token_params.password)
             )
             access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
-        access_token_dict = asdict(access_token)
+        access_token_dict = ResponseSerializer.serialize(access_token)
         return jsonify(access_token_dict), 201
@@ -0,0 +1,16 @@
+from functools import wraps
+from typing import Any, Callable
+
+from quart import request
+
+from modules.authentication.rest_api.access_auth_middleware import verify_authorization_header
+
+
+def async_access_auth_middleware(next_func: Callable) -> Callable:
+    @wraps(next_func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        auth_payload = verify_authorization_header(request.headers.get("Authorization"), kwargs)
+        setattr(request, "account_id", auth_payload.account_id)  # Set account_id attribute on request
+        return await next_func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,22 @@
+import asyncio
+
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.account.async_account_service import AsyncAccountService
+from modules.application.response_serializer import ResponseSerializer
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.types import CreatePasswordResetTokenParams
+
+
+class AsyncPasswordResetTokenView(MethodView):
+    async def post(self) -> ResponseReturnValue:
+        request_data = await request.get_json()
+        password_reset_token_params = CreatePasswordResetTokenParams(**request_data)
+        account_obj = await AsyncAccountService.get_account_by_username(username=password_reset_token_params.username)
+        password_reset_token = await asyncio.to_thread(
+            AuthenticationService.create_password_reset_token, params=account_obj
+        )
+        password_reset_token_dict = ResponseSerializer.serialize(password_reset_token)
+        return jsonify(password_reset_token_dict), 201
@@ -1,4 +1,5 @@
 from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
 
 from modules.authentication.rest_api.authentication_router import AuthenticationRouter
 
@@ -8,3 +9,8 @@ class AuthenticationRestApiServer:
     def create() -> Blueprint:
         authentication_api_blueprint = Blueprint("authentication", __name__)
         return AuthenticationRouter.create_route(blueprint=authentication_api_blueprint)
+
+    @staticmethod
+    def create_async() -> AsyncBlueprint:
+        authentication_api_blueprint = AsyncBlueprint("authentication", __name__)
+        return AuthenticationRouter.create_async_route(blueprint=authentication_api_blueprint)
@@ -1,6 +1,9 @@
 from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
 
 from modules.authentication.rest_api.access_token_view import AccessTokenView
+from modules.authentication.rest_api.async_access_token_view import AsyncAccessTokenView
+from modules.authentication.rest_api.async_password_reset_token_view import AsyncPasswordResetTokenView
 from modules.authentication.rest_api.password_reset_token_view import PasswordResetTokenView
 
 
@@ -12,3 +15,11 @@ class AuthenticationRouter:
             "/password-reset-tokens", view_func=PasswordResetTokenView.as_view("password_reset_token_view")
         )
         return blueprint
+
+    @staticmethod
+    def create_async_route(*, blueprint: AsyncBlueprint) -> AsyncBlueprint:
+        blueprint.add_url_rule("/access-tokens", view_func=AsyncAccessTokenView.as_view("access_token_view"))
+        blueprint.add_url_rule(
+            "/password-reset-tokens", view_func=AsyncPasswordResetTokenView.as_view("password_reset_token_view")
+        )
+        return blueprint
@@ -1,10 +1,9 @@
-from dataclasses import asdict
-
 from flask import jsonify, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
 from modules.account.account_service import AccountService
+from modules.application.response_serializer import ResponseSerializer
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import CreatePasswordResetTokenParams
 
@@ -15,5 +14,5 @@ class PasswordResetTokenView(MethodView):
         password_reset_token_params = CreatePasswordResetTokenParams(**request_data)
         account_obj = AccountService.get_account_by_username(username=password_reset_token_params.username)
         password_reset_token = AuthenticationService.create_password_reset_token(params=account_obj)
-        password_reset_token_dict = asdict(password_reset_token)
+        password_reset_token_dict = ResponseSerializer.serialize(password_reset_token)
         return jsonify(password_reset_token_dict), 201
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from modules.application.common.types import CursorPaginationResult, PaginationResult, RawPaginationResult
+from modules.comment.internal.async_comment_reader import AsyncCommentReader
+from modules.comment.internal.async_comment_writer import AsyncCommentWriter
+from modules.comment.types import (
+    Comment,
+    CommentDeletionResult,
+    CreateCommentParams,
+    DeleteCommentParams,
+    GetCommentParams,
+    GetCursorPaginatedCommentsParams,
+    GetPaginatedCommentsParams,
+    UpdateCommentParams,
+)
+
+
+class AsyncCommentService:
+    @staticmethod
+    async def create_comment(*, params: CreateCommentParams) -> Comment:
+        return await AsyncCommentWriter.create_comment(params=params)
+
+    @staticmethod
+    async def get_comment(*, params: GetCommentParams) -> Comment:
+        return await AsyncCommentReader.get_comment(params=params)
+
+    @staticmethod
+    async def get_comment_version(*, params: GetCommentParams) -> Optional[str]:
+        return await AsyncCommentReader.get_comment_version(params=params)
+
+    @staticmethod
+    async def get_comments_version(*, task_id: str) -> Optional[str]:
+        return await AsyncCommentReader.get_comments_version(task_id=task_id)
+
+    @staticmethod
+    async def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
+        return await AsyncCommentReader.get_paginated_comments(params=params)
+
+    @staticmethod
+    async def get_raw_paginated_comments(*, params: GetPaginatedCommentsParams) -> RawPaginationResult:
+        return await AsyncCommentReader.get_raw_paginated_comments(params=params)
+
+    @staticmethod
+    async def get_cursor_paginated_comments(
+        *, params: GetCursorPaginatedCommentsParams
+    ) -> CursorPaginationResult[Comment]:
+        return await AsyncCommentReader.get_cursor_paginated_comments(params=params)
+
+    @staticmethod
+    async def update_comment(*, params: UpdateCommentParams) -> Comment:
+        return await AsyncCommentWriter.update_comment(params=params)
+
+    @staticmethod
+    async def delete_comment(*, params: DeleteCommentParams) -> CommentDeletionResult:
+        return await AsyncCommentWriter.delete_comment(params=params)
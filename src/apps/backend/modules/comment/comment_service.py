@@ -1,13 +1,25 @@
-from modules.application.common.types import PaginationResult
+from typing import List, Optional
+
+from modules.application.common.types import (
+    CounterReconciliationResult,
+    CursorPaginationResult,
+    PaginationResult,
+    RawPaginationResult,
+)
 from modules.comment.internal.comment_reader import CommentReader
 from modules.comment.internal.comment_writer import CommentWriter
 from modules.comment.types import (
     CreateCommentParams,
     DeleteCommentParams,
+    DeleteTaskCommentsParams,
+    GetCursorPaginatedCommentsParams,
     GetPaginatedCommentsParams,
     GetCommentParams,
     Comment,
     CommentDeletionResult,
+    CommentSearchHit,
+    OrphanedCommentsDeletionResult,
+    SearchCommentsParams,
     UpdateCommentParams,
 )
 
@@ -21,10 +33,30 @@ class CommentService:
     def get_comment(*, params: GetCommentParams) -> Comment:
         return CommentReader.get_comment(params=params)
 
+    @staticmethod
+    def get_comment_version(*, params: GetCommentParams) -> Optional[str]:
+        return CommentReader.get_comment_version(params=params)
+
+    @staticmethod
+    def get_comments_version(*, task_id: str) -> Optional[str]:
+        return CommentReader.get_comments_version(task_id=task_id)
+
     @staticmethod
     def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
         return CommentReader.get_paginated_comments(params=params)
 
+    @staticmethod
+    def get_raw_paginated_comments(*, params: GetPaginatedCommentsParams) -> RawPaginationResult:
+        return CommentReader.get_raw_paginated_comments(params=params)
+
+    @staticmethod
+    def get_cursor_paginated_comments(*, params: GetCursorPaginatedCommentsParams) -> CursorPaginationResult[Comment]:
+        return CommentReader.get_cursor_paginated_comments(params=params)
+
+    @staticmethod
+    def search_comments(*, params: SearchCommentsParams) -> List[CommentSearchHit]:
+        return CommentReader.search_comments(params=params)
+
     @staticmethod
     def update_comment(*, params: UpdateCommentParams) -> Comment:
         return CommentWriter.update_comment(params=params)
@@ -32,3 +64,15 @@ class CommentService:
     @staticmethod
     def delete_comment(*, params: DeleteCommentParams) -> CommentDeletionResult:
         return CommentWriter.delete_comment(params=params)
+
+    @staticmethod
+    def delete_task_comments(*, params: DeleteTaskCommentsParams) -> int:
+        return CommentWriter.delete_task_comments(params=params)
+
+    @staticmethod
+    def delete_orphaned_comments() -> OrphanedCommentsDeletionResult:
+        return CommentWriter.delete_orphaned_comments()
+
+    @staticmethod
+    def reconcile_comment_counts() -> CounterReconciliationResult:
+        return CommentWriter.reconcile_comment_counts()
@@ -0,0 +1,176 @@
+from typing import Any, List, Optional, Tuple
+
+from bson.objectid import ObjectId
+from bson.raw_bson import DEFAULT_RAW_BSON_OPTIONS
+
+from modules.application.common.base_model import BaseModel
+from modules.application.common.constants import DETAIL_READ_PREFERENCE, LISTING_READ_PREFERENCE
+from modules.application.common.types import (
+    CursorPaginationResult,
+    PaginationParams,
+    PaginationResult,
+    RawPaginationResult,
+)
+from modules.application.repository import ApplicationRepositoryClient, AsyncApplicationRepositoryClient
+from modules.comment.errors import CommentNotFoundError
+from modules.comment.internal.comment_util import COMMENT_FIELDS, CommentUtil
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import (
+    Comment,
+    GetCommentParams,
+    GetCursorPaginatedCommentsParams,
+    GetPaginatedCommentsParams,
+)
+from modules.task.async_task_service import AsyncTaskService
+
+
+class AsyncCommentReader:
+    @staticmethod
+    async def get_comment(*, params: GetCommentParams) -> Comment:
+        comment_bson = await CommentRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(DETAIL_READ_PREFERENCE)
+        ).find_one(
+            {
+                "_id": ObjectId(params.comment_id),
+                "task_id": params.task_id,
+                "account_id": params.account_id,
+                "active": True,
+            },
+            BaseModel.build_projection(params.fields),
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        if comment_bson is None:
+            raise CommentNotFoundError(comment_id=params.comment_id)
+        return CommentUtil.convert_comment_bson_to_comment(comment_bson)
+
+    @staticmethod
+    async def get_comment_version(*, params: GetCommentParams) -> Optional[str]:
+        if not ObjectId.is_valid(params.comment_id):
+            return None
+        comment_bson = await CommentRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(DETAIL_READ_PREFERENCE)
+        ).find_one(
+            {
+                "_id": ObjectId(params.comment_id),
+                "task_id": params.task_id,
+                "account_id": params.account_id,
+                "active": True,
+            },
+            {"updated_at": 1},
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        if comment_bson is None:
+            return None
+        return str(comment_bson.get("updated_at"))
+
+    @staticmethod
+    async def get_comments_version(*, task_id: str) -> Optional[str]:
+        # Every comment write of a task bumps a version on the task document, see IncrementTaskCommentCountParams
+        return await AsyncTaskService.get_task_comments_version(task_id=task_id)
+
+    @staticmethod
+    async def get_comment_count(*, task_id: str) -> int:
+        return await AsyncTaskService.get_comment_count(task_id=task_id)
+
+    @staticmethod
+    async def get_listing_comment_count(*, task_id: str, filter_query: dict[str, Any], filtered: bool) -> int:
+        """
+        The task's comment counter only holds the unfiltered total, so a filtered listing counts its matches instead.
+        """
+        if not filtered:
+            return await AsyncCommentReader.get_comment_count(task_id=task_id)
+        return await CommentRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).count_documents(filter_query, session=AsyncApplicationRepositoryClient.get_causal_session())
+
+    @staticmethod
+    async def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
+        comments_bson, pagination_params, total_count, total_pages = await AsyncCommentReader._find_paginated_comments(
+            params=params, raw=False
+        )
+        comments = [CommentUtil.convert_comment_bson_to_comment(comment_bson) for comment_bson in comments_bson]
+        return PaginationResult(
+            items=comments, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+        )
+
+    @staticmethod
+    async def get_raw_paginated_comments(*, params: GetPaginatedCommentsParams) -> RawPaginationResult:
+        raw_comments_bson, pagination_params, total_count, total_pages = (
+            await AsyncCommentReader._find_paginated_comments(params=params, raw=True)
+        )
+        return RawPaginationResult(
+            item_batches=CommentUtil.transcode_raw_comments_bson(raw_comments_bson, params.fields),
+            pagination_params=pagination_params,
+            total_count=total_count,
+            total_pages=total_pages,
+        )
+
+    @staticmethod
+    async def get_cursor_paginated_comments(
+        *, params: GetCursorPaginatedCommentsParams
+    ) -> CursorPaginationResult[Comment]:
+        filter_query = BaseModel.apply_pagination_cursor(
+            BaseModel.apply_timestamp_filters(
+                {"task_id": params.task_id, "account_id": params.account_id, "active": True}, params.filter_params
+            ),
+            params.pagination_params.cursor,
+            params.sort_params,
+        )
+        ((sort_by, _), _) = BaseModel.build_sort(params.sort_params)
+        cursor = (
+            CommentRepository.async_collection(
+                read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+            )
+            .find(
+                filter_query,
+                BaseModel.build_projection(params.fields, required_fields=(sort_by,)),
+                session=AsyncApplicationRepositoryClient.get_causal_session(),
+            )
+            .sort(BaseModel.build_sort(params.sort_params))
+            .limit(params.pagination_params.size + 1)
+        )
+
+        comments_bson, next_cursor = BaseModel.calculate_next_pagination_cursor(
+            await cursor.to_list(), params.pagination_params.size, params.sort_params
+        )
+        comments = [CommentUtil.convert_comment_bson_to_comment(comment_bson) for comment_bson in comments_bson]
+        return CursorPaginationResult(
+            items=comments, pagination_params=params.pagination_params, next_cursor=next_cursor
+        )
+
+    @staticmethod
+    async def _find_paginated_comments(
+        *, params: GetPaginatedCommentsParams, raw: bool
+    ) -> Tuple[List[Any], PaginationParams, Optional[int], Optional[int]]:
+        """
+        Reads the page of comment documents. Raw pages are read as RawBSONDocuments projected to the Comment fields,
+        and still in full while the request's causal session is open, so only their transcoding is left to the response.
+        """
+        filter_query = BaseModel.apply_timestamp_filters(
+            {"task_id": params.task_id, "account_id": params.account_id, "active": True}, params.filter_params
+        )
+        total_count = (
+            await AsyncCommentReader.get_listing_comment_count(
+                task_id=params.task_id, filter_query=filter_query, filtered=params.filter_params is not None
+            )
+            if params.include_total
+            else None
+        )
+        pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
+            params.pagination_params, total_count
+        )
+        collection = CommentRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        )
+        if raw:
+            collection = collection.with_options(codec_options=DEFAULT_RAW_BSON_OPTIONS)
+        cursor = collection.find(
+            filter_query,
+            BaseModel.build_projection((params.fields or COMMENT_FIELDS) if raw else params.fields),
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+
+        cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
+
+        comments_bson = await cursor.skip(skip).limit(pagination_params.size).to_list()
+        return comments_bson, pagination_params, total_count, total_pages
@@ -0,0 +1,81 @@
+from datetime import datetime
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+
+from modules.application.repository import AsyncApplicationRepositoryClient
+from modules.comment.errors import CommentNotFoundError
+from modules.comment.internal.comment_util import CommentUtil
+from modules.comment.internal.store.comment_model import CommentModel
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import (
+    Comment,
+    CommentDeletionResult,
+    CreateCommentParams,
+    DeleteCommentParams,
+    UpdateCommentParams,
+)
+from modules.task.async_task_service import AsyncTaskService
+from modules.task.types import IncrementTaskCommentCountParams
+
+
+class AsyncCommentWriter:
+    @staticmethod
+    async def create_comment(*, params: CreateCommentParams) -> Comment:
+        comment_bson = CommentModel(
+            task_id=params.task_id, account_id=params.account_id, content=params.content
+        ).to_bson()
+
+        created_comment_bson = await CommentRepository.async_insert_document(comment_bson)
+        await AsyncCommentWriter._increment_comment_count(
+            account_id=params.account_id, task_id=params.task_id, amount=1
+        )
+
+        return CommentUtil.convert_comment_bson_to_comment(created_comment_bson)
+
+    @staticmethod
+    async def update_comment(*, params: UpdateCommentParams) -> Comment:
+        updated_comment_bson = await CommentRepository.async_collection().find_one_and_update(
+            {
+                "_id": ObjectId(params.comment_id),
+                "task_id": params.task_id,
+                "account_id": params.account_id,
+                "active": True,
+            },
+            {"$set": {"content": params.content, "updated_at": datetime.now()}},
+            return_document=ReturnDocument.AFTER,
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+
+        if updated_comment_bson is None:
+            raise CommentNotFoundError(comment_id=params.comment_id)
+
+        # The count is unchanged, but the increment still versions the task's comment listings
+        await AsyncCommentWriter._increment_comment_count(
+            account_id=params.account_id, task_id=params.task_id, amount=0
+        )
+
+        return CommentUtil.convert_comment_bson_to_comment(updated_comment_bson)
+
+    @staticmethod
+    async def delete_comment(*, params: DeleteCommentParams) -> CommentDeletionResult:
+        deletion_time = datetime.now()
+        is_deleted = await CommentRepository.async_soft_delete_document(
+            {"_id": ObjectId(params.comment_id), "task_id": params.task_id, "account_id": params.account_id},
+            deletion_time,
+        )
+
+        if not is_deleted:
+            raise CommentNotFoundError(comment_id=params.comment_id)
+
+        await AsyncCommentWriter._increment_comment_count(
+            account_id=params.account_id, task_id=params.task_id, amount=-1
+        )
+
+        return CommentDeletionResult(comment_id=params.comment_id, deleted_at=deletion_time, success=True)
+
+    @staticmethod
+    async def _increment_comment_count(*, account_id: str, task_id: str, amount: int) -> None:
+        await AsyncTaskService.increment_comment_count(
+            params=IncrementTaskCommentCountParams(account_id=account_id, task_id=task_id, amount=amount)
+        )
@@ -1,44 +1,193 @@
+from typing import Any, List, Optional, Tuple
+
 from bson.objectid import ObjectId
+from bson.raw_bson import DEFAULT_RAW_BSON_OPTIONS
 
 from modules.application.common.base_model import BaseModel
-from modules.application.common.types import PaginationResult
+from modules.application.common.constants import DETAIL_READ_PREFERENCE, LISTING_READ_PREFERENCE
+from modules.application.common.types import (
+    CursorPaginationResult,
+    PaginationParams,
+    PaginationResult,
+    RawPaginationResult,
+)
+from modules.application.repository import ApplicationRepositoryClient
 from modules.comment.errors import CommentNotFoundError
 from modules.comment.internal.store.comment_repository import CommentRepository
-from modules.comment.internal.comment_util import CommentUtil
-from modules.comment.types import GetPaginatedCommentsParams, GetCommentParams, Comment
+from modules.comment.internal.comment_util import COMMENT_FIELDS, CommentUtil
+from modules.comment.types import (
+    GetCursorPaginatedCommentsParams,
+    GetPaginatedCommentsParams,
+    GetCommentParams,
+    Comment,
+    CommentSearchHit,
+    SearchCommentsParams,
+)
+from modules.task.task_service import TaskService
 
 
 class CommentReader:
     @staticmethod
     def get_comment(*, params: GetCommentParams) -> Comment:
-        comment_bson = CommentRepository.collection().find_one(
+        comment_bson = CommentRepository.collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(DETAIL_READ_PREFERENCE)
+        ).find_one(
             {
                 "_id": ObjectId(params.comment_id),
                 "task_id": params.task_id,
                 "account_id": params.account_id,
                 "active": True,
-            }
+            },
+            BaseModel.build_projection(params.fields),
+            session=ApplicationRepositoryClient.get_causal_session(),
         )
         if comment_bson is None:
             raise CommentNotFoundError(comment_id=params.comment_id)
         return CommentUtil.convert_comment_bson_to_comment(comment_bson)
 
     @staticmethod
-    def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
-        filter_query = {"task_id": params.task_id, "account_id": params.account_id, "active": True}
-        total_count = CommentRepository.collection().count_documents(filter_query)
-        pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
-            params.pagination_params, total_count
+    def get_comment_version(*, params: GetCommentParams) -> Optional[str]:
+        if not ObjectId.is_valid(params.comment_id):
+            return None
+        comment_bson = CommentRepository.collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(DETAIL_READ_PREFERENCE)
+        ).find_one(
+            {
+                "_id": ObjectId(params.comment_id),
+                "task_id": params.task_id,
+                "account_id": params.account_id,
+                "active": True,
+            },
+            {"updated_at": 1},
+            session=ApplicationRepositoryClient.get_causal_session(),
         )
-        cursor = CommentRepository.collection().find(filter_query)
+        if comment_bson is None:
+            return None
+        return str(comment_bson.get("updated_at"))
 
-        if params.sort_params:
-            cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
-        else:
-            cursor = cursor.sort([("created_at", -1), ("_id", -1)])
+    @staticmethod
+    def get_comments_version(*, task_id: str) -> Optional[str]:
+        # Every comment write of a task bumps a version on the task document, see IncrementTaskCommentCountParams
+        return TaskService.get_task_comments_version(task_id=task_id)
 
-        comments_bson = list(cursor.skip(skip).limit(pagination_params.size))
+    @staticmethod
+    def get_comment_count(*, task_id: str) -> int:
+        return TaskService.get_comment_count(task_id=task_id)
+
+    @staticmethod
+    def get_listing_comment_count(*, task_id: str, filter_query: dict[str, Any], filtered: bool) -> int:
+        """
+        The task's comment counter only holds the unfiltered total, so a filtered listing counts its matches instead.
+        """
+        if not filtered:
+            return CommentReader.get_comment_count(task_id=task_id)
+        return CommentRepository.collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).count_documents(filter_query, session=ApplicationRepositoryClient.get_causal_session())
+
+    @staticmethod
+    def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
+        comments_bson, pagination_params, total_count, total_pages = CommentReader._find_paginated_comments(
+            params=params, raw=False
+        )
         comments = [CommentUtil.convert_comment_bson_to_comment(comment_bson) for comment_bson in comments_bson]
         return PaginationResult(
             items=comments, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
         )
+
+    @staticmethod
+    def get_raw_paginated_comments(*, params: GetPaginatedCommentsParams) -> RawPaginationResult:
+        raw_comments_bson, pagination_params, total_count, total_pages = CommentReader._find_paginated_comments(
+            params=params, raw=True
+        )
+        return RawPaginationResult(
+            item_batches=CommentUtil.transcode_raw_comments_bson(raw_comments_bson, params.fields),
+            pagination_params=pagination_params,
+            total_count=total_count,
+            total_pages=total_pages,
+        )
+
+    @staticmethod
+    def get_cursor_paginated_comments(*, params: GetCursorPaginatedCommentsParams) -> CursorPaginationResult[Comment]:
+        filter_query = BaseModel.apply_pagination_cursor(
+            BaseModel.apply_timestamp_filters(
+                {"task_id": params.task_id, "account_id": params.account_id, "active": True}, params.filter_params
+            ),
+            params.pagination_params.cursor,
+            params.sort_params,
+        )
+        ((sort_by, _), _) = BaseModel.build_sort(params.sort_params)
+        cursor = (
+            CommentRepository.collection(
+                read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+            )
+            .find(
+                filter_query,
+                BaseModel.build_projection(params.fields, required_fields=(sort_by,)),
+                session=ApplicationRepositoryClient.get_causal_session(),
+            )
+            .sort(BaseModel.build_sort(params.sort_params))
+            .limit(params.pagination_params.size + 1)
+        )
+
+        comments_bson, next_cursor = BaseModel.calculate_next_pagination_cursor(
+            list(cursor), params.pagination_params.size, params.sort_params
+        )
+        comments = [CommentUtil.convert_comment_bson_to_comment(comment_bson) for comment_bson in comments_bson]
+        return CursorPaginationResult(
+            items=comments, pagination_params=params.pagination_params, next_cursor=next_cursor
+        )
+
+    @staticmethod
+    def search_comments(*, params: SearchCommentsParams) -> List[CommentSearchHit]:
+        comments_bson = CommentRepository.collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).aggregate(
+            BaseModel.build_text_search_pipeline(
+                {"account_id": params.account_id, "active": True}, params.text_query, params.after, params.limit
+            ),
+            session=ApplicationRepositoryClient.get_causal_session(),
+        )
+        return [
+            CommentSearchHit(
+                comment=CommentUtil.convert_comment_bson_to_comment(comment_bson), score=comment_bson["text_score"]
+            )
+            for comment_bson in comments_bson
+        ]
+
+    @staticmethod
+    def _find_paginated_comments(
+        *, params: GetPaginatedCommentsParams, raw: bool
+    ) -> Tuple[List[Any], PaginationParams, Optional[int], Optional[int]]:
+        """
+        Reads the page of comment documents. Raw pages are read as RawBSONDocuments projected to the Comment fields,
+        and still in full while the request's causal session is open, so only their transcoding is left to the response.
+        """
+        filter_query = BaseModel.apply_timestamp_filters(
+            {"task_id": params.task_id, "account_id": params.account_id, "active": True}, params.filter_params
+        )
+        total_count = (
+            CommentReader.get_listing_comment_count(
+                task_id=params.task_id, filter_query=filter_query, filtered=params.filter_params is not None
+            )
+            if params.include_total
+            else None
+        )
+        pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
+            params.pagination_params, total_count
+        )
+        collection = CommentRepository.collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        )
+        if raw:
+            collection = collection.with_options(codec_options=DEFAULT_RAW_BSON_OPTIONS)
+        cursor = collection.find(
+            filter_query,
+            BaseModel.build_projection((params.fields or COMMENT_FIELDS) if raw else params.fields),
+            session=ApplicationRepositoryClient.get_causal_session(),
+        )
+
+        cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
+
+        comments_bson = list(cursor.skip(skip).limit(pagination_params.size))
+        return comments_bson, pagination_params, total_count, total_pages
@@ -1,18 +1,27 @@
-from typing import Any
+from dataclasses import fields
+from typing import Any, Iterator, List, Optional, Tuple
 
+from modules.application.bson_codec import BsonCodec
 from modules.comment.internal.store.comment_model import CommentModel
 from modules.comment.types import Comment
+from modules.config.config_service import ConfigService
+
+COMMENT_BSON_DECODER = BsonCodec.get_decoder(CommentModel, Comment)
+
+COMMENT_FIELDS = tuple(comment_field.name for comment_field in fields(Comment))
 
 
 class CommentUtil:
     @staticmethod
     def convert_comment_bson_to_comment(comment_bson: dict[str, Any]) -> Comment:
-        validated_comment_data = CommentModel.from_bson(comment_bson)
-        return Comment(
-            id=str(validated_comment_data.id),
-            task_id=validated_comment_data.task_id,
-            account_id=validated_comment_data.account_id,
-            content=validated_comment_data.content,
-            created_at=validated_comment_data.created_at,
-            updated_at=validated_comment_data.updated_at,
+        return COMMENT_BSON_DECODER(comment_bson)
+
+    @staticmethod
+    def transcode_raw_comments_bson(
+        raw_comments_bson: List[Any], comment_fields: Optional[Tuple[str, ...]]
+    ) -> Iterator[List[dict[str, Any]]]:
+        return BsonCodec.transcode_in_batches(
+            raw_comments_bson,
+            BsonCodec.get_json_transcoder(CommentModel, Comment, comment_fields),
+            ConfigService[int].get_value(key="listings.raw_bson_batch_size", default=100),
         )
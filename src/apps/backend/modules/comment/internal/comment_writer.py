@@ -1,32 +1,39 @@
 from datetime import datetime
+from typing import List, Tuple
 
 from bson.objectid import ObjectId
 from pymongo import ReturnDocument
 
+from modules.application.common.types import CounterReconciliationResult
+from modules.application.repository import ApplicationRepositoryClient
+
 from modules.comment.errors import CommentNotFoundError
 from modules.comment.internal.store.comment_model import CommentModel
 from modules.comment.internal.store.comment_repository import CommentRepository
-from modules.comment.internal.comment_reader import CommentReader
 from modules.comment.internal.comment_util import CommentUtil
 from modules.comment.types import (
     CreateCommentParams,
     DeleteCommentParams,
-    GetCommentParams,
+    DeleteTaskCommentsParams,
     Comment,
     CommentDeletionResult,
+    OrphanedCommentsDeletionResult,
     UpdateCommentParams,
 )
+from modules.config.config_service import ConfigService
+from modules.task.task_service import TaskService
+from modules.task.types import IncrementTaskCommentCountParams
 
 
 class CommentWriter:
     @staticmethod
     def create_comment(*, params: CreateCommentParams) -> Comment:
-        comment_bson = CommentModel(~~
+        comment_bson = CommentModel(
             task_id=params.task_id, account_id=params.account_id, content=params.content
         ).to_bson()
 
-        query = CommentRepository.collection().insert_one(comment_bson)
-        created_comment_bson = CommentRepository.collection().find_one({"_id": query.inserted_id})
+        created_comment_bson = CommentRepository.insert_document(comment_bson)
+        CommentWriter._increment_comment_count(account_id=params.account_id, task_id=params.task_id, amount=1)
 
         return CommentUtil.convert_comment_bson_to_comment(created_comment_bson)
 
@@ -41,29 +48,117 @@ class CommentWriter:
             },
             {"$set": {"content": params.content, "updated_at": datetime.now()}},
             return_document=ReturnDocument.AFTER,
+            session=ApplicationRepositoryClient.get_causal_session(),
         )
 
         if updated_comment_bson is None:
             raise CommentNotFoundError(comment_id=params.comment_id)
 
+        # The count is unchanged, but the increment still versions the task's comment listings
+        CommentWriter._increment_comment_count(account_id=params.account_id, task_id=params.task_id, amount=0)
+
         return CommentUtil.convert_comment_bson_to_comment(updated_comment_bson)
 
     @staticmethod
     def delete_comment(*, params: DeleteCommentParams) -> CommentDeletionResult:
-        comment = CommentReader.get_comment(
-            params=GetCommentParams(
-                account_id=params.account_id, task_id=params.task_id, comment_id=params.comment_id
-            )
-        )
-
         deletion_time = datetime.now()
-        updated_comment_bson = CommentRepository.collection().find_one_and_update(
-            {"_id": ObjectId(comment.id)},
-            {"$set": {"active": False, "updated_at": deletion_time}},
-            return_document=ReturnDocument.AFTER,
+        is_deleted = CommentRepository.soft_delete_document(
+            {"_id": ObjectId(params.comment_id), "task_id": params.task_id, "account_id": params.account_id},
+            deletion_time,
         )
 
-        if updated_comment_bson is None:
+        if not is_deleted:
             raise CommentNotFoundError(comment_id=params.comment_id)
 
+        CommentWriter._increment_comment_count(account_id=params.account_id, task_id=params.task_id, amount=-1)
+
         return CommentDeletionResult(comment_id=params.comment_id, deleted_at=deletion_time, success=True)
+
+    @staticmethod
+    def delete_task_comments(*, params: DeleteTaskCommentsParams) -> int:
+        """
+        Soft-deletes every active comment of a deleted task and returns how many were deleted. Works in chunks of
+        comments.deletion_chunk_size so each update_many stays short however many comments the task has. Every chunk
+        takes its comments off the task's comment_count, so the count and versions hold if a retry resumes midway.
+        """
+        chunk_size = ConfigService[int].get_value(key="comments.deletion_chunk_size")
+        filter_query = {"task_id": params.task_id, "active": True}
+        deleted_count = 0
+
+        while True:
+            comments_bson = list(
+                CommentRepository.collection().find(filter_query, {"_id": 1, "account_id": 1}).limit(chunk_size)
+            )
+            if not comments_bson:
+                return deleted_count
+
+            result = CommentRepository.collection().update_many(
+                {**filter_query, "_id": {"$in": [comment_bson["_id"] for comment_bson in comments_bson]}},
+                {"$set": {"active": False, "updated_at": datetime.now()}},
+            )
+            deleted_count += result.modified_count
+            CommentWriter._increment_comment_count(
+                account_id=comments_bson[0]["account_id"], task_id=params.task_id, amount=-result.modified_count
+            )
+
+    @staticmethod
+    def delete_orphaned_comments() -> OrphanedCommentsDeletionResult:
+        """
+        Soft-deletes the active comments of tasks that are no longer active, left behind when the deletion of a task
+        could not enqueue TaskCommentsDeletionWorker or the worker gave up. The tasks that still have active comments
+        are read from one cursor and checked comments.orphan_check_batch_size at a time.
+        """
+        batch_size = ConfigService[int].get_value(key="comments.orphan_check_batch_size")
+        checked_task_count = 0
+        orphaned_task_count = 0
+        deleted_comment_count = 0
+        task_ids: List[str] = []
+
+        for task_bson in CommentRepository.collection().aggregate(
+            [{"$match": {"active": True}}, {"$group": {"_id": "$task_id"}}], batchSize=batch_size
+        ):
+            task_ids.append(task_bson["_id"])
+            if len(task_ids) < batch_size:
+                continue
+            batch_orphaned_count, batch_deleted_count = CommentWriter._delete_orphaned_task_comments(task_ids=task_ids)
+            checked_task_count += len(task_ids)
+            orphaned_task_count += batch_orphaned_count
+            deleted_comment_count += batch_deleted_count
+            task_ids = []
+
+        if task_ids:
+            batch_orphaned_count, batch_deleted_count = CommentWriter._delete_orphaned_task_comments(task_ids=task_ids)
+            checked_task_count += len(task_ids)
+            orphaned_task_count += batch_orphaned_count
+            deleted_comment_count += batch_deleted_count
+
+        return OrphanedCommentsDeletionResult(
+            checked_task_count=checked_task_count,
+            orphaned_task_count=orphaned_task_count,
+            deleted_comment_count=deleted_comment_count,
+        )
+
+    @staticmethod
+    def reconcile_comment_counts() -> CounterReconciliationResult:
+        """
+        Recomputes every task's active comment count and overwrites the comment_count of the tasks that drifted.
+        Writes racing with the reconciliation can reintroduce drift, so run it outside of peak traffic.
+        """
+        return TaskService.repair_comment_counts()
+
+    @staticmethod
+    def _delete_orphaned_task_comments(*, task_ids: List[str]) -> Tuple[int, int]:
+        active_task_ids = set(TaskService.get_active_task_ids(task_ids=task_ids))
+        orphaned_task_ids = [task_id for task_id in task_ids if task_id not in active_task_ids]
+        deleted_comment_count = sum(
+            CommentWriter.delete_task_comments(params=DeleteTaskCommentsParams(task_id=task_id))
+            for task_id in orphaned_task_ids
+        )
+        return len(orphaned_task_ids), deleted_comment_count
+
+    @staticmethod
+    def _increment_comment_count(*, account_id: str, task_id: str, amount: int) -> None:
+        # The count lives on the task document so task listings return it without a query per task
+        TaskService.increment_comment_count(
+            params=IncrementTaskCommentCountParams(account_id=account_id, task_id=task_id, amount=amount)
+        )
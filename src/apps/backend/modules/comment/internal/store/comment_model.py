@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -13,9 +13,9 @@ class CommentModel(BaseModel):
     account_id: str
     content: str
     active: bool = True
-    created_at: Optional[datetime] = datetime.now()
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
     id: Optional[ObjectId | str] = None
-    updated_at: Optional[datetime] = datetime.now()
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
 
     @classmethod
     def from_bson(cls, bson_data: dict) -> "CommentModel":
@@ -1,9 +1,7 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.application.repository import ApplicationRepository
 from modules.comment.internal.store.comment_model import CommentModel
-from modules.logger.logger import Logger
 
 COMMENT_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -24,26 +22,30 @@ COMMENT_VALIDATION_SCHEMA = {
 class CommentRepository(ApplicationRepository):
     collection_name = CommentModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        # Create compound index for efficient querying by task and account
-        collection.create_index(
+    indexes = [
+        # Compound index for efficient querying by task and account
+        IndexModel(
             [("active", 1), ("task_id", 1), ("account_id", 1)],
             name="active_task_account_index",
             partialFilterExpression={"active": True},
-        )
-
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": COMMENT_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:
-                collection.database.create_collection(cls.collection_name, validator=COMMENT_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection comments: {e.details}")
-        return True
+        ),
+        # Backs the (created_at, _id) seek predicate and sort used by comment listings, and created_at range filters
+        IndexModel(
+            [("task_id", 1), ("account_id", 1), ("created_at", -1), ("_id", -1)],
+            name="task_account_created_at_id_index",
+            partialFilterExpression={"active": True},
+        ),
+        # Backs listings sorted by updated_at or filtered with updated_since
+        IndexModel(
+            [("task_id", 1), ("account_id", 1), ("updated_at", -1), ("_id", -1)],
+            name="task_account_updated_at_id_index",
+            partialFilterExpression={"active": True},
+        ),
+        # Backs account scoped full-text search over comment content
+        IndexModel(
+            [("account_id", 1), ("content", "text")],
+            name="account_id_content_text_index",
+            partialFilterExpression={"active": True},
+        ),
+    ]
+    validator = COMMENT_VALIDATION_SCHEMA
@@ -0,0 +1,99 @@
+from typing import Optional
+
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+from werkzeug.datastructures import MultiDict
+
+from modules.application.common.base_model import BaseModel
+from modules.application.response_serializer import ResponseSerializer
+from modules.application.rest_api.async_causal_consistency_middleware import async_causal_consistency_middleware
+from modules.application.rest_api.async_conditional_get_middleware import async_conditional_get_middleware
+from modules.application.rest_api.async_raw_listing_response import async_raw_listing_response
+from modules.application.rest_api.raw_listing_response import is_raw_listing_enabled
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.comment.async_comment_service import AsyncCommentService
+from modules.comment.rest_api.comment_view import COMMENT_FIELDS
+from modules.comment.rest_api.comment_view_util import CommentViewUtil
+from modules.comment.types import DeleteCommentParams, GetCommentParams
+
+
+async def get_comment_resource_version(
+    *, request_args: MultiDict, account_id: str, task_id: str, comment_id: Optional[str] = None
+) -> Optional[str]:
+    if comment_id:
+        return await AsyncCommentService.get_comment_version(
+            params=GetCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
+        )
+    return await AsyncCommentService.get_comments_version(task_id=task_id)
+
+
+class AsyncCommentView(MethodView):
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        create_comment_params = CommentViewUtil.build_create_comment_params(
+            account_id=account_id, task_id=task_id, request_data=await request.get_json()
+        )
+
+        created_comment = await AsyncCommentService.create_comment(params=create_comment_params)
+        comment_dict = ResponseSerializer.serialize(created_comment)
+
+        return jsonify(comment_dict), 201
+
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    @async_conditional_get_middleware(get_comment_resource_version)
+    async def get(self, account_id: str, task_id: str, comment_id: Optional[str] = None) -> ResponseReturnValue:
+        comment_fields = BaseModel.parse_projection_fields(request.args.get("fields"), COMMENT_FIELDS)
+
+        if comment_id:
+            comment_params = GetCommentParams(
+                account_id=account_id, task_id=task_id, comment_id=comment_id, fields=comment_fields
+            )
+            comment = await AsyncCommentService.get_comment(params=comment_params)
+            comment_dict = ResponseSerializer.serialize(comment, comment_fields)
+            return jsonify(comment_dict), 200
+        elif "cursor" in request.args:
+            cursor_comments_params = CommentViewUtil.build_cursor_paginated_comments_params(
+                account_id=account_id, task_id=task_id, request_args=request.args, comment_fields=comment_fields
+            )
+
+            cursor_pagination_result = await AsyncCommentService.get_cursor_paginated_comments(
+                params=cursor_comments_params
+            )
+
+            return jsonify(CommentViewUtil.serialize_pagination_result(cursor_pagination_result, comment_fields)), 200
+        else:
+            comments_params = CommentViewUtil.build_paginated_comments_params(
+                account_id=account_id, task_id=task_id, request_args=request.args, comment_fields=comment_fields
+            )
+
+            if is_raw_listing_enabled():
+                raw_pagination_result = await AsyncCommentService.get_raw_paginated_comments(params=comments_params)
+                return async_raw_listing_response(raw_pagination_result), 200
+
+            pagination_result = await AsyncCommentService.get_paginated_comments(params=comments_params)
+
+            return jsonify(CommentViewUtil.serialize_pagination_result(pagination_result, comment_fields)), 200
+
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def patch(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
+        update_comment_params = CommentViewUtil.build_update_comment_params(
+            account_id=account_id, task_id=task_id, comment_id=comment_id, request_data=await request.get_json()
+        )
+
+        updated_comment = await AsyncCommentService.update_comment(params=update_comment_params)
+        comment_dict = ResponseSerializer.serialize(updated_comment)
+
+        return jsonify(comment_dict), 200
+
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def delete(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
+        delete_params = DeleteCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
+
+        await AsyncCommentService.delete_comment(params=delete_params)
+
+        return "", 204
@@ -1,4 +1,5 @@
 from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
 
 from modules.comment.rest_api.comment_router import CommentRouter
 
@@ -8,3 +9,8 @@ class CommentRestApiServer:
     def create() -> Blueprint:
         comment_api_blueprint = Blueprint("comment", __name__)
         return CommentRouter.create_route(blueprint=comment_api_blueprint)
+
+    @staticmethod
+    def create_async() -> AsyncBlueprint:
+        comment_api_blueprint = AsyncBlueprint("comment", __name__)
+        return CommentRouter.create_async_route(blueprint=comment_api_blueprint)
@@ -1,5 +1,7 @@
 from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
 
+from modules.comment.rest_api.async_comment_view import AsyncCommentView
 from modules.comment.rest_api.comment_view import CommentView
 
 
@@ -18,3 +20,18 @@ class CommentRouter:
         )
 
         return blueprint
+
+    @staticmethod
+    def create_async_route(*, blueprint: AsyncBlueprint) -> AsyncBlueprint:
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>/comments",
+            view_func=AsyncCommentView.as_view("comment_view"),
+            methods=["POST", "GET"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>/comments/<comment_id>",
+            view_func=AsyncCommentView.as_view("comment_view_by_id"),
+            methods=["GET", "PATCH", "DELETE"],
+        )
+
+        return blueprint
@@ -1,97 +1,95 @@
-from dataclasses import asdict
+from dataclasses import fields
 from typing import Optional
 
+from werkzeug.datastructures import MultiDict
+
 from flask import jsonify, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
-from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
-from modules.application.common.types import PaginationParams
+from modules.application.common.base_model import BaseModel
+from modules.application.response_serializer import ResponseSerializer
+from modules.application.rest_api.causal_consistency_middleware import causal_consistency_middleware
+from modules.application.rest_api.conditional_get_middleware import conditional_get_middleware
+from modules.application.rest_api.raw_listing_response import is_raw_listing_enabled, raw_listing_response
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
-from modules.comment.errors import CommentBadRequestError
 from modules.comment.comment_service import CommentService
-from modules.comment.types import (
-    CreateCommentParams,
-    DeleteCommentParams,
-    GetPaginatedCommentsParams,
-    GetCommentParams,
-    UpdateCommentParams,
-)
+from modules.comment.rest_api.comment_view_util import CommentViewUtil
+from modules.comment.types import Comment, DeleteCommentParams, GetCommentParams
 
+COMMENT_FIELDS = tuple(comment_field.name for comment_field in fields(Comment))
 
-class CommentView(MethodView):
-    @access_auth_middleware
-    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
 
-        if request_data is None:
-            raise CommentBadRequestError("Request body is required")
+def get_comment_resource_version(
+    *, request_args: MultiDict, account_id: str, task_id: str, comment_id: Optional[str] = None
+) -> Optional[str]:
+    if comment_id:
+        return CommentService.get_comment_version(
+            params=GetCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
+        )
+    return CommentService.get_comments_version(task_id=task_id)
 
-        if not request_data.get("content"):
-            raise CommentBadRequestError("Content is required")
 
-        create_comment_params = CreateCommentParams(
-            account_id=account_id, task_id=task_id, content=request_data["content"]
+class CommentView(MethodView):
+    @access_auth_middleware
+    @causal_consistency_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        create_comment_params = CommentViewUtil.build_create_comment_params(
+            account_id=account_id, task_id=task_id, request_data=request.get_json()
         )
 
         created_comment = CommentService.create_comment(params=create_comment_params)
-        comment_dict = asdict(created_comment)
+        comment_dict = ResponseSerializer.serialize(created_comment)
 
         return jsonify(comment_dict), 201
 
     @access_auth_middleware
+    @causal_consistency_middleware
+    @conditional_get_middleware(get_comment_resource_version)
     def get(self, account_id: str, task_id: str, comment_id: Optional[str] = None) -> ResponseReturnValue:
+        comment_fields = BaseModel.parse_projection_fields(request.args.get("fields"), COMMENT_FIELDS)
+
         if comment_id:
-            comment_params = GetCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
+            comment_params = GetCommentParams(
+                account_id=account_id, task_id=task_id, comment_id=comment_id, fields=comment_fields
+            )
             comment = CommentService.get_comment(params=comment_params)
-            comment_dict = asdict(comment)
+            comment_dict = ResponseSerializer.serialize(comment, comment_fields)
             return jsonify(comment_dict), 200
-        else:
-            page = request.args.get("page", type=int)
-            size = request.args.get("size", type=int)
-
-            if page is not None and page < 1:
-                raise CommentBadRequestError("Page must be greater than 0")
-
-            if size is not None and size < 1:
-                raise CommentBadRequestError("Size must be greater than 0")
+        elif "cursor" in request.args:
+            cursor_comments_params = CommentViewUtil.build_cursor_paginated_comments_params(
+                account_id=account_id, task_id=task_id, request_args=request.args, comment_fields=comment_fields
+            )
 
-            if page is None:
-                page = DEFAULT_PAGINATION_PARAMS.page
-            if size is None:
-                size = DEFAULT_PAGINATION_PARAMS.size
+            cursor_pagination_result = CommentService.get_cursor_paginated_comments(params=cursor_comments_params)
 
-            pagination_params = PaginationParams(page=page, size=size, offset=0)
-            comments_params = GetPaginatedCommentsParams(
-                account_id=account_id, task_id=task_id, pagination_params=pagination_params
+            return jsonify(CommentViewUtil.serialize_pagination_result(cursor_pagination_result, comment_fields)), 200
+        else:
+            comments_params = CommentViewUtil.build_paginated_comments_params(
+                account_id=account_id, task_id=task_id, request_args=request.args, comment_fields=comment_fields
             )
 
-            pagination_result = CommentService.get_paginated_comments(params=comments_params)
+            if is_raw_listing_enabled():
+                return raw_listing_response(CommentService.get_raw_paginated_comments(params=comments_params)), 200
 
-            response_data = asdict(pagination_result)
+            pagination_result = CommentService.get_paginated_comments(params=comments_params)
 
-            return jsonify(response_data), 200
+            return jsonify(CommentViewUtil.serialize_pagination_result(pagination_result, comment_fields)), 200
 
     @access_auth_middleware
+    @causal_consistency_middleware
     def patch(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise CommentBadRequestError("Request body is required")
-
-        if not request_data.get("content"):
-            raise CommentBadRequestError("Content is required")
-
-        update_comment_params = UpdateCommentParams(
-            account_id=account_id, task_id=task_id, comment_id=comment_id, content=request_data["content"]
+        update_comment_params = CommentViewUtil.build_update_comment_params(
+            account_id=account_id, task_id=task_id, comment_id=comment_id, request_data=request.get_json()
         )
 
         updated_comment = CommentService.update_comment(params=update_comment_params)
-        comment_dict = asdict(updated_comment)
+        comment_dict = ResponseSerializer.serialize(updated_comment)
 
         return jsonify(comment_dict), 200
 
     @access_auth_middleware
+    @causal_consistency_middleware
     def delete(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
         delete_params = DeleteCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
 
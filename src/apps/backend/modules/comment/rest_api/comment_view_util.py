@@ -0,0 +1,133 @@
+from dataclasses import replace
+from typing import Any, Optional, Tuple
+
+from werkzeug.datastructures import MultiDict
+
+from modules.application.common.base_model import BaseModel
+from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS, LISTING_SORT_FIELDS
+from modules.application.common.types import (
+    CursorPaginationParams,
+    CursorPaginationResult,
+    PaginationParams,
+    PaginationResult,
+    SortParams,
+    TimestampFilterParams,
+)
+from modules.application.response_serializer import ResponseSerializer
+from modules.comment.errors import CommentBadRequestError
+from modules.comment.types import (
+    Comment,
+    CreateCommentParams,
+    GetCursorPaginatedCommentsParams,
+    GetPaginatedCommentsParams,
+    UpdateCommentParams,
+)
+
+
+class CommentViewUtil:
+    """
+    Request parsing and response shaping shared by the sync (Flask) and async (Quart) comment views.
+    """
+
+    @staticmethod
+    def build_create_comment_params(
+        *, account_id: str, task_id: str, request_data: Optional[dict[str, Any]]
+    ) -> CreateCommentParams:
+        if request_data is None:
+            raise CommentBadRequestError("Request body is required")
+
+        if not request_data.get("content"):
+            raise CommentBadRequestError("Content is required")
+
+        return CreateCommentParams(account_id=account_id, task_id=task_id, content=request_data["content"])
+
+    @staticmethod
+    def build_update_comment_params(
+        *, account_id: str, task_id: str, comment_id: str, request_data: Optional[dict[str, Any]]
+    ) -> UpdateCommentParams:
+        if request_data is None:
+            raise CommentBadRequestError("Request body is required")
+
+        if not request_data.get("content"):
+            raise CommentBadRequestError("Content is required")
+
+        return UpdateCommentParams(
+            account_id=account_id, task_id=task_id, comment_id=comment_id, content=request_data["content"]
+        )
+
+    @staticmethod
+    def build_cursor_paginated_comments_params(
+        *, account_id: str, task_id: str, request_args: MultiDict[str, str], comment_fields: Optional[tuple[str, ...]]
+    ) -> GetCursorPaginatedCommentsParams:
+        size = request_args.get("size", type=int)
+
+        if size is not None and size < 1:
+            raise CommentBadRequestError("Size must be greater than 0")
+
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        cursor_pagination_params = CursorPaginationParams(size=size, cursor=request_args.get("cursor") or None)
+        sort_params, filter_params = CommentViewUtil.parse_sort_and_filter_params(request_args=request_args)
+        return GetCursorPaginatedCommentsParams(
+            account_id=account_id,
+            task_id=task_id,
+            pagination_params=cursor_pagination_params,
+            sort_params=sort_params,
+            filter_params=filter_params,
+            fields=comment_fields,
+        )
+
+    @staticmethod
+    def build_paginated_comments_params(
+        *, account_id: str, task_id: str, request_args: MultiDict[str, str], comment_fields: Optional[tuple[str, ...]]
+    ) -> GetPaginatedCommentsParams:
+        page = request_args.get("page", type=int)
+        size = request_args.get("size", type=int)
+
+        if page is not None and page < 1:
+            raise CommentBadRequestError("Page must be greater than 0")
+
+        if size is not None and size < 1:
+            raise CommentBadRequestError("Size must be greater than 0")
+
+        if page is None:
+            page = DEFAULT_PAGINATION_PARAMS.page
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        pagination_params = PaginationParams(page=page, size=size, offset=0)
+        include_total = request_args.get("include_total", "true").lower() != "false"
+        sort_params, filter_params = CommentViewUtil.parse_sort_and_filter_params(request_args=request_args)
+        return GetPaginatedCommentsParams(
+            account_id=account_id,
+            task_id=task_id,
+            pagination_params=pagination_params,
+            sort_params=sort_params,
+            filter_params=filter_params,
+            include_total=include_total,
+            fields=comment_fields,
+        )
+
+    @staticmethod
+    def parse_sort_and_filter_params(
+        *, request_args: MultiDict[str, str]
+    ) -> Tuple[Optional[SortParams], Optional[TimestampFilterParams]]:
+        sort_params = BaseModel.parse_sort_params(
+            request_args.get("sort"), request_args.get("order"), LISTING_SORT_FIELDS
+        )
+        filter_params = BaseModel.parse_timestamp_filters(
+            request_args.get("created_after"), request_args.get("created_before"), request_args.get("updated_since")
+        )
+        return sort_params, filter_params
+
+    @staticmethod
+    def serialize_pagination_result(
+        pagination_result: PaginationResult[Comment] | CursorPaginationResult[Comment],
+        comment_fields: Optional[tuple[str, ...]],
+    ) -> dict[str, Any]:
+        response_data = ResponseSerializer.serialize(replace(pagination_result, items=[]))
+        response_data["items"] = [
+            ResponseSerializer.serialize(comment, comment_fields) for comment in pagination_result.items
+        ]
+        return response_data
@@ -1,8 +1,15 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
-from modules.application.common.types import PaginationParams, PaginationResult, SortParams
+from modules.application.common.types import (
+    CursorPaginationParams,
+    PaginationParams,
+    PaginationResult,
+    SortParams,
+    TextSearchPosition,
+    TimestampFilterParams,
+)
 
 
 @dataclass(frozen=True)
@@ -20,6 +27,7 @@ class GetCommentParams:
     account_id: str
     task_id: str
     comment_id: str
+    fields: Optional[Tuple[str, ...]] = None
 
 
 @dataclass(frozen=True)
@@ -28,6 +36,33 @@ class GetPaginatedCommentsParams:
     task_id: str
     pagination_params: PaginationParams
     sort_params: Optional[SortParams] = None
+    filter_params: Optional[TimestampFilterParams] = None
+    include_total: bool = True
+    fields: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class GetCursorPaginatedCommentsParams:
+    account_id: str
+    task_id: str
+    pagination_params: CursorPaginationParams
+    sort_params: Optional[SortParams] = None
+    filter_params: Optional[TimestampFilterParams] = None
+    fields: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class SearchCommentsParams:
+    account_id: str
+    text_query: str
+    limit: int
+    after: Optional[TextSearchPosition] = None
+
+
+@dataclass(frozen=True)
+class CommentSearchHit:
+    comment: Comment
+    score: float
 
 
 @dataclass(frozen=True)
@@ -52,6 +87,18 @@ class DeleteCommentParams:
     comment_id: str
 
 
+@dataclass(frozen=True)
+class DeleteTaskCommentsParams:
+    task_id: str
+
+
+@dataclass(frozen=True)
+class OrphanedCommentsDeletionResult:
+    checked_task_count: int
+    orphaned_task_count: int
+    deleted_comment_count: int
+
+
 @dataclass(frozen=True)
 class CommentDeletionResult:
     comment_id: str
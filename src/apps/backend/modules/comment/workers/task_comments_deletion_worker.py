@@ -0,0 +1,29 @@
+import asyncio
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.comment.comment_service import CommentService
+from modules.comment.types import DeleteTaskCommentsParams
+from modules.logger.logger import Logger
+
+
+class TaskCommentsDeletionWorker(BaseWorker):
+    """
+    Soft-deletes the comments of a deleted task off the request thread, so they leave the active partial indexes.
+    Re-running it is safe because it only touches comments that are still active. The deletion runs off the event
+    loop, which other activities of the worker share.
+    """
+
+    max_execution_time_in_seconds = 1800
+    max_retries = 5
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        (task_id,) = args
+        deleted_count = await asyncio.to_thread(
+            CommentService.delete_task_comments, params=DeleteTaskCommentsParams(task_id=task_id)
+        )
+        Logger.info(message=f"Soft-deleted {deleted_count} comments of deleted task {task_id}")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
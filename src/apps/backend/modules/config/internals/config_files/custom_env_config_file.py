@@ -25,7 +25,10 @@ class CustomEnvConfig:
 
         for key, value in data.items():
             if isinstance(value, dict):
-                updated_data[key] = CustomEnvConfig._search_and_replace_dict_value_with_env(value)
+                # A formatted mapping whose variable is unset resolves to None and must not hide the file value
+                result = CustomEnvConfig._search_and_replace_dict_value_with_env(value)
+                if result is not None:
+                    updated_data[key] = result
             elif isinstance(value, str):
                 result = CustomEnvConfig._search_and_get_str_value_from_env(value)
                 if result is not None:
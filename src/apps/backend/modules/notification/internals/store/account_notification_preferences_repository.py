@@ -1,11 +1,9 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.notification.internals.store.account_notification_preferences_model import (
     AccountNotificationPreferencesModel,
 )
 from modules.application.repository import ApplicationRepository
-from modules.logger.logger import Logger
 
 ACCOUNT_NOTIFICATION_PREFERENCES_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -35,32 +33,13 @@ ACCOUNT_NOTIFICATION_PREFERENCES_VALIDATION_SCHEMA = {
 class AccountNotificationPreferencesRepository(ApplicationRepository):
     collection_name = AccountNotificationPreferencesModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index(
+    indexes = [
+        IndexModel(
             [("active", 1), ("account_id", 1)],
             unique=True,
             partialFilterExpression={"active": True},
             name="active_account_id_unique",
-        )
-
-        collection.create_index("account_id", name="account_id_index")
-
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": ACCOUNT_NOTIFICATION_PREFERENCES_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:
-                collection.database.create_collection(
-                    cls.collection_name, validator=ACCOUNT_NOTIFICATION_PREFERENCES_VALIDATION_SCHEMA
-                )
-            else:
-                Logger.error(
-                    message=f"OperationFailure occurred for collection account_notification_preferences: {e.details}"
-                )
-        return True
+        ),
+        IndexModel("account_id", name="account_id_index"),
+    ]
+    validator = ACCOUNT_NOTIFICATION_PREFERENCES_VALIDATION_SCHEMA
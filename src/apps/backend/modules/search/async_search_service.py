@@ -0,0 +1,15 @@
+import asyncio
+
+from modules.search.search_service import SearchService
+from modules.search.types import SearchParams, SearchResult
+
+
+class AsyncSearchService:
+    """
+    Async counterpart of SearchService. Search fans out to the task and comment services, so it runs the sync service
+    in a worker thread.
+    """
+
+    @staticmethod
+    async def search(*, params: SearchParams) -> SearchResult:
+        return await asyncio.to_thread(SearchService.search, params=params)
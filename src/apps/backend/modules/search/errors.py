@@ -0,0 +1,7 @@
+from modules.application.errors import AppError
+from modules.search.types import SearchErrorCode
+
+
+class SearchBadRequestError(AppError):
+    def __init__(self, message: str) -> None:
+        super().__init__(code=SearchErrorCode.BAD_REQUEST, http_status_code=400, message=message)
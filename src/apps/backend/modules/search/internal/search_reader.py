@@ -0,0 +1,51 @@
+from modules.comment.comment_service import CommentService
+from modules.comment.types import SearchCommentsParams
+from modules.search.internal.search_util import SearchUtil
+from modules.search.types import SearchHit, SearchHitType, SearchParams, SearchResult
+from modules.task.task_service import TaskService
+from modules.task.types import SearchTasksParams
+
+
+class SearchReader:
+    @staticmethod
+    def search(*, params: SearchParams) -> SearchResult:
+        """
+        Fetches one page more than requested from every type that is not exhausted yet, merges them by relevance and
+        highlights only the hits that make it onto the page.
+        """
+        positions, exhausted = SearchUtil.decode_cursor(params.cursor)
+        fetch_limit = params.size + 1
+
+        fetched_hits: dict[SearchHitType, list[SearchHit]] = {hit_type: [] for hit_type in SearchHitType}
+        if SearchHitType.TASK not in exhausted:
+            task_search_hits = TaskService.search_tasks(
+                params=SearchTasksParams(
+                    account_id=params.account_id,
+                    text_query=params.text_query,
+                    limit=fetch_limit,
+                    after=positions[SearchHitType.TASK],
+                )
+            )
+            fetched_hits[SearchHitType.TASK] = [SearchUtil.convert_task_search_hit(hit) for hit in task_search_hits]
+        if SearchHitType.COMMENT not in exhausted:
+            comment_search_hits = CommentService.search_comments(
+                params=SearchCommentsParams(
+                    account_id=params.account_id,
+                    text_query=params.text_query,
+                    limit=fetch_limit,
+                    after=positions[SearchHitType.COMMENT],
+                )
+            )
+            fetched_hits[SearchHitType.COMMENT] = [
+                SearchUtil.convert_comment_search_hit(hit) for hit in comment_search_hits
+            ]
+
+        page = SearchUtil.merge_hits([hit for hits in fetched_hits.values() for hit in hits], params.size)
+        next_cursor = SearchUtil.calculate_next_cursor(
+            fetched_hits=fetched_hits, page=page, positions=positions, exhausted=exhausted, fetch_limit=fetch_limit
+        )
+
+        highlight_pattern = SearchUtil.build_highlight_pattern(params.text_query)
+        return SearchResult(
+            items=[SearchUtil.highlight_hit(hit, highlight_pattern) for hit in page], next_cursor=next_cursor
+        )
@@ -0,0 +1,173 @@
+import base64
+import html
+import json
+import re
+from dataclasses import replace
+from typing import List, Optional, Set, Tuple
+
+from bson.errors import InvalidId
+from bson.objectid import ObjectId
+
+from modules.application.common.types import TextSearchPosition
+from modules.application.errors import InvalidPaginationCursorError
+from modules.comment.types import CommentSearchHit
+from modules.search.types import SearchHit, SearchHitType
+from modules.task.types import TaskSearchHit
+
+# Snippets of long fields keep this many characters, starting a little before the first match
+SNIPPET_LENGTH = 160
+SNIPPET_LEADING_CONTEXT_LENGTH = 40
+
+# Words Mongo drops from English text searches, so they must not be highlighted either
+SEARCH_STOP_WORDS = {"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or"}
+SEARCH_STOP_WORDS |= {"that", "the", "this", "to", "was", "with"}
+
+SearchPositions = dict[SearchHitType, Optional[TextSearchPosition]]
+
+
+class SearchUtil:
+    @staticmethod
+    def convert_task_search_hit(task_search_hit: TaskSearchHit) -> SearchHit:
+        return SearchHit(
+            type=SearchHitType.TASK,
+            id=task_search_hit.task.id,
+            score=task_search_hit.score,
+            highlights={},
+            task=task_search_hit.task,
+        )
+
+    @staticmethod
+    def convert_comment_search_hit(comment_search_hit: CommentSearchHit) -> SearchHit:
+        return SearchHit(
+            type=SearchHitType.COMMENT,
+            id=comment_search_hit.comment.id,
+            score=comment_search_hit.score,
+            highlights={},
+            comment=comment_search_hit.comment,
+        )
+
+    @staticmethod
+    def merge_hits(hits: List[SearchHit], size: int) -> List[SearchHit]:
+        """
+        Orders hits of every type by score, then type and id descending, the order each type was fetched in, so a
+        type's hits on a page always continue right after its position in the cursor.
+        """
+        return sorted(hits, key=lambda hit: (hit.score, hit.type == SearchHitType.TASK, hit.id), reverse=True)[:size]
+
+    @staticmethod
+    def calculate_next_cursor(
+        *,
+        fetched_hits: dict[SearchHitType, List[SearchHit]],
+        page: List[SearchHit],
+        positions: SearchPositions,
+        exhausted: Set[SearchHitType],
+        fetch_limit: int,
+    ) -> Optional[str]:
+        """
+        Advances the position of every type that has hits on the page. A type is exhausted once it returned fewer
+        hits than fetch_limit and all of them made it onto a page. Returns None when every type is exhausted.
+        """
+        next_positions = dict(positions)
+        next_exhausted = set(exhausted)
+        for hit_type, type_hits in fetched_hits.items():
+            page_hits = [hit for hit in page if hit.type == hit_type]
+            if page_hits:
+                next_positions[hit_type] = TextSearchPosition(score=page_hits[-1].score, id=page_hits[-1].id)
+            if hit_type not in exhausted and len(type_hits) < fetch_limit and len(page_hits) == len(type_hits):
+                next_exhausted.add(hit_type)
+
+        if next_exhausted == set(SearchHitType):
+            return None
+        return SearchUtil.encode_cursor(next_positions, next_exhausted)
+
+    @staticmethod
+    def encode_cursor(positions: SearchPositions, exhausted: Set[SearchHitType]) -> str:
+        payload = {
+            "positions": {
+                hit_type.value: None if position is None else {"score": position.score, "id": position.id}
+                for hit_type, position in positions.items()
+            },
+            "exhausted": sorted(hit_type.value for hit_type in exhausted),
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8")
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Tuple[SearchPositions, Set[SearchHitType]]:
+        if not cursor:
+            return {hit_type: None for hit_type in SearchHitType}, set()
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))
+            positions: SearchPositions = {}
+            for hit_type in SearchHitType:
+                position = payload["positions"][hit_type.value]
+                positions[hit_type] = (
+                    None
+                    if position is None
+                    else TextSearchPosition(score=float(position["score"]), id=str(ObjectId(position["id"])))
+                )
+            return positions, {SearchHitType(hit_type) for hit_type in payload["exhausted"]}
+        except (ValueError, KeyError, TypeError, InvalidId):
+            raise InvalidPaginationCursorError()
+
+    @staticmethod
+    def highlight_hit(hit: SearchHit, highlight_pattern: Optional[re.Pattern[str]]) -> SearchHit:
+        if highlight_pattern is None:
+            return hit
+
+        if hit.task is not None:
+            searched_fields = {"title": hit.task.title, "description": hit.task.description}
+        elif hit.comment is not None:
+            searched_fields = {"content": hit.comment.content}
+        else:
+            searched_fields = {}
+
+        highlights = {}
+        for field_name, text in searched_fields.items():
+            snippet = SearchUtil.build_snippet(text, highlight_pattern)
+            if snippet is not None:
+                highlights[field_name] = snippet
+        return replace(hit, highlights=highlights)
+
+    @staticmethod
+    def build_highlight_pattern(text_query: str) -> Optional[re.Pattern[str]]:
+        """
+        Matches the words that start with the stem of a searched word, approximating the words Mongo's stemmer
+        matched. $text reports only a score, so the matched words have to be found again here.
+        """
+        stems = {
+            SearchUtil.stem_word(word)
+            for word in re.findall(r"\w+", text_query.lower())
+            if word not in SEARCH_STOP_WORDS
+        }
+        if not stems:
+            return None
+
+        alternatives = "|".join(re.escape(stem) for stem in sorted(stems, key=len, reverse=True))
+        return re.compile(rf"\b(?:{alternatives})\w*", re.IGNORECASE)
+
+    @staticmethod
+    def build_snippet(text: str, highlight_pattern: re.Pattern[str]) -> Optional[str]:
+        first_match = highlight_pattern.search(text)
+        if first_match is None:
+            return None
+
+        start = 0 if len(text) <= SNIPPET_LENGTH else max(0, first_match.start() - SNIPPET_LEADING_CONTEXT_LENGTH)
+        end = min(len(text), start + SNIPPET_LENGTH)
+
+        snippet_parts = ["…" if start > 0 else ""]
+        position = start
+        for match in highlight_pattern.finditer(text, start, end):
+            snippet_parts.append(html.escape(text[position : match.start()]))
+            snippet_parts.append(f"<mark>{html.escape(match.group())}</mark>")
+            position = match.end()
+        snippet_parts.append(html.escape(text[position:end]))
+        snippet_parts.append("…" if end < len(text) else "")
+        return "".join(snippet_parts)
+
+    @staticmethod
+    def stem_word(word: str) -> str:
+        for suffix in ("ing", "ed", "es", "s", "e"):
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                return word[: -len(suffix)]
+        return word
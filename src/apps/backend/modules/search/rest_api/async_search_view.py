@@ -0,0 +1,19 @@
+from quart import jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.application.rest_api.async_causal_consistency_middleware import async_causal_consistency_middleware
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.search.async_search_service import AsyncSearchService
+from modules.search.rest_api.search_view_util import SearchViewUtil
+
+
+class AsyncSearchView(MethodView):
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def get(self, account_id: str) -> ResponseReturnValue:
+        search_params = SearchViewUtil.build_search_params(account_id=account_id, request_args=request.args)
+
+        search_result = await AsyncSearchService.search(params=search_params)
+
+        return jsonify(SearchViewUtil.serialize_search_result(search_result)), 200
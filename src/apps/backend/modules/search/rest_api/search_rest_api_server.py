@@ -0,0 +1,16 @@
+from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
+
+from modules.search.rest_api.search_router import SearchRouter
+
+
+class SearchRestApiServer:
+    @staticmethod
+    def create() -> Blueprint:
+        search_api_blueprint = Blueprint("search", __name__)
+        return SearchRouter.create_route(blueprint=search_api_blueprint)
+
+    @staticmethod
+    def create_async() -> AsyncBlueprint:
+        search_api_blueprint = AsyncBlueprint("search", __name__)
+        return SearchRouter.create_async_route(blueprint=search_api_blueprint)
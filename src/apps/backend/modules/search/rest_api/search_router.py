@@ -0,0 +1,23 @@
+from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
+
+from modules.search.rest_api.async_search_view import AsyncSearchView
+from modules.search.rest_api.search_view import SearchView
+
+
+class SearchRouter:
+    @staticmethod
+    def create_route(*, blueprint: Blueprint) -> Blueprint:
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/search", view_func=SearchView.as_view("search_view"), methods=["GET"]
+        )
+
+        return blueprint
+
+    @staticmethod
+    def create_async_route(*, blueprint: AsyncBlueprint) -> AsyncBlueprint:
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/search", view_func=AsyncSearchView.as_view("search_view"), methods=["GET"]
+        )
+
+        return blueprint
@@ -0,0 +1,19 @@
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.application.rest_api.causal_consistency_middleware import causal_consistency_middleware
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.search.rest_api.search_view_util import SearchViewUtil
+from modules.search.search_service import SearchService
+
+
+class SearchView(MethodView):
+    @access_auth_middleware
+    @causal_consistency_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        search_params = SearchViewUtil.build_search_params(account_id=account_id, request_args=request.args)
+
+        search_result = SearchService.search(params=search_params)
+
+        return jsonify(SearchViewUtil.serialize_search_result(search_result)), 200
@@ -0,0 +1,58 @@
+from typing import Any
+
+from werkzeug.datastructures import MultiDict
+
+from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
+from modules.application.response_serializer import ResponseSerializer
+from modules.config.config_service import ConfigService
+from modules.search.errors import SearchBadRequestError
+from modules.search.types import SearchHit, SearchParams, SearchResult
+
+
+class SearchViewUtil:
+    """
+    Request parsing and response shaping shared by the sync (Flask) and async (Quart) search views.
+    """
+
+    @staticmethod
+    def build_search_params(*, account_id: str, request_args: MultiDict[str, str]) -> SearchParams:
+        text_query = request_args.get("q", "").strip()
+        if not text_query:
+            raise SearchBadRequestError("q is required")
+
+        max_query_length = ConfigService[int].get_value(key="search.max_query_length")
+        if len(text_query) > max_query_length:
+            raise SearchBadRequestError(f"q can be at most {max_query_length} characters long")
+
+        size = request_args.get("size", type=int)
+        max_page_size = ConfigService[int].get_value(key="search.max_page_size")
+        if size is not None and not 1 <= size <= max_page_size:
+            raise SearchBadRequestError(f"Size must be between 1 and {max_page_size}")
+
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        return SearchParams(
+            account_id=account_id, text_query=text_query, size=size, cursor=request_args.get("cursor") or None
+        )
+
+    @staticmethod
+    def serialize_search_result(search_result: SearchResult) -> dict[str, Any]:
+        return {
+            "items": [SearchViewUtil.serialize_search_hit(hit) for hit in search_result.items],
+            "next_cursor": search_result.next_cursor,
+        }
+
+    @staticmethod
+    def serialize_search_hit(hit: SearchHit) -> dict[str, Any]:
+        hit_dict: dict[str, Any] = {
+            "type": hit.type.value,
+            "id": hit.id,
+            "score": hit.score,
+            "highlights": hit.highlights,
+        }
+        if hit.task is not None:
+            hit_dict["task"] = ResponseSerializer.serialize(hit.task)
+        if hit.comment is not None:
+            hit_dict["comment"] = ResponseSerializer.serialize(hit.comment)
+        return hit_dict
@@ -0,0 +1,8 @@
+from modules.search.internal.search_reader import SearchReader
+from modules.search.types import SearchParams, SearchResult
+
+
+class SearchService:
+    @staticmethod
+    def search(*, params: SearchParams) -> SearchResult:
+        return SearchReader.search(params=params)
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import List, Optional
+
+from modules.comment.types import Comment
+from modules.task.types import Task
+
+
+class SearchHitType(StrEnum):
+    TASK = "task"
+    COMMENT = "comment"
+
+
+@dataclass(frozen=True)
+class SearchParams:
+    account_id: str
+    text_query: str
+    size: int
+    cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    type: SearchHitType
+    id: str
+    score: float
+    # Searched field name to an HTML escaped snippet of it, with the matched words wrapped in <mark>
+    highlights: dict[str, str]
+    task: Optional[Task] = None
+    comment: Optional[Comment] = None
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    items: List[SearchHit]
+    next_cursor: Optional[str]
+
+
+@dataclass(frozen=True)
+class SearchErrorCode:
+    BAD_REQUEST: str = "SEARCH_ERR_01"
@@ -0,0 +1,114 @@
+from typing import AsyncIterator, Optional
+
+from modules.application.common.types import CursorPaginationResult, PaginationResult, RawPaginationResult
+from modules.comment.types import Comment
+from modules.task.internal.async_task_reader import AsyncTaskReader
+from modules.task.internal.async_task_writer import AsyncTaskWriter
+from modules.task.types import (
+    AsyncImportTasksParams,
+    AsyncStageTaskImportParams,
+    CreateTaskParams,
+    CreateTasksParams,
+    CreateTasksResult,
+    DeleteTaskParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
+    GetCursorPaginatedTasksWithCommentsParams,
+    GetPaginatedTasksParams,
+    GetPaginatedTasksWithCommentsParams,
+    GetTaskImportParams,
+    GetTaskParams,
+    IncrementTaskCommentCountParams,
+    Task,
+    TaskDeletionResult,
+    TaskImport,
+    TaskImportResult,
+    TaskWithComments,
+    UpdateTaskParams,
+)
+
+
+class AsyncTaskService:
+    @staticmethod
+    async def create_task(*, params: CreateTaskParams) -> Task:
+        return await AsyncTaskWriter.create_task(params=params)
+
+    @staticmethod
+    async def create_tasks(*, params: CreateTasksParams) -> CreateTasksResult:
+        return await AsyncTaskWriter.create_tasks(params=params)
+
+    @staticmethod
+    async def import_tasks(*, params: AsyncImportTasksParams) -> TaskImportResult:
+        return await AsyncTaskWriter.import_tasks(params=params)
+
+    @staticmethod
+    async def stage_task_import(*, params: AsyncStageTaskImportParams) -> TaskImport:
+        return await AsyncTaskWriter.stage_task_import(params=params)
+
+    @staticmethod
+    async def fail_task_import(*, import_id: str) -> None:
+        await AsyncTaskWriter.fail_task_import(import_id=import_id)
+
+    @staticmethod
+    async def get_task_import(*, params: GetTaskImportParams) -> TaskImport:
+        return await AsyncTaskReader.get_task_import(params=params)
+
+    @staticmethod
+    async def get_task(*, params: GetTaskParams) -> Task:
+        return await AsyncTaskReader.get_task(params=params)
+
+    @staticmethod
+    async def get_task_version(*, params: GetTaskParams) -> Optional[str]:
+        return await AsyncTaskReader.get_task_version(params=params)
+
+    @staticmethod
+    async def get_tasks_version(*, account_id: str) -> str:
+        return await AsyncTaskReader.get_tasks_version(account_id=account_id)
+
+    @staticmethod
+    async def get_task_comments_version(*, task_id: str) -> Optional[str]:
+        return await AsyncTaskReader.get_task_comments_version(task_id=task_id)
+
+    @staticmethod
+    async def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
+        return await AsyncTaskReader.get_paginated_tasks(params=params)
+
+    @staticmethod
+    async def get_raw_paginated_tasks(*, params: GetPaginatedTasksParams) -> RawPaginationResult:
+        return await AsyncTaskReader.get_raw_paginated_tasks(params=params)
+
+    @staticmethod
+    async def get_cursor_paginated_tasks(*, params: GetCursorPaginatedTasksParams) -> CursorPaginationResult[Task]:
+        return await AsyncTaskReader.get_cursor_paginated_tasks(params=params)
+
+    @staticmethod
+    async def get_paginated_tasks_with_comments(
+        *, params: GetPaginatedTasksWithCommentsParams
+    ) -> PaginationResult[TaskWithComments]:
+        return await AsyncTaskReader.get_paginated_tasks_with_comments(params=params)
+
+    @staticmethod
+    async def get_cursor_paginated_tasks_with_comments(
+        *, params: GetCursorPaginatedTasksWithCommentsParams
+    ) -> CursorPaginationResult[TaskWithComments]:
+        return await AsyncTaskReader.get_cursor_paginated_tasks_with_comments(params=params)
+
+    @staticmethod
+    def export_tasks_with_comments(*, params: ExportTasksParams) -> AsyncIterator[Task | Comment]:
+        return AsyncTaskReader.export_tasks_with_comments(params=params)
+
+    @staticmethod
+    async def update_task(*, params: UpdateTaskParams) -> Task:
+        return await AsyncTaskWriter.update_task(params=params)
+
+    @staticmethod
+    async def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
+        return await AsyncTaskWriter.delete_task(params=params)
+
+    @staticmethod
+    async def get_comment_count(*, task_id: str) -> int:
+        return await AsyncTaskReader.get_comment_count(task_id=task_id)
+
+    @staticmethod
+    async def increment_comment_count(*, params: IncrementTaskCommentCountParams) -> None:
+        await AsyncTaskWriter.increment_comment_count(params=params)
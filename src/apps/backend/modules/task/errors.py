@@ -12,3 +12,12 @@ class TaskNotFoundError(AppError):
 class TaskBadRequestError(AppError):
     def __init__(self, message: str) -> None:
         super().__init__(code=TaskErrorCode.BAD_REQUEST, http_status_code=400, message=message)
+
+
+class TaskImportNotFoundError(AppError):
+    def __init__(self, import_id: str) -> None:
+        super().__init__(
+            code=TaskErrorCode.IMPORT_NOT_FOUND,
+            http_status_code=404,
+            message=f"Task import with id {import_id} not found.",
+        )
@@ -0,0 +1,336 @@
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from bson.objectid import ObjectId
+from bson.raw_bson import DEFAULT_RAW_BSON_OPTIONS
+from pymongo.errors import DuplicateKeyError
+
+from modules.application.common.base_model import BaseModel
+from modules.application.common.constants import DETAIL_READ_PREFERENCE, LISTING_READ_PREFERENCE
+from modules.application.common.types import (
+    CursorPaginationResult,
+    PaginationParams,
+    PaginationResult,
+    RawPaginationResult,
+)
+from modules.application.repository import ApplicationRepositoryClient, AsyncApplicationRepositoryClient
+from modules.comment.types import Comment
+from modules.config.config_service import ConfigService
+from modules.task.errors import TaskImportNotFoundError, TaskNotFoundError
+from modules.task.internal.store.task_count_model import TaskCountModel
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_import_repository import TaskImportRepository
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_util import TASK_FIELDS, TaskUtil
+from modules.task.types import (
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
+    GetCursorPaginatedTasksWithCommentsParams,
+    GetPaginatedTasksParams,
+    GetPaginatedTasksWithCommentsParams,
+    GetTaskImportParams,
+    GetTaskParams,
+    Task,
+    TaskImport,
+    TaskWithComments,
+)
+
+
+class AsyncTaskReader:
+    @staticmethod
+    async def get_task(*, params: GetTaskParams) -> Task:
+        task_bson = await TaskRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(DETAIL_READ_PREFERENCE)
+        ).find_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+            BaseModel.build_projection(params.fields),
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        if task_bson is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+        return TaskUtil.convert_task_bson_to_task(task_bson)
+
+    @staticmethod
+    async def get_task_import(*, params: GetTaskImportParams) -> TaskImport:
+        task_import_bson = None
+        if ObjectId.is_valid(params.import_id):
+            task_import_bson = await TaskImportRepository.async_collection().find_one(
+                {"_id": ObjectId(params.import_id), "account_id": params.account_id}
+            )
+        if task_import_bson is None:
+            raise TaskImportNotFoundError(import_id=params.import_id)
+        return TaskUtil.convert_task_import_bson_to_task_import(task_import_bson)
+
+    @staticmethod
+    async def get_task_version(*, params: GetTaskParams) -> Optional[str]:
+        """
+        Version of a task's representation for conditional GETs. Reads two fields, so answering a revalidation costs
+        less than reading the task. Returns None when the task does not exist.
+        """
+        if not ObjectId.is_valid(params.task_id):
+            return None
+        task_bson = await TaskRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(DETAIL_READ_PREFERENCE)
+        ).find_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+            {"updated_at": 1, "comment_count": 1},
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        if task_bson is None:
+            return None
+        # The comment count is part of the representation but changes without touching updated_at
+        return f"{task_bson.get('updated_at')}:{task_bson.get('comment_count', 0)}"
+
+    @staticmethod
+    async def get_tasks_version(*, account_id: str) -> str:
+        task_count_bson = await TaskCountRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).find_one({"_id": account_id}, {"version": 1}, session=AsyncApplicationRepositoryClient.get_causal_session())
+        if task_count_bson is None:
+            return "0"
+        return str(TaskCountModel.from_bson(task_count_bson).version)
+
+    @staticmethod
+    async def get_task_comments_version(*, task_id: str) -> Optional[str]:
+        if not ObjectId.is_valid(task_id):
+            return None
+        task_bson = await TaskRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).find_one(
+            {"_id": ObjectId(task_id), "active": True},
+            {"comments_version": 1},
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        if task_bson is None:
+            return None
+        return str(TaskModel.from_bson(task_bson).comments_version)
+
+    @staticmethod
+    async def get_task_count(*, account_id: str) -> int:
+        task_count_bson = await TaskCountRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).find_one({"_id": account_id}, session=AsyncApplicationRepositoryClient.get_causal_session())
+        if task_count_bson is not None and "count" in task_count_bson:
+            return TaskCountModel.from_bson(task_count_bson).count
+
+        # Accounts whose tasks predate the counter have no count yet, only task writes bumping the listing version, so
+        # their tasks are counted once and the count is seeded with the result
+        task_count = await TaskRepository.async_collection().count_documents(
+            {"account_id": account_id, "active": True}, session=AsyncApplicationRepositoryClient.get_causal_session()
+        )
+        try:
+            await TaskCountRepository.async_collection().update_one(
+                {"_id": account_id, "count": {"$exists": False}},
+                {"$set": {"count": task_count}},
+                upsert=True,
+                session=AsyncApplicationRepositoryClient.get_causal_session(),
+            )
+        except DuplicateKeyError:
+            # A concurrent listing seeded the count first
+            pass
+        return task_count
+
+    @staticmethod
+    async def get_listing_task_count(*, account_id: str, filter_query: dict[str, Any], filtered: bool) -> int:
+        """
+        The per account counter only holds the unfiltered total, so a filtered listing counts its matches instead.
+        """
+        if not filtered:
+            return await AsyncTaskReader.get_task_count(account_id=account_id)
+        return await TaskRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).count_documents(filter_query, session=AsyncApplicationRepositoryClient.get_causal_session())
+
+    @staticmethod
+    async def get_comment_count(*, task_id: str) -> int:
+        if not ObjectId.is_valid(task_id):
+            return 0
+        task_bson = await TaskRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).find_one(
+            {"_id": ObjectId(task_id)},
+            {"comment_count": 1},
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        if task_bson is None:
+            return 0
+        return TaskModel.from_bson(task_bson).comment_count
+
+    @staticmethod
+    async def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
+        tasks_bson, pagination_params, total_count, total_pages = await AsyncTaskReader._find_paginated_tasks(
+            params=params, raw=False
+        )
+        tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
+        return PaginationResult(
+            items=tasks, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+        )
+
+    @staticmethod
+    async def get_raw_paginated_tasks(*, params: GetPaginatedTasksParams) -> RawPaginationResult:
+        raw_tasks_bson, pagination_params, total_count, total_pages = await AsyncTaskReader._find_paginated_tasks(
+            params=params, raw=True
+        )
+        return RawPaginationResult(
+            item_batches=TaskUtil.transcode_raw_tasks_bson(raw_tasks_bson, params.fields),
+            pagination_params=pagination_params,
+            total_count=total_count,
+            total_pages=total_pages,
+        )
+
+    @staticmethod
+    async def get_cursor_paginated_tasks(*, params: GetCursorPaginatedTasksParams) -> CursorPaginationResult[Task]:
+        filter_query = BaseModel.apply_pagination_cursor(
+            BaseModel.apply_timestamp_filters({"account_id": params.account_id, "active": True}, params.filter_params),
+            params.pagination_params.cursor,
+            params.sort_params,
+        )
+        ((sort_by, _), _) = BaseModel.build_sort(params.sort_params)
+        cursor = (
+            TaskRepository.async_collection(
+                read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+            )
+            .find(
+                filter_query,
+                BaseModel.build_projection(params.fields, required_fields=(sort_by,)),
+                session=AsyncApplicationRepositoryClient.get_causal_session(),
+            )
+            .sort(BaseModel.build_sort(params.sort_params))
+            .limit(params.pagination_params.size + 1)
+        )
+
+        tasks_bson, next_cursor = BaseModel.calculate_next_pagination_cursor(
+            await cursor.to_list(), params.pagination_params.size, params.sort_params
+        )
+        tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
+        return CursorPaginationResult(items=tasks, pagination_params=params.pagination_params, next_cursor=next_cursor)
+
+    @staticmethod
+    async def get_paginated_tasks_with_comments(
+        *, params: GetPaginatedTasksWithCommentsParams
+    ) -> PaginationResult[TaskWithComments]:
+        tasks_params = params.tasks_params
+        filter_query = BaseModel.apply_timestamp_filters(
+            {"account_id": tasks_params.account_id, "active": True}, tasks_params.filter_params
+        )
+        total_count = (
+            await AsyncTaskReader.get_listing_task_count(
+                account_id=tasks_params.account_id,
+                filter_query=filter_query,
+                filtered=tasks_params.filter_params is not None,
+            )
+            if tasks_params.include_total
+            else None
+        )
+        pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
+            tasks_params.pagination_params, total_count
+        )
+
+        tasks_bson = await AsyncTaskReader._aggregate_tasks_with_comments(
+            pipeline=TaskUtil.build_tasks_with_comments_pipeline(
+                account_id=tasks_params.account_id,
+                filter_query=filter_query,
+                sort=BaseModel.build_sort(tasks_params.sort_params),
+                projection=BaseModel.build_projection(tasks_params.fields),
+                skip=skip,
+                limit=pagination_params.size,
+                comments_limit=params.comments_limit,
+            )
+        )
+        tasks = [TaskUtil.convert_task_bson_to_task_with_comments(task_bson) for task_bson in tasks_bson]
+        return PaginationResult(
+            items=tasks, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+        )
+
+    @staticmethod
+    async def get_cursor_paginated_tasks_with_comments(
+        *, params: GetCursorPaginatedTasksWithCommentsParams
+    ) -> CursorPaginationResult[TaskWithComments]:
+        tasks_params = params.tasks_params
+        ((sort_by, _), _) = BaseModel.build_sort(tasks_params.sort_params)
+        tasks_bson = await AsyncTaskReader._aggregate_tasks_with_comments(
+            pipeline=TaskUtil.build_tasks_with_comments_pipeline(
+                account_id=tasks_params.account_id,
+                filter_query=BaseModel.apply_pagination_cursor(
+                    BaseModel.apply_timestamp_filters(
+                        {"account_id": tasks_params.account_id, "active": True}, tasks_params.filter_params
+                    ),
+                    tasks_params.pagination_params.cursor,
+                    tasks_params.sort_params,
+                ),
+                sort=BaseModel.build_sort(tasks_params.sort_params),
+                projection=BaseModel.build_projection(tasks_params.fields, required_fields=(sort_by,)),
+                skip=0,
+                limit=tasks_params.pagination_params.size + 1,
+                comments_limit=params.comments_limit,
+            )
+        )
+
+        page_bson, next_cursor = BaseModel.calculate_next_pagination_cursor(
+            tasks_bson, tasks_params.pagination_params.size, tasks_params.sort_params
+        )
+        tasks = [TaskUtil.convert_task_bson_to_task_with_comments(task_bson) for task_bson in page_bson]
+        return CursorPaginationResult(
+            items=tasks, pagination_params=tasks_params.pagination_params, next_cursor=next_cursor
+        )
+
+    @staticmethod
+    async def export_tasks_with_comments(*, params: ExportTasksParams) -> AsyncIterator[Task | Comment]:
+        tasks_cursor = await TaskRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).aggregate(
+            TaskUtil.build_task_export_pipeline(account_id=params.account_id, after_task_id=params.after_task_id),
+            batchSize=ConfigService[int].get_value(key="tasks.export_batch_size"),
+        )
+        try:
+            previous_task_id = None
+            async for task_bson in tasks_cursor:
+                for item in TaskUtil.convert_task_export_bson(task_bson, previous_task_id):
+                    yield item
+                previous_task_id = task_bson["_id"]
+        finally:
+            await tasks_cursor.close()
+
+    @staticmethod
+    async def _aggregate_tasks_with_comments(*, pipeline: List[dict[str, Any]]) -> List[dict[str, Any]]:
+        tasks_cursor = await TaskRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        ).aggregate(pipeline, session=AsyncApplicationRepositoryClient.get_causal_session())
+        return await tasks_cursor.to_list()
+
+    @staticmethod
+    async def _find_paginated_tasks(
+        *, params: GetPaginatedTasksParams, raw: bool
+    ) -> Tuple[List[Any], PaginationParams, Optional[int], Optional[int]]:
+        """
+        Reads the page of task documents. Raw pages are read as RawBSONDocuments projected to the Task fields, and
+        still in full while the request's causal session is open, so only their transcoding is left to the response.
+        """
+        filter_query = BaseModel.apply_timestamp_filters(
+            {"account_id": params.account_id, "active": True}, params.filter_params
+        )
+        total_count = (
+            await AsyncTaskReader.get_listing_task_count(
+                account_id=params.account_id, filter_query=filter_query, filtered=params.filter_params is not None
+            )
+            if params.include_total
+            else None
+        )
+        pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
+            params.pagination_params, total_count
+        )
+        collection = TaskRepository.async_collection(
+            read_preference=ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+        )
+        if raw:
+            collection = collection.with_options(codec_options=DEFAULT_RAW_BSON_OPTIONS)
+        cursor = collection.find(
+            filter_query,
+            BaseModel.build_projection((params.fields or TASK_FIELDS) if raw else params.fields),
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+
+        cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
+
+        tasks_bson = await cursor.skip(skip).limit(pagination_params.size).to_list()
+        return tasks_bson, pagination_params, total_count, total_pages
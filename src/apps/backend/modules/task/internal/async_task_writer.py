@@ -0,0 +1,180 @@
+from datetime import datetime
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+
+from modules.application.repository import AsyncApplicationRepositoryClient
+from modules.task.errors import TaskNotFoundError
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_import_chunk_model import TaskImportChunkModel
+from modules.task.internal.store.task_import_chunk_repository import TaskImportChunkRepository
+from modules.task.internal.store.task_import_model import TaskImportModel
+from modules.task.internal.store.task_import_repository import TaskImportRepository
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_import_batcher import TaskImportBatcher
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import (
+    AsyncImportTasksParams,
+    AsyncStageTaskImportParams,
+    CreateTaskParams,
+    CreateTasksParams,
+    CreateTasksResult,
+    DeleteTaskParams,
+    IncrementTaskCommentCountParams,
+    Task,
+    TaskDeletionResult,
+    TaskImport,
+    TaskImportResult,
+    TaskImportStatus,
+    UpdateTaskParams,
+)
+
+
+class AsyncTaskWriter:
+    @staticmethod
+    async def create_task(*, params: CreateTaskParams) -> Task:
+        task_bson = TaskModel(
+            account_id=params.account_id, description=params.description, title=params.title
+        ).to_bson()
+
+        created_task_bson = await TaskRepository.async_insert_document(task_bson)
+        await AsyncTaskWriter._increment_task_count(account_id=params.account_id, amount=1)
+
+        return TaskUtil.convert_task_bson_to_task(created_task_bson)
+
+    @staticmethod
+    async def create_tasks(*, params: CreateTasksParams) -> CreateTasksResult:
+        tasks_bson = [
+            TaskRepository.to_stored_document(
+                TaskModel(account_id=params.account_id, description=task.description, title=task.title).to_bson()
+            )
+            for task in params.tasks
+        ]
+
+        write_errors: dict[int, str] = {}
+        try:
+            await TaskRepository.async_collection().insert_many(
+                tasks_bson, ordered=params.ordered, session=AsyncApplicationRepositoryClient.get_causal_session()
+            )
+        except BulkWriteError as e:
+            write_errors = {error["index"]: error["errmsg"] for error in e.details["writeErrors"]}
+
+        create_tasks_result = TaskUtil.build_create_tasks_result(
+            tasks_bson=tasks_bson, write_errors=write_errors, ordered=params.ordered
+        )
+        if create_tasks_result.created_count:
+            await AsyncTaskWriter._increment_task_count(
+                account_id=params.account_id, amount=create_tasks_result.created_count
+            )
+
+        return create_tasks_result
+
+    @staticmethod
+    async def import_tasks(*, params: AsyncImportTasksParams) -> TaskImportResult:
+        task_import_batcher = TaskUtil.create_task_import_batcher()
+        async for line in params.lines:
+            if task_import_batcher.add_line(line):
+                await AsyncTaskWriter._write_task_import_batch(
+                    account_id=params.account_id, task_import_batcher=task_import_batcher
+                )
+
+        if task_import_batcher.has_pending_tasks():
+            await AsyncTaskWriter._write_task_import_batch(
+                account_id=params.account_id, task_import_batcher=task_import_batcher
+            )
+
+        return task_import_batcher.build_result()
+
+    @staticmethod
+    async def stage_task_import(*, params: AsyncStageTaskImportParams) -> TaskImport:
+        task_import_bson = await TaskImportRepository.async_insert_document(
+            TaskImportModel(account_id=params.account_id, status=str(TaskImportStatus.PENDING)).to_bson()
+        )
+        import_id = str(task_import_bson["_id"])
+
+        index = 0
+        async for chunk in params.chunks:
+            await TaskImportChunkRepository.async_collection().insert_one(
+                TaskImportChunkModel(import_id=import_id, index=index, data=chunk).to_bson()
+            )
+            index += 1
+
+        return TaskUtil.convert_task_import_bson_to_task_import(task_import_bson)
+
+    @staticmethod
+    async def fail_task_import(*, import_id: str) -> None:
+        await TaskImportRepository.async_collection().update_one(
+            {"_id": ObjectId(import_id)},
+            {"$set": {"status": str(TaskImportStatus.FAILED), "updated_at": datetime.now()}},
+        )
+        await TaskImportChunkRepository.async_collection().delete_many({"import_id": import_id})
+
+    @staticmethod
+    async def update_task(*, params: UpdateTaskParams) -> Task:
+        updated_task_bson = await TaskRepository.async_collection().find_one_and_update(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+            {"$set": {"description": params.description, "title": params.title, "updated_at": datetime.now()}},
+            return_document=ReturnDocument.AFTER,
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+
+        if updated_task_bson is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        await AsyncTaskWriter._increment_task_listing_version(account_id=params.account_id)
+        return TaskUtil.convert_task_bson_to_task(updated_task_bson)
+
+    @staticmethod
+    async def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
+        deletion_time = datetime.now()
+        is_deleted = await TaskRepository.async_soft_delete_document(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id}, deletion_time
+        )
+
+        if not is_deleted:
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        await AsyncTaskWriter._increment_task_count(account_id=params.account_id, amount=-1)
+
+        return TaskDeletionResult(task_id=params.task_id, deleted_at=deletion_time, success=True)
+
+    @staticmethod
+    async def increment_comment_count(*, params: IncrementTaskCommentCountParams) -> None:
+        if not ObjectId.is_valid(params.task_id):
+            return
+        await TaskRepository.async_collection().update_one(
+            {"_id": ObjectId(params.task_id)},
+            {"$inc": {"comment_count": params.amount, "comments_version": 1}},
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        # Listings show comment counts and can embed comments, so comment writes change them too
+        await AsyncTaskWriter._increment_task_listing_version(account_id=params.account_id)
+
+    @staticmethod
+    async def _write_task_import_batch(*, account_id: str, task_import_batcher: TaskImportBatcher) -> None:
+        create_tasks_result = await AsyncTaskWriter.create_tasks(
+            params=CreateTasksParams(account_id=account_id, tasks=task_import_batcher.take_batch(), ordered=False)
+        )
+        task_import_batcher.record_batch_result(create_tasks_result)
+
+    @staticmethod
+    async def _increment_task_count(*, account_id: str, amount: int) -> None:
+        update_result = await TaskCountRepository.async_collection().update_one(
+            {"_id": account_id, "count": {"$exists": True}},
+            {"$inc": {"count": amount, "version": 1}},
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
+        if update_result.matched_count == 0:
+            # Not counted yet, the first listing seeds the count from the tasks themselves, this write included
+            await AsyncTaskWriter._increment_task_listing_version(account_id=account_id)
+
+    @staticmethod
+    async def _increment_task_listing_version(*, account_id: str) -> None:
+        await TaskCountRepository.async_collection().update_one(
+            {"_id": account_id},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            session=AsyncApplicationRepositoryClient.get_causal_session(),
+        )
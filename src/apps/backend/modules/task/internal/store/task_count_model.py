@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskCountModel(BaseModel):
+    # Keyed by account_id so that reads and $inc updates go straight to the _id index
+    id: str
+    count: int = 0
+    # Bumped by every write that changes the account's task listings, versions them for conditional GETs
+    version: int = 0
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskCountModel":
+        return cls(id=str(bson_data.get("_id")), count=bson_data.get("count", 0), version=bson_data.get("version", 0))
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_counts"
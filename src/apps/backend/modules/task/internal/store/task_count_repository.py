@@ -0,0 +1,6 @@
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_count_model import TaskCountModel
+
+
+class TaskCountRepository(ApplicationRepository):
+    collection_name = TaskCountModel.get_collection_name()
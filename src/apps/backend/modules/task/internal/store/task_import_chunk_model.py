@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskImportChunkModel(BaseModel):
+    import_id: str
+    # Position of the chunk in the upload
+    index: int
+    data: bytes
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    id: Optional[ObjectId | str] = None
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskImportChunkModel":
+        return cls(
+            created_at=bson_data.get("created_at"),
+            data=bson_data.get("data", b""),
+            id=bson_data.get("_id"),
+            import_id=bson_data.get("import_id", ""),
+            index=bson_data.get("index", 0),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_import_chunks"
@@ -0,0 +1,17 @@
+from pymongo import IndexModel
+
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_import_chunk_model import TaskImportChunkModel
+
+# Chunks of an import whose worker never ran to completion are dropped after a week
+TASK_IMPORT_CHUNK_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class TaskImportChunkRepository(ApplicationRepository):
+    collection_name = TaskImportChunkModel.get_collection_name()
+
+    indexes = [
+        # Backs TaskImportWorker reading an import's chunks in upload order
+        IndexModel([("import_id", 1), ("index", 1)], name="import_id_index_index", unique=True),
+        IndexModel([("created_at", 1)], name="created_at_ttl_index", expireAfterSeconds=TASK_IMPORT_CHUNK_TTL_SECONDS),
+    ]
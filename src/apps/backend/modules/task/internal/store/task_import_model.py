@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskImportModel(BaseModel):
+    account_id: str
+    status: str
+    # Lines already processed, where a retried TaskImportWorker resumes
+    line_count: int = 0
+    imported_count: int = 0
+    failed_count: int = 0
+    errors: List[dict[str, Any]] = field(default_factory=list)
+    # Incremented by every run of TaskImportWorker that claims the import, only the latest run may write
+    attempt: int = 0
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    id: Optional[ObjectId | str] = None
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskImportModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            attempt=bson_data.get("attempt", 0),
+            created_at=bson_data.get("created_at"),
+            errors=bson_data.get("errors", []),
+            failed_count=bson_data.get("failed_count", 0),
+            id=bson_data.get("_id"),
+            imported_count=bson_data.get("imported_count", 0),
+            line_count=bson_data.get("line_count", 0),
+            status=bson_data.get("status", ""),
+            updated_at=bson_data.get("updated_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_imports"
@@ -0,0 +1,18 @@
+from pymongo import IndexModel
+
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_import_model import TaskImportModel
+from modules.task.types import TaskImportStatus
+
+
+class TaskImportRepository(ApplicationRepository):
+    collection_name = TaskImportModel.get_collection_name()
+
+    indexes = [
+        # Backs StaleTaskImportsWorker looking up the running imports whose progress stopped moving
+        IndexModel(
+            [("updated_at", 1)],
+            partialFilterExpression={"status": str(TaskImportStatus.RUNNING)},
+            name="running_updated_at_index",
+        )
+    ]
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -13,15 +13,20 @@ class TaskModel(BaseModel):
     description: str
     title: str
     active: bool = True
-    created_at: Optional[datetime] = datetime.now()
+    comment_count: int = 0
+    # Bumped by every comment write of the task, versions the task's comment listings for conditional GETs
+    comments_version: int = 0
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
     id: Optional[ObjectId | str] = None
-    updated_at: Optional[datetime] = datetime.now()
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
 
     @classmethod
     def from_bson(cls, bson_data: dict) -> "TaskModel":
         return cls(
             account_id=bson_data.get("account_id", ""),
             active=bson_data.get("active", True),
+            comment_count=bson_data.get("comment_count", 0),
+            comments_version=bson_data.get("comments_version", 0),
             created_at=bson_data.get("created_at"),
             description=bson_data.get("description", ""),
             id=bson_data.get("_id"),
@@ -1,9 +1,7 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo import IndexModel
 
 from modules.application.repository import ApplicationRepository
 from modules.task.internal.store.task_model import TaskModel
-from modules.logger.logger import Logger
 
 TASK_VALIDATION_SCHEMA = {
     "$jsonSchema": {
@@ -14,6 +12,8 @@ TASK_VALIDATION_SCHEMA = {
             "description": {"bsonType": "string"},
             "title": {"bsonType": "string"},
             "active": {"bsonType": "bool"},
+            "comment_count": {"bsonType": ["int", "long"]},
+            "comments_version": {"bsonType": ["int", "long"]},
             "created_at": {"bsonType": "date"},
             "updated_at": {"bsonType": "date"},
         },
@@ -24,23 +24,32 @@ TASK_VALIDATION_SCHEMA = {
 class TaskRepository(ApplicationRepository):
     collection_name = TaskModel.get_collection_name()
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index(
+    indexes = [
+        IndexModel(
             [("active", 1), ("account_id", 1)], name="active_account_id_index", partialFilterExpression={"active": True}
-        )
-
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": TASK_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:
-                collection.database.create_collection(cls.collection_name, validator=TASK_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection tasks: {e.details}")
-        return True
+        ),
+        # Backs the (created_at, _id) seek predicate and sort used by task listings, and created_at range filters
+        IndexModel(
+            [("account_id", 1), ("created_at", -1), ("_id", -1)],
+            name="account_id_created_at_id_index",
+            partialFilterExpression={"active": True},
+        ),
+        # Backs the NDJSON export, which walks an account's tasks in _id order so it can resume after any task
+        IndexModel(
+            [("account_id", 1), ("_id", 1)], name="account_id_id_index", partialFilterExpression={"active": True}
+        ),
+        # Backs listings sorted by updated_at or filtered with updated_since
+        IndexModel(
+            [("account_id", 1), ("updated_at", -1), ("_id", -1)],
+            name="account_id_updated_at_id_index",
+            partialFilterExpression={"active": True},
+        ),
+        # Backs account scoped full-text search, where a title match outranks a description match
+        IndexModel(
+            [("account_id", 1), ("title", "text"), ("description", "text")],
+            name="account_id_title_description_text_index",
+            weights={"title": 5, "description": 1},
+            partialFilterExpression={"active": True},
+        ),
+    ]
+    validator = TASK_VALIDATION_SCHEMA
@@ -0,0 +1,111 @@
+from typing import List, Optional
+
+import orjson
+
+from modules.task.errors import TaskBadRequestError
+from modules.task.types import CreateTaskItemParams, CreateTasksResult, TaskImportLineError, TaskImportResult
+
+
+class TaskImportBatcher:
+    """
+    Turns the NDJSON lines of a task import into insert_many batches and tallies the outcome of every line. Lines are
+    validated as they are added and a batch is handed out once it holds batch_size tasks, so an import of any size
+    holds a single batch. Only the first max_reported_errors failed lines are kept, the others are only counted.
+    A batcher built from the progress of an interrupted import carries on from its last line.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        max_line_bytes: int,
+        max_reported_errors: int,
+        progress: Optional[TaskImportResult] = None,
+    ) -> None:
+        self._batch_size = batch_size
+        self._max_line_bytes = max_line_bytes
+        self._max_reported_errors = max_reported_errors
+
+        self._line_count = progress.line_count if progress else 0
+        self._imported_count = progress.imported_count if progress else 0
+        self._failed_count = progress.failed_count if progress else 0
+        self._errors: List[TaskImportLineError] = list(progress.errors) if progress else []
+
+        self._batch: List[CreateTaskItemParams] = []
+        self._batch_line_numbers: List[int] = []
+        self._taken_batch_line_numbers: List[int] = []
+
+    def add_line(self, line: bytes) -> bool:
+        """
+        Validates the next line of the upload. Returns True once the pending batch is full.
+        """
+        self._line_count += 1
+        if not line.strip():
+            return False
+
+        try:
+            task_item = self._parse_line(line)
+        except TaskBadRequestError as e:
+            self._record_error(line_number=self._line_count, message=e.message)
+            return False
+
+        self._batch.append(task_item)
+        self._batch_line_numbers.append(self._line_count)
+        return len(self._batch) >= self._batch_size
+
+    def has_pending_tasks(self) -> bool:
+        return bool(self._batch)
+
+    def take_batch(self) -> List[CreateTaskItemParams]:
+        batch = self._batch
+        self._taken_batch_line_numbers = self._batch_line_numbers
+        self._batch = []
+        self._batch_line_numbers = []
+        return batch
+
+    def record_batch_result(self, create_tasks_result: CreateTasksResult) -> None:
+        """
+        Tallies the outcome of the batch last taken, reporting failed tasks by the line they were read from.
+        """
+        self._imported_count += create_tasks_result.created_count
+        for item_result in create_tasks_result.items:
+            if not item_result.success:
+                self._record_error(
+                    line_number=self._taken_batch_line_numbers[item_result.index],
+                    message=item_result.error_message or "Task could not be created",
+                )
+
+    def build_result(self) -> TaskImportResult:
+        return TaskImportResult(
+            line_count=self._line_count,
+            imported_count=self._imported_count,
+            failed_count=self._failed_count,
+            errors=list(self._errors),
+        )
+
+    def _parse_line(self, line: bytes) -> CreateTaskItemParams:
+        if len(line) > self._max_line_bytes:
+            raise TaskBadRequestError(f"Line is longer than {self._max_line_bytes} bytes")
+
+        try:
+            task_data = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            raise TaskBadRequestError("Line is not valid JSON")
+
+        if not isinstance(task_data, dict):
+            raise TaskBadRequestError("Line must be a JSON object")
+
+        title = task_data.get("title")
+        if not title or not isinstance(title, str):
+            raise TaskBadRequestError("Title is required")
+
+        description = task_data.get("description")
+        if not description or not isinstance(description, str):
+            raise TaskBadRequestError("Description is required")
+
+        return CreateTaskItemParams(description=description, title=title)
+
+    def _record_error(self, *, line_number: int, message: str) -> None:
+        self._failed_count += 1
+        if len(self._errors) < self._max_reported_errors:
+            self._errors.append(TaskImportLineError(line=line_number, message=message))
@@ -1,16 +1,259 @@
-from typing import Any
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, cast
 
+from bson.objectid import ObjectId
+
+from modules.application.bson_codec import BsonCodec
+from modules.comment.types import Comment
+from modules.config.config_service import ConfigService
+from modules.task.internal.store.task_import_model import TaskImportModel
 from modules.task.internal.store.task_model import TaskModel
-from modules.task.types import Task
+from modules.task.internal.task_import_batcher import TaskImportBatcher
+from modules.task.types import (
+    CreateTaskItemResult,
+    CreateTasksResult,
+    Task,
+    TaskImport,
+    TaskImportLineError,
+    TaskImportResult,
+    TaskWithComments,
+)
+
+# Owned by the comment module; tasks only read it to embed comments in listings and exports
+COMMENTS_COLLECTION_NAME = "comments"
+
+TASK_BSON_DECODER = BsonCodec.get_decoder(TaskModel, Task)
+
+TASK_FIELDS = tuple(task_field.name for task_field in fields(Task))
 
 
 class TaskUtil:
     @staticmethod
     def convert_task_bson_to_task(task_bson: dict[str, Any]) -> Task:
-        validated_task_data = TaskModel.from_bson(task_bson)
-        return Task(
-            account_id=validated_task_data.account_id,
-            description=validated_task_data.description,
-            id=str(validated_task_data.id),
-            title=validated_task_data.title,
+        return TASK_BSON_DECODER(task_bson)
+
+    @staticmethod
+    def transcode_raw_tasks_bson(
+        raw_tasks_bson: List[Any], task_fields: Optional[Tuple[str, ...]]
+    ) -> Iterator[List[dict[str, Any]]]:
+        return BsonCodec.transcode_in_batches(
+            raw_tasks_bson,
+            BsonCodec.get_json_transcoder(TaskModel, Task, task_fields),
+            ConfigService[int].get_value(key="listings.raw_bson_batch_size", default=100),
+        )
+
+    @staticmethod
+    def convert_task_bson_to_task_with_comments(task_bson: dict[str, Any]) -> TaskWithComments:
+        return TaskWithComments(
+            task=TaskUtil.convert_task_bson_to_task(task_bson),
+            comments=[
+                TaskUtil.convert_comment_bson_to_comment(comment_bson) for comment_bson in task_bson.get("comments", [])
+            ],
+        )
+
+    @staticmethod
+    def convert_comment_bson_to_comment(comment_bson: dict[str, Any]) -> Comment:
+        return Comment(
+            id=str(comment_bson["_id"]),
+            task_id=comment_bson["task_id"],
+            account_id=comment_bson["account_id"],
+            content=comment_bson["content"],
+            created_at=comment_bson["created_at"],
+            updated_at=comment_bson["updated_at"],
+        )
+
+    @staticmethod
+    def convert_task_export_bson(
+        task_bson: dict[str, Any], previous_task_id: Optional[ObjectId]
+    ) -> List[Task | Comment]:
+        """
+        Export documents hold a task and at most one of its comments, so a task spans as many documents as it has
+        comments. Its task line is only emitted from the first of them.
+        """
+        items: List[Task | Comment] = []
+        if task_bson["_id"] != previous_task_id:
+            items.append(TaskUtil.convert_task_bson_to_task(task_bson))
+        if "comments" in task_bson:
+            items.append(TaskUtil.convert_comment_bson_to_comment(task_bson["comments"]))
+        return items
+
+    @staticmethod
+    def build_tasks_with_comments_pipeline(
+        *,
+        account_id: str,
+        filter_query: dict[str, Any],
+        sort: Sequence[Tuple[str, int]],
+        projection: Optional[dict[str, int]],
+        skip: int,
+        limit: int,
+        comments_limit: int,
+    ) -> List[dict[str, Any]]:
+        """
+        Pages through the tasks exactly like the find() based listings and only then joins comments, so the $lookup runs
+        once per task on the page. Its sub-pipeline is served by the comments' (task_id, account_id, created_at, _id)
+        index and stops after comments_limit comments.
+        """
+        pipeline: List[dict[str, Any]] = [{"$match": filter_query}, {"$sort": dict(sort)}]
+        if skip:
+            pipeline.append({"$skip": skip})
+        pipeline.append({"$limit": limit})
+        if projection is not None:
+            pipeline.append({"$project": projection})
+
+        pipeline += TaskUtil.build_comments_lookup_stages(
+            account_id=account_id, comments_sort={"created_at": -1, "_id": -1}, comments_limit=comments_limit
+        )
+        return pipeline
+
+    @staticmethod
+    def build_task_export_pipeline(*, account_id: str, after_task_id: Optional[str]) -> List[dict[str, Any]]:
+        """
+        Walks every active task of the account in _id order, after after_task_id when resuming, and joins all of its
+        active comments oldest first. The whole export is this one pipeline, read through a single cursor. The comments
+        are unwound into one document each, so a task with any number of comments stays under the 16 MB BSON limit.
+        """
+        filter_query: dict[str, Any] = {"account_id": account_id, "active": True}
+        if after_task_id is not None:
+            filter_query["_id"] = {"$gt": ObjectId(after_task_id)}
+
+        return [
+            {"$match": filter_query},
+            {"$sort": {"_id": 1}},
+            *TaskUtil.build_comments_lookup_stages(
+                account_id=account_id,
+                comments_sort={"created_at": 1, "_id": 1},
+                comments_limit=None,
+                unwind_comments=True,
+            ),
+        ]
+
+    @staticmethod
+    def build_comments_lookup_stages(
+        *, account_id: str, comments_sort: dict[str, int], comments_limit: Optional[int], unwind_comments: bool = False
+    ) -> List[dict[str, Any]]:
+        """
+        With unwind_comments every comment gets a document of its own, tasks without comments keeping theirs. The
+        $unwind has to follow the $lookup directly for Mongo to coalesce the two, so the joined array is never built.
+        """
+        comments_pipeline: List[dict[str, Any]] = [
+            {"$match": {"account_id": account_id, "active": True}},
+            {"$sort": comments_sort},
+        ]
+        if comments_limit is not None:
+            comments_pipeline.append({"$limit": comments_limit})
+
+        stages: List[dict[str, Any]] = [
+            # Comments reference their task by the string form of its _id
+            {"$addFields": {"_comment_task_id": {"$toString": "$_id"}}},
+            {
+                "$lookup": {
+                    "from": COMMENTS_COLLECTION_NAME,
+                    "localField": "_comment_task_id",
+                    "foreignField": "task_id",
+                    "pipeline": comments_pipeline,
+                    "as": "comments",
+                }
+            },
+        ]
+        if unwind_comments:
+            stages.append({"$unwind": {"path": "$comments", "preserveNullAndEmptyArrays": True}})
+        stages.append({"$unset": "_comment_task_id"})
+        return stages
+
+    @staticmethod
+    def build_comment_count_repair_pipeline() -> List[dict[str, Any]]:
+        """
+        Walks every task with the active comment count joined in. The $lookup only counts the task's comments, so
+        each task stays small however many comments it has.
+        """
+        return [
+            {"$project": {"account_id": 1, "comment_count": 1}},
+            {"$addFields": {"_comment_task_id": {"$toString": "$_id"}}},
+            {
+                "$lookup": {
+                    "from": COMMENTS_COLLECTION_NAME,
+                    "localField": "_comment_task_id",
+                    "foreignField": "task_id",
+                    "pipeline": [{"$match": {"active": True}}, {"$count": "count"}],
+                    "as": "active_comments",
+                }
+            },
+            {"$unset": "_comment_task_id"},
+        ]
+
+    @staticmethod
+    def get_active_comment_count(task_bson: dict[str, Any]) -> int:
+        # $count emits no document when the task has no active comments
+        active_comments = task_bson["active_comments"]
+        return int(active_comments[0]["count"]) if active_comments else 0
+
+    @staticmethod
+    def build_create_tasks_result(
+        *, tasks_bson: List[dict[str, Any]], write_errors: dict[int, str], ordered: bool
+    ) -> CreateTasksResult:
+        """
+        In ordered mode Mongo stops at the first failed document, so every later document is reported as not
+        attempted; unordered mode attempts every document.
+        """
+        first_failed_index = min(write_errors) if write_errors else len(tasks_bson)
+        item_results = []
+        for index, task_bson in enumerate(tasks_bson):
+            if index in write_errors:
+                item_results.append(CreateTaskItemResult(index=index, success=False, error_message=write_errors[index]))
+            elif ordered and index > first_failed_index:
+                item_results.append(
+                    CreateTaskItemResult(
+                        index=index,
+                        success=False,
+                        error_message="Not attempted because an earlier task in the ordered batch failed.",
+                    )
+                )
+            else:
+                item_results.append(
+                    CreateTaskItemResult(index=index, success=True, task=TaskUtil.convert_task_bson_to_task(task_bson))
+                )
+
+        created_count = sum(1 for item_result in item_results if item_result.success)
+        return CreateTasksResult(
+            items=item_results, created_count=created_count, failed_count=len(item_results) - created_count
+        )
+
+    @staticmethod
+    def create_task_import_batcher(progress: Optional[TaskImportResult] = None) -> TaskImportBatcher:
+        return TaskImportBatcher(
+            batch_size=ConfigService[int].get_value(key="tasks.import_batch_size"),
+            max_line_bytes=ConfigService[int].get_value(key="tasks.import_max_line_bytes"),
+            max_reported_errors=ConfigService[int].get_value(key="tasks.import_max_reported_errors"),
+            progress=progress,
         )
+
+    @staticmethod
+    def convert_task_import_bson_to_task_import(task_import_bson: dict[str, Any]) -> TaskImport:
+        task_import_model = TaskImportModel.from_bson(task_import_bson)
+        return TaskImport(
+            id=str(task_import_model.id),
+            account_id=task_import_model.account_id,
+            status=task_import_model.status,
+            result=TaskImportResult(
+                line_count=task_import_model.line_count,
+                imported_count=task_import_model.imported_count,
+                failed_count=task_import_model.failed_count,
+                errors=[
+                    TaskImportLineError(line=error["line"], message=error["message"])
+                    for error in task_import_model.errors
+                ],
+            ),
+            created_at=cast(datetime, task_import_model.created_at),
+            updated_at=cast(datetime, task_import_model.updated_at),
+        )
+
+    @staticmethod
+    def build_task_import_progress_update(progress: TaskImportResult) -> dict[str, Any]:
+        return {
+            "line_count": progress.line_count,
+            "imported_count": progress.imported_count,
+            "failed_count": progress.failed_count,
+            "errors": [{"line": error.line, "message": error.message} for error in progress.errors],
+            "updated_at": datetime.now(),
+        }
@@ -1,19 +1,39 @@
-from datetime import datetime
+import itertools
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Iterator, List, Optional
 
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
+from modules.application.common.types import CounterReconciliationResult
+from modules.application.ndjson_line_splitter import split_ndjson_lines
+from modules.application.repository import ApplicationRepositoryClient
+
+from modules.config.config_service import ConfigService
 from modules.task.errors import TaskNotFoundError
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_import_chunk_model import TaskImportChunkModel
+from modules.task.internal.store.task_import_chunk_repository import TaskImportChunkRepository
+from modules.task.internal.store.task_import_model import TaskImportModel
+from modules.task.internal.store.task_import_repository import TaskImportRepository
 from modules.task.internal.store.task_model import TaskModel
 from modules.task.internal.store.task_repository import TaskRepository
-from modules.task.internal.task_reader import TaskReader
+from modules.task.internal.task_import_batcher import TaskImportBatcher
 from modules.task.internal.task_util import TaskUtil
 from modules.task.types import (
     CreateTaskParams,
+    CreateTasksParams,
+    CreateTasksResult,
     DeleteTaskParams,
-    GetTaskParams,
+    ImportTasksParams,
+    IncrementTaskCommentCountParams,
+    StageTaskImportParams,
     Task,
     TaskDeletionResult,
+    TaskImport,
+    TaskImportResult,
+    TaskImportStatus,
     UpdateTaskParams,
 )
 
@@ -25,36 +45,354 @@ class TaskWriter:
             account_id=params.account_id, description=params.description, title=params.title
         ).to_bson()
 
-        query = TaskRepository.collection().insert_one(task_bson)
-        created_task_bson = TaskRepository.collection().find_one({"_id": query.inserted_id})
+        created_task_bson = TaskRepository.insert_document(task_bson)
+        TaskWriter._increment_task_count(account_id=params.account_id, amount=1)
 
         return TaskUtil.convert_task_bson_to_task(created_task_bson)
 
+    @staticmethod
+    def create_tasks(*, params: CreateTasksParams) -> CreateTasksResult:
+        """
+        Writes the whole batch with a single insert_many and reports the outcome of every item.
+        """
+        tasks_bson = [
+            TaskRepository.to_stored_document(
+                TaskModel(account_id=params.account_id, description=task.description, title=task.title).to_bson()
+            )
+            for task in params.tasks
+        ]
+
+        write_errors: dict[int, str] = {}
+        try:
+            TaskRepository.collection().insert_many(
+                tasks_bson, ordered=params.ordered, session=ApplicationRepositoryClient.get_causal_session()
+            )
+        except BulkWriteError as e:
+            write_errors = {error["index"]: error["errmsg"] for error in e.details["writeErrors"]}
+
+        create_tasks_result = TaskUtil.build_create_tasks_result(
+            tasks_bson=tasks_bson, write_errors=write_errors, ordered=params.ordered
+        )
+        if create_tasks_result.created_count:
+            TaskWriter._increment_task_count(account_id=params.account_id, amount=create_tasks_result.created_count)
+
+        return create_tasks_result
+
+    @staticmethod
+    def import_tasks(*, params: ImportTasksParams) -> TaskImportResult:
+        """
+        Writes the tasks of an NDJSON upload one unordered insert_many batch at a time, as its lines are read. The next
+        line is only read once the previous batch is written, so a client sending faster than Mongo writes is held
+        back by the flow control of the request body rather than buffered.
+        """
+        task_import_batcher = TaskUtil.create_task_import_batcher()
+        for _ in TaskWriter._write_task_import_batches(
+            account_id=params.account_id, lines=params.lines, task_import_batcher=task_import_batcher
+        ):
+            pass
+        return task_import_batcher.build_result()
+
+    @staticmethod
+    def stage_task_import(*, params: StageTaskImportParams) -> TaskImport:
+        """
+        Stores the upload chunk by chunk, each written before the next is read. The import stays pending until the
+        caller hands it to TaskImportWorker.
+        """
+        task_import_bson = TaskImportRepository.insert_document(
+            TaskImportModel(account_id=params.account_id, status=str(TaskImportStatus.PENDING)).to_bson()
+        )
+        import_id = str(task_import_bson["_id"])
+
+        for index, chunk in enumerate(params.chunks):
+            TaskImportChunkRepository.collection().insert_one(
+                TaskImportChunkModel(import_id=import_id, index=index, data=chunk).to_bson()
+            )
+
+        return TaskUtil.convert_task_import_bson_to_task_import(task_import_bson)
+
+    @staticmethod
+    def run_task_import(*, import_id: str) -> Iterator[TaskImport]:
+        """
+        Imports the staged chunks of an import, yielding its progress after every batch written. Progress is recorded
+        on the import as it is yielded, so a rerun resumes after the last batch recorded; only a batch written by an
+        attempt that died before recording it is written twice. Completed and failed imports yield nothing.
+
+        Every run claims the import by incrementing its attempt. A run whose attempt was superseded by a later one, a
+        retry started while it was still alive, stops before its next batch and none of its progress is recorded.
+        """
+        task_import_bson = TaskImportRepository.collection().find_one_and_update(
+            {
+                "_id": ObjectId(import_id),
+                "status": {"$in": [str(TaskImportStatus.PENDING), str(TaskImportStatus.RUNNING)]},
+            },
+            {"$set": {"status": str(TaskImportStatus.RUNNING), "updated_at": datetime.now()}, "$inc": {"attempt": 1}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if task_import_bson is None:
+            return
+
+        attempt = task_import_bson["attempt"]
+        task_import = TaskUtil.convert_task_import_bson_to_task_import(task_import_bson)
+        task_import_batcher = TaskUtil.create_task_import_batcher(progress=task_import.result)
+        lines = itertools.islice(
+            TaskWriter._read_task_import_lines(import_id=import_id), task_import.result.line_count, None
+        )
+
+        for progress in TaskWriter._write_task_import_batches(
+            account_id=task_import.account_id,
+            lines=lines,
+            task_import_batcher=task_import_batcher,
+            is_writable=lambda: TaskWriter._is_task_import_attempt_current(import_id=import_id, attempt=attempt),
+        ):
+            updated_task_import = TaskWriter._update_task_import(
+                import_id=import_id, attempt=attempt, update=TaskUtil.build_task_import_progress_update(progress)
+            )
+            if updated_task_import is None:
+                return
+            yield updated_task_import
+
+        completed_task_import = TaskWriter._update_task_import(
+            import_id=import_id,
+            attempt=attempt,
+            update={
+                **TaskUtil.build_task_import_progress_update(task_import_batcher.build_result()),
+                "status": str(TaskImportStatus.COMPLETED),
+            },
+        )
+        if completed_task_import is None:
+            return
+        yield completed_task_import
+        TaskImportChunkRepository.collection().delete_many({"import_id": import_id})
+
+    @staticmethod
+    def fail_task_import(*, import_id: str) -> None:
+        TaskImportRepository.collection().update_one(
+            {"_id": ObjectId(import_id)},
+            {"$set": {"status": str(TaskImportStatus.FAILED), "updated_at": datetime.now()}},
+        )
+        TaskImportChunkRepository.collection().delete_many({"import_id": import_id})
+
+    @staticmethod
+    def fail_stale_task_imports() -> int:
+        """
+        Fails the running imports whose progress has not moved for tasks.import_stale_after_seconds and drops their
+        chunks. TaskImportWorker fails an import when its last attempt raises, but an attempt killed by a heartbeat or
+        execution timeout leaves it running. Returns how many imports were failed.
+        """
+        stale_after_seconds = ConfigService[int].get_value(key="tasks.import_stale_after_seconds")
+        stale_filter = {
+            "status": str(TaskImportStatus.RUNNING),
+            "updated_at": {"$lt": datetime.now() - timedelta(seconds=stale_after_seconds)},
+        }
+        failed_count = 0
+
+        for task_import_bson in list(TaskImportRepository.collection().find(stale_filter, {"_id": 1})):
+            # Filtered again so that an import a retry claimed since the lookup keeps running
+            update_result = TaskImportRepository.collection().update_one(
+                {**stale_filter, "_id": task_import_bson["_id"]},
+                {"$set": {"status": str(TaskImportStatus.FAILED), "updated_at": datetime.now()}},
+            )
+            if update_result.modified_count:
+                TaskImportChunkRepository.collection().delete_many({"import_id": str(task_import_bson["_id"])})
+                failed_count += 1
+
+        return failed_count
+
     @staticmethod
     def update_task(*, params: UpdateTaskParams) -> Task:
         updated_task_bson = TaskRepository.collection().find_one_and_update(
             {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
             {"$set": {"description": params.description, "title": params.title, "updated_at": datetime.now()}},
             return_document=ReturnDocument.AFTER,
+            session=ApplicationRepositoryClient.get_causal_session(),
         )
 
         if updated_task_bson is None:
             raise TaskNotFoundError(task_id=params.task_id)
 
+        TaskWriter._increment_task_listing_version(account_id=params.account_id)
         return TaskUtil.convert_task_bson_to_task(updated_task_bson)
 
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
-        task = TaskReader.get_task(params=GetTaskParams(account_id=params.account_id, task_id=params.task_id))
-
         deletion_time = datetime.now()
-        updated_task_bson = TaskRepository.collection().find_one_and_update(
-            {"_id": ObjectId(task.id)},
-            {"$set": {"active": False, "updated_at": deletion_time}},
-            return_document=ReturnDocument.AFTER,
+        is_deleted = TaskRepository.soft_delete_document(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id}, deletion_time
         )
 
-        if updated_task_bson is None:
+        if not is_deleted:
             raise TaskNotFoundError(task_id=params.task_id)
 
+        TaskWriter._increment_task_count(account_id=params.account_id, amount=-1)
+
         return TaskDeletionResult(task_id=params.task_id, deleted_at=deletion_time, success=True)
+
+    @staticmethod
+    def reconcile_task_counts() -> CounterReconciliationResult:
+        """
+        Recomputes every account's active task count and overwrites the counters that drifted.
+        Writes racing with the reconciliation can reintroduce drift, so run it outside of peak traffic.
+        """
+        actual_counts = {
+            count_bson["_id"]: count_bson["count"]
+            for count_bson in TaskRepository.collection().aggregate(
+                [{"$match": {"active": True}}, {"$group": {"_id": "$account_id", "count": {"$sum": 1}}}]
+            )
+        }
+        stored_counts = {
+            count_bson["_id"]: count_bson.get("count", 0) for count_bson in TaskCountRepository.collection().find({})
+        }
+
+        account_ids = actual_counts.keys() | stored_counts.keys()
+        repair_operations = [
+            UpdateOne(
+                {"_id": account_id},
+                {"$set": {"count": actual_counts.get(account_id, 0)}, "$inc": {"version": 1}},
+                upsert=True,
+            )
+            for account_id in account_ids
+            if actual_counts.get(account_id, 0) != stored_counts.get(account_id)
+        ]
+
+        if repair_operations:
+            TaskCountRepository.collection().bulk_write(repair_operations, ordered=False)
+
+        return CounterReconciliationResult(checked_count=len(account_ids), repaired_count=len(repair_operations))
+
+    @staticmethod
+    def increment_comment_count(*, params: IncrementTaskCommentCountParams) -> None:
+        # A single $inc on the task keeps concurrent comment writes from losing updates
+        if not ObjectId.is_valid(params.task_id):
+            return
+        TaskRepository.collection().update_one(
+            {"_id": ObjectId(params.task_id)},
+            {"$inc": {"comment_count": params.amount, "comments_version": 1}},
+            session=ApplicationRepositoryClient.get_causal_session(),
+        )
+        # Listings show comment counts and can embed comments, so comment writes change them too
+        TaskWriter._increment_task_listing_version(account_id=params.account_id)
+
+    @staticmethod
+    def repair_comment_counts() -> CounterReconciliationResult:
+        """
+        Recomputes every task's active comment count and overwrites the comment_count of the tasks that drifted.
+        Tasks stored before the counter existed have no comment_count and are backfilled the same way. Tasks are
+        read from a single cursor and the repairs are written in batches, so memory stays bounded by the batch size.
+        """
+        batch_size = ConfigService[int].get_value(key="tasks.comment_count_repair_batch_size")
+        checked_count = 0
+        repaired_count = 0
+        repaired_tasks_bson = []
+
+        for task_bson in TaskRepository.collection().aggregate(
+            TaskUtil.build_comment_count_repair_pipeline(), batchSize=batch_size
+        ):
+            checked_count += 1
+            if TaskUtil.get_active_comment_count(task_bson) != task_bson.get("comment_count"):
+                repaired_tasks_bson.append(task_bson)
+            if len(repaired_tasks_bson) >= batch_size:
+                repaired_count += TaskWriter._write_comment_count_repairs(tasks_bson=repaired_tasks_bson)
+                repaired_tasks_bson = []
+
+        if repaired_tasks_bson:
+            repaired_count += TaskWriter._write_comment_count_repairs(tasks_bson=repaired_tasks_bson)
+
+        return CounterReconciliationResult(checked_count=checked_count, repaired_count=repaired_count)
+
+    @staticmethod
+    def _increment_task_count(*, account_id: str, amount: int) -> None:
+        update_result = TaskCountRepository.collection().update_one(
+            {"_id": account_id, "count": {"$exists": True}},
+            {"$inc": {"count": amount, "version": 1}},
+            session=ApplicationRepositoryClient.get_causal_session(),
+        )
+        if update_result.matched_count == 0:
+            # Not counted yet, the first listing seeds the count from the tasks themselves, this write included
+            TaskWriter._increment_task_listing_version(account_id=account_id)
+
+    @staticmethod
+    def _increment_task_listing_version(*, account_id: str) -> None:
+        TaskCountRepository.collection().update_one(
+            {"_id": account_id},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            session=ApplicationRepositoryClient.get_causal_session(),
+        )
+
+    @staticmethod
+    def _write_comment_count_repairs(*, tasks_bson: List[dict[str, Any]]) -> int:
+        TaskRepository.collection().bulk_write(
+            [
+                UpdateOne(
+                    {"_id": task_bson["_id"]}, {"$set": {"comment_count": TaskUtil.get_active_comment_count(task_bson)}}
+                )
+                for task_bson in tasks_bson
+            ],
+            ordered=False,
+        )
+        TaskCountRepository.collection().bulk_write(
+            [
+                UpdateOne({"_id": account_id}, {"$inc": {"version": 1}}, upsert=True)
+                for account_id in {task_bson["account_id"] for task_bson in tasks_bson}
+            ],
+            ordered=False,
+        )
+        return len(tasks_bson)
+
+    @staticmethod
+    def _write_task_import_batches(
+        *,
+        account_id: str,
+        lines: Iterable[bytes],
+        task_import_batcher: TaskImportBatcher,
+        is_writable: Optional[Callable[[], bool]] = None,
+    ) -> Iterator[TaskImportResult]:
+        for line in lines:
+            if task_import_batcher.add_line(line):
+                if is_writable and not is_writable():
+                    return
+                TaskWriter._write_task_import_batch(account_id=account_id, task_import_batcher=task_import_batcher)
+                yield task_import_batcher.build_result()
+
+        if task_import_batcher.has_pending_tasks():
+            if is_writable and not is_writable():
+                return
+            TaskWriter._write_task_import_batch(account_id=account_id, task_import_batcher=task_import_batcher)
+            yield task_import_batcher.build_result()
+
+    @staticmethod
+    def _write_task_import_batch(*, account_id: str, task_import_batcher: TaskImportBatcher) -> None:
+        create_tasks_result = TaskWriter.create_tasks(
+            params=CreateTasksParams(account_id=account_id, tasks=task_import_batcher.take_batch(), ordered=False)
+        )
+        task_import_batcher.record_batch_result(create_tasks_result)
+
+    @staticmethod
+    def _read_task_import_lines(*, import_id: str) -> Iterator[bytes]:
+        # One chunk per round trip, so the worker holds a single chunk of the upload at a time
+        chunks_bson = (
+            TaskImportChunkRepository.collection().find({"import_id": import_id}).sort("index", 1).batch_size(1)
+        )
+        return split_ndjson_lines(
+            (chunk_bson["data"] for chunk_bson in chunks_bson),
+            ConfigService[int].get_value(key="tasks.import_max_line_bytes"),
+        )
+
+    @staticmethod
+    def _is_task_import_attempt_current(*, import_id: str, attempt: int) -> bool:
+        task_import_bson = TaskImportRepository.collection().find_one(
+            {"_id": ObjectId(import_id), "attempt": attempt, "status": str(TaskImportStatus.RUNNING)}, {"_id": 1}
+        )
+        return task_import_bson is not None
+
+    @staticmethod
+    def _update_task_import(*, import_id: str, attempt: int, update: dict) -> Optional[TaskImport]:
+        # Matches nothing once a later attempt has claimed the import or fail_stale_task_imports has failed it
+        task_import_bson = TaskImportRepository.collection().find_one_and_update(
+            {"_id": ObjectId(import_id), "attempt": attempt, "status": str(TaskImportStatus.RUNNING)},
+            {"$set": update},
+            return_document=ReturnDocument.AFTER,
+        )
+        if task_import_bson is None:
+            return None
+        return TaskUtil.convert_task_import_bson_to_task_import(task_import_bson)
@@ -0,0 +1,190 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from werkzeug.datastructures import MultiDict
+
+from quart import current_app, jsonify, request
+from quart.typing import ResponseReturnValue
+from quart.views import MethodView
+
+from modules.application.common.base_model import BaseModel
+from modules.application.common.constants import NDJSON_MIMETYPE
+from modules.application.common.types import CursorPaginationResult, PaginationResult
+from modules.application.response_serializer import ResponseSerializer
+from modules.application.rest_api.async_causal_consistency_middleware import async_causal_consistency_middleware
+from modules.application.rest_api.async_conditional_get_middleware import async_conditional_get_middleware
+from modules.application.rest_api.async_raw_listing_response import async_raw_listing_response
+from modules.application.rest_api.raw_listing_response import is_raw_listing_enabled
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.config.config_service import ConfigService
+from modules.task.async_task_service import AsyncTaskService
+from modules.task.rest_api.task_view import TASK_FIELDS
+from modules.task.rest_api.task_view_util import TaskViewUtil
+from modules.task.types import (
+    AsyncStageTaskImportParams,
+    DeleteTaskParams,
+    GetCursorPaginatedTasksWithCommentsParams,
+    GetPaginatedTasksWithCommentsParams,
+    GetTaskImportParams,
+    GetTaskParams,
+    Task,
+    TaskWithComments,
+)
+
+
+async def get_task_resource_version(
+    *, request_args: MultiDict, account_id: str, task_id: Optional[str] = None
+) -> Optional[str]:
+    if task_id:
+        return await AsyncTaskService.get_task_version(params=GetTaskParams(account_id=account_id, task_id=task_id))
+    return await AsyncTaskService.get_tasks_version(account_id=account_id)
+
+
+class AsyncTaskView(MethodView):
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def post(self, account_id: str) -> ResponseReturnValue:
+        create_task_params = TaskViewUtil.build_create_task_params(
+            account_id=account_id, request_data=await request.get_json()
+        )
+
+        created_task = await AsyncTaskService.create_task(params=create_task_params)
+        task_dict = ResponseSerializer.serialize(created_task)
+
+        return jsonify(task_dict), 201
+
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    @async_conditional_get_middleware(get_task_resource_version)
+    async def get(self, account_id: str, task_id: Optional[str] = None) -> ResponseReturnValue:
+        task_fields = BaseModel.parse_projection_fields(request.args.get("fields"), TASK_FIELDS)
+
+        if task_id:
+            task_params = GetTaskParams(account_id=account_id, task_id=task_id, fields=task_fields)
+            task = await AsyncTaskService.get_task(params=task_params)
+            task_dict = ResponseSerializer.serialize(task, task_fields)
+            return jsonify(task_dict), 200
+        elif "cursor" in request.args:
+            cursor_tasks_params = TaskViewUtil.build_cursor_paginated_tasks_params(
+                account_id=account_id, request_args=request.args, task_fields=task_fields
+            )
+
+            comments_limit = TaskViewUtil.parse_embedded_comments_limit(request_args=request.args)
+
+            cursor_pagination_result: CursorPaginationResult[Task] | CursorPaginationResult[TaskWithComments]
+            if comments_limit is None:
+                cursor_pagination_result = await AsyncTaskService.get_cursor_paginated_tasks(params=cursor_tasks_params)
+            else:
+                cursor_pagination_result = await AsyncTaskService.get_cursor_paginated_tasks_with_comments(
+                    params=GetCursorPaginatedTasksWithCommentsParams(
+                        tasks_params=cursor_tasks_params, comments_limit=comments_limit
+                    )
+                )
+
+            return jsonify(TaskViewUtil.serialize_pagination_result(cursor_pagination_result, task_fields)), 200
+        else:
+            tasks_params = TaskViewUtil.build_paginated_tasks_params(
+                account_id=account_id, request_args=request.args, task_fields=task_fields
+            )
+
+            comments_limit = TaskViewUtil.parse_embedded_comments_limit(request_args=request.args)
+
+            if comments_limit is None and is_raw_listing_enabled():
+                raw_pagination_result = await AsyncTaskService.get_raw_paginated_tasks(params=tasks_params)
+                return async_raw_listing_response(raw_pagination_result), 200
+
+            pagination_result: PaginationResult[Task] | PaginationResult[TaskWithComments]
+            if comments_limit is None:
+                pagination_result = await AsyncTaskService.get_paginated_tasks(params=tasks_params)
+            else:
+                pagination_result = await AsyncTaskService.get_paginated_tasks_with_comments(
+                    params=GetPaginatedTasksWithCommentsParams(tasks_params=tasks_params, comments_limit=comments_limit)
+                )
+
+            return jsonify(TaskViewUtil.serialize_pagination_result(pagination_result, task_fields)), 200
+
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def patch(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        update_task_params = TaskViewUtil.build_update_task_params(
+            account_id=account_id, task_id=task_id, request_data=await request.get_json()
+        )
+
+        updated_task = await AsyncTaskService.update_task(params=update_task_params)
+        task_dict = ResponseSerializer.serialize(updated_task)
+
+        return jsonify(task_dict), 200
+
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def delete(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        delete_params = DeleteTaskParams(account_id=account_id, task_id=task_id)
+
+        await AsyncTaskService.delete_task(params=delete_params)
+        # Starting a worker runs its own event loop, so it cannot run on this one
+        await asyncio.to_thread(TaskViewUtil.enqueue_task_comments_deletion, task_id=task_id)
+
+        return "", 204
+
+    @staticmethod
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def create_tasks(account_id: str) -> ResponseReturnValue:
+        create_tasks_params = TaskViewUtil.build_create_tasks_params(
+            account_id=account_id, request_data=await request.get_json()
+        )
+
+        create_tasks_result = await AsyncTaskService.create_tasks(params=create_tasks_params)
+
+        status_code = 201 if create_tasks_result.failed_count == 0 else 207
+        return jsonify(ResponseSerializer.serialize(create_tasks_result)), status_code
+
+    @staticmethod
+    @async_access_auth_middleware
+    async def export_tasks(account_id: str) -> ResponseReturnValue:
+        export_tasks_params = TaskViewUtil.build_export_tasks_params(account_id=account_id, request_args=request.args)
+        json_provider = current_app.json
+        chunk_size = ConfigService[int].get_value(key="tasks.export_batch_size")
+
+        async def generate_body() -> AsyncIterator[str]:
+            chunk: List[str] = []
+            async for export_item in AsyncTaskService.export_tasks_with_comments(params=export_tasks_params):
+                chunk.append(TaskViewUtil.encode_export_line(export_item, json_provider))
+                if len(chunk) == chunk_size:
+                    yield "".join(chunk)
+                    chunk = []
+            if chunk:
+                yield "".join(chunk)
+
+        return current_app.response_class(generate_body(), mimetype=NDJSON_MIMETYPE), 200
+
+    @staticmethod
+    @async_access_auth_middleware
+    @async_causal_consistency_middleware
+    async def import_tasks(account_id: str) -> ResponseReturnValue:
+        # Quart reads the body ahead of the view without flow control, buffering at most MAX_CONTENT_LENGTH bytes
+        if TaskViewUtil.is_staged_import(content_length=request.content_length):
+            chunk_size = ConfigService[int].get_value(key="tasks.import_chunk_size")
+            task_import = await AsyncTaskService.stage_task_import(
+                params=AsyncStageTaskImportParams(
+                    account_id=account_id, chunks=TaskViewUtil.coalesce_chunks(request.body, chunk_size)
+                )
+            )
+            await TaskViewUtil.async_start_task_import(import_id=task_import.id)
+            location = f"{request.path}/{task_import.id}"
+            return jsonify(ResponseSerializer.serialize(task_import)), 202, {"Location": location}
+
+        import_result = await AsyncTaskService.import_tasks(
+            params=TaskViewUtil.build_async_import_tasks_params(account_id=account_id, chunks=request.body)
+        )
+
+        status_code = 201 if import_result.failed_count == 0 else 207
+        return jsonify(ResponseSerializer.serialize(import_result)), status_code
+
+    @staticmethod
+    @async_access_auth_middleware
+    async def get_task_import(account_id: str, import_id: str) -> ResponseReturnValue:
+        task_import = await AsyncTaskService.get_task_import(
+            params=GetTaskImportParams(account_id=account_id, import_id=import_id)
+        )
+        return jsonify(ResponseSerializer.serialize(task_import)), 200
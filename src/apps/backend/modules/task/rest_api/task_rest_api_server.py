@@ -1,4 +1,5 @@
 from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
 
 from modules.task.rest_api.task_router import TaskRouter
 
@@ -8,3 +9,8 @@ class TaskRestApiServer:
     def create() -> Blueprint:
         task_api_blueprint = Blueprint("task", __name__)
         return TaskRouter.create_route(blueprint=task_api_blueprint)
+
+    @staticmethod
+    def create_async() -> AsyncBlueprint:
+        task_api_blueprint = AsyncBlueprint("task", __name__)
+        return TaskRouter.create_async_route(blueprint=task_api_blueprint)
@@ -1,5 +1,7 @@
 from flask import Blueprint
+from quart import Blueprint as AsyncBlueprint
 
+from modules.task.rest_api.async_task_view import AsyncTaskView
 from modules.task.rest_api.task_view import TaskView
 
 
@@ -14,5 +16,36 @@ class TaskRouter:
             view_func=TaskView.as_view("task_view_by_id"),
             methods=["GET", "PATCH", "DELETE"],
         )
+        blueprint.add_url_rule("/accounts/<account_id>/tasks:batch", view_func=TaskView.create_tasks, methods=["POST"])
+        blueprint.add_url_rule("/accounts/<account_id>/tasks:import", view_func=TaskView.import_tasks, methods=["POST"])
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:import/<import_id>", view_func=TaskView.get_task_import, methods=["GET"]
+        )
+        blueprint.add_url_rule("/accounts/<account_id>/export.ndjson", view_func=TaskView.export_tasks, methods=["GET"])
+
+        return blueprint
+
+    @staticmethod
+    def create_async_route(*, blueprint: AsyncBlueprint) -> AsyncBlueprint:
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks", view_func=AsyncTaskView.as_view("task_view"), methods=["POST", "GET"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>",
+            view_func=AsyncTaskView.as_view("task_view_by_id"),
+            methods=["GET", "PATCH", "DELETE"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:batch", view_func=AsyncTaskView.create_tasks, methods=["POST"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:import", view_func=AsyncTaskView.import_tasks, methods=["POST"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:import/<import_id>", view_func=AsyncTaskView.get_task_import, methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/export.ndjson", view_func=AsyncTaskView.export_tasks, methods=["GET"]
+        )
 
         return blueprint
@@ -1,104 +1,190 @@
-from dataclasses import asdict
-from typing import Optional
+from dataclasses import fields
+from functools import partial
+from typing import Iterator, List, Optional
 
-from flask import jsonify, request
+from werkzeug.datastructures import MultiDict
+
+from flask import current_app, jsonify, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
-from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
-from modules.application.common.types import PaginationParams
+from modules.application.common.base_model import BaseModel
+from modules.application.common.constants import NDJSON_MIMETYPE
+from modules.application.common.types import CursorPaginationResult, PaginationResult
+from modules.application.response_serializer import ResponseSerializer
+from modules.application.rest_api.causal_consistency_middleware import causal_consistency_middleware
+from modules.application.rest_api.conditional_get_middleware import conditional_get_middleware
+from modules.application.rest_api.raw_listing_response import is_raw_listing_enabled, raw_listing_response
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
-from modules.task.errors import TaskBadRequestError
+from modules.config.config_service import ConfigService
+from modules.task.rest_api.task_view_util import TaskViewUtil
 from modules.task.task_service import TaskService
 from modules.task.types import (
-    CreateTaskParams,
     DeleteTaskParams,
-    GetPaginatedTasksParams,
+    GetCursorPaginatedTasksWithCommentsParams,
+    GetPaginatedTasksWithCommentsParams,
+    GetTaskImportParams,
     GetTaskParams,
-    UpdateTaskParams,
+    StageTaskImportParams,
+    Task,
+    TaskWithComments,
 )
 
+TASK_FIELDS = tuple(task_field.name for task_field in fields(Task))
 
-class TaskView(MethodView):
-    @access_auth_middleware
-    def post(self, account_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise TaskBadRequestError("Request body is required")
 
-        if not request_data.get("title"):
-            raise TaskBadRequestError("Title is required")
+def get_task_resource_version(
+    *, request_args: MultiDict, account_id: str, task_id: Optional[str] = None
+) -> Optional[str]:
+    if task_id:
+        return TaskService.get_task_version(params=GetTaskParams(account_id=account_id, task_id=task_id))
+    return TaskService.get_tasks_version(account_id=account_id)
 
-        if not request_data.get("description"):
-            raise TaskBadRequestError("Description is required")
 
-        create_task_params = CreateTaskParams(
-            account_id=account_id, title=request_data["title"], description=request_data["description"]
+class TaskView(MethodView):
+    @access_auth_middleware
+    @causal_consistency_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        create_task_params = TaskViewUtil.build_create_task_params(
+            account_id=account_id, request_data=request.get_json()
         )
 
         created_task = TaskService.create_task(params=create_task_params)
-        task_dict = asdict(created_task)
+        task_dict = ResponseSerializer.serialize(created_task)
 
         return jsonify(task_dict), 201
 
     @access_auth_middleware
+    @causal_consistency_middleware
+    @conditional_get_middleware(get_task_resource_version)
     def get(self, account_id: str, task_id: Optional[str] = None) -> ResponseReturnValue:
+        task_fields = BaseModel.parse_projection_fields(request.args.get("fields"), TASK_FIELDS)
+
         if task_id:
-            task_params = GetTaskParams(account_id=account_id, task_id=task_id)
+            task_params = GetTaskParams(account_id=account_id, task_id=task_id, fields=task_fields)
             task = TaskService.get_task(params=task_params)
-            task_dict = asdict(task)
+            task_dict = ResponseSerializer.serialize(task, task_fields)
             return jsonify(task_dict), 200
+        elif "cursor" in request.args:
+            cursor_tasks_params = TaskViewUtil.build_cursor_paginated_tasks_params(
+                account_id=account_id, request_args=request.args, task_fields=task_fields
+            )
+
+            comments_limit = TaskViewUtil.parse_embedded_comments_limit(request_args=request.args)
+
+            cursor_pagination_result: CursorPaginationResult[Task] | CursorPaginationResult[TaskWithComments]
+            if comments_limit is None:
+                cursor_pagination_result = TaskService.get_cursor_paginated_tasks(params=cursor_tasks_params)
+            else:
+                cursor_pagination_result = TaskService.get_cursor_paginated_tasks_with_comments(
+                    params=GetCursorPaginatedTasksWithCommentsParams(
+                        tasks_params=cursor_tasks_params, comments_limit=comments_limit
+                    )
+                )
+
+            return jsonify(TaskViewUtil.serialize_pagination_result(cursor_pagination_result, task_fields)), 200
         else:
-            page = request.args.get("page", type=int)
-            size = request.args.get("size", type=int)
-
-            if page is not None and page < 1:
-                raise TaskBadRequestError("Page must be greater than 0")
-
-            if size is not None and size < 1:
-                raise TaskBadRequestError("Size must be greater than 0")
-
-            if page is None:
-                page = DEFAULT_PAGINATION_PARAMS.page
-            if size is None:
-                size = DEFAULT_PAGINATION_PARAMS.size
+            tasks_params = TaskViewUtil.build_paginated_tasks_params(
+                account_id=account_id, request_args=request.args, task_fields=task_fields
+            )
 
-            pagination_params = PaginationParams(page=page, size=size, offset=0)
-            tasks_params = GetPaginatedTasksParams(account_id=account_id, pagination_params=pagination_params)
+            comments_limit = TaskViewUtil.parse_embedded_comments_limit(request_args=request.args)
 
-            pagination_result = TaskService.get_paginated_tasks(params=tasks_params)
+            if comments_limit is None and is_raw_listing_enabled():
+                return raw_listing_response(TaskService.get_raw_paginated_tasks(params=tasks_params)), 200
 
-            response_data = asdict(pagination_result)
+            pagination_result: PaginationResult[Task] | PaginationResult[TaskWithComments]
+            if comments_limit is None:
+                pagination_result = TaskService.get_paginated_tasks(params=tasks_params)
+            else:
+                pagination_result = TaskService.get_paginated_tasks_with_comments(
+                    params=GetPaginatedTasksWithCommentsParams(tasks_params=tasks_params, comments_limit=comments_limit)
+                )
 
-            return jsonify(response_data), 200
+            return jsonify(TaskViewUtil.serialize_pagination_result(pagination_result, task_fields)), 200
 
     @access_auth_middleware
+    @causal_consistency_middleware
     def patch(self, account_id: str, task_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise TaskBadRequestError("Request body is required")
-
-        if not request_data.get("title"):
-            raise TaskBadRequestError("Title is required")
-
-        if not request_data.get("description"):
-            raise TaskBadRequestError("Description is required")
-
-        update_task_params = UpdateTaskParams(
-            account_id=account_id, task_id=task_id, title=request_data["title"], description=request_data["description"]
+        update_task_params = TaskViewUtil.build_update_task_params(
+            account_id=account_id, task_id=task_id, request_data=request.get_json()
         )
 
         updated_task = TaskService.update_task(params=update_task_params)
-        task_dict = asdict(updated_task)
+        task_dict = ResponseSerializer.serialize(updated_task)
 
         return jsonify(task_dict), 200
 
     @access_auth_middleware
+    @causal_consistency_middleware
     def delete(self, account_id: str, task_id: str) -> ResponseReturnValue:
         delete_params = DeleteTaskParams(account_id=account_id, task_id=task_id)
 
         TaskService.delete_task(params=delete_params)
+        TaskViewUtil.enqueue_task_comments_deletion(task_id=task_id)
 
         return "", 204
+
+    @staticmethod
+    @access_auth_middleware
+    @causal_consistency_middleware
+    def create_tasks(account_id: str) -> ResponseReturnValue:
+        create_tasks_params = TaskViewUtil.build_create_tasks_params(
+            account_id=account_id, request_data=request.get_json()
+        )
+
+        create_tasks_result = TaskService.create_tasks(params=create_tasks_params)
+
+        status_code = 201 if create_tasks_result.failed_count == 0 else 207
+        return jsonify(ResponseSerializer.serialize(create_tasks_result)), status_code
+
+    @staticmethod
+    @access_auth_middleware
+    def export_tasks(account_id: str) -> ResponseReturnValue:
+        # No causal session: the export is read while the body is sent, after the request's session has ended
+        export_tasks_params = TaskViewUtil.build_export_tasks_params(account_id=account_id, request_args=request.args)
+        json_provider = current_app.json
+        chunk_size = ConfigService[int].get_value(key="tasks.export_batch_size")
+
+        def generate_body() -> Iterator[str]:
+            chunk: List[str] = []
+            for export_item in TaskService.export_tasks_with_comments(params=export_tasks_params):
+                chunk.append(TaskViewUtil.encode_export_line(export_item, json_provider))
+                if len(chunk) == chunk_size:
+                    yield "".join(chunk)
+                    chunk = []
+            if chunk:
+                yield "".join(chunk)
+
+        return current_app.response_class(generate_body(), mimetype=NDJSON_MIMETYPE), 200
+
+    @staticmethod
+    @access_auth_middleware
+    @causal_consistency_middleware
+    def import_tasks(account_id: str) -> ResponseReturnValue:
+        # The body is read a chunk at a time as tasks are written, never in full
+        chunk_size = ConfigService[int].get_value(key="tasks.import_chunk_size")
+        chunks = iter(partial(request.stream.read, chunk_size), b"")
+
+        if TaskViewUtil.is_staged_import(content_length=request.content_length):
+            task_import = TaskService.stage_task_import(
+                params=StageTaskImportParams(account_id=account_id, chunks=chunks)
+            )
+            TaskViewUtil.start_task_import(import_id=task_import.id)
+            location = f"{request.path}/{task_import.id}"
+            return jsonify(ResponseSerializer.serialize(task_import)), 202, {"Location": location}
+
+        import_result = TaskService.import_tasks(
+            params=TaskViewUtil.build_import_tasks_params(account_id=account_id, chunks=chunks)
+        )
+
+        status_code = 201 if import_result.failed_count == 0 else 207
+        return jsonify(ResponseSerializer.serialize(import_result)), status_code
+
+    @staticmethod
+    @access_auth_middleware
+    def get_task_import(account_id: str, import_id: str) -> ResponseReturnValue:
+        task_import = TaskService.get_task_import(
+            params=GetTaskImportParams(account_id=account_id, import_id=import_id)
+        )
+        return jsonify(ResponseSerializer.serialize(task_import)), 200
@@ -0,0 +1,303 @@
+import asyncio
+from dataclasses import replace
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, List, Optional, Tuple
+
+from bson.objectid import ObjectId
+
+from werkzeug.datastructures import MultiDict
+
+from flask.json.provider import JSONProvider
+
+from modules.application.application_service import ApplicationService
+from modules.application.common.base_model import BaseModel
+from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS, LISTING_SORT_FIELDS
+from modules.application.common.types import (
+    CursorPaginationParams,
+    CursorPaginationResult,
+    PaginationParams,
+    PaginationResult,
+    SortParams,
+    TimestampFilterParams,
+)
+from modules.application.errors import WorkerClientConnectionError, WorkerStartError
+from modules.application.ndjson_line_splitter import async_split_ndjson_lines, split_ndjson_lines
+from modules.application.response_serializer import ResponseSerializer
+from modules.comment.types import Comment
+from modules.comment.workers.task_comments_deletion_worker import TaskCommentsDeletionWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.async_task_service import AsyncTaskService
+from modules.task.errors import TaskBadRequestError
+from modules.task.task_service import TaskService
+from modules.task.types import (
+    AsyncImportTasksParams,
+    CreateTaskItemParams,
+    CreateTaskParams,
+    CreateTasksParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
+    GetPaginatedTasksParams,
+    ImportTasksParams,
+    Task,
+    TaskWithComments,
+    UpdateTaskParams,
+)
+from modules.task.workers.task_import_worker import TaskImportWorker
+
+
+class TaskViewUtil:
+    """
+    Request parsing and response shaping shared by the sync (Flask) and async (Quart) task views.
+    """
+
+    @staticmethod
+    def build_create_task_params(*, account_id: str, request_data: Optional[dict[str, Any]]) -> CreateTaskParams:
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        if not request_data.get("title"):
+            raise TaskBadRequestError("Title is required")
+
+        if not request_data.get("description"):
+            raise TaskBadRequestError("Description is required")
+
+        return CreateTaskParams(
+            account_id=account_id, title=request_data["title"], description=request_data["description"]
+        )
+
+    @staticmethod
+    def build_update_task_params(
+        *, account_id: str, task_id: str, request_data: Optional[dict[str, Any]]
+    ) -> UpdateTaskParams:
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        if not request_data.get("title"):
+            raise TaskBadRequestError("Title is required")
+
+        if not request_data.get("description"):
+            raise TaskBadRequestError("Description is required")
+
+        return UpdateTaskParams(
+            account_id=account_id, task_id=task_id, title=request_data["title"], description=request_data["description"]
+        )
+
+    @staticmethod
+    def build_create_tasks_params(*, account_id: str, request_data: Optional[dict[str, Any]]) -> CreateTasksParams:
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        tasks_data = request_data.get("tasks")
+        if not isinstance(tasks_data, list) or not tasks_data:
+            raise TaskBadRequestError("Tasks must be a non-empty list")
+
+        batch_max_size = ConfigService[int].get_value(key="tasks.batch_max_size")
+        if len(tasks_data) > batch_max_size:
+            raise TaskBadRequestError(f"A batch can contain at most {batch_max_size} tasks")
+
+        ordered = request_data.get("ordered", True)
+        if not isinstance(ordered, bool):
+            raise TaskBadRequestError("ordered must be a boolean")
+
+        task_items = []
+        for index, task_data in enumerate(tasks_data):
+            if not isinstance(task_data, dict) or not task_data.get("title"):
+                raise TaskBadRequestError(f"Title is required for task at index {index}")
+
+            if not task_data.get("description"):
+                raise TaskBadRequestError(f"Description is required for task at index {index}")
+
+            task_items.append(CreateTaskItemParams(description=task_data["description"], title=task_data["title"]))
+
+        return CreateTasksParams(account_id=account_id, tasks=task_items, ordered=ordered)
+
+    @staticmethod
+    def build_export_tasks_params(*, account_id: str, request_args: MultiDict[str, str]) -> ExportTasksParams:
+        after_task_id = request_args.get("after") or None
+        if after_task_id is not None and not ObjectId.is_valid(after_task_id):
+            raise TaskBadRequestError("after must be the id of a task")
+
+        return ExportTasksParams(account_id=account_id, after_task_id=after_task_id)
+
+    @staticmethod
+    def is_staged_import(*, content_length: Optional[int]) -> bool:
+        """
+        Uploads without a Content-Length or larger than tasks.import_inline_max_bytes are staged for TaskImportWorker
+        instead of being imported while the client waits.
+        """
+        return content_length is None or content_length > ConfigService[int].get_value(
+            key="tasks.import_inline_max_bytes"
+        )
+
+    @staticmethod
+    def start_task_import(*, import_id: str) -> None:
+        """
+        Hands a staged import to TaskImportWorker. When the worker cannot be started the import is marked failed and
+        its chunks dropped before the error is raised.
+        """
+        try:
+            ApplicationService.run_worker_immediately(cls=TaskImportWorker, arguments=(import_id,))
+        except (WorkerClientConnectionError, WorkerStartError):
+            TaskService.fail_task_import(import_id=import_id)
+            raise
+
+    @staticmethod
+    async def async_start_task_import(*, import_id: str) -> None:
+        try:
+            # Starting a worker runs its own event loop, so it cannot run on this one
+            await asyncio.to_thread(
+                ApplicationService.run_worker_immediately, cls=TaskImportWorker, arguments=(import_id,)
+            )
+        except (WorkerClientConnectionError, WorkerStartError):
+            await AsyncTaskService.fail_task_import(import_id=import_id)
+            raise
+
+    @staticmethod
+    def build_import_tasks_params(*, account_id: str, chunks: Iterable[bytes]) -> ImportTasksParams:
+        max_line_bytes = ConfigService[int].get_value(key="tasks.import_max_line_bytes")
+        return ImportTasksParams(account_id=account_id, lines=split_ndjson_lines(chunks, max_line_bytes))
+
+    @staticmethod
+    def build_async_import_tasks_params(*, account_id: str, chunks: AsyncIterable[bytes]) -> AsyncImportTasksParams:
+        max_line_bytes = ConfigService[int].get_value(key="tasks.import_max_line_bytes")
+        return AsyncImportTasksParams(account_id=account_id, lines=async_split_ndjson_lines(chunks, max_line_bytes))
+
+    @staticmethod
+    async def coalesce_chunks(chunks: AsyncIterable[bytes], chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Joins the pieces an ASGI body arrives in into chunks of at least chunk_size bytes, the last one excepted.
+        """
+        buffer = bytearray()
+        async for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    @staticmethod
+    def build_cursor_paginated_tasks_params(
+        *, account_id: str, request_args: MultiDict[str, str], task_fields: Optional[tuple[str, ...]]
+    ) -> GetCursorPaginatedTasksParams:
+        size = request_args.get("size", type=int)
+
+        if size is not None and size < 1:
+            raise TaskBadRequestError("Size must be greater than 0")
+
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        cursor_pagination_params = CursorPaginationParams(size=size, cursor=request_args.get("cursor") or None)
+        sort_params, filter_params = TaskViewUtil.parse_sort_and_filter_params(request_args=request_args)
+        return GetCursorPaginatedTasksParams(
+            account_id=account_id,
+            pagination_params=cursor_pagination_params,
+            sort_params=sort_params,
+            filter_params=filter_params,
+            fields=task_fields,
+        )
+
+    @staticmethod
+    def build_paginated_tasks_params(
+        *, account_id: str, request_args: MultiDict[str, str], task_fields: Optional[tuple[str, ...]]
+    ) -> GetPaginatedTasksParams:
+        page = request_args.get("page", type=int)
+        size = request_args.get("size", type=int)
+
+        if page is not None and page < 1:
+            raise TaskBadRequestError("Page must be greater than 0")
+
+        if size is not None and size < 1:
+            raise TaskBadRequestError("Size must be greater than 0")
+
+        if page is None:
+            page = DEFAULT_PAGINATION_PARAMS.page
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        pagination_params = PaginationParams(page=page, size=size, offset=0)
+        include_total = request_args.get("include_total", "true").lower() != "false"
+        sort_params, filter_params = TaskViewUtil.parse_sort_and_filter_params(request_args=request_args)
+        return GetPaginatedTasksParams(
+            account_id=account_id,
+            pagination_params=pagination_params,
+            sort_params=sort_params,
+            filter_params=filter_params,
+            include_total=include_total,
+            fields=task_fields,
+        )
+
+    @staticmethod
+    def parse_sort_and_filter_params(
+        *, request_args: MultiDict[str, str]
+    ) -> Tuple[Optional[SortParams], Optional[TimestampFilterParams]]:
+        sort_params = BaseModel.parse_sort_params(
+            request_args.get("sort"), request_args.get("order"), LISTING_SORT_FIELDS
+        )
+        filter_params = BaseModel.parse_timestamp_filters(
+            request_args.get("created_after"), request_args.get("created_before"), request_args.get("updated_since")
+        )
+        return sort_params, filter_params
+
+    @staticmethod
+    def parse_embedded_comments_limit(*, request_args: MultiDict[str, str]) -> Optional[int]:
+        """
+        Parses ?embed=comments:<n>, the number of latest comments to nest in each listed task, or None when absent.
+        """
+        embed = request_args.get("embed")
+        if not embed:
+            return None
+
+        embedded_resource, _, raw_limit = embed.partition(":")
+        if embedded_resource != "comments" or not raw_limit.isdigit():
+            raise TaskBadRequestError("embed must have the form comments:<n>")
+
+        comments_limit = int(raw_limit)
+        max_limit = ConfigService[int].get_value(key="tasks.embedded_comments_max_limit")
+        if not 1 <= comments_limit <= max_limit:
+            raise TaskBadRequestError(f"The number of embedded comments must be between 1 and {max_limit}")
+
+        return comments_limit
+
+    @staticmethod
+    def serialize_pagination_result(
+        pagination_result: PaginationResult[Any] | CursorPaginationResult[Any], task_fields: Optional[tuple[str, ...]]
+    ) -> dict[str, Any]:
+        response_data = ResponseSerializer.serialize(replace(pagination_result, items=[]))
+        response_data["items"] = [TaskViewUtil.serialize_task(task, task_fields) for task in pagination_result.items]
+        return response_data
+
+    @staticmethod
+    def serialize_task(task: Task | TaskWithComments, task_fields: Optional[tuple[str, ...]]) -> dict[str, Any]:
+        if isinstance(task, TaskWithComments):
+            return {
+                **ResponseSerializer.serialize(task.task, task_fields),
+                "comments": [ResponseSerializer.serialize(comment) for comment in task.comments],
+            }
+        return ResponseSerializer.serialize(task, task_fields)
+
+    @staticmethod
+    def enqueue_task_comments_deletion(*, task_id: str) -> None:
+        """
+        Hands the deleted task's comments to TaskCommentsDeletionWorker instead of deleting them on the request thread.
+        The task is already deleted at this point, so a failure to enqueue is logged rather than failing the request,
+        and scripts/delete_orphaned_comments.py deletes the comments left behind.
+        """
+        if not ConfigService[bool].get_value(key="tasks.cascade_comment_deletion_enabled"):
+            return
+
+        try:
+            ApplicationService.run_worker_immediately(cls=TaskCommentsDeletionWorker, arguments=(task_id,))
+        except (WorkerClientConnectionError, WorkerStartError) as e:
+            Logger.error(message=f"Could not enqueue comment deletion for task {task_id}: {e.message}")
+
+    @staticmethod
+    def encode_export_line(export_item: Task | Comment, json_provider: JSONProvider) -> str:
+        """
+        An NDJSON export line: a task, or a comment of the task on the last task line before it. The id of the last
+        task line is where an interrupted export resumes with ?after=.
+        """
+        if isinstance(export_item, Comment):
+            return f"{json_provider.dumps({'type': 'comment', 'comment': ResponseSerializer.serialize(export_item)})}\n"
+        return f"{json_provider.dumps({'type': 'task', 'task': ResponseSerializer.serialize(export_item)})}\n"
@@ -1,13 +1,36 @@
-from modules.application.common.types import PaginationResult
+from typing import Iterator, List, Optional
+
+from modules.application.common.types import (
+    CounterReconciliationResult,
+    CursorPaginationResult,
+    PaginationResult,
+    RawPaginationResult,
+)
+from modules.comment.types import Comment
 from modules.task.internal.task_reader import TaskReader
 from modules.task.internal.task_writer import TaskWriter
 from modules.task.types import (
     CreateTaskParams,
+    CreateTasksParams,
+    CreateTasksResult,
     DeleteTaskParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
+    GetCursorPaginatedTasksWithCommentsParams,
     GetPaginatedTasksParams,
+    GetPaginatedTasksWithCommentsParams,
+    GetTaskImportParams,
     GetTaskParams,
+    ImportTasksParams,
+    IncrementTaskCommentCountParams,
+    SearchTasksParams,
+    StageTaskImportParams,
     Task,
     TaskDeletionResult,
+    TaskImport,
+    TaskImportResult,
+    TaskSearchHit,
+    TaskWithComments,
     UpdateTaskParams,
 )
 
@@ -17,14 +40,82 @@ class TaskService:
     def create_task(*, params: CreateTaskParams) -> Task:
         return TaskWriter.create_task(params=params)
 
+    @staticmethod
+    def create_tasks(*, params: CreateTasksParams) -> CreateTasksResult:
+        return TaskWriter.create_tasks(params=params)
+
+    @staticmethod
+    def import_tasks(*, params: ImportTasksParams) -> TaskImportResult:
+        return TaskWriter.import_tasks(params=params)
+
+    @staticmethod
+    def stage_task_import(*, params: StageTaskImportParams) -> TaskImport:
+        return TaskWriter.stage_task_import(params=params)
+
+    @staticmethod
+    def run_task_import(*, import_id: str) -> Iterator[TaskImport]:
+        return TaskWriter.run_task_import(import_id=import_id)
+
+    @staticmethod
+    def fail_task_import(*, import_id: str) -> None:
+        TaskWriter.fail_task_import(import_id=import_id)
+
+    @staticmethod
+    def fail_stale_task_imports() -> int:
+        return TaskWriter.fail_stale_task_imports()
+
+    @staticmethod
+    def get_task_import(*, params: GetTaskImportParams) -> TaskImport:
+        return TaskReader.get_task_import(params=params)
+
     @staticmethod
     def get_task(*, params: GetTaskParams) -> Task:
         return TaskReader.get_task(params=params)
 
+    @staticmethod
+    def get_task_version(*, params: GetTaskParams) -> Optional[str]:
+        return TaskReader.get_task_version(params=params)
+
+    @staticmethod
+    def get_tasks_version(*, account_id: str) -> str:
+        return TaskReader.get_tasks_version(account_id=account_id)
+
+    @staticmethod
+    def get_task_comments_version(*, task_id: str) -> Optional[str]:
+        return TaskReader.get_task_comments_version(task_id=task_id)
+
     @staticmethod
     def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
         return TaskReader.get_paginated_tasks(params=params)
 
+    @staticmethod
+    def get_raw_paginated_tasks(*, params: GetPaginatedTasksParams) -> RawPaginationResult:
+        return TaskReader.get_raw_paginated_tasks(params=params)
+
+    @staticmethod
+    def get_cursor_paginated_tasks(*, params: GetCursorPaginatedTasksParams) -> CursorPaginationResult[Task]:
+        return TaskReader.get_cursor_paginated_tasks(params=params)
+
+    @staticmethod
+    def get_paginated_tasks_with_comments(
+        *, params: GetPaginatedTasksWithCommentsParams
+    ) -> PaginationResult[TaskWithComments]:
+        return TaskReader.get_paginated_tasks_with_comments(params=params)
+
+    @staticmethod
+    def get_cursor_paginated_tasks_with_comments(
+        *, params: GetCursorPaginatedTasksWithCommentsParams
+    ) -> CursorPaginationResult[TaskWithComments]:
+        return TaskReader.get_cursor_paginated_tasks_with_comments(params=params)
+
+    @staticmethod
+    def search_tasks(*, params: SearchTasksParams) -> List[TaskSearchHit]:
+        return TaskReader.search_tasks(params=params)
+
+    @staticmethod
+    def export_tasks_with_comments(*, params: ExportTasksParams) -> Iterator[Task | Comment]:
+        return TaskReader.export_tasks_with_comments(params=params)
+
     @staticmethod
     def update_task(*, params: UpdateTaskParams) -> Task:
         return TaskWriter.update_task(params=params)
@@ -32,3 +123,23 @@ class TaskService:
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
         return TaskWriter.delete_task(params=params)
+
+    @staticmethod
+    def get_active_task_ids(*, task_ids: List[str]) -> List[str]:
+        return TaskReader.get_active_task_ids(task_ids=task_ids)
+
+    @staticmethod
+    def get_comment_count(*, task_id: str) -> int:
+        return TaskReader.get_comment_count(task_id=task_id)
+
+    @staticmethod
+    def increment_comment_count(*, params: IncrementTaskCommentCountParams) -> None:
+        TaskWriter.increment_comment_count(params=params)
+
+    @staticmethod
+    def repair_comment_counts() -> CounterReconciliationResult:
+        return TaskWriter.repair_comment_counts()
+
+    @staticmethod
+    def reconcile_task_counts() -> CounterReconciliationResult:
+        return TaskWriter.reconcile_task_counts()
@@ -1,8 +1,17 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from enum import StrEnum
+from typing import AsyncIterable, Iterable, List, Optional, Tuple
 
-from modules.application.common.types import PaginationParams, PaginationResult, SortParams
+from modules.application.common.types import (
+    CursorPaginationParams,
+    PaginationParams,
+    PaginationResult,
+    SortParams,
+    TextSearchPosition,
+    TimestampFilterParams,
+)
+from modules.comment.types import Comment
 
 
 @dataclass(frozen=True)
@@ -11,12 +20,14 @@ class Task:
     account_id: str
     description: str
     title: str
+    comment_count: int = 0
 
 
 @dataclass(frozen=True)
 class GetTaskParams:
     account_id: str
     task_id: str
+    fields: Optional[Tuple[str, ...]] = None
 
 
 @dataclass(frozen=True)
@@ -24,6 +35,58 @@ class GetPaginatedTasksParams:
     account_id: str
     pagination_params: PaginationParams
     sort_params: Optional[SortParams] = None
+    filter_params: Optional[TimestampFilterParams] = None
+    include_total: bool = True
+    fields: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class GetCursorPaginatedTasksParams:
+    account_id: str
+    pagination_params: CursorPaginationParams
+    sort_params: Optional[SortParams] = None
+    filter_params: Optional[TimestampFilterParams] = None
+    fields: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class TaskWithComments:
+    task: Task
+    # The latest active comments of the task, newest first
+    comments: List[Comment]
+
+
+@dataclass(frozen=True)
+class GetPaginatedTasksWithCommentsParams:
+    tasks_params: GetPaginatedTasksParams
+    comments_limit: int
+
+
+@dataclass(frozen=True)
+class GetCursorPaginatedTasksWithCommentsParams:
+    tasks_params: GetCursorPaginatedTasksParams
+    comments_limit: int
+
+
+@dataclass(frozen=True)
+class ExportTasksParams:
+    account_id: str
+    # Resumes an interrupted export after the last task it emitted
+    after_task_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SearchTasksParams:
+    account_id: str
+    text_query: str
+    limit: int
+    after: Optional[TextSearchPosition] = None
+
+
+@dataclass(frozen=True)
+class TaskSearchHit:
+    task: Task
+    score: float
 
 
 @dataclass(frozen=True)
@@ -33,6 +96,100 @@ class CreateTaskParams:
     title: str
 
 
+@dataclass(frozen=True)
+class CreateTaskItemParams:
+    description: str
+    title: str
+
+
+@dataclass(frozen=True)
+class CreateTasksParams:
+    account_id: str
+    tasks: List[CreateTaskItemParams]
+    ordered: bool = True
+
+
+@dataclass(frozen=True)
+class CreateTaskItemResult:
+    index: int
+    success: bool
+    task: Optional[Task] = None
+    error_message: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CreateTasksResult:
+    items: List[CreateTaskItemResult]
+    created_count: int
+    failed_count: int
+
+
+@dataclass(frozen=True)
+class ImportTasksParams:
+    account_id: str
+    # NDJSON lines of the upload, pulled one at a time so that only the batch being written is held in memory
+    lines: Iterable[bytes]
+
+
+@dataclass(frozen=True)
+class AsyncImportTasksParams:
+    account_id: str
+    lines: AsyncIterable[bytes]
+
+
+@dataclass(frozen=True)
+class StageTaskImportParams:
+    account_id: str
+    # Raw chunks of the upload, stored as they are read and split into lines by TaskImportWorker
+    chunks: Iterable[bytes]
+
+
+@dataclass(frozen=True)
+class AsyncStageTaskImportParams:
+    account_id: str
+    chunks: AsyncIterable[bytes]
+
+
+@dataclass(frozen=True)
+class GetTaskImportParams:
+    account_id: str
+    import_id: str
+
+
+@dataclass(frozen=True)
+class TaskImportLineError:
+    line: int
+    message: str
+
+
+@dataclass(frozen=True)
+class TaskImportResult:
+    # Lines read, blank ones included, so that line numbers match the uploaded file
+    line_count: int
+    imported_count: int
+    failed_count: int
+    # The first tasks.import_max_reported_errors failed lines, failed_count counts all of them
+    errors: List[TaskImportLineError]
+
+
+class TaskImportStatus(StrEnum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+@dataclass(frozen=True)
+class TaskImport:
+    id: str
+    account_id: str
+    status: str
+    # Progress so far, updated by TaskImportWorker after every batch it writes
+    result: TaskImportResult
+    created_at: datetime
+    updated_at: datetime
+
+
 @dataclass(frozen=True)
 class UpdateTaskParams:
     account_id: str
@@ -54,7 +211,16 @@ class TaskDeletionResult:
     success: bool
 
 
+@dataclass(frozen=True)
+class IncrementTaskCommentCountParams:
+    account_id: str
+    task_id: str
+    # 0 when a comment changed without changing the count, which still invalidates cached comment listings
+    amount: int
+
+
 @dataclass(frozen=True)
 class TaskErrorCode:
     NOT_FOUND: str = "TASK_ERR_01"
     BAD_REQUEST: str = "TASK_ERR_02"
+    IMPORT_NOT_FOUND: str = "TASK_ERR_03"
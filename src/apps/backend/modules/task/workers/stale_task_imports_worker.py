@@ -0,0 +1,24 @@
+import asyncio
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+
+
+class StaleTaskImportsWorker(BaseWorker):
+    """
+    Scheduled as a cron, fails the imports left running by a TaskImportWorker whose last attempt timed out, so their
+    status stops reading RUNNING and their staged chunks are dropped.
+    """
+
+    max_execution_time_in_seconds = 300
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        failed_count = await asyncio.to_thread(TaskService.fail_stale_task_imports)
+        Logger.info(message=f"Failed {failed_count} stale task imports")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
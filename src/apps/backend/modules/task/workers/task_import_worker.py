@@ -0,0 +1,40 @@
+import asyncio
+from typing import Any
+
+from temporalio import activity
+
+from modules.application.types import BaseWorker
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+
+
+class TaskImportWorker(BaseWorker):
+    """
+    Imports the tasks of an NDJSON upload staged by POST /accounts/<id>/tasks:import, for uploads too large to import
+    while the client waits. Progress is recorded on the import after every batch written and sent as the activity
+    heartbeat; a retried attempt resumes after the last batch written and an attempt it superseded stops writing. The
+    import is marked failed once the last attempt fails. Batches are written off the event loop, which stays free to
+    send the heartbeats.
+    """
+
+    max_execution_time_in_seconds = 6 * 60 * 60
+    max_retries = 5
+    heartbeat_timeout_in_seconds = 300
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        (import_id,) = args
+        task_imports = TaskService.run_task_import(import_id=import_id)
+        try:
+            while (task_import := await asyncio.to_thread(lambda: next(task_imports, None))) is not None:
+                if activity.in_activity():
+                    activity.heartbeat(task_import.result.line_count)
+        except Exception:
+            if not activity.in_activity() or activity.info().attempt >= TaskImportWorker.max_retries:
+                await asyncio.to_thread(TaskService.fail_task_import, import_id=import_id)
+            raise
+
+        Logger.info(message=f"Finished task import {import_id}")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
@@ -0,0 +1,168 @@
+"""
+Compares the gunicorn gthread server (server:app) with the uvicorn worker serving the async app (asgi_server:app)
+under many concurrent slow clients. Both servers run with a single worker; every client trickles its request
+headers in with a delay, holding its connection open the way slow mobile clients do.
+
+Runs against the MongoDB configured for the current APP_ENV and removes the account and tasks it creates.
+
+Usage: make run-script file=benchmarks/async_server_benchmark ARGS="<concurrency> <requests per client>"
+"""
+
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from bson.objectid import ObjectId
+
+from modules.account.account_service import AccountService
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.authentication.authentication_service import AuthenticationService
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import CreateTaskItemParams, CreateTasksParams
+
+CONCURRENCY = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+REQUESTS_PER_CLIENT = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+SLOW_CLIENT_DELAY_SECONDS = 0.2
+SERVER_STARTUP_TIMEOUT_SECONDS = 60
+HOST = "127.0.0.1"
+
+SERVERS = {
+    "gunicorn gthread (server:app)": (8091, ["-c", "gunicorn_config.py", "server:app"]),
+    "gunicorn uvicorn (asgi_server:app)": (8092, ["-c", "gunicorn_asgi_config.py", "asgi_server:app"]),
+}
+
+
+@dataclass
+class LoadResult:
+    wall_seconds: float = 0.0
+    error_count: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+
+async def send_slow_request(port: int, path: str, access_token: str) -> tuple[int, float]:
+    request_head = f"GET {path} HTTP/1.1\r\nHost: {HOST}:{port}\r\n".encode()
+    request_tail = f"Authorization: Bearer {access_token}\r\nConnection: close\r\n\r\n".encode()
+
+    started_at = time.perf_counter()
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        writer.write(request_head)
+        await writer.drain()
+        await asyncio.sleep(SLOW_CLIENT_DELAY_SECONDS)
+        writer.write(request_tail)
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+
+    status_line = response.split(b"\r\n", 1)[0].split(b" ")
+    status_code = int(status_line[1]) if len(status_line) > 1 else 0
+    return status_code, time.perf_counter() - started_at
+
+
+async def run_client(port: int, path: str, access_token: str, result: LoadResult) -> None:
+    for _ in range(REQUESTS_PER_CLIENT):
+        try:
+            status_code, latency = await send_slow_request(port, path, access_token)
+        except OSError:
+            result.error_count += 1
+            continue
+
+        if status_code == 200:
+            result.latencies.append(latency)
+        else:
+            result.error_count += 1
+
+
+async def run_load(port: int, path: str, access_token: str) -> LoadResult:
+    result = LoadResult()
+    started_at = time.perf_counter()
+    await asyncio.gather(*(run_client(port, path, access_token, result) for _ in range(CONCURRENCY)))
+    result.wall_seconds = time.perf_counter() - started_at
+    return result
+
+
+async def wait_for_server(port: int) -> None:
+    deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection(HOST, port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.5)
+
+    raise TimeoutError(f"Server on port {port} did not start within {SERVER_STARTUP_TIMEOUT_SECONDS}s")
+
+
+def start_server(port: int, server_args: list[str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        ["gunicorn", *server_args, "--bind", f"{HOST}:{port}", "--workers", "1", "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def print_result(name: str, result: LoadResult) -> None:
+    request_count = CONCURRENCY * REQUESTS_PER_CLIENT
+    print(name)
+    print(f"  Requests:     {request_count} ({result.error_count} failed)")
+    print(f"  Wall time:    {result.wall_seconds:.2f}s ({len(result.latencies) / result.wall_seconds:.0f} req/s)")
+    if len(result.latencies) >= 2:
+        percentiles = statistics.quantiles(result.latencies, n=100)
+        print(
+            f"  Latency:      p50 {percentiles[49] * 1000:.0f}ms, p95 {percentiles[94] * 1000:.0f}ms, "
+            f"p99 {percentiles[98] * 1000:.0f}ms"
+        )
+
+
+def main() -> None:
+    account = AccountService.create_account_by_username_and_password(
+        params=CreateAccountByUsernameAndPasswordParams(
+            first_name="Benchmark", last_name="User", password="password", username=f"benchmark-{uuid4()}"
+        )
+    )
+    access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+    TaskService.create_tasks(
+        params=CreateTasksParams(
+            account_id=account.id,
+            tasks=[
+                CreateTaskItemParams(description="Created by the async server benchmark", title=f"Benchmark {index}")
+                for index in range(20)
+            ],
+            ordered=False,
+        )
+    )
+    path = f"/api/accounts/{account.id}/tasks?size=20"
+
+    print(f"Concurrent clients:   {CONCURRENCY}")
+    print(f"Requests per client:  {REQUESTS_PER_CLIENT}")
+    print(f"Client header delay:  {SLOW_CLIENT_DELAY_SECONDS * 1000:.0f}ms")
+
+    try:
+        for name, (port, server_args) in SERVERS.items():
+            server = start_server(port, server_args)
+            try:
+                asyncio.run(wait_for_server(port))
+                print_result(name, asyncio.run(run_load(port, path, access_token.token)))
+            finally:
+                server.terminate()
+                server.wait()
+    finally:
+        TaskRepository.collection().delete_many({"account_id": account.id})
+        TaskCountRepository.collection().delete_many({"_id": account.id})
+        AccountNotificationPreferencesRepository.collection().delete_many({"account_id": account.id})
+        AccountRepository.collection().delete_one({"_id": ObjectId(account.id)})
+
+
+if __name__ == "__main__":
+    main()
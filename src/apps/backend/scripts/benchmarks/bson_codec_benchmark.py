@@ -0,0 +1,130 @@
+"""
+Measures decoding a page of 1,000 task and comment documents into DTOs with the BsonCodec decoders against the
+previous from_bson then DTO conversion, and encoding models with BsonCodec against asdict. Documents are decoded from
+raw BSON first, like the driver does, and that cost is reported separately. No database is needed.
+
+Usage: make run-script file=benchmarks/bson_codec_benchmark ARGS="<iterations>"
+"""
+
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable, cast
+
+import bson
+from bson.objectid import ObjectId
+
+from modules.application.bson_codec import BsonCodec
+from modules.comment.internal.comment_util import CommentUtil
+from modules.comment.internal.store.comment_model import CommentModel
+from modules.comment.types import Comment
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import Task
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+PAGE_SIZE = 1000
+
+
+def convert_task_with_model(task_bson: dict[str, Any]) -> Task:
+    task_model = TaskModel.from_bson(task_bson)
+    return Task(
+        account_id=task_model.account_id,
+        comment_count=task_model.comment_count,
+        description=task_model.description,
+        id=str(task_model.id),
+        title=task_model.title,
+    )
+
+
+def convert_comment_with_model(comment_bson: dict[str, Any]) -> Comment:
+    comment_model = CommentModel.from_bson(comment_bson)
+    return Comment(
+        id=str(comment_model.id),
+        task_id=comment_model.task_id,
+        account_id=comment_model.account_id,
+        content=comment_model.content,
+        created_at=cast(datetime, comment_model.created_at),
+        updated_at=cast(datetime, comment_model.updated_at),
+    )
+
+
+def encode_with_asdict(model: Any) -> dict[str, Any]:
+    document = asdict(model)
+    if document.get("id") is not None:
+        document["_id"] = document.pop("id")
+    else:
+        document.pop("id", None)
+    return document
+
+
+def build_models() -> tuple[list[TaskModel], list[CommentModel]]:
+    account_id = str(ObjectId())
+    now = datetime.now().replace(microsecond=0)
+    task_models = [
+        TaskModel(
+            id=ObjectId(),
+            account_id=account_id,
+            title=f"Follow up on invoice {index} with the finance team",
+            description=f"Check the payment status of invoice {index} and update the customer record accordingly.",
+            comment_count=index % 5,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(PAGE_SIZE)
+    ]
+    comment_models = [
+        CommentModel(
+            id=ObjectId(),
+            task_id=str(task_models[index].id),
+            account_id=account_id,
+            content="Reminder sent, waiting for an answer from the customer.",
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(PAGE_SIZE)
+    ]
+    return task_models, comment_models
+
+
+def time_page(name: str, convert: Callable[[Any], Any], items: list[Any]) -> float:
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for item in items:
+            convert(item)
+    elapsed_ms = (time.perf_counter() - started_at) / ITERATIONS * 1000
+    print(f"    {name:<24} {elapsed_ms:8.2f}ms/page")
+    return elapsed_ms
+
+
+def compare(title: str, baseline: Callable[[Any], Any], codec: Callable[[Any], Any], items: list[Any]) -> None:
+    print(f"  {title}")
+    baseline_ms = time_page("before", baseline, items)
+    codec_ms = time_page("BsonCodec", codec, items)
+    print(f"    speedup {baseline_ms / codec_ms:.1f}x")
+
+
+def main() -> None:
+    task_models, comment_models = build_models()
+    raw_task_documents = [bson.encode(encode_with_asdict(task_model)) for task_model in task_models]
+    raw_comment_documents = [bson.encode(encode_with_asdict(comment_model)) for comment_model in comment_models]
+    task_documents = [bson.decode(raw_document) for raw_document in raw_task_documents]
+    comment_documents = [bson.decode(raw_document) for raw_document in raw_comment_documents]
+
+    print(f"Iterations: {ITERATIONS}, page size: {PAGE_SIZE}")
+    print("  bson.decode of the raw documents, paid by the driver either way")
+    time_page("tasks", bson.decode, raw_task_documents)
+    time_page("comments", bson.decode, raw_comment_documents)
+    compare("task documents to Task", convert_task_with_model, TaskUtil.convert_task_bson_to_task, task_documents)
+    compare(
+        "comment documents to Comment",
+        convert_comment_with_model,
+        CommentUtil.convert_comment_bson_to_comment,
+        comment_documents,
+    )
+    compare("TaskModel.to_bson", encode_with_asdict, BsonCodec.get_encoder(TaskModel), task_models)
+
+
+if __name__ == "__main__":
+    main()
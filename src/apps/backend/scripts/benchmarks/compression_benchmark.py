@@ -0,0 +1,86 @@
+"""
+Measures the CPU cost of compressing typical task listing payloads against the bytes it saves, for every installed
+encoding of CompressionMiddleware at a few levels. Payloads are serialized the way the task views serialize them, so
+no database is needed.
+
+Usage: make run-script file=benchmarks/compression_benchmark ARGS="<iterations>"
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from bson.objectid import ObjectId
+from flask import Flask
+
+from modules.application.common.types import PaginationParams, PaginationResult
+from modules.application.rest_api.compression_middleware import COMPRESSORS
+from modules.comment.types import Comment
+from modules.task.rest_api.task_view_util import TaskViewUtil
+from modules.task.types import Task, TaskWithComments
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+PAGE_SIZES = (10, 50, 100)
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 6, 11), "zstd": (1, 3, 9)}
+
+
+def build_payload(size: int, comments_per_task: int) -> bytes:
+    account_id = str(ObjectId())
+    now = datetime.now()
+    tasks: list[Any] = []
+    for index in range(size):
+        task = Task(
+            id=str(ObjectId()),
+            account_id=account_id,
+            title=f"Follow up on invoice {index} with the finance team",
+            description=f"Check the payment status of invoice {index} and update the customer record accordingly.",
+            comment_count=comments_per_task,
+        )
+        comments = [
+            Comment(
+                id=str(ObjectId()),
+                task_id=task.id,
+                account_id=account_id,
+                content=f"Reminder {comment_index} sent, waiting for an answer from the customer.",
+                created_at=now - timedelta(minutes=comment_index),
+                updated_at=now - timedelta(minutes=comment_index),
+            )
+            for comment_index in range(comments_per_task)
+        ]
+        tasks.append(TaskWithComments(task=task, comments=comments) if comments_per_task else task)
+
+    pagination_result = PaginationResult(
+        items=tasks, pagination_params=PaginationParams(page=1, size=size), total_count=size * 20, total_pages=20
+    )
+    return Flask(__name__).json.dumps(TaskViewUtil.serialize_pagination_result(pagination_result, None)).encode()
+
+
+def time_compression(encoding: str, level: int, payload: bytes) -> None:
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        compressor = COMPRESSORS[encoding](level)
+        compressed_payload = compressor.compress(payload) + compressor.finish()
+    elapsed_seconds = time.perf_counter() - started_at
+
+    print(
+        f"    {encoding:<5} level {level:<3} {len(compressed_payload):>8} bytes"
+        f" ({len(compressed_payload) / len(payload):6.1%})"
+        f" {elapsed_seconds / ITERATIONS * 1_000_000:9.1f}us/op"
+        f" {len(payload) * ITERATIONS / elapsed_seconds / 1_000_000:8.1f}MB/s"
+    )
+
+
+def main() -> None:
+    print(f"Iterations: {ITERATIONS}, installed encodings: {', '.join(COMPRESSORS)}")
+    for comments_per_task in (0, 3):
+        for size in PAGE_SIZES:
+            payload = build_payload(size, comments_per_task)
+            print(f"  {size} tasks, {comments_per_task} embedded comments each: {len(payload)} bytes")
+            for encoding in COMPRESSORS:
+                for level in LEVELS[encoding]:
+                    time_compression(encoding, level, payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Measures the cost of encoding a 100 task PaginationResult into a JSON response with Flask's DefaultJSONProvider against
+FastJSONProvider, both from the dict TaskViewUtil builds and from the dataclasses directly, and checks the bodies are
+byte for byte the same. Payloads are built in memory, so no database is needed.
+
+Usage: make run-script file=benchmarks/json_provider_benchmark ARGS="<iterations>"
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from bson.objectid import ObjectId
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+from modules.application.common.types import PaginationParams, PaginationResult
+from modules.application.json_provider import FastJSONProvider
+from modules.comment.types import Comment
+from modules.task.rest_api.task_view_util import TaskViewUtil
+from modules.task.types import Task, TaskWithComments
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+PAGE_SIZE = 100
+
+
+def build_pagination_result(comments_per_task: int) -> PaginationResult[Any]:
+    account_id = str(ObjectId())
+    now = datetime.now()
+    tasks: list[Any] = []
+    for index in range(PAGE_SIZE):
+        task = Task(
+            id=str(ObjectId()),
+            account_id=account_id,
+            title=f"Follow up on invoice {index} with the finance team",
+            description=f"Check the payment status of invoice {index} and update the customer record accordingly.",
+            comment_count=comments_per_task,
+        )
+        comments = [
+            Comment(
+                id=str(ObjectId()),
+                task_id=task.id,
+                account_id=account_id,
+                content=f"Reminder {comment_index} sent, waiting for an answer from the customer.",
+                created_at=now - timedelta(minutes=comment_index),
+                updated_at=now - timedelta(minutes=comment_index),
+            )
+            for comment_index in range(comments_per_task)
+        ]
+        tasks.append(TaskWithComments(task=task, comments=comments) if comments_per_task else task)
+
+    return PaginationResult(
+        items=tasks,
+        pagination_params=PaginationParams(page=1, size=PAGE_SIZE),
+        total_count=PAGE_SIZE * 20,
+        total_pages=20,
+    )
+
+
+def time_response(app: Flask, name: str, provider: JSONProvider, payload: Any) -> tuple[bytes, float]:
+    with app.app_context():
+        started_at = time.perf_counter()
+        for _ in range(ITERATIONS):
+            body = provider.response(payload).get_data()
+        elapsed_seconds = time.perf_counter() - started_at
+
+    print(f"    {name:<8} {len(body):>8} bytes {elapsed_seconds / ITERATIONS * 1_000_000:9.1f}us/op")
+    return body, elapsed_seconds
+
+
+def main() -> None:
+    app = Flask(__name__)
+    providers = {"default": DefaultJSONProvider(app), "fast": FastJSONProvider(app)}
+
+    print(f"Iterations: {ITERATIONS}, page size: {PAGE_SIZE}")
+    for comments_per_task in (0, 3):
+        pagination_result = build_pagination_result(comments_per_task)
+        payloads = {
+            "serialized": TaskViewUtil.serialize_pagination_result(pagination_result, None),
+            "dataclass": pagination_result,
+        }
+        for payload_name, payload in payloads.items():
+            print(f"  {payload_name}, {comments_per_task} embedded comments each:")
+            results = {name: time_response(app, name, provider, payload) for name, provider in providers.items()}
+            (default_body, default_seconds), (fast_body, fast_seconds) = results["default"], results["fast"]
+            print(f"    speedup {default_seconds / fast_seconds:.1f}x, identical: {default_body == fast_body}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Measures writing a 1,000 task listing page the usual way, decoding each document into a dict then a Task DTO and
+encoding the whole serialized page, against the listings.raw_bson_enabled path, which transcodes RawBSONDocuments into
+JSON-ready dicts and encodes them one batch at a time as the body is streamed. Reports latency and the tracemalloc peak
+of each, and checks the bodies are byte for byte the same. Documents are built in memory, so no database is needed.
+
+Usage: make run-script file=benchmarks/raw_listing_benchmark ARGS="<iterations>"
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+import bson
+from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
+from flask import Flask
+
+from modules.application.common.types import PaginationParams, PaginationResult, RawPaginationResult
+from modules.application.json_provider import FastJSONProvider
+from modules.application.rest_api.raw_listing_response import stream_raw_pagination_result
+from modules.task.internal.task_util import TaskUtil
+from modules.task.rest_api.task_view_util import TaskViewUtil
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+PAGE_SIZE = 1000
+TOTAL_COUNT = PAGE_SIZE * 20
+
+
+def build_raw_documents() -> list[bytes]:
+    account_id = str(ObjectId())
+    return [
+        bson.encode(
+            {
+                "_id": ObjectId(),
+                "account_id": account_id,
+                "title": f"Follow up on invoice {index} with the finance team",
+                "description": f"Check the payment status of invoice {index} and update the customer record.",
+                "comment_count": index % 5,
+            }
+        )
+        for index in range(PAGE_SIZE)
+    ]
+
+
+def write_dto_page(provider: FastJSONProvider, raw_documents: list[bytes]) -> bytes:
+    tasks = [TaskUtil.convert_task_bson_to_task(bson.decode(raw_document)) for raw_document in raw_documents]
+    pagination_result = PaginationResult(
+        items=tasks,
+        pagination_params=PaginationParams(page=1, size=PAGE_SIZE),
+        total_count=TOTAL_COUNT,
+        total_pages=TOTAL_COUNT // PAGE_SIZE,
+    )
+    return provider.response(TaskViewUtil.serialize_pagination_result(pagination_result, None)).get_data()
+
+
+def build_raw_pagination_result(raw_documents: list[bytes]) -> RawPaginationResult:
+    raw_tasks_bson = [RawBSONDocument(raw_document) for raw_document in raw_documents]
+    return RawPaginationResult(
+        item_batches=TaskUtil.transcode_raw_tasks_bson(raw_tasks_bson, None),
+        pagination_params=PaginationParams(page=1, size=PAGE_SIZE),
+        total_count=TOTAL_COUNT,
+        total_pages=TOTAL_COUNT // PAGE_SIZE,
+    )
+
+
+def write_raw_page(provider: FastJSONProvider, raw_documents: list[bytes]) -> int:
+    # Chunks are dropped once written, as they are once sent to the client
+    body_size = 0
+    for chunk in stream_raw_pagination_result(build_raw_pagination_result(raw_documents), provider):
+        body_size += len(chunk)
+    return body_size
+
+
+def measure(name: str, write_page: Callable[[], object]) -> float:
+    write_page()
+    tracemalloc.start()
+    write_page()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        write_page()
+    elapsed_ms = (time.perf_counter() - started_at) / ITERATIONS * 1000
+
+    print(f"  {name:<6} {elapsed_ms:8.2f}ms/page  peak {peak_bytes / 1024 / 1024:7.2f}MiB")
+    return elapsed_ms
+
+
+def main() -> None:
+    app = Flask(__name__)
+    provider = FastJSONProvider(app)
+    raw_documents = build_raw_documents()
+
+    with app.app_context():
+        dto_body = write_dto_page(provider, raw_documents)
+        raw_body = b"".join(stream_raw_pagination_result(build_raw_pagination_result(raw_documents), provider))
+
+        print(f"Iterations: {ITERATIONS}, page size: {PAGE_SIZE}, body: {len(dto_body)} bytes")
+        dto_ms = measure("DTO", lambda: write_dto_page(provider, raw_documents))
+        raw_ms = measure("raw", lambda: write_raw_page(provider, raw_documents))
+        print(f"  speedup {dto_ms / raw_ms:.1f}x, identical: {dto_body == raw_body}")
+
+
+if __name__ == "__main__":
+    main()
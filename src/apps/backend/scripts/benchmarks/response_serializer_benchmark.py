@@ -0,0 +1,92 @@
+"""
+Measures ResponseSerializer against dataclasses.asdict for the DTOs the views return, from a single task up to a 100
+task PaginationResult. DTOs are built in memory, so no database is needed.
+
+Usage: make run-script file=benchmarks/response_serializer_benchmark ARGS="<iterations>"
+"""
+
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable
+
+from bson.objectid import ObjectId
+
+from modules.account.rest_api.account_view import ACCOUNT_PROFILE_FIELDS
+from modules.account.types import Account, PhoneNumber
+from modules.application.common.types import PaginationParams, PaginationResult
+from modules.application.response_serializer import ResponseSerializer
+from modules.authentication.types import AccessToken
+from modules.comment.types import Comment
+from modules.notification.types import AccountNotificationPreferences
+from modules.task.types import Task
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+
+def build_task(index: int, account_id: str) -> Task:
+    return Task(
+        id=str(ObjectId()),
+        account_id=account_id,
+        title=f"Follow up on invoice {index} with the finance team",
+        description=f"Check the payment status of invoice {index} and update the customer record accordingly.",
+        comment_count=index % 5,
+    )
+
+
+def build_dtos() -> dict[str, Any]:
+    account_id = str(ObjectId())
+    now = datetime.now()
+    return {
+        "Task": build_task(0, account_id),
+        "Comment": Comment(
+            id=str(ObjectId()),
+            task_id=str(ObjectId()),
+            account_id=account_id,
+            content="Reminder sent, waiting for an answer from the customer.",
+            created_at=now,
+            updated_at=now,
+        ),
+        "Account": Account(
+            id=account_id,
+            first_name="first_name",
+            last_name="last_name",
+            hashed_password="$2b$12$" + "x" * 53,
+            phone_number=PhoneNumber(country_code="+91", phone_number="9999999999"),
+            username="username",
+        ),
+        "AccessToken": AccessToken(token="x" * 180, account_id=account_id, expires_at=now.isoformat()),
+        "AccountNotificationPreferences": AccountNotificationPreferences(account_id=account_id),
+        "PaginationResult[Task] x100": PaginationResult(
+            items=[build_task(index, account_id) for index in range(100)],
+            pagination_params=PaginationParams(page=1, size=100),
+            total_count=2000,
+            total_pages=20,
+        ),
+    }
+
+
+def time_serializer(serialize: Callable[[Any], dict[str, Any]], dto: Any) -> float:
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        serialize(dto)
+    return (time.perf_counter() - started_at) / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    print(f"Iterations: {ITERATIONS}")
+    for name, dto in build_dtos().items():
+        asdict_us = time_serializer(asdict, dto)
+        serializer_us = time_serializer(ResponseSerializer.serialize, dto)
+        print(
+            f"  {name:<32} asdict {asdict_us:9.1f}us/op  serializer {serializer_us:9.1f}us/op"
+            f"  speedup {asdict_us / serializer_us:5.1f}x"
+        )
+
+    account_dict = ResponseSerializer.serialize(build_dtos()["Account"])
+    print(f"Account fields: {', '.join(account_dict)} (allowed: {', '.join(ACCOUNT_PROFILE_FIELDS)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Seeds an account with tasks and comments and times full-text search pages against the text indexes, first pages and
+pages reached by following next_cursor. Documents are written straight to the collections in batches; they are removed
+again when the benchmark ends.
+
+Usage: make run-script file=benchmarks/search_benchmark ARGS="<documents> <searches>"
+"""
+
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from bson.objectid import ObjectId
+
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.search.search_service import SearchService
+from modules.search.types import SearchParams
+from modules.task.internal.store.task_repository import TaskRepository
+
+DOCUMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+SEARCHES = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+BATCH_SIZE = 10_000
+PAGE_SIZE = 20
+FOLLOWED_PAGES = 5
+
+# Word frequencies are skewed so searches cover both rare and very common terms
+VOCABULARY = [f"word{index}" for index in range(5_000)]
+VOCABULARY_WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+SEARCH_TERMS = {"common": VOCABULARY[0], "medium": VOCABULARY[100], "rare": VOCABULARY[4_000]}
+
+
+def build_text(generator: random.Random, word_count: int) -> str:
+    return " ".join(generator.choices(VOCABULARY, weights=VOCABULARY_WEIGHTS, k=word_count))
+
+
+def seed(account_id: str) -> None:
+    generator = random.Random(42)
+    now = datetime.now()
+    task_count = DOCUMENTS // 2
+    task_ids: list[str] = []
+
+    started_at = time.perf_counter()
+    for batch_start in range(0, task_count, BATCH_SIZE):
+        tasks_bson = [
+            {
+                "_id": ObjectId(),
+                "account_id": account_id,
+                "title": build_text(generator, 4),
+                "description": build_text(generator, 30),
+                "active": True,
+                "comment_count": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for _ in range(min(BATCH_SIZE, task_count - batch_start))
+        ]
+        TaskRepository.collection().insert_many(tasks_bson, ordered=False)
+        task_ids.extend(str(task_bson["_id"]) for task_bson in tasks_bson)
+
+    for batch_start in range(0, DOCUMENTS - task_count, BATCH_SIZE):
+        CommentRepository.collection().insert_many(
+            [
+                {
+                    "task_id": generator.choice(task_ids),
+                    "account_id": account_id,
+                    "content": build_text(generator, 20),
+                    "active": True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for _ in range(min(BATCH_SIZE, DOCUMENTS - task_count - batch_start))
+            ],
+            ordered=False,
+        )
+    print(f"Seeded {DOCUMENTS} documents in {time.perf_counter() - started_at:.1f}s")
+
+
+def time_search(name: str, search: Callable[[], object]) -> None:
+    durations_ms = []
+    for _ in range(SEARCHES):
+        started_at = time.perf_counter()
+        search()
+        durations_ms.append((time.perf_counter() - started_at) * 1000)
+    durations_ms.sort()
+    print(
+        f"  {name:<24} p50 {durations_ms[len(durations_ms) // 2]:8.1f}ms"
+        f"  p95 {durations_ms[int(len(durations_ms) * 0.95)]:8.1f}ms"
+    )
+
+
+def follow_pages(account_id: str, text_query: str) -> None:
+    cursor: Optional[str] = None
+    for _ in range(FOLLOWED_PAGES):
+        result = SearchService.search(
+            params=SearchParams(account_id=account_id, text_query=text_query, size=PAGE_SIZE, cursor=cursor)
+        )
+        cursor = result.next_cursor
+        if cursor is None:
+            break
+
+
+def main() -> None:
+    account_id = str(ObjectId())
+    try:
+        seed(account_id)
+        print(f"Searches per measurement: {SEARCHES}, page size: {PAGE_SIZE}")
+        for frequency, text_query in SEARCH_TERMS.items():
+            time_search(
+                f"{frequency} first page",
+                lambda: SearchService.search(
+                    params=SearchParams(account_id=account_id, text_query=text_query, size=PAGE_SIZE)
+                ),
+            )
+            time_search(f"{frequency} {FOLLOWED_PAGES} pages", lambda: follow_pages(account_id, text_query))
+    finally:
+        TaskRepository.collection().delete_many({"account_id": account_id})
+        CommentRepository.collection().delete_many({"account_id": account_id})
+
+
+if __name__ == "__main__":
+    main()
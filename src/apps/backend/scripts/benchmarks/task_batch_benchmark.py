@@ -0,0 +1,72 @@
+"""
+Compares creating tasks with one POST /tasks per item against a single POST /tasks:batch.
+
+Runs against the MongoDB configured for the current APP_ENV and removes the account and tasks it creates.
+
+Usage: make run-script file=benchmarks/task_batch_benchmark
+"""
+
+import json
+import sys
+import time
+from uuid import uuid4
+
+from bson.objectid import ObjectId
+
+from modules.account.account_service import AccountService
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.authentication.authentication_service import AuthenticationService
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from server import app
+
+TASK_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+
+def main() -> None:
+    account = AccountService.create_account_by_username_and_password(
+        params=CreateAccountByUsernameAndPasswordParams(
+            first_name="Benchmark", last_name="User", password="password", username=f"benchmark-{uuid4()}"
+        )
+    )
+    access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+    headers = {"Authorization": f"Bearer {access_token.token}", "Content-Type": "application/json"}
+    tasks_data = [
+        {"title": f"Benchmark task {index}", "description": "Created by the batch benchmark"}
+        for index in range(TASK_COUNT)
+    ]
+
+    try:
+        with app.test_client() as client:
+            started_at = time.perf_counter()
+            for task_data in tasks_data:
+                response = client.post(f"/api/accounts/{account.id}/tasks", headers=headers, data=json.dumps(task_data))
+                assert response.status_code == 201, response.json
+            per_item_seconds = time.perf_counter() - started_at
+
+            started_at = time.perf_counter()
+            response = client.post(
+                f"/api/accounts/{account.id}/tasks:batch",
+                headers=headers,
+                data=json.dumps({"tasks": tasks_data, "ordered": False}),
+            )
+            assert response.status_code == 201, response.json
+            batch_seconds = time.perf_counter() - started_at
+
+        print(f"Tasks per run:      {TASK_COUNT}")
+        print(f"Per-item POSTs:     {per_item_seconds:.3f}s ({TASK_COUNT / per_item_seconds:.0f} tasks/s)")
+        print(f"Single batch POST:  {batch_seconds:.3f}s ({TASK_COUNT / batch_seconds:.0f} tasks/s)")
+        print(f"Speedup:            {per_item_seconds / batch_seconds:.1f}x")
+    finally:
+        TaskRepository.collection().delete_many({"account_id": account.id})
+        TaskCountRepository.collection().delete_many({"_id": account.id})
+        AccountNotificationPreferencesRepository.collection().delete_many({"account_id": account.id})
+        AccountRepository.collection().delete_one({"_id": ObjectId(account.id)})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Times TaskService operations with storage latency removed, so changes to service, reader and writer logic can be
+compared at high iteration counts. Runs against the in-memory repository backend and refuses to run against MongoDB.
+
+Usage: MONGODB_BACKEND=memory make run-script file=benchmarks/task_service_benchmark ARGS="<iterations>"
+"""
+
+import sys
+import time
+from typing import Callable
+
+from bson.objectid import ObjectId
+
+from modules.application.common.constants import IN_MEMORY_BACKEND
+from modules.application.common.types import CursorPaginationParams
+from modules.application.repository import ApplicationRepositoryClient
+from modules.task.task_service import TaskService
+from modules.task.types import (
+    CreateTaskParams,
+    DeleteTaskParams,
+    GetCursorPaginatedTasksParams,
+    GetTaskParams,
+    UpdateTaskParams,
+)
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+
+def time_operation(name: str, operation: Callable[[int], object]) -> None:
+    started_at = time.perf_counter()
+    for index in range(ITERATIONS):
+        operation(index)
+    elapsed_seconds = time.perf_counter() - started_at
+    print(
+        f"  {name:<20} {elapsed_seconds / ITERATIONS * 1_000_000:8.1f}us/op ({ITERATIONS / elapsed_seconds:.0f} ops/s)"
+    )
+
+
+def main() -> None:
+    if ApplicationRepositoryClient.get_backend() != IN_MEMORY_BACKEND:
+        sys.exit("Set MONGODB_BACKEND=memory, this benchmark measures service logic without storage latency")
+
+    account_id = str(ObjectId())
+    task_ids: list[str] = []
+
+    print(f"Iterations: {ITERATIONS}")
+    time_operation(
+        "create_task",
+        lambda index: task_ids.append(
+            TaskService.create_task(
+                params=CreateTaskParams(account_id=account_id, title=f"Task {index}", description="Benchmark")
+            ).id
+        ),
+    )
+    time_operation(
+        "get_task",
+        lambda index: TaskService.get_task(params=GetTaskParams(account_id=account_id, task_id=task_ids[index])),
+    )
+    time_operation(
+        "update_task",
+        lambda index: TaskService.update_task(
+            params=UpdateTaskParams(account_id=account_id, task_id=task_ids[index], title="Updated", description="")
+        ),
+    )
+    time_operation(
+        "list_tasks (size 10)",
+        lambda _: TaskService.get_cursor_paginated_tasks(
+            params=GetCursorPaginatedTasksParams(
+                account_id=account_id, pagination_params=CursorPaginationParams(size=10)
+            )
+        ),
+    )
+    time_operation(
+        "delete_task",
+        lambda index: TaskService.delete_task(params=DeleteTaskParams(account_id=account_id, task_id=task_ids[index])),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+from modules.comment.comment_service import CommentService
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
+
+def main() -> None:
+    LoggerManager.mount_logger()
+
+    deletion_result = CommentService.delete_orphaned_comments()
+    Logger.info(
+        message=f"Deleted orphaned comments: checked {deletion_result.checked_task_count} tasks, "
+        f"deleted {deletion_result.deleted_comment_count} comments of {deletion_result.orphaned_task_count} "
+        "inactive tasks"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Applies the indexes and validators declared on every repository to the configured database and reports how the
+live database differed. Safe to run repeatedly; run it before deploying so app workers never build indexes.
+
+Usage: make run-script file=provision_collections [ARGS="--dry-run"]
+"""
+
+import argparse
+import sys
+from typing import List, Type
+
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.application.repository import ApplicationRepository, ApplicationRepositoryClient
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_import_chunk_repository import TaskImportChunkRepository
+from modules.task.internal.store.task_import_repository import TaskImportRepository
+from modules.task.internal.store.task_repository import TaskRepository
+
+REPOSITORIES: List[Type[ApplicationRepository]] = [
+    AccountRepository,
+    AccountNotificationPreferencesRepository,
+    CommentRepository,
+    OTPRepository,
+    PasswordResetTokenRepository,
+    TaskCountRepository,
+    TaskImportChunkRepository,
+    TaskImportRepository,
+    TaskRepository,
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Provision MongoDB collections, indexes and validators.")
+    parser.add_argument("--dry-run", action="store_true", help="report the differences without applying them")
+    args = parser.parse_args()
+
+    LoggerManager.mount_logger()
+    database = ApplicationRepositoryClient.get_client().get_database()
+    action = "would" if args.dry_run else "did"
+    has_changes = False
+
+    for repository in REPOSITORIES:
+        result = repository.provision_collection(database, dry_run=args.dry_run)
+        has_changes = has_changes or result.has_changes
+
+        if result.collection_created:
+            Logger.info(message=f"{result.collection_name}: {action} create collection")
+        if result.validator_changed:
+            Logger.info(message=f"{result.collection_name}: {action} update validator")
+        for index_name in result.created_indexes:
+            Logger.info(message=f"{result.collection_name}: {action} create index {index_name}")
+        for index_name in result.recreated_indexes:
+            Logger.info(message=f"{result.collection_name}: {action} recreate changed index {index_name}")
+        for index_name in result.undeclared_indexes:
+            Logger.info(message=f"{result.collection_name}: live index {index_name} is not declared, left in place")
+        if not result.has_changes:
+            Logger.info(message=f"{result.collection_name}: up to date")
+
+    # A dry run exits non-zero when the live database has drifted, so CI can gate deploys on it
+    if args.dry_run and has_changes:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+from modules.comment.comment_service import CommentService
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+from modules.task.task_service import TaskService
+
+
+def main() -> None:
+    LoggerManager.mount_logger()
+
+    task_counts_result = TaskService.reconcile_task_counts()
+    Logger.info(
+        message=f"Reconciled task counts: checked {task_counts_result.checked_count} accounts, "
+        f"repaired {task_counts_result.repaired_count}"
+    )
+
+    comment_counts_result = CommentService.reconcile_comment_counts()
+    Logger.info(
+        message=f"Reconciled comment counts: checked {comment_counts_result.checked_count} tasks, "
+        f"repaired {comment_counts_result.repaired_count}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,18 +8,23 @@ from bin.blueprints import api_blueprint, img_assets_blueprint, react_blueprint
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.application.application_service import ApplicationService
 from modules.application.errors import AppError, WorkerClientConnectionError
+from modules.application.json_provider import FastJSONProvider
+from modules.application.rest_api.compression_middleware import CompressionMiddleware
 from modules.application.workers.health_check_worker import HealthCheckWorker
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
+from modules.search.rest_api.search_rest_api_server import SearchRestApiServer
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
+from modules.task.workers.stale_task_imports_worker import StaleTaskImportsWorker
 from modules.comment.rest_api.comment_rest_api_server import CommentRestApiServer
 from scripts.bootstrap_app import BootstrapApp
 
 load_dotenv()
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 cors = CORS(app, resources={r"/*": {"origins": "http://localhost:4001"}})
 
 # Mount deps
@@ -36,6 +41,9 @@ try:
     # In production, it is optional to run this worker
     ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *")
 
+    # Fail the task imports whose worker timed out on its last attempt
+    ApplicationService.schedule_worker_as_cron(cls=StaleTaskImportsWorker, cron_schedule="*/10 * * * *")
+
 except WorkerClientConnectionError as e:
     Logger.critical(message=e.message)
 
@@ -47,6 +55,10 @@ if ConfigService.has_value("is_server_running_behind_proxy") and ConfigService[b
 ):
     app.wsgi_app = ProxyFix(app.wsgi_app)  # type: ignore
 
+# Compress responses for clients that accept it, see the compression config
+if ConfigService[bool].get_value(key="compression.enabled", default=False):
+    app.wsgi_app = CompressionMiddleware.from_config(app.wsgi_app)  # type: ignore
+
 # Register authentication apis
 authentication_blueprint = AuthenticationRestApiServer.create()
 api_blueprint.register_blueprint(authentication_blueprint)
@@ -63,6 +75,10 @@ api_blueprint.register_blueprint(task_blueprint)
 comment_blueprint = CommentRestApiServer.create()
 api_blueprint.register_blueprint(comment_blueprint)
 
+# Register search apis
+search_blueprint = SearchRestApiServer.create()
+api_blueprint.register_blueprint(search_blueprint)
+
 app.register_blueprint(api_blueprint)
 
 # Register frontend elements
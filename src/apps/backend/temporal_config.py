@@ -4,16 +4,18 @@ from temporalio import activity, workflow
 
 from modules.application.types import BaseWorker, RegisteredWorker
 from modules.application.workers.health_check_worker import HealthCheckWorker
-
-
-class TemporalConfig: 
-
-
-# hewpldasdsad
-
-
-
-                                      WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker]
+from modules.comment.workers.task_comments_deletion_worker import TaskCommentsDeletionWorker
+from modules.task.workers.stale_task_imports_worker import StaleTaskImportsWorker
+from modules.task.workers.task_import_worker import TaskImportWorker
+
+
+class TemporalConfig:
+    WORKERS: List[Type[BaseWorker]] = [
+        HealthCheckWorker,
+        StaleTaskImportsWorker,
+        TaskCommentsDeletionWorker,
+        TaskImportWorker,
+    ]
 
     REGISTERED_WORKERS: List[RegisteredWorker] = []
 
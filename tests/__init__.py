@@ -0,0 +1 @@
+import tests.database_command_counter  # noqa: F401
@@ -0,0 +1,44 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Tuple
+
+from pymongo import monitoring
+
+CRUD_COMMAND_NAMES = {"aggregate", "count", "delete", "find", "findAndModify", "getMore", "insert", "update"}
+
+
+class DatabaseCommandCounter(monitoring.CommandListener):
+    """
+    Records the CRUD commands sent to MongoDB as (command_name, collection_name) pairs while a block is recording.
+    The full command documents are kept in command_documents for tests that need to replay them.
+    """
+
+    def __init__(self) -> None:
+        self.commands: List[Tuple[str, str]] = []
+        self.command_documents: List[dict[str, Any]] = []
+        self.is_recording = False
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if self.is_recording and event.command_name in CRUD_COMMAND_NAMES:
+            self.commands.append((event.command_name, event.command[event.command_name]))
+            self.command_documents.append(dict(event.command))
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+    @contextmanager
+    def record(self) -> Iterator[List[Tuple[str, str]]]:
+        self.commands = []
+        self.command_documents = []
+        self.is_recording = True
+        try:
+            yield self.commands
+        finally:
+            self.is_recording = False
+
+
+# Registered before any MongoClient is created so every client used by the tests reports to it
+DATABASE_COMMAND_COUNTER = DatabaseCommandCounter()
+monitoring.register(DATABASE_COMMAND_COUNTER)
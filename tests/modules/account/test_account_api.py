@@ -1,4 +1,5 @@
 import json
+import time
 from datetime import datetime, timedelta
 from unittest import mock
 
@@ -12,10 +13,12 @@ from modules.account.types import (
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
+from modules.application.errors import ProjectionErrorCode
 from modules.authentication.types import AccessTokenErrorCode, OTPErrorCode
 from modules.config.config_service import ConfigService
 from modules.notification.sms_service import SMSService
 from tests.modules.account.base_test_account import BaseTestAccount
+from tests.database_command_counter import DATABASE_COMMAND_COUNTER
 
 ACCOUNT_URL = "http://127.0.0.1:8080/api/accounts"
 HEADERS = {"Content-Type": "application/json"}
@@ -32,6 +35,7 @@ class TestAccountApi(BaseTestAccount):
             assert response.status_code == 201
             assert response.json, f"No response from API with status code:: {response.status}"
             assert response.json.get("username") == "username"
+            assert "hashed_password" not in response.json
 
     def test_create_account_with_existing_user(self) -> None:
         account = AccountService.create_account_by_username_and_password(
@@ -134,6 +138,60 @@ class TestAccountApi(BaseTestAccount):
             assert response.json.get("username") == account.username
             assert response.json.get("first_name") == account.first_name
             assert response.json.get("last_name") == account.last_name
+            assert "hashed_password" not in response.json
+
+    def test_get_account_with_fields(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        with app.test_client() as client:
+            access_token = client.post(
+                "http://127.0.0.1:8080/api/access-tokens",
+                headers=HEADERS,
+                data=json.dumps({"username": account.username, "password": "password"}),
+            )
+            response = client.get(
+                f"http://127.0.0.1:8080/api/accounts/{account.id}?fields=id,username",
+                headers={"Authorization": f"Bearer {access_token.json.get('token')}"},
+            )
+            assert response.status_code == 200
+            assert response.json == {"id": account.id, "username": account.username}
+
+            response = client.get(
+                f"http://127.0.0.1:8080/api/accounts/{account.id}?fields=hashed_password",
+                headers={"Authorization": f"Bearer {access_token.json.get('token')}"},
+            )
+            assert response.status_code == 400
+            assert response.json.get("code") == ProjectionErrorCode.INVALID_FIELDS
+
+    def test_get_account_answers_matching_if_none_match_with_304(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        with app.test_client() as client:
+            access_token = client.post(
+                "http://127.0.0.1:8080/api/access-tokens",
+                headers=HEADERS,
+                data=json.dumps({"username": account.username, "password": "password"}),
+            )
+            auth_headers = {"Authorization": f"Bearer {access_token.json.get('token')}"}
+            etag = client.get(f"{ACCOUNT_URL}/{account.id}", headers=auth_headers).headers.get("ETag")
+
+            response = client.get(f"{ACCOUNT_URL}/{account.id}", headers={**auth_headers, "If-None-Match": etag})
+            assert response.status_code == 304
+
+            time.sleep(0.01)
+            client.patch(f"{ACCOUNT_URL}/{account.id}", headers=HEADERS, data=json.dumps({"first_name": "new"}))
+
+            response = client.get(f"{ACCOUNT_URL}/{account.id}", headers={**auth_headers, "If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.json.get("first_name") == "new"
 
     def test_get_account_by_username_and_password_with_invalid_password(self) -> None:
         account = AccountService.create_account_by_username_and_password(
@@ -441,3 +499,38 @@ class TestAccountApi(BaseTestAccount):
             )
 
             assert response.status_code == 500
+
+    def test_create_account_by_username_and_password_round_trips(self) -> None:
+        payload = json.dumps(
+            {"first_name": "first_name", "last_name": "last_name", "password": "password", "username": "username"}
+        )
+
+        with app.test_client() as client:
+            with DATABASE_COMMAND_COUNTER.record() as commands:
+                response = client.post(ACCOUNT_URL, headers=HEADERS, data=payload)
+
+        assert response.status_code == 201
+        # The find is the username uniqueness check, the account itself is not read back
+        assert commands == [
+            ("find", "accounts"),
+            ("insert", "accounts"),
+            ("findAndModify", "account_notification_preferences"),
+        ]
+
+    @mock.patch.object(SMSService, "send_sms_for_account")
+    def test_create_account_by_phone_number_round_trips(self, mock_send_sms) -> None:
+        payload = json.dumps({"phone_number": {"country_code": "+91", "phone_number": "9999999999"}})
+
+        with app.test_client() as client:
+            with DATABASE_COMMAND_COUNTER.record() as commands:
+                response = client.post(ACCOUNT_URL, headers=HEADERS, data=payload)
+
+        assert response.status_code == 201
+        # The find looks up an existing account with the number, the otps update expires its previous OTPs
+        assert commands == [
+            ("find", "accounts"),
+            ("insert", "accounts"),
+            ("findAndModify", "account_notification_preferences"),
+            ("update", "otps"),
+            ("insert", "otps"),
+        ]
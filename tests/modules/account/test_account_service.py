@@ -1,10 +1,13 @@
 from datetime import datetime
 from unittest.mock import patch
 
+import pytest
 from server import app
 
 from modules.account.account_service import AccountService
-from modules.account.errors import AccountNotFoundError, AccountWithIdNotFoundError
+from modules.account.errors import AccountNotFoundError, AccountWithIdNotFoundError, AccountWithPhoneNumberExistsError
+from modules.account.internal.account_writer import AccountWriter
+from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import (
     AccountErrorCode,
     AccountSearchByIdParams,
@@ -64,6 +67,24 @@ class TestAccountService(BaseTestAccount):
 
         assert account.phone_number == PhoneNumber(country_code="+91", phone_number="9999999999")
 
+    def test_create_account_by_phone_number_rejects_an_active_duplicate(self) -> None:
+        params = CreateAccountByPhoneNumberParams(
+            phone_number=PhoneNumber(country_code="+91", phone_number="9999999999")
+        )
+        AccountWriter.create_account_by_phone_number(params=params)
+        for username in ["first@example.com", "second@example.com"]:
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    password="password", username=username, first_name="first_name", last_name="last_name"
+                )
+            )
+
+        with pytest.raises(AccountWithPhoneNumberExistsError) as exc_info:
+            AccountWriter.create_account_by_phone_number(params=params)
+
+        assert exc_info.value.code == AccountErrorCode.PHONE_NUMBER_ALREADY_EXISTS
+        assert AccountRepository.collection().count_documents({"active": True, "phone_number": {"$ne": None}}) == 1
+
     def test_throw_exception_when_phone_number_not_exist(self) -> None:
         phone_number = PhoneNumber(**{"country_code": "+91", "phone_number": "9999999999"})
         try:
@@ -0,0 +1,101 @@
+import unittest
+
+from asgi_server import app
+
+from modules.account.account_service import AccountService
+from modules.account.types import AccountErrorCode, CreateAccountByUsernameAndPasswordParams
+from modules.application.repository import AsyncApplicationRepositoryClient
+from tests.modules.account.base_test_account import BaseTestAccount
+
+ACCOUNT_URL = "http://127.0.0.1:8080/api/accounts"
+ACCESS_TOKEN_URL = "http://127.0.0.1:8080/api/access-tokens"
+HEADERS = {"Content-Type": "application/json"}
+
+
+class TestAsyncAccountApi(BaseTestAccount, unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self) -> None:
+        await AsyncApplicationRepositoryClient.close()
+
+    async def test_create_account_and_log_in(self) -> None:
+        account_data = {
+            "first_name": "first_name",
+            "last_name": "last_name",
+            "password": "password",
+            "username": "username",
+        }
+
+        create_response = await app.test_client().post(ACCOUNT_URL, headers=HEADERS, json=account_data)
+        token_response = await app.test_client().post(
+            ACCESS_TOKEN_URL, headers=HEADERS, json={"username": "username", "password": "password"}
+        )
+        create_response_json = await create_response.get_json()
+        token_response_json = await token_response.get_json()
+
+        assert create_response.status_code == 201
+        assert create_response_json.get("username") == "username"
+        assert token_response.status_code == 201
+        assert token_response_json.get("account_id") == create_response_json.get("id")
+        assert token_response_json.get("token")
+
+    async def test_create_account_with_existing_user(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        response = await app.test_client().post(
+            ACCOUNT_URL,
+            headers=HEADERS,
+            json={
+                "first_name": "first_name",
+                "last_name": "last_name",
+                "password": "password",
+                "username": account.username,
+            },
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 409
+        assert response_json.get("code") == AccountErrorCode.USERNAME_ALREADY_EXISTS
+
+    async def test_log_in_with_invalid_password(self) -> None:
+        AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        response = await app.test_client().post(
+            ACCESS_TOKEN_URL, headers=HEADERS, json={"username": "username", "password": "invalid_password"}
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 401
+        assert response_json.get("code") == AccountErrorCode.INVALID_CREDENTIALS
+
+    async def test_get_update_and_delete_account(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        token_response = await app.test_client().post(
+            ACCESS_TOKEN_URL, headers=HEADERS, json={"username": "username", "password": "password"}
+        )
+        auth_headers = {**HEADERS, "Authorization": f"Bearer {(await token_response.get_json()).get('token')}"}
+        account_url = f"{ACCOUNT_URL}/{account.id}"
+
+        update_response = await app.test_client().patch(account_url, headers=HEADERS, json={"first_name": "Updated"})
+        get_response = await app.test_client().get(account_url, headers=auth_headers)
+        delete_response = await app.test_client().delete(account_url, headers=auth_headers)
+        deleted_get_response = await app.test_client().get(account_url, headers=auth_headers)
+
+        assert update_response.status_code == 200
+        assert get_response.status_code == 200
+        assert (await get_response.get_json()).get("first_name") == "Updated"
+        assert "hashed_password" not in await get_response.get_json()
+        assert delete_response.status_code == 204
+        assert deleted_get_response.status_code == 404
+        assert (await deleted_get_response.get_json()).get("code") == AccountErrorCode.NOT_FOUND
@@ -8,6 +8,7 @@ from modules.notification.types import CreateOrUpdateAccountNotificationPreferen
 from server import app
 
 from tests.modules.account.base_test_account import BaseTestAccount
+from tests.database_command_counter import DATABASE_COMMAND_COUNTER
 
 ACCOUNT_URL = "http://127.0.0.1:8080/api/accounts"
 HEADERS = {"Content-Type": "application/json"}
@@ -379,3 +380,29 @@ class TestNotificationPreferencesApi(BaseTestAccount):
             assert response.json["sms_enabled"] is False
             assert "account_id" in response.json
             assert response.json["account_id"] == account2.id
+
+    def test_update_notification_preferences_takes_one_round_trip(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        with app.test_client() as client:
+            access_token_response = client.post(
+                "http://127.0.0.1:8080/api/access-tokens",
+                headers=HEADERS,
+                data=json.dumps({"username": account.username, "password": "password"}),
+            )
+
+            with DATABASE_COMMAND_COUNTER.record() as commands:
+                response = client.patch(
+                    f"{ACCOUNT_URL}/{account.id}/notification-preferences",
+                    headers={**HEADERS, "Authorization": f"Bearer {access_token_response.json.get('token')}"},
+                    data=json.dumps({"sms_enabled": False}),
+                )
+
+        assert response.status_code == 200
+        assert response.json["sms_enabled"] is False
+        assert response.json["email_enabled"] is True
+        assert commands == [("findAndModify", "account_notification_preferences")]
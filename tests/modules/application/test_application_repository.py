@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from unittest import mock
+
+from pymongo import AsyncMongoClient, IndexModel
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+from modules.application.common.constants import LISTING_READ_PREFERENCE
+from modules.application.errors import InvalidConsistencyTokenError
+from modules.application.repository import (
+    ApplicationRepository,
+    ApplicationRepositoryClient,
+    AsyncApplicationRepositoryClient,
+)
+from modules.config.config_service import ConfigService
+from tests.modules.application.base_test_application import BaseTestApplication
+
+PROVISIONING_TEST_VALIDATOR = {"$jsonSchema": {"bsonType": "object", "required": ["owner_id"]}}
+
+
+class ProvisioningTestRepository(ApplicationRepository):
+    collection_name = "provisioning_test_items"
+    indexes = [IndexModel([("owner_id", 1), ("created_at", -1)], name="owner_id_created_at_index")]
+    validator = PROVISIONING_TEST_VALIDATOR
+
+
+def is_replica_set() -> bool:
+    return "setName" in ApplicationRepositoryClient.get_client().admin.command("hello")
+
+
+class TestApplicationRepository(BaseTestApplication):
+    def setUp(self) -> None:
+        self.database = ApplicationRepositoryClient.get_client().get_database()
+        self.database.drop_collection(ProvisioningTestRepository.collection_name)
+
+    def tearDown(self) -> None:
+        self.database.drop_collection(ProvisioningTestRepository.collection_name)
+
+    def test_provision_collection_dry_run_reports_without_applying(self) -> None:
+        result = ProvisioningTestRepository.provision_collection(self.database, dry_run=True)
+
+        assert result.collection_created
+        assert not result.validator_changed
+        assert result.created_indexes == ["owner_id_created_at_index"]
+        assert ProvisioningTestRepository.collection_name not in self.database.list_collection_names()
+
+    def test_provision_collection_is_idempotent(self) -> None:
+        ProvisioningTestRepository.provision_collection(self.database)
+
+        result = ProvisioningTestRepository.provision_collection(self.database)
+
+        assert not result.has_changes
+        collection = self.database[ProvisioningTestRepository.collection_name]
+        assert "owner_id_created_at_index" in collection.index_information()
+        collection_info = next(self.database.list_collections(filter={"name": collection.name}))
+        assert collection_info["options"]["validator"] == PROVISIONING_TEST_VALIDATOR
+
+    def test_provision_collection_recreates_changed_index_and_reports_undeclared(self) -> None:
+        collection = self.database[ProvisioningTestRepository.collection_name]
+        collection.create_index([("owner_id", 1)], name="owner_id_created_at_index")
+        collection.create_index([("legacy_field", 1)], name="legacy_field_index")
+
+        result = ProvisioningTestRepository.provision_collection(self.database)
+
+        assert result.recreated_indexes == ["owner_id_created_at_index"]
+        assert result.undeclared_indexes == ["legacy_field_index"]
+        assert result.validator_changed
+        live_indexes = collection.index_information()
+        assert live_indexes["owner_id_created_at_index"]["key"] == [("owner_id", 1), ("created_at", -1)]
+        assert "legacy_field_index" in live_indexes
+
+
+class TestApplicationRepositoryClient(BaseTestApplication):
+    def setUp(self) -> None:
+        self.previous_client = ApplicationRepositoryClient.get_client()
+
+    def tearDown(self) -> None:
+        if ApplicationRepositoryClient.get_client() is not self.previous_client:
+            self.previous_client.close()
+
+    def test_get_client_creates_a_single_client_under_concurrent_first_use(self) -> None:
+        ApplicationRepositoryClient.reset_after_fork()
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def get_client() -> None:
+            barrier.wait()
+            clients.append(ApplicationRepositoryClient.get_client())
+
+        threads = [threading.Thread(target=get_client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(clients) == 8
+        assert len({id(client) for client in clients}) == 1
+
+    def test_collection_is_rebound_to_the_new_client_after_fork(self) -> None:
+        ProvisioningTestRepository.collection()
+
+        ApplicationRepositoryClient.reset_after_fork()
+
+        client = ApplicationRepositoryClient.get_client()
+        assert client is not self.previous_client
+        assert ProvisioningTestRepository.collection().database.client is client
+
+    def test_get_pool_metrics_tracks_checkouts(self) -> None:
+        checkouts_before = ApplicationRepositoryClient.get_pool_metrics().checkouts
+
+        ProvisioningTestRepository.collection().find_one({})
+
+        metrics = ApplicationRepositoryClient.get_pool_metrics()
+        assert metrics.checkouts > checkouts_before
+        assert metrics.connections_in_use == 0
+        assert metrics.max_connections_in_use >= 1
+        assert metrics.checkout_failures == 0
+
+    def test_get_read_preference_defaults_to_primary(self) -> None:
+        assert ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE) == Primary()
+        assert ApplicationRepositoryClient.get_read_preference("unconfigured") == Primary()
+
+    def test_get_read_preference_uses_configured_mode_and_staleness(self) -> None:
+        get_value = ConfigService.get_value
+
+        with (
+            mock.patch.object(ApplicationRepositoryClient, "_read_preferences", {}),
+            mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    {"mongodb.read_preferences.listing.mode": "secondaryPreferred"}.get(key) or get_value(key, default)
+                ),
+            ),
+        ):
+            read_preference = ApplicationRepositoryClient.get_read_preference(LISTING_READ_PREFERENCE)
+
+        assert read_preference == SecondaryPreferred(max_staleness=90)
+
+    def test_collection_applies_read_preference_per_read(self) -> None:
+        read_preference = SecondaryPreferred(max_staleness=90)
+
+        assert ProvisioningTestRepository.collection().read_preference == Primary()
+        assert ProvisioningTestRepository.collection(read_preference=read_preference).read_preference == read_preference
+        assert ProvisioningTestRepository.collection().read_preference == Primary()
+
+    def test_start_causal_session_rejects_invalid_consistency_token(self) -> None:
+        with self.assertRaises(InvalidConsistencyTokenError):
+            with ApplicationRepositoryClient.start_causal_session("not-a-token"):
+                pass
+
+    def test_consistency_token_carries_the_operation_time_to_a_new_session(self) -> None:
+        if not is_replica_set():
+            self.skipTest("causal consistency tokens need a replica set")
+
+        with ApplicationRepositoryClient.start_causal_session() as write_session:
+            ProvisioningTestRepository.insert_document({"owner_id": "owner"})
+        consistency_token = ApplicationRepositoryClient.get_consistency_token(write_session)
+
+        assert consistency_token is not None
+        with ApplicationRepositoryClient.start_causal_session(consistency_token) as read_session:
+            assert read_session.operation_time == write_session.operation_time
+            document = ProvisioningTestRepository.collection(
+                read_preference=SecondaryPreferred(max_staleness=90)
+            ).find_one({"owner_id": "owner"}, session=ApplicationRepositoryClient.get_causal_session())
+
+        assert document is not None
+        ProvisioningTestRepository.collection().delete_many({})
+
+
+class TestAsyncApplicationRepositoryClient(BaseTestApplication):
+    def test_get_client_closes_the_client_of_a_previous_event_loop(self) -> None:
+        async def get_client() -> AsyncMongoClient:
+            client = AsyncApplicationRepositoryClient.get_client()
+            # Lets the close of a previous client run before the loop is shut down
+            await asyncio.sleep(0)
+            return client
+
+        with mock.patch.object(AsyncMongoClient, "close", autospec=True) as mock_close:
+            previous_client = asyncio.run(get_client())
+            client = asyncio.run(get_client())
+            assert mock_close.await_args_list == [mock.call(previous_client)]
+
+            asyncio.run(AsyncApplicationRepositoryClient.close())
+
+        assert client is not previous_client
+        assert mock_close.await_args_list == [mock.call(previous_client), mock.call(client)]
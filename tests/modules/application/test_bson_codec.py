@@ -0,0 +1,103 @@
+from dataclasses import asdict
+from datetime import datetime
+
+import bson
+from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
+
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.store.account_model import AccountModel
+from modules.account.types import Account, PhoneNumber
+from modules.application.bson_codec import BsonCodec
+from modules.authentication.internals.otp.otp_util import OTPUtil
+from modules.authentication.internals.otp.store.otp_model import OTPModel
+from modules.comment.internal.comment_util import CommentUtil
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import Task
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestBsonCodec(BaseTestApplication):
+    def test_decoders_read_documents_like_from_bson(self) -> None:
+        task_id = ObjectId()
+        created_at = datetime(2024, 5, 17, 8, 30, 15)
+        task = TaskUtil.convert_task_bson_to_task(
+            {"_id": task_id, "account_id": "account", "title": "Title", "description": "Description", "active": True}
+        )
+        comment = CommentUtil.convert_comment_bson_to_comment(
+            {"_id": task_id, "task_id": "task", "content": "Content", "created_at": created_at}
+        )
+        account = AccountUtil.convert_account_bson_to_account(
+            {"_id": task_id, "username": "username", "phone_number": {"country_code": "+91", "phone_number": "99"}}
+        )
+        otp = OTPUtil.convert_otp_bson_to_otp(
+            {"_id": task_id, "otp_code": "1234", "phone_number": {"country_code": "+91", "phone_number": "99"}}
+        )
+
+        assert task == Task(
+            id=str(task_id), account_id="account", title="Title", description="Description", comment_count=0
+        )
+        assert (comment.account_id, comment.created_at, comment.updated_at) == ("", created_at, None)
+        assert (account.first_name, account.hashed_password) == ("", "")
+        assert account.phone_number == PhoneNumber(country_code="+91", phone_number="99")
+        assert AccountUtil.convert_account_bson_to_account({"_id": task_id}).phone_number is None
+        assert (otp.otp_code, otp.status, otp.phone_number.phone_number) == ("1234", "", "99")
+
+        with self.assertRaises(ValueError):
+            OTPUtil.convert_otp_bson_to_otp({"_id": task_id, "otp_code": "1234"})
+
+    def test_to_bson_matches_asdict_with_id_renamed(self) -> None:
+        created_at = datetime(2024, 5, 17, 8, 30, 15)
+        task_model = TaskModel(
+            account_id="account", description="Description", title="Title", created_at=created_at, updated_at=created_at
+        )
+        account_model = AccountModel(
+            first_name="first_name",
+            hashed_password="hashed_password",
+            id=ObjectId(),
+            last_name="last_name",
+            phone_number=PhoneNumber(country_code="+91", phone_number="99"),
+            username="username",
+        )
+        otp_model = OTPModel(
+            active=True,
+            id=None,
+            otp_code="1234",
+            phone_number=PhoneNumber(country_code="+91", phone_number="99"),
+            status="PENDING",
+        )
+
+        for model in (task_model, account_model, otp_model):
+            expected_document = asdict(model)
+            model_id = expected_document.pop("id")
+            if model_id is not None:
+                expected_document["_id"] = model_id
+
+            document = model.to_bson()
+
+            assert document == expected_document
+            assert list(document) == list(expected_document)
+
+        assert BsonCodec.get_encoder(TaskModel) is BsonCodec.get_encoder(TaskModel)
+
+    def test_json_transcoders_read_raw_documents_like_serialized_dtos(self) -> None:
+        task_document = {"_id": ObjectId(), "account_id": "account", "title": "Title", "description": "Description"}
+        account_document = {"_id": ObjectId(), "username": "username", "phone_number": {"country_code": "+91"}}
+        account_document["phone_number"]["phone_number"] = "99"
+
+        for model_type, dto_type, document, fields in (
+            (TaskModel, Task, task_document, None),
+            (TaskModel, Task, task_document, ("title", "id")),
+            (AccountModel, Account, account_document, None),
+        ):
+            dto_dict = asdict(BsonCodec.get_decoder(model_type, dto_type)(document))
+            expected_item = {name: dto_dict[name] for name in fields or dto_dict}
+
+            item = BsonCodec.get_json_transcoder(model_type, dto_type, fields)(RawBSONDocument(bson.encode(document)))
+
+            assert item == expected_item
+            assert list(item) == list(expected_item)
+
+        batches = list(BsonCodec.transcode_in_batches(range(5), lambda document: {"value": document}, 2))
+        assert [len(batch) for batch in batches] == [2, 2, 1]
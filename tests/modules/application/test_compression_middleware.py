@@ -0,0 +1,100 @@
+import gzip
+import json
+import unittest
+from typing import Iterator
+
+from flask import Flask, Response, jsonify, stream_with_context
+
+from modules.application.rest_api.compression_middleware import COMPRESSORS, CompressionMiddleware
+from tests.modules.application.base_test_application import BaseTestApplication
+
+ITEMS = [
+    {"id": index, "title": f"Task {index}", "description": "A description long enough to compress"}
+    for index in range(50)
+]
+
+
+def create_app() -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/items")
+    def get_items() -> Response:
+        response = jsonify(ITEMS)
+        response.set_etag("items-version")
+        return response
+
+    @app.route("/small")
+    def get_small() -> Response:
+        return jsonify({"ok": True})
+
+    @app.route("/stream")
+    def stream_items() -> Response:
+        def generate() -> Iterator[str]:
+            for item in ITEMS:
+                yield json.dumps(item) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+    @app.route("/image")
+    def get_image() -> Response:
+        return Response(b"\x89PNG" * 1000, mimetype="image/png")
+
+    app.wsgi_app = CompressionMiddleware(  # type: ignore
+        app.wsgi_app, encodings=["zstd", "br", "gzip"], levels={}, minimum_size=1024
+    )
+    return app
+
+
+class TestCompressionMiddleware(BaseTestApplication):
+    def setUp(self) -> None:
+        self.client = create_app().test_client()
+
+    def test_compresses_json_with_the_negotiated_encoding(self) -> None:
+        response = self.client.get("/items", headers={"Accept-Encoding": "gzip, deflate"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["ETag"] == 'W/"items-version"'
+        assert int(response.headers["Content-Length"]) == len(response.data)
+        assert json.loads(gzip.decompress(response.data)) == ITEMS
+
+    def test_sends_identity_without_accept_encoding_or_below_minimum_size(self) -> None:
+        identity_response = self.client.get("/items")
+        small_response = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+        image_response = self.client.get("/image", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in identity_response.headers
+        assert identity_response.headers["ETag"] == '"items-version"'
+        assert identity_response.json == ITEMS
+        assert "Content-Encoding" not in small_response.headers
+        assert small_response.headers["Vary"] == "Accept-Encoding"
+        assert small_response.json == {"ok": True}
+        assert "Content-Encoding" not in image_response.headers
+
+    def test_stream_compresses_generator_responses(self) -> None:
+        response = self.client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        lines = gzip.decompress(response.data).decode().splitlines()
+        assert [json.loads(line) for line in lines] == ITEMS
+
+    def test_negotiates_by_quality_then_server_preference(self) -> None:
+        middleware = CompressionMiddleware(
+            create_app().wsgi_app, encodings=["zstd", "br", "gzip"], levels={}, minimum_size=0
+        )
+        installed_encodings = [encoding for encoding in ("zstd", "br", "gzip") if encoding in COMPRESSORS]
+
+        assert middleware.negotiate_encoding("gzip;q=0.5, br;q=0.1") == "gzip"
+        assert middleware.negotiate_encoding("*") == installed_encodings[0]
+        assert middleware.negotiate_encoding("gzip;q=0, deflate") is None
+        assert middleware.negotiate_encoding("") is None
+
+    @unittest.skipUnless("br" in COMPRESSORS, "brotli is not installed")
+    def test_compresses_with_brotli(self) -> None:
+        import brotli
+
+        response = self.client.get("/items", headers={"Accept-Encoding": "br"})
+
+        assert response.headers["Content-Encoding"] == "br"
+        assert json.loads(brotli.decompress(response.data)) == ITEMS
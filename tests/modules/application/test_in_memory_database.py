@@ -0,0 +1,227 @@
+from datetime import datetime
+from unittest import mock
+
+from bson.objectid import ObjectId
+from pymongo import IndexModel, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from modules.application.common.constants import IN_MEMORY_BACKEND
+from modules.application.common.types import CursorPaginationParams
+from modules.application.internal.in_memory_database import InMemoryDatabase
+from modules.application.repository import ApplicationRepositoryClient
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import CreateTaskParams, GetCursorPaginatedTasksParams, GetTaskParams
+from tests.modules.application.base_test_application import BaseTestApplication
+
+ACTIVE_OWNER_UNIQUE_INDEX = IndexModel(
+    [("owner_id", 1)], name="active_owner_id_unique", unique=True, partialFilterExpression={"active": True}
+)
+
+
+class TestInMemoryDatabase(BaseTestApplication):
+    def setUp(self) -> None:
+        self.collection = InMemoryDatabase(name="test").get_collection("items", indexes=[ACTIVE_OWNER_UNIQUE_INDEX])
+
+    def test_find_applies_filter_sort_skip_limit_and_projection(self) -> None:
+        self.collection.insert_many(
+            [
+                {"owner_id": str(rank), "rank": rank, "active": rank % 2 == 0, "title": f"item {rank}"}
+                for rank in range(6)
+            ],
+            ordered=False,
+        )
+
+        documents = list(
+            self.collection.find({"active": True}, {"rank": 1, "_id": 0}).sort([("rank", -1)]).skip(1).limit(1)
+        )
+
+        assert documents == [{"rank": 2}]
+        assert self.collection.count_documents({"rank": {"$gte": 3}}) == 3
+        assert self.collection.count_documents({"$or": [{"rank": {"$lt": 1}}, {"title": "item 5"}]}) == 2
+
+    def test_returned_documents_do_not_share_state_with_the_store(self) -> None:
+        document = {"owner_id": "a", "tags": ["one"], "created_at": datetime(2024, 1, 1, 12, 0, 0, 123456)}
+        self.collection.insert_one(document)
+
+        found_document = self.collection.find_one({"_id": document["_id"]})
+        assert found_document is not None
+        found_document["tags"].append("two")
+
+        stored_document = self.collection.find_one(document["_id"])
+        assert stored_document is not None
+        assert stored_document["tags"] == ["one"]
+        assert stored_document["created_at"] == datetime(2024, 1, 1, 12, 0, 0, 123000)
+
+    def test_find_one_and_update_returns_updated_document_and_upserts(self) -> None:
+        self.collection.insert_one({"_id": "counter", "count": 1})
+
+        updated_document = self.collection.find_one_and_update(
+            {"_id": "counter"}, {"$inc": {"count": 2}}, return_document=ReturnDocument.AFTER
+        )
+        upserted_document = self.collection.find_one_and_update(
+            {"_id": "other"},
+            {"$inc": {"count": 1}, "$setOnInsert": {"created": True}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
+        assert updated_document == {"_id": "counter", "count": 3}
+        assert upserted_document == {"_id": "other", "count": 1, "created": True}
+
+    def test_update_one_reports_matched_modified_and_upserted_counts(self) -> None:
+        self.collection.insert_one({"_id": "item", "active": True, "owner_id": "a"})
+
+        unchanged_result = self.collection.update_one({"_id": "item"}, {"$set": {"active": True}})
+        upserted_result = self.collection.update_one({"_id": "new"}, {"$set": {"owner_id": "b"}}, upsert=True)
+
+        assert (unchanged_result.matched_count, unchanged_result.modified_count) == (1, 0)
+        assert upserted_result.upserted_id == "new"
+        assert upserted_result.matched_count == 0
+
+    def test_partial_unique_index_only_covers_matching_documents(self) -> None:
+        self.collection.insert_one({"owner_id": "a", "active": False})
+        self.collection.insert_one({"owner_id": "a", "active": False})
+        self.collection.insert_one({"owner_id": "a", "active": True})
+
+        with self.assertRaises(DuplicateKeyError) as context:
+            self.collection.insert_one({"owner_id": "a", "active": True})
+        assert context.exception.code == 11000
+        assert "active_owner_id_unique" in str(context.exception)
+
+        self.collection.update_one({"owner_id": "a", "active": True}, {"$set": {"active": False}})
+        self.collection.insert_one({"owner_id": "a", "active": True})
+        assert self.collection.count_documents({"owner_id": "a", "active": True}) == 1
+
+    def test_insert_many_reports_duplicates_as_bulk_write_errors(self) -> None:
+        existing_id = ObjectId()
+        self.collection.insert_one({"_id": existing_id})
+        documents = [{"title": "first"}, {"_id": existing_id}, {"title": "third"}]
+
+        with self.assertRaises(BulkWriteError) as context:
+            self.collection.insert_many(documents, ordered=False)
+
+        write_errors = context.exception.details["writeErrors"]
+        assert [write_error["index"] for write_error in write_errors] == [1]
+        assert all("_id" in document for document in documents)
+        assert context.exception.details["nInserted"] == 2
+
+    def test_aggregate_groups_and_counts(self) -> None:
+        self.collection.insert_many([{"owner_id": owner_id} for owner_id in ("a", "a", "b")])
+
+        results = list(
+            self.collection.aggregate(
+                [{"$match": {"owner_id": {"$in": ["a", "b"]}}}, {"$group": {"_id": "$owner_id", "count": {"$sum": 1}}}]
+            )
+        )
+
+        assert sorted((result["_id"], result["count"]) for result in results) == [("a", 2), ("b", 1)]
+
+    def test_aggregate_joins_other_collections_with_lookup(self) -> None:
+        owner_id = ObjectId()
+        self.collection.insert_one({"_id": owner_id, "owner_id": "a"})
+        self.collection.database.get_collection("notes").insert_many(
+            [{"item_id": str(owner_id), "rank": rank} for rank in range(3)] + [{"item_id": "other", "rank": 9}]
+        )
+
+        (result,) = self.collection.aggregate(
+            [
+                {"$addFields": {"_item_id": {"$toString": "$_id"}}},
+                {
+                    "$lookup": {
+                        "from": "notes",
+                        "localField": "_item_id",
+                        "foreignField": "item_id",
+                        "pipeline": [{"$sort": {"rank": -1}}, {"$limit": 2}, {"$project": {"_id": 0, "rank": 1}}],
+                        "as": "notes",
+                    }
+                },
+                {"$unset": "_item_id"},
+            ]
+        )
+
+        assert result == {"_id": owner_id, "owner_id": "a", "notes": [{"rank": 2}, {"rank": 1}]}
+
+    def test_aggregate_unwinds_arrays_and_preserves_empty_ones(self) -> None:
+        self.collection.insert_many(
+            [{"owner_id": "a", "notes": [1, 2]}, {"owner_id": "b", "notes": []}, {"owner_id": "c", "notes": None}]
+        )
+
+        results = self.collection.aggregate(
+            [{"$unwind": {"path": "$notes", "preserveNullAndEmptyArrays": True}}, {"$project": {"_id": 0}}]
+        )
+        dropped_results = self.collection.aggregate([{"$unwind": "$notes"}, {"$project": {"_id": 0}}])
+
+        assert list(results) == [
+            {"owner_id": "a", "notes": 1},
+            {"owner_id": "a", "notes": 2},
+            {"owner_id": "b"},
+            {"owner_id": "c", "notes": None},
+        ]
+        assert list(dropped_results) == [{"owner_id": "a", "notes": 1}, {"owner_id": "a", "notes": 2}]
+
+    def test_aggregate_scores_text_matches_with_index_weights(self) -> None:
+        collection = InMemoryDatabase(name="test").get_collection(
+            "notes",
+            indexes=[IndexModel([("title", "text"), ("body", "text")], name="text_index", weights={"title": 3})],
+        )
+        collection.insert_many(
+            [
+                {"_id": 1, "title": "Release notes", "body": "Nothing"},
+                {"_id": 2, "title": "Plan", "body": "The release is released"},
+                {"_id": 3, "title": "Plan", "body": "Unrelated"},
+            ]
+        )
+
+        results = list(
+            collection.aggregate(
+                [
+                    {"$match": {"$text": {"$search": "releasing"}}},
+                    {"$addFields": {"score": {"$meta": "textScore"}}},
+                    {"$sort": {"score": -1}},
+                ]
+            )
+        )
+
+        assert [(result["_id"], result["score"]) for result in results] == [(1, 3.0), (2, 2.0)]
+        assert collection.index_information()["text_index"]["key"] == [("_fts", "text"), ("_ftsx", 1)]
+
+    def test_unsupported_operator_is_rejected(self) -> None:
+        self.collection.insert_one({"owner_id": "a"})
+
+        with self.assertRaises(NotImplementedError):
+            list(self.collection.find({"owner_id": {"$where": "true"}}))
+
+
+class TestInMemoryRepositoryBackend(BaseTestApplication):
+    def setUp(self) -> None:
+        self.patches = [
+            mock.patch.object(ApplicationRepositoryClient, "_backend", IN_MEMORY_BACKEND),
+            mock.patch.object(ApplicationRepositoryClient, "_in_memory_database", InMemoryDatabase(name="test")),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        for patch in self.patches:
+            patch.stop()
+
+    def test_services_run_against_the_in_memory_backend(self) -> None:
+        account_id = str(ObjectId())
+        created_tasks = [
+            TaskService.create_task(
+                params=CreateTaskParams(account_id=account_id, title=f"Task {index}", description="")
+            )
+            for index in range(3)
+        ]
+
+        task = TaskService.get_task(params=GetTaskParams(account_id=account_id, task_id=created_tasks[0].id))
+        page = TaskService.get_cursor_paginated_tasks(
+            params=GetCursorPaginatedTasksParams(
+                account_id=account_id, pagination_params=CursorPaginationParams(size=2)
+            )
+        )
+
+        assert task.title == "Task 0"
+        assert [listed_task.id for listed_task in page.items] == [created_tasks[2].id, created_tasks[1].id]
+        assert TaskRepository.collection().count_documents({}) == 3
@@ -0,0 +1,82 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+from bson.objectid import ObjectId
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from modules.application.common.types import PaginationParams, PaginationResult
+from modules.application.json_provider import FastJSONProvider
+from modules.comment.types import Comment
+from modules.task.types import Task, TaskDeletionResult
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestFastJSONProvider(BaseTestApplication):
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.default_provider = DefaultJSONProvider(self.app)
+        self.fast_provider = FastJSONProvider(self.app)
+
+    def assert_same_response(self, obj: object) -> None:
+        default_response = self.default_provider.response(obj)
+        fast_response = self.fast_provider.response(obj)
+
+        assert fast_response.get_data() == default_response.get_data()
+        assert fast_response.mimetype == default_response.mimetype
+
+    def test_responses_are_byte_identical_to_the_default_provider(self) -> None:
+        created_at = datetime(2024, 5, 17, 8, 30, 15, 123000)
+        tasks = [
+            Task(id=str(ObjectId()), account_id="account", title=f"Task {index}", description="", comment_count=index)
+            for index in range(3)
+        ]
+
+        self.assert_same_response(
+            asdict(
+                PaginationResult(
+                    items=tasks, pagination_params=PaginationParams(page=1, size=3), total_count=3, total_pages=1
+                )
+            )
+        )
+        self.assert_same_response(
+            Comment(
+                id="comment",
+                task_id="task",
+                account_id="account",
+                content="Hi",
+                created_at=created_at,
+                updated_at=created_at,
+            )
+        )
+        self.assert_same_response(asdict(TaskDeletionResult(task_id="task", deleted_at=created_at, success=True)))
+        self.assert_same_response({"text": "Café ☕ \U0001f600   </script>", "b": 1, "a": [None, 1.5, True]})
+        self.assert_same_response({"big": 2**70, "decimal": Decimal("1.10"), "nested": {2: "non string key"}})
+
+    def test_non_ascii_text_is_escaped_without_encoding_twice(self) -> None:
+        obj = {"title": "Tâche \u2028 任务 \U0001f600", "items": ["Café", "plain"]}
+
+        with mock.patch.object(json, "dumps", side_effect=AssertionError("encoded with json")):
+            fast_data = self.fast_provider.response(obj).get_data()
+
+        assert fast_data == self.default_provider.response(obj).get_data()
+
+    def test_object_ids_are_written_as_strings(self) -> None:
+        object_id = ObjectId()
+
+        assert self.fast_provider.dumps({"_id": object_id}, separators=(",", ":")) == f'{{"_id":"{object_id}"}}'
+        assert self.fast_provider.dumps({"_id": object_id}) == f'{{"_id": "{object_id}"}}'
+
+    def test_loads_matches_json(self) -> None:
+        assert self.fast_provider.loads(b'{"title": "T\\u00e2che", "size": 10, "ratio": 0.5}') == {
+            "title": "Tâche",
+            "size": 10,
+            "ratio": 0.5,
+        }
+        assert self.fast_provider.loads("[NaN]")[0] != 0
+
+        with self.assertRaises(ValueError):
+            self.fast_provider.loads("{invalid")
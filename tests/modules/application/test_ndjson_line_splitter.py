@@ -0,0 +1,19 @@
+from modules.application.ndjson_line_splitter import NDJSONLineSplitter, split_ndjson_lines
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestNDJSONLineSplitter(BaseTestApplication):
+    def test_splits_lines_across_chunks(self) -> None:
+        body = b'{"a":1}\r\n\n{"b":2}\n{"c":3}'
+
+        for chunk_size in (1, 3, len(body)):
+            chunks = [body[start : start + chunk_size] for start in range(0, len(body), chunk_size)]
+            assert list(split_ndjson_lines(chunks, max_line_bytes=64)) == [b'{"a":1}', b"", b'{"b":2}', b'{"c":3}']
+
+    def test_cuts_long_lines_down_to_one_byte_over_the_limit(self) -> None:
+        splitter = NDJSONLineSplitter(max_line_bytes=4)
+
+        assert splitter.feed(b"abcdefgh") == []
+        assert splitter.feed(b"ijkl\nxy") == [b"abcde"]
+        assert splitter.finish() == [b"xy"]
+        assert splitter.finish() == []
@@ -0,0 +1,258 @@
+from datetime import datetime
+from unittest import mock
+
+from modules.account.account_service import AccountService
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import (
+    AccountSearchByIdParams,
+    AccountSearchParams,
+    CreateAccountByPhoneNumberParams,
+    CreateAccountByUsernameAndPasswordParams,
+    PhoneNumber,
+    UpdateAccountProfileParams,
+)
+from modules.application.common.types import (
+    CursorPaginationParams,
+    PaginationParams,
+    SortDirection,
+    SortParams,
+    TimestampFilterParams,
+)
+from modules.application.repository import ApplicationRepositoryClient
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.authentication.types import CreateOTPParams, VerifyOTPParams
+from modules.comment.comment_service import CommentService
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import (
+    CreateCommentParams,
+    DeleteCommentParams,
+    GetCommentParams,
+    GetCursorPaginatedCommentsParams,
+    GetPaginatedCommentsParams,
+    UpdateCommentParams,
+)
+from modules.notification.email_service import EmailService
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.sms_service import SMSService
+from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import (
+    CreateTaskParams,
+    DeleteTaskParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
+    GetCursorPaginatedTasksWithCommentsParams,
+    GetPaginatedTasksParams,
+    GetTaskParams,
+    UpdateTaskParams,
+)
+from tests.database_command_counter import DATABASE_COMMAND_COUNTER
+from tests.modules.application.base_test_application import BaseTestApplication
+from tests.query_plan_inspector import QueryPlanInspector
+
+SEEDED_ACCOUNT_COUNT = 3
+SEEDED_TASKS_PER_ACCOUNT = 30
+SEEDED_COMMENTS_PER_TASK = 20
+SEEDED_PHONE_NUMBERS = [PhoneNumber(country_code="+91", phone_number=f"99999999{index:02d}") for index in range(3)]
+
+
+class TestQueryPlans(BaseTestApplication):
+    """
+    Seeds every collection, runs each reader and writer query shape while recording the commands sent to MongoDB,
+    and explains them to catch collection scans, in-memory sorts and over-examination. Maintenance jobs such as
+    the counter reconciliation read whole collections by design and are not exercised here.
+    """
+
+    def setUp(self) -> None:
+        self.database = ApplicationRepositoryClient.get_client().get_database()
+        self.accounts = [
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="Plan", last_name="User", password="password", username=f"plan-user-{index}"
+                )
+            )
+            for index in range(SEEDED_ACCOUNT_COUNT)
+        ]
+        self.tasks = []
+        for account in self.accounts:
+            for index in range(SEEDED_TASKS_PER_ACCOUNT):
+                task = TaskService.create_task(
+                    params=CreateTaskParams(account_id=account.id, title=f"Task {index}", description="Seeded task")
+                )
+                self.tasks.append(task)
+                # Soft-deleted tasks make sure the active filters are backed by the partial indexes
+                if index % 5 == 0:
+                    TaskService.delete_task(params=DeleteTaskParams(account_id=account.id, task_id=task.id))
+
+        self.task = TaskService.create_task(
+            params=CreateTaskParams(account_id=self.accounts[0].id, title="Commented task", description="Seeded task")
+        )
+        self.comments = [
+            CommentService.create_comment(
+                params=CreateCommentParams(
+                    account_id=self.accounts[0].id, task_id=self.task.id, content=f"Comment {index}"
+                )
+            )
+            for index in range(SEEDED_COMMENTS_PER_TASK)
+        ]
+
+        with mock.patch.object(SMSService, "send_sms_for_account"):
+            for phone_number in SEEDED_PHONE_NUMBERS:
+                AccountService.get_or_create_account_by_phone_number(
+                    params=CreateAccountByPhoneNumberParams(phone_number=phone_number)
+                )
+
+    def tearDown(self) -> None:
+        for repository in [
+            AccountRepository,
+            AccountNotificationPreferencesRepository,
+            CommentRepository,
+            OTPRepository,
+            PasswordResetTokenRepository,
+            TaskCountRepository,
+            TaskRepository,
+        ]:
+            repository.collection().delete_many({})
+
+    @mock.patch.object(EmailService, "send_email_for_account")
+    @mock.patch.object(SMSService, "send_sms_for_account")
+    def test_query_plans_use_indexes(self, mock_send_sms, mock_send_email) -> None:
+        account = self.accounts[0]
+
+        with DATABASE_COMMAND_COUNTER.record():
+            self._run_account_queries(account_id=account.id, username=account.username)
+            self._run_task_queries(account_id=account.id)
+            self._run_comment_queries(account_id=account.id)
+
+        recorded_commands = list(DATABASE_COMMAND_COUNTER.command_documents)
+        violations = [
+            violation
+            for command_document in recorded_commands
+            for violation in QueryPlanInspector.find_plan_violations(self.database, command_document)
+        ]
+
+        assert recorded_commands
+        assert violations == [], "\n".join(violations)
+
+    def _run_account_queries(self, *, account_id: str, username: str) -> None:
+        AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account_id))
+        AccountService.get_account_by_username_and_password(
+            params=AccountSearchParams(username=username, password="password")
+        )
+        AccountService.update_account_profile(
+            account_id=account_id, params=UpdateAccountProfileParams(first_name="Updated")
+        )
+        AccountService.get_account_notification_preferences_by_account_id(account_id=account_id)
+        AccountService.create_or_update_account_notification_preferences(
+            account_id=account_id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(sms_enabled=False)
+        )
+
+        account = AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account_id))
+        password_reset_token = AuthenticationService.create_password_reset_token(params=account)
+        AuthenticationService.get_password_reset_token_by_account_id(account_id=account_id)
+        AuthenticationService.set_password_reset_token_as_used_by_id(password_reset_token_id=password_reset_token.id)
+
+        phone_number = SEEDED_PHONE_NUMBERS[0]
+        phone_account = AccountService.get_or_create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=phone_number)
+        )
+        otp = AuthenticationService.create_otp(
+            params=CreateOTPParams(phone_number=phone_number), account_id=phone_account.id
+        )
+        AuthenticationService.verify_otp(params=VerifyOTPParams(otp_code=otp.otp_code, phone_number=phone_number))
+
+        AccountService.delete_account(account_id=self.accounts[-1].id)
+
+    def _run_task_queries(self, *, account_id: str) -> None:
+        TaskService.get_task(params=GetTaskParams(account_id=account_id, task_id=self.task.id))
+        TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(
+                account_id=account_id, pagination_params=PaginationParams(page=2, size=10, offset=0)
+            )
+        )
+        first_page = TaskService.get_cursor_paginated_tasks(
+            params=GetCursorPaginatedTasksParams(
+                account_id=account_id, pagination_params=CursorPaginationParams(size=10)
+            )
+        )
+        TaskService.get_cursor_paginated_tasks(
+            params=GetCursorPaginatedTasksParams(
+                account_id=account_id, pagination_params=CursorPaginationParams(size=10, cursor=first_page.next_cursor)
+            )
+        )
+        TaskService.get_cursor_paginated_tasks(
+            params=GetCursorPaginatedTasksParams(
+                account_id=account_id,
+                pagination_params=CursorPaginationParams(size=10),
+                sort_params=SortParams(sort_by="updated_at", sort_direction=SortDirection.ASC),
+                filter_params=TimestampFilterParams(created_after=datetime(2000, 1, 1)),
+            )
+        )
+        TaskService.get_cursor_paginated_tasks_with_comments(
+            params=GetCursorPaginatedTasksWithCommentsParams(
+                tasks_params=GetCursorPaginatedTasksParams(
+                    account_id=account_id, pagination_params=CursorPaginationParams(size=10)
+                ),
+                comments_limit=3,
+            )
+        )
+        list(
+            TaskService.export_tasks_with_comments(
+                params=ExportTasksParams(account_id=account_id, after_task_id=self.tasks[0].id)
+            )
+        )
+        TaskService.update_task(
+            params=UpdateTaskParams(account_id=account_id, task_id=self.task.id, title="Updated", description="Updated")
+        )
+        task_to_delete = next(task for task in self.tasks if task.account_id == account_id and task.title == "Task 1")
+        TaskService.delete_task(params=DeleteTaskParams(account_id=account_id, task_id=task_to_delete.id))
+
+    def _run_comment_queries(self, *, account_id: str) -> None:
+        comment = self.comments[0]
+        CommentService.get_comment(
+            params=GetCommentParams(account_id=account_id, task_id=self.task.id, comment_id=comment.id)
+        )
+        CommentService.get_paginated_comments(
+            params=GetPaginatedCommentsParams(
+                account_id=account_id,
+                task_id=self.task.id,
+                pagination_params=PaginationParams(page=2, size=5, offset=0),
+            )
+        )
+        first_page = CommentService.get_cursor_paginated_comments(
+            params=GetCursorPaginatedCommentsParams(
+                account_id=account_id, task_id=self.task.id, pagination_params=CursorPaginationParams(size=5)
+            )
+        )
+        CommentService.get_cursor_paginated_comments(
+            params=GetCursorPaginatedCommentsParams(
+                account_id=account_id,
+                task_id=self.task.id,
+                pagination_params=CursorPaginationParams(size=5, cursor=first_page.next_cursor),
+            )
+        )
+        CommentService.get_cursor_paginated_comments(
+            params=GetCursorPaginatedCommentsParams(
+                account_id=account_id,
+                task_id=self.task.id,
+                pagination_params=CursorPaginationParams(size=5),
+                sort_params=SortParams(sort_by="updated_at", sort_direction=SortDirection.DESC),
+                filter_params=TimestampFilterParams(updated_since=datetime(2000, 1, 1)),
+            )
+        )
+        CommentService.update_comment(
+            params=UpdateCommentParams(
+                account_id=account_id, task_id=self.task.id, comment_id=comment.id, content="Updated"
+            )
+        )
+        CommentService.delete_comment(
+            params=DeleteCommentParams(account_id=account_id, task_id=self.task.id, comment_id=self.comments[1].id)
+        )
@@ -0,0 +1,55 @@
+from dataclasses import asdict
+from datetime import datetime
+
+from modules.account.rest_api.account_view import ACCOUNT_PROFILE_FIELDS
+from modules.account.types import Account, PhoneNumber
+from modules.application.common.types import PaginationParams, PaginationResult
+from modules.application.response_serializer import ResponseSerializer
+from modules.comment.types import Comment
+from modules.task.types import Task, TaskWithComments
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestResponseSerializer(BaseTestApplication):
+    def test_serialize_matches_asdict(self) -> None:
+        created_at = datetime(2024, 5, 17, 8, 30, 15)
+        task = Task(id="task", account_id="account", title="Title", description="Description", comment_count=1)
+        comment = Comment(
+            id="comment",
+            task_id=task.id,
+            account_id="account",
+            content="Content",
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        pagination_result = PaginationResult(
+            items=[task, TaskWithComments(task=task, comments=[comment])],
+            pagination_params=PaginationParams(page=1, size=2),
+            total_count=2,
+            total_pages=1,
+        )
+
+        assert ResponseSerializer.serialize(task) == asdict(task)
+        assert ResponseSerializer.serialize(comment) == asdict(comment)
+        assert ResponseSerializer.serialize(pagination_result) == asdict(pagination_result)
+
+    def test_serialize_projects_requested_fields_in_order(self) -> None:
+        task = Task(id="task", account_id="account", title="Title", description="Description")
+
+        assert list(ResponseSerializer.serialize(task, ("title", "id")).items()) == [("title", "Title"), ("id", "task")]
+
+    def test_serialize_keeps_registered_types_to_their_allowed_fields(self) -> None:
+        account = Account(
+            id="account",
+            first_name="first_name",
+            last_name="last_name",
+            hashed_password="hashed_password",
+            phone_number=PhoneNumber(country_code="+91", phone_number="9999999999"),
+            username="username",
+        )
+
+        account_dict = ResponseSerializer.serialize(account)
+
+        assert tuple(account_dict) == ACCOUNT_PROFILE_FIELDS
+        assert account_dict["phone_number"] == {"country_code": "+91", "phone_number": "9999999999"}
+        assert ResponseSerializer.serialize(account, ("id", "hashed_password")) == {"id": "account"}
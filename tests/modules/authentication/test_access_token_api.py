@@ -1,4 +1,5 @@
 import json
+import time
 
 from server import app
 
@@ -13,7 +14,8 @@ from modules.account.types import (
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 from modules.authentication.authentication_service import AuthenticationService
-from modules.authentication.types import CreateOTPParams, OTPErrorCode, VerifyOTPParams
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.types import CreateOTPParams, OTPErrorCode, OTPStatus, VerifyOTPParams
 from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
 
 API_URL = "http://127.0.0.1:8080/api/access-tokens"
@@ -146,6 +148,28 @@ class TestAccessTokenApi(BaseTestAccessToken):
             assert response.json.get("code") == OTPErrorCode.OTP_EXPIRED
             assert response.json.get("message") == "The OTP has expired. Please request a new OTP."
 
+    def test_new_otp_expires_previous_otps(self) -> None:
+        phone_number = {"country_code": "+91", "phone_number": "9999999999"}
+        account = AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=PhoneNumber(**phone_number))
+        )
+
+        first_otp = AuthenticationService.create_otp(
+            params=CreateOTPParams(phone_number=PhoneNumber(**phone_number)), account_id=account.id
+        )
+        time.sleep(0.01)
+        second_otp = AuthenticationService.create_otp(
+            params=CreateOTPParams(phone_number=PhoneNumber(**phone_number)), account_id=account.id
+        )
+
+        otps_bson = list(OTPRepository.collection().find({"phone_number": phone_number}).sort("_id", 1))
+        assert [(str(otp_bson["_id"]), otp_bson["status"]) for otp_bson in otps_bson] == [
+            (first_otp.id, OTPStatus.EXPIRED),
+            (second_otp.id, OTPStatus.PENDING),
+        ]
+        # The TTL index prunes OTPs by created_at, so it must be the time each OTP was issued
+        assert otps_bson[0]["created_at"] < otps_bson[1]["created_at"]
+
     def test_otp_based_auth_flow_with_disabled_sms_preferences(self):
         """Test complete OTP authentication flow works with disabled SMS preferences"""
         phone_number = {"country_code": "+91", "phone_number": "9999999999"}
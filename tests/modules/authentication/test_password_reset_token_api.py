@@ -13,6 +13,7 @@ from modules.authentication.internals.password_reset_token.password_reset_token_
 from modules.notification.email_service import EmailService
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+from tests.database_command_counter import DATABASE_COMMAND_COUNTER
 from tests.modules.authentication.base_test_password_reset_token import BaseTestPasswordResetToken
 
 ACCOUNT_API_URL = "http://127.0.0.1:8080/api/accounts"
@@ -276,3 +277,20 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
 
         self.assertTrue(mock_send_email.called)
         self.assertTrue(mock_send_email.call_args.kwargs["bypass_preferences"])
+
+    @mock.patch.object(EmailService, "send_email_for_account")
+    def test_create_password_reset_token_round_trips(self, mock_send_email) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        with app.test_client() as client:
+            with DATABASE_COMMAND_COUNTER.record() as commands:
+                response = client.post(
+                    PASSWORD_RESET_TOKEN_URL, headers=HEADERS, data=json.dumps({"username": account.username})
+                )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(commands, [("find", "accounts"), ("insert", "password_reset_tokens")])
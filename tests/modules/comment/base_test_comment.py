@@ -7,6 +7,7 @@ from modules.account.account_service import AccountService
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import CreateAccountByUsernameAndPasswordParams, Account
 from modules.logger.logger_manager import LoggerManager
+from modules.task.internal.store.task_count_repository import TaskCountRepository
 from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.task_service import TaskService
 from modules.task.types import CreateTaskParams, Task
@@ -35,6 +36,7 @@ class BaseTestComment(unittest.TestCase):
     def tearDown(self) -> None:
         CommentRepository.collection().delete_many({})
         TaskRepository.collection().delete_many({})
+        TaskCountRepository.collection().delete_many({})
         AccountRepository.collection().delete_many({})
 
     # URL HELPER METHODS
@@ -0,0 +1,80 @@
+import unittest
+
+from asgi_server import app
+
+from modules.application.repository import AsyncApplicationRepositoryClient
+from modules.comment.types import CommentErrorCode
+from tests.modules.comment.base_test_comment import BaseTestComment
+
+
+class TestAsyncCommentApi(BaseTestComment, unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self) -> None:
+        await AsyncApplicationRepositoryClient.close()
+
+    def get_auth_headers(self, token: str) -> dict:
+        return {**self.HEADERS, "Authorization": f"Bearer {token}"}
+
+    async def test_create_comment_success(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        response = await app.test_client().post(
+            self.get_comment_api_url(account.id, task.id),
+            headers=self.get_auth_headers(token),
+            json={"content": self.DEFAULT_COMMENT_CONTENT},
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 201
+        assert response_json.get("content") == self.DEFAULT_COMMENT_CONTENT
+        assert response_json.get("task_id") == task.id
+
+    async def test_create_comment_missing_content(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        response = await app.test_client().post(
+            self.get_comment_api_url(account.id, task.id), headers=self.get_auth_headers(token), json={}
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 400
+        assert response_json.get("code") == CommentErrorCode.BAD_REQUEST
+
+    async def test_get_paginated_comments_counts_async_writes(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        self.create_multiple_test_comments(account_id=account.id, task_id=task.id, count=2)
+
+        await app.test_client().post(
+            self.get_comment_api_url(account.id, task.id), headers=self.get_auth_headers(token), json={"content": "New"}
+        )
+        response = await app.test_client().get(
+            f"{self.get_comment_api_url(account.id, task.id)}?page=1&size=10", headers=self.get_auth_headers(token)
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 200
+        assert response_json["total_count"] == 3
+        assert len(response_json["items"]) == 3
+
+    async def test_update_and_delete_comment(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        comment = self.create_test_comment(account_id=account.id, task_id=task.id)
+        comment_url = self.get_comment_by_id_api_url(account.id, task.id, comment.id)
+
+        update_response = await app.test_client().patch(
+            comment_url, headers=self.get_auth_headers(token), json={"content": "Updated"}
+        )
+        delete_response = await app.test_client().delete(comment_url, headers=self.get_auth_headers(token))
+        get_response = await app.test_client().get(comment_url, headers=self.get_auth_headers(token))
+        list_response = self.make_authenticated_request("GET", account.id, task.id, token)
+
+        assert update_response.status_code == 200
+        assert (await update_response.get_json()).get("content") == "Updated"
+        assert delete_response.status_code == 204
+        assert get_response.status_code == 404
+        assert (await get_response.get_json()).get("code") == CommentErrorCode.NOT_FOUND
+        assert list_response.json["total_count"] == 0
@@ -1,7 +1,14 @@
+import time
+from datetime import datetime
+from unittest import mock
+
 from server import app
 
+from modules.application.errors import SortErrorCode
 from modules.authentication.types import AccessTokenErrorCode
 from modules.comment.types import CommentErrorCode
+from modules.config.config_service import ConfigService
+from tests.database_command_counter import DATABASE_COMMAND_COUNTER
 from tests.modules.comment.base_test_comment import BaseTestComment
 
 
@@ -101,6 +108,99 @@ class TestCommentApi(BaseTestComment):
 
         assert response1.json["items"][0]["id"] != response2.json["items"][0]["id"]
 
+    def test_get_all_comments_raw_listing_matches_listing(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        self.create_multiple_test_comments(account_id=account.id, task_id=task.id, count=5)
+        get_value = ConfigService.get_value
+
+        for query_params in ("page=1&size=5", "sort=updated_at&order=asc&fields=content,created_at"):
+            response = self.make_authenticated_request("GET", account.id, task.id, token, query_params=query_params)
+            with mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    {"listings.raw_bson_enabled": True, "listings.raw_bson_batch_size": 2}.get(key)
+                    or get_value(key, default)
+                ),
+            ):
+                raw_response = self.make_authenticated_request(
+                    "GET", account.id, task.id, token, query_params=query_params
+                )
+
+            assert raw_response.status_code == 200
+            assert raw_response.is_streamed
+            assert raw_response.get_data() == response.get_data()
+
+    def test_get_all_comments_with_cursor_pagination(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        self.create_multiple_test_comments(account_id=account.id, task_id=task.id, count=3)
+
+        response1 = self.make_authenticated_request("GET", account.id, task.id, token, query_params="cursor=&size=2")
+        response2 = self.make_authenticated_request(
+            "GET", account.id, task.id, token, query_params=f"cursor={response1.json['next_cursor']}&size=2"
+        )
+
+        assert response1.status_code == 200
+        assert [item["content"] for item in response1.json["items"]] == ["Comment 3", "Comment 2"]
+        assert response2.status_code == 200
+        assert [item["content"] for item in response2.json["items"]] == ["Comment 1"]
+        assert response2.json["next_cursor"] is None
+
+    def test_get_all_comments_sorted_and_filtered(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        first_comment, second_comment = self.create_multiple_test_comments(
+            account_id=account.id, task_id=task.id, count=2
+        )
+        time.sleep(0.01)
+        updated_since = datetime.now()
+        updated_since = updated_since.replace(microsecond=updated_since.microsecond // 1000 * 1000)
+        self.make_authenticated_request(
+            "PATCH", account.id, task.id, token, comment_id=first_comment.id, data={"content": "Updated"}
+        )
+
+        ascending_response = self.make_authenticated_request(
+            "GET", account.id, task.id, token, query_params="cursor=&order=asc"
+        )
+        updated_response = self.make_authenticated_request(
+            "GET", account.id, task.id, token, query_params="sort=updated_at"
+        )
+        filtered_response = self.make_authenticated_request(
+            "GET", account.id, task.id, token, query_params=f"updated_since={updated_since.isoformat()}"
+        )
+        invalid_response = self.make_authenticated_request(
+            "GET", account.id, task.id, token, query_params="sort=content"
+        )
+
+        assert [item["id"] for item in ascending_response.json["items"]] == [first_comment.id, second_comment.id]
+        assert [item["id"] for item in updated_response.json["items"]] == [first_comment.id, second_comment.id]
+        assert [item["content"] for item in filtered_response.json["items"]] == ["Updated"]
+        assert filtered_response.json["total_count"] == 1
+        self.assert_error_response(invalid_response, 400, SortErrorCode.INVALID_SORT)
+
+    def test_get_all_comments_with_fields_and_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        self.create_multiple_test_comments(account_id=account.id, task_id=task.id, count=3)
+
+        response1 = self.make_authenticated_request(
+            "GET", account.id, task.id, token, query_params="cursor=&size=2&fields=content"
+        )
+        response2 = self.make_authenticated_request(
+            "GET",
+            account.id,
+            task.id,
+            token,
+            query_params=f"cursor={response1.json['next_cursor']}&size=2&fields=content",
+        )
+
+        assert response1.status_code == 200
+        assert response1.json["items"] == [{"content": "Comment 3"}, {"content": "Comment 2"}]
+        assert response2.status_code == 200
+        assert response2.json["items"] == [{"content": "Comment 1"}]
+
     def test_get_all_comments_no_auth(self) -> None:
         account, _ = self.create_account_and_get_token()
         task = self.create_test_task(account_id=account.id)
@@ -297,3 +397,69 @@ class TestCommentApi(BaseTestComment):
         # Try to get task2's comment using task1's id - should fail
         response = self.make_authenticated_request("GET", account.id, task1.id, token, comment_id=comment2.id)
         self.assert_error_response(response, 404, CommentErrorCode.NOT_FOUND)
+
+    def test_create_comment_round_trips(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        with DATABASE_COMMAND_COUNTER.record() as commands:
+            response = self.make_authenticated_request(
+                "POST", account.id, task.id, token, data={"content": self.DEFAULT_COMMENT_CONTENT}
+            )
+
+        # Besides the comment, the write increments the task's comment_count and versions the task listings
+        assert response.status_code == 201
+        assert commands == [("insert", "comments"), ("update", "tasks"), ("update", "task_counts")]
+        get_response = self.make_authenticated_request(
+            "GET", account.id, task.id, token, comment_id=response.json["id"]
+        )
+        assert get_response.json == response.json
+
+    def test_delete_comment_round_trips(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        comment = self.create_test_comment(account_id=account.id, task_id=task.id)
+
+        with DATABASE_COMMAND_COUNTER.record() as commands:
+            response = self.make_authenticated_request("DELETE", account.id, task.id, token, comment_id=comment.id)
+
+        assert response.status_code == 204
+        assert commands == [("update", "comments"), ("update", "tasks"), ("update", "task_counts")]
+
+    def test_update_comment_round_trips(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        comment = self.create_test_comment(account_id=account.id, task_id=task.id)
+
+        with DATABASE_COMMAND_COUNTER.record() as commands:
+            response = self.make_authenticated_request(
+                "PATCH", account.id, task.id, token, comment_id=comment.id, data={"content": "Updated content"}
+            )
+
+        assert response.status_code == 200
+        assert commands == [("findAndModify", "comments"), ("update", "tasks"), ("update", "task_counts")]
+
+    def test_get_comments_answers_matching_if_none_match_until_a_comment_changes(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        comment = self.create_test_comment(account_id=account.id, task_id=task.id)
+        comments_url = self.get_comment_api_url(account.id, task.id)
+        comment_url = self.get_comment_by_id_api_url(account.id, task.id, comment.id)
+
+        with app.test_client() as client:
+            comments_etag = client.get(comments_url, headers={"Authorization": f"Bearer {token}"}).headers["ETag"]
+            comment_etag = client.get(comment_url, headers={"Authorization": f"Bearer {token}"}).headers["ETag"]
+
+            for url, etag in ((comments_url, comments_etag), (comment_url, comment_etag)):
+                response = client.get(url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag})
+                assert response.status_code == 304
+
+            time.sleep(0.01)
+            self.make_authenticated_request(
+                "PATCH", account.id, task.id, token, comment_id=comment.id, data={"content": "Edited"}
+            )
+
+            for url, etag in ((comments_url, comments_etag), (comment_url, comment_etag)):
+                response = client.get(url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag})
+                assert response.status_code == 200
+                assert response.headers["ETag"] != etag
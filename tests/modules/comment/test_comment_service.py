@@ -1,16 +1,29 @@
+import asyncio
 from datetime import datetime
+from unittest import mock
 
-from modules.application.common.types import PaginationParams
+from bson.objectid import ObjectId
+
+from modules.application.common.types import CursorPaginationParams, PaginationParams
+from modules.application.errors import InvalidPaginationCursorError
 from modules.comment.errors import CommentNotFoundError
 from modules.comment.comment_service import CommentService
 from modules.comment.types import (
     CreateCommentParams,
     DeleteCommentParams,
+    DeleteTaskCommentsParams,
+    GetCursorPaginatedCommentsParams,
     GetPaginatedCommentsParams,
     GetCommentParams,
     CommentErrorCode,
+    OrphanedCommentsDeletionResult,
     UpdateCommentParams,
 )
+from modules.comment.workers.task_comments_deletion_worker import TaskCommentsDeletionWorker
+from modules.config.config_service import ConfigService
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import GetTaskParams
 from tests.modules.comment.base_test_comment import BaseTestComment
 
 
@@ -111,6 +124,167 @@ class TestCommentService(BaseTestComment):
         assert result.pagination_params.page == 1
         assert result.pagination_params.size == 1
 
+    def test_get_paginated_comments_without_total(self) -> None:
+        self.create_multiple_test_comments(account_id=self.account.id, task_id=self.task.id, count=2)
+        get_params = GetPaginatedCommentsParams(
+            account_id=self.account.id,
+            task_id=self.task.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+            include_total=False,
+        )
+
+        result = CommentService.get_paginated_comments(params=get_params)
+
+        assert len(result.items) == 2
+        assert result.total_count is None
+
+    def test_comment_writes_keep_task_comment_count(self) -> None:
+        comments = self.create_multiple_test_comments(account_id=self.account.id, task_id=self.task.id, count=3)
+        CommentService.delete_comment(
+            params=DeleteCommentParams(account_id=self.account.id, task_id=self.task.id, comment_id=comments[0].id)
+        )
+
+        task = TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=self.task.id))
+
+        assert task.comment_count == 2
+
+    def test_reconcile_comment_counts_repairs_drift(self) -> None:
+        self.create_multiple_test_comments(account_id=self.account.id, task_id=self.task.id, count=2)
+        TaskRepository.collection().update_one({"_id": ObjectId(self.task.id)}, {"$unset": {"comment_count": ""}})
+
+        reconciliation_result = CommentService.reconcile_comment_counts()
+
+        assert reconciliation_result.repaired_count == 1
+        get_params = GetPaginatedCommentsParams(
+            account_id=self.account.id,
+            task_id=self.task.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+        )
+        assert CommentService.get_paginated_comments(params=get_params).total_count == 2
+        task = TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=self.task.id))
+        assert task.comment_count == 2
+
+    def test_reconcile_comment_counts_writes_repairs_in_batches(self) -> None:
+        other_tasks = [self.create_test_task(account_id=self.account.id) for _ in range(2)]
+        self.create_multiple_test_comments(account_id=self.account.id, task_id=other_tasks[0].id, count=2)
+        TaskRepository.collection().update_many({}, {"$set": {"comment_count": 5}})
+        get_value = ConfigService.get_value
+
+        with mock.patch.object(
+            ConfigService,
+            "get_value",
+            side_effect=lambda key, default=None: (
+                2 if key == "tasks.comment_count_repair_batch_size" else get_value(key, default)
+            ),
+        ):
+            reconciliation_result = CommentService.reconcile_comment_counts()
+
+        assert reconciliation_result.checked_count == 3
+        assert reconciliation_result.repaired_count == 3
+        comment_counts = [
+            TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task.id)).comment_count
+            for task in (self.task, *other_tasks)
+        ]
+        assert comment_counts == [0, 2, 0]
+
+    def test_delete_task_comments_soft_deletes_in_chunks(self) -> None:
+        other_task = self.create_test_task(account_id=self.account.id)
+        self.create_multiple_test_comments(account_id=self.account.id, task_id=self.task.id, count=5)
+        other_comment = self.create_test_comment(account_id=self.account.id, task_id=other_task.id)
+        comments_version = TaskService.get_task_comments_version(task_id=self.task.id)
+        tasks_version = TaskService.get_tasks_version(account_id=self.account.id)
+        get_value = ConfigService.get_value
+
+        with mock.patch.object(
+            ConfigService,
+            "get_value",
+            side_effect=lambda key, default=None: (
+                2 if key == "comments.deletion_chunk_size" else get_value(key, default)
+            ),
+        ):
+            deleted_count = CommentService.delete_task_comments(params=DeleteTaskCommentsParams(task_id=self.task.id))
+
+        assert deleted_count == 5
+        assert TaskService.get_comment_count(task_id=self.task.id) == 0
+        assert TaskService.get_comment_count(task_id=other_task.id) == 1
+        assert TaskService.get_task_comments_version(task_id=self.task.id) != comments_version
+        assert TaskService.get_tasks_version(account_id=self.account.id) != tasks_version
+        get_params = GetPaginatedCommentsParams(
+            account_id=self.account.id,
+            task_id=self.task.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+            include_total=False,
+        )
+        assert CommentService.get_paginated_comments(params=get_params).items == []
+        assert CommentService.get_comment(
+            params=GetCommentParams(account_id=self.account.id, task_id=other_task.id, comment_id=other_comment.id)
+        )
+        assert CommentService.delete_task_comments(params=DeleteTaskCommentsParams(task_id=self.task.id)) == 0
+
+    def test_task_comments_deletion_worker_deletes_the_task_comments(self) -> None:
+        self.create_multiple_test_comments(account_id=self.account.id, task_id=self.task.id, count=3)
+
+        asyncio.run(TaskCommentsDeletionWorker.execute(self.task.id))
+
+        assert TaskService.get_comment_count(task_id=self.task.id) == 0
+        assert CommentService.delete_task_comments(params=DeleteTaskCommentsParams(task_id=self.task.id)) == 0
+
+    def test_delete_orphaned_comments_deletes_comments_of_inactive_tasks(self) -> None:
+        other_task = self.create_test_task(account_id=self.account.id)
+        self.create_multiple_test_comments(account_id=self.account.id, task_id=self.task.id, count=3)
+        other_comment = self.create_test_comment(account_id=self.account.id, task_id=other_task.id)
+        TaskRepository.collection().update_one({"_id": ObjectId(self.task.id)}, {"$set": {"active": False}})
+        get_value = ConfigService.get_value
+
+        with mock.patch.object(
+            ConfigService,
+            "get_value",
+            side_effect=lambda key, default=None: (
+                1 if key == "comments.orphan_check_batch_size" else get_value(key, default)
+            ),
+        ):
+            deletion_result = CommentService.delete_orphaned_comments()
+
+        assert deletion_result == OrphanedCommentsDeletionResult(
+            checked_task_count=2, orphaned_task_count=1, deleted_comment_count=3
+        )
+        assert CommentService.get_comment(
+            params=GetCommentParams(account_id=self.account.id, task_id=other_task.id, comment_id=other_comment.id)
+        )
+        assert CommentService.delete_orphaned_comments().checked_task_count == 1
+
+    def test_get_cursor_paginated_comments_walks_all_pages(self) -> None:
+        created_comments = self.create_multiple_test_comments(account_id=self.account.id, task_id=self.task.id, count=3)
+
+        first_page = CommentService.get_cursor_paginated_comments(
+            params=GetCursorPaginatedCommentsParams(
+                account_id=self.account.id, task_id=self.task.id, pagination_params=CursorPaginationParams(size=2)
+            )
+        )
+        second_page = CommentService.get_cursor_paginated_comments(
+            params=GetCursorPaginatedCommentsParams(
+                account_id=self.account.id,
+                task_id=self.task.id,
+                pagination_params=CursorPaginationParams(size=2, cursor=first_page.next_cursor),
+            )
+        )
+
+        assert first_page.next_cursor is not None
+        assert second_page.next_cursor is None
+        assert [comment.id for comment in first_page.items + second_page.items] == [
+            comment.id for comment in reversed(created_comments)
+        ]
+
+    def test_get_cursor_paginated_comments_invalid_cursor(self) -> None:
+        get_params = GetCursorPaginatedCommentsParams(
+            account_id=self.account.id,
+            task_id=self.task.id,
+            pagination_params=CursorPaginationParams(size=2, cursor="not-a-cursor"),
+        )
+
+        with self.assertRaises(InvalidPaginationCursorError):
+            CommentService.get_cursor_paginated_comments(params=get_params)
+
     def test_update_comment(self) -> None:
         created_comment = self.create_test_comment(
             account_id=self.account.id, task_id=self.task.id, content="Original Comment"
@@ -26,3 +26,8 @@ class TestConfig(BaseTestConfig):
 
         populated_env = os.environ.get("APP_ENV")
         assert populated_env == "testing" or populated_env == "docker-test"
+
+    def test_unset_formatted_environment_variable_keeps_the_file_value(self) -> None:
+        assert "COMPRESSION_MINIMUM_SIZE" not in os.environ
+
+        assert ConfigService[int].get_value(key="compression.minimum_size") == 1024
@@ -0,0 +1 @@
+# Search tests
@@ -0,0 +1,25 @@
+from server import app
+
+from modules.search.rest_api.search_rest_api_server import SearchRestApiServer
+from tests.modules.comment.base_test_comment import BaseTestComment
+
+
+class BaseTestSearch(BaseTestComment):
+    def setUp(self) -> None:
+        super().setUp()
+        SearchRestApiServer.create()
+
+    # URL HELPER METHODS
+
+    def get_search_api_url(self, account_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/search"
+
+    # HTTP REQUEST HELPER METHODS
+
+    def make_search_request(self, account_id: str, token: str, query_params: str = ""):
+        url = self.get_search_api_url(account_id)
+        if query_params:
+            url += f"?{query_params}"
+
+        with app.test_client() as client:
+            return client.get(url, headers={"Authorization": f"Bearer {token}"})
@@ -0,0 +1,60 @@
+from modules.application.errors import PaginationErrorCode
+from modules.authentication.types import AccessTokenErrorCode
+from modules.search.types import SearchErrorCode
+from tests.modules.search.base_test_search import BaseTestSearch
+
+
+class TestSearchApi(BaseTestSearch):
+    def test_search_returns_ranked_hits_with_highlights(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id, title="Quarterly report", description="Draft it")
+        comment = self.create_test_comment(account_id=account.id, task_id=task.id, content="Report is late")
+
+        response = self.make_search_request(account.id, token, query_params="q=report")
+
+        assert response.status_code == 200
+        items = response.json["items"]
+        assert [(item["type"], item["id"]) for item in items] == [("task", task.id), ("comment", comment.id)]
+        assert items[0]["task"]["title"] == "Quarterly report"
+        assert items[0]["highlights"] == {"title": "Quarterly <mark>report</mark>"}
+        assert items[1]["comment"]["content"] == "Report is late"
+        assert response.json["next_cursor"] is None
+
+    def test_search_follows_next_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = [
+            self.create_test_task(account_id=account.id, title=f"Audit {index}", description="Yearly")
+            for index in range(3)
+        ]
+
+        first_page = self.make_search_request(account.id, token, query_params="q=audit&size=2")
+        second_page = self.make_search_request(
+            account.id, token, query_params=f"q=audit&size=2&cursor={first_page.json['next_cursor']}"
+        )
+
+        assert [item["id"] for item in first_page.json["items"]] == [tasks[2].id, tasks[1].id]
+        assert [item["id"] for item in second_page.json["items"]] == [tasks[0].id]
+        assert second_page.json["next_cursor"] is None
+
+    def test_search_requires_a_query(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_search_request(account.id, token, query_params="q=%20")
+
+        self.assert_error_response(response, 400, SearchErrorCode.BAD_REQUEST)
+
+    def test_search_rejects_invalid_size_and_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        size_response = self.make_search_request(account.id, token, query_params="q=report&size=0")
+        cursor_response = self.make_search_request(account.id, token, query_params="q=report&cursor=invalid")
+
+        self.assert_error_response(size_response, 400, SearchErrorCode.BAD_REQUEST)
+        self.assert_error_response(cursor_response, 400, PaginationErrorCode.INVALID_CURSOR)
+
+    def test_search_requires_authentication(self) -> None:
+        account, _ = self.create_account_and_get_token()
+
+        response = self.make_search_request(account.id, "invalid_token", query_params="q=report")
+
+        self.assert_error_response(response, 401, AccessTokenErrorCode.ACCESS_TOKEN_INVALID)
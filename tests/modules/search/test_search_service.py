@@ -0,0 +1,73 @@
+from bson.objectid import ObjectId
+
+from modules.application.errors import InvalidPaginationCursorError
+from modules.search.search_service import SearchService
+from modules.search.types import SearchHitType, SearchParams
+from tests.modules.search.base_test_search import BaseTestSearch
+
+
+class TestSearchService(BaseTestSearch):
+    def test_search_ranks_tasks_and_comments_by_relevance(self) -> None:
+        account_id = str(ObjectId())
+        title_match = self.create_test_task(account_id=account_id, title="Invoice reminders", description="Monthly")
+        description_match = self.create_test_task(
+            account_id=account_id, title="Billing", description="Send the invoice to finance"
+        )
+        comment_match = self.create_test_comment(
+            account_id=account_id, task_id=description_match.id, content="Invoices were sent twice"
+        )
+        self.create_test_task(account_id=account_id, title="Unrelated", description="Nothing to see")
+        self.create_test_task(account_id=str(ObjectId()), title="Invoice of another account", description="Other")
+
+        result = SearchService.search(params=SearchParams(account_id=account_id, text_query="invoice", size=10))
+
+        assert [(hit.type, hit.id) for hit in result.items] == [
+            (SearchHitType.TASK, title_match.id),
+            (SearchHitType.TASK, description_match.id),
+            (SearchHitType.COMMENT, comment_match.id),
+        ]
+        assert result.items[0].highlights == {"title": "<mark>Invoice</mark> reminders"}
+        assert result.items[2].highlights == {"content": "<mark>Invoices</mark> were sent twice"}
+        assert result.next_cursor is None
+
+    def test_search_pages_through_every_hit_once(self) -> None:
+        account_id = str(ObjectId())
+        task = self.create_test_task(account_id=account_id, title="Deploy", description="Deploy the release")
+        expected_ids = {task.id}
+        for index in range(4):
+            expected_ids.add(self.create_test_task(account_id=account_id, title=f"Deploy {index}", description="x").id)
+            expected_ids.add(
+                self.create_test_comment(account_id=account_id, task_id=task.id, content=f"deploy note {index}").id
+            )
+
+        seen_ids: list[str] = []
+        cursor = None
+        while True:
+            result = SearchService.search(
+                params=SearchParams(account_id=account_id, text_query="deploy", size=3, cursor=cursor)
+            )
+            seen_ids.extend(hit.id for hit in result.items)
+            assert len(result.items) <= 3
+            cursor = result.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen_ids) == len(expected_ids)
+        assert set(seen_ids) == expected_ids
+
+    def test_search_highlights_a_window_of_long_fields(self) -> None:
+        account_id = str(ObjectId())
+        description = "a" * 300 + " the <b>rollback</b> plan " + "z" * 300
+        self.create_test_task(account_id=account_id, title="Release", description=description)
+
+        result = SearchService.search(params=SearchParams(account_id=account_id, text_query="rollback", size=1))
+
+        snippet = result.items[0].highlights["description"]
+        assert snippet.startswith("…") and snippet.endswith("…")
+        assert "&lt;b&gt;<mark>rollback</mark>&lt;/b&gt;" in snippet
+
+    def test_search_rejects_an_invalid_cursor(self) -> None:
+        with self.assertRaises(InvalidPaginationCursorError):
+            SearchService.search(
+                params=SearchParams(account_id=str(ObjectId()), text_query="deploy", size=1, cursor="invalid")
+            )
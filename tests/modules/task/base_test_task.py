@@ -7,6 +7,9 @@ from modules.account.account_service import AccountService
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import CreateAccountByUsernameAndPasswordParams, Account
 from modules.logger.logger_manager import LoggerManager
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_import_chunk_repository import TaskImportChunkRepository
+from modules.task.internal.store.task_import_repository import TaskImportRepository
 from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
 from modules.task.task_service import TaskService
@@ -30,6 +33,9 @@ class BaseTestTask(unittest.TestCase):
 
     def tearDown(self) -> None:
         TaskRepository.collection().delete_many({})
+        TaskCountRepository.collection().delete_many({})
+        TaskImportRepository.collection().delete_many({})
+        TaskImportChunkRepository.collection().delete_many({})
         AccountRepository.collection().delete_many({})
 
     # URL HELPER METHODS
@@ -37,6 +43,15 @@ class BaseTestTask(unittest.TestCase):
     def get_task_api_url(self, account_id: str) -> str:
         return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks"
 
+    def get_task_batch_api_url(self, account_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks:batch"
+
+    def get_task_import_api_url(self, account_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks:import"
+
+    def get_task_export_api_url(self, account_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/export.ndjson"
+
     def get_task_by_id_api_url(self, account_id: str, task_id: str) -> str:
         return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks/{task_id}"
 
@@ -0,0 +1,258 @@
+import json
+import unittest
+from unittest import mock
+
+from asgi_server import app
+from server import app as sync_app
+
+from modules.application.application_service import ApplicationService
+from modules.application.repository import AsyncApplicationRepositoryClient
+from modules.authentication.types import AccessTokenErrorCode
+from modules.config.config_service import ConfigService
+from modules.task.internal.store.task_import_chunk_repository import TaskImportChunkRepository
+from modules.task.types import TaskErrorCode
+from modules.task.workers.task_import_worker import TaskImportWorker
+from tests.modules.task.base_test_task import BaseTestTask
+
+
+class TestAsyncTaskApi(BaseTestTask, unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self) -> None:
+        await AsyncApplicationRepositoryClient.close()
+
+    def get_auth_headers(self, token: str) -> dict:
+        return {**self.HEADERS, "Authorization": f"Bearer {token}"}
+
+    async def test_create_task_success(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task_data = {"title": self.DEFAULT_TASK_TITLE, "description": self.DEFAULT_TASK_DESCRIPTION}
+
+        response = await app.test_client().post(
+            self.get_task_api_url(account.id), headers=self.get_auth_headers(token), json=task_data
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 201
+        self.assert_task_response(
+            response_json,
+            title=self.DEFAULT_TASK_TITLE,
+            description=self.DEFAULT_TASK_DESCRIPTION,
+            account_id=account.id,
+        )
+
+    async def test_create_task_missing_title(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = await app.test_client().post(
+            self.get_task_api_url(account.id),
+            headers=self.get_auth_headers(token),
+            json={"description": self.DEFAULT_TASK_DESCRIPTION},
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 400
+        assert response_json.get("code") == TaskErrorCode.BAD_REQUEST
+        assert "Title is required" in response_json.get("message")
+
+    async def test_create_task_no_auth(self) -> None:
+        account, _ = self.create_account_and_get_token()
+        task_data = {"title": self.DEFAULT_TASK_TITLE, "description": self.DEFAULT_TASK_DESCRIPTION}
+
+        response = await app.test_client().post(self.get_task_api_url(account.id), headers=self.HEADERS, json=task_data)
+        response_json = await response.get_json()
+
+        assert response.status_code == 401
+        assert response_json.get("code") == AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND
+
+    async def test_get_task_by_id_matches_sync_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_task = self.create_test_task(account_id=account.id)
+
+        response = await app.test_client().get(
+            self.get_task_by_id_api_url(account.id, created_task.id), headers=self.get_auth_headers(token)
+        )
+        sync_response = self.make_authenticated_request("GET", account.id, token, task_id=created_task.id)
+
+        assert response.status_code == 200
+        assert await response.get_json() == sync_response.json
+
+    async def test_get_task_etag_matches_sync_api_and_answers_304(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_task = self.create_test_task(account_id=account.id)
+        sync_response = self.make_authenticated_request("GET", account.id, token, task_id=created_task.id)
+
+        response = await app.test_client().get(
+            self.get_task_by_id_api_url(account.id, created_task.id),
+            headers={**self.get_auth_headers(token), "If-None-Match": sync_response.headers["ETag"]},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == sync_response.headers["ETag"]
+
+    async def test_get_task_not_found(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = await app.test_client().get(
+            self.get_task_by_id_api_url(account.id, "507f1f77bcf86cd799439011"), headers=self.get_auth_headers(token)
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 404
+        assert response_json.get("code") == TaskErrorCode.NOT_FOUND
+
+    async def test_get_paginated_tasks(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=5)
+
+        response = await app.test_client().get(
+            f"{self.get_task_api_url(account.id)}?page=1&size=2", headers=self.get_auth_headers(token)
+        )
+        response_json = await response.get_json()
+
+        assert response.status_code == 200
+        self.assert_pagination_response(
+            response_json, expected_items_count=2, expected_total_count=5, expected_page=1, expected_size=2
+        )
+
+    async def test_get_raw_paginated_tasks_matches_sync_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=5)
+        get_value = ConfigService.get_value
+
+        sync_response = self.make_authenticated_request("GET", account.id, token, query_params="page=1&size=4")
+        with mock.patch.object(
+            ConfigService,
+            "get_value",
+            side_effect=lambda key, default=None: (
+                {"listings.raw_bson_enabled": True, "listings.raw_bson_batch_size": 3}.get(key)
+                or get_value(key, default)
+            ),
+        ):
+            response = await app.test_client().get(
+                f"{self.get_task_api_url(account.id)}?page=1&size=4", headers=self.get_auth_headers(token)
+            )
+            body = await response.get_data()
+
+        assert response.status_code == 200
+        assert body == sync_response.get_data()
+
+    async def test_export_tasks_matches_sync_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        with sync_app.test_client() as client:
+            sync_response = client.get(
+                self.get_task_export_api_url(account.id), headers={"Authorization": f"Bearer {token}"}
+            )
+        response = await app.test_client().get(
+            self.get_task_export_api_url(account.id), headers=self.get_auth_headers(token)
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert await response.get_data() == sync_response.get_data()
+
+    async def test_import_tasks_matches_sync_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        lines = [json.dumps({"title": f"Task {i}", "description": f"Description {i}"}) for i in range(3)]
+        body = "\n".join([*lines, "{", json.dumps({"title": "No description"})]).encode()
+        get_value = ConfigService.get_value
+
+        with mock.patch.object(
+            ConfigService,
+            "get_value",
+            side_effect=lambda key, default=None: {"tasks.import_batch_size": 2}.get(key) or get_value(key, default),
+        ):
+            with sync_app.test_client() as client:
+                sync_response = client.post(
+                    self.get_task_import_api_url(account.id), headers={"Authorization": f"Bearer {token}"}, data=body
+                )
+            # Quart's test client leaves out the Content-Length that clients send
+            response = await app.test_client().post(
+                self.get_task_import_api_url(account.id),
+                headers={"Authorization": f"Bearer {token}", "Content-Length": str(len(body))},
+                data=body,
+            )
+
+        assert response.status_code == 207
+        assert await response.get_json() == sync_response.json
+        assert sync_response.json["imported_count"] == 3
+        assert [error["line"] for error in sync_response.json["errors"]] == [4, 5]
+        assert self.make_authenticated_request("GET", account.id, token).json["total_count"] == 6
+
+    async def test_import_tasks_stages_large_uploads_for_the_worker(self) -> None:
+        account, token = self.create_account_and_get_token()
+        body = "\n".join(json.dumps({"title": f"Task {i}", "description": f"Description {i}"}) for i in range(3))
+        get_value = ConfigService.get_value
+
+        with (
+            mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    {"tasks.import_inline_max_bytes": 16}.get(key) or get_value(key, default)
+                ),
+            ),
+            mock.patch.object(ApplicationService, "run_worker_immediately") as mock_run_worker_immediately,
+        ):
+            response = await app.test_client().post(
+                self.get_task_import_api_url(account.id), headers={"Authorization": f"Bearer {token}"}, data=body
+            )
+        response_json = await response.get_json()
+        await TaskImportWorker.execute(response_json["id"])
+        status_response = await app.test_client().get(
+            response.headers["Location"], headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 202
+        assert response_json["status"] == "PENDING"
+        mock_run_worker_immediately.assert_called_once_with(cls=TaskImportWorker, arguments=(response_json["id"],))
+        assert (await status_response.get_json())["result"]["imported_count"] == 3
+        assert TaskImportChunkRepository.collection().count_documents({}) == 0
+
+    async def test_get_cursor_paginated_tasks_walks_every_task(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_tasks = self.create_multiple_test_tasks(account_id=account.id, count=5)
+
+        seen_task_ids = []
+        cursor = ""
+        while cursor is not None:
+            response = await app.test_client().get(
+                f"{self.get_task_api_url(account.id)}?cursor={cursor}&size=2", headers=self.get_auth_headers(token)
+            )
+            response_json = await response.get_json()
+            assert response.status_code == 200
+            seen_task_ids.extend(task["id"] for task in response_json["items"])
+            cursor = response_json["next_cursor"]
+
+        assert sorted(seen_task_ids) == sorted(task.id for task in created_tasks)
+
+    async def test_update_and_delete_task(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_task = self.create_test_task(account_id=account.id)
+        task_url = self.get_task_by_id_api_url(account.id, created_task.id)
+
+        update_response = await app.test_client().patch(
+            task_url, headers=self.get_auth_headers(token), json={"title": "Updated", "description": "Updated"}
+        )
+        delete_response = await app.test_client().delete(task_url, headers=self.get_auth_headers(token))
+        get_response = await app.test_client().get(task_url, headers=self.get_auth_headers(token))
+
+        assert update_response.status_code == 200
+        assert (await update_response.get_json()).get("title") == "Updated"
+        assert delete_response.status_code == 204
+        assert get_response.status_code == 404
+
+    async def test_create_tasks_batch(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks_data = [{"title": f"Task {index}", "description": "Batch"} for index in range(3)]
+
+        response = await app.test_client().post(
+            self.get_task_batch_api_url(account.id), headers=self.get_auth_headers(token), json={"tasks": tasks_data}
+        )
+        response_json = await response.get_json()
+        list_response = self.make_authenticated_request("GET", account.id, token)
+
+        assert response.status_code == 201
+        assert response_json["created_count"] == 3
+        assert list_response.json["total_count"] == 3
@@ -1,7 +1,38 @@
+import asyncio
+import gzip
+import io
+import json
+import time
+from datetime import datetime, timedelta
+from unittest import mock
+
+from bson.objectid import ObjectId
 from server import app
 
+from modules.application.application_service import ApplicationService
+from modules.application.common.constants import CONSISTENCY_TOKEN_HEADER
+from modules.application.errors import (
+    FilterErrorCode,
+    PaginationErrorCode,
+    ProjectionErrorCode,
+    ReadConsistencyErrorCode,
+    SortErrorCode,
+    WorkerClientConnectionError,
+    WorkerErrorCode,
+)
 from modules.authentication.types import AccessTokenErrorCode
-from modules.task.types import TaskErrorCode
+from modules.comment.comment_service import CommentService
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import CreateCommentParams
+from modules.comment.workers.task_comments_deletion_worker import TaskCommentsDeletionWorker
+from modules.config.config_service import ConfigService
+from modules.task.internal.store.task_import_chunk_repository import TaskImportChunkRepository
+from modules.task.internal.store.task_import_repository import TaskImportRepository
+from modules.task.task_service import TaskService
+from modules.task.types import GetTaskImportParams, TaskErrorCode
+from modules.task.workers.stale_task_imports_worker import StaleTaskImportsWorker
+from modules.task.workers.task_import_worker import TaskImportWorker
+from tests.database_command_counter import DATABASE_COMMAND_COUNTER
 from tests.modules.task.base_test_task import BaseTestTask
 
 
@@ -106,6 +137,210 @@ class TestTaskApi(BaseTestTask):
 
         assert response1.json["items"][0]["id"] != response2.json["items"][0]["id"]
 
+    def test_get_all_tasks_without_total(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=2)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include_total=false")
+
+        assert response.status_code == 200
+        assert len(response.json["items"]) == 2
+        assert response.json["total_count"] is None
+        assert response.json["total_pages"] is None
+
+    def test_get_all_tasks_with_fields(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_tasks = self.create_multiple_test_tasks(account_id=account.id, count=2)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="fields=id,title")
+
+        assert response.status_code == 200
+        assert len(response.json["items"]) == 2
+        for item in response.json["items"]:
+            assert set(item.keys()) == {"id", "title"}
+        assert {item["id"] for item in response.json["items"]} == {task.id for task in created_tasks}
+
+    def test_get_all_tasks_raw_listing_matches_listing(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=5)
+        get_value = ConfigService.get_value
+
+        for query_params in ("page=1&size=4", "page=2&size=4&fields=title,id", "include_total=false"):
+            response = self.make_authenticated_request("GET", account.id, token, query_params=query_params)
+            with mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    {"listings.raw_bson_enabled": True, "listings.raw_bson_batch_size": 3}.get(key)
+                    or get_value(key, default)
+                ),
+            ):
+                raw_response = self.make_authenticated_request("GET", account.id, token, query_params=query_params)
+
+            assert raw_response.status_code == 200
+            assert raw_response.is_streamed
+            assert raw_response.mimetype == "application/json"
+            assert raw_response.get_data() == response.get_data()
+
+    def test_get_task_with_fields(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_task = self.create_test_task(account_id=account.id)
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, task_id=created_task.id, query_params="fields=title"
+        )
+
+        assert response.status_code == 200
+        assert response.json == {"title": created_task.title}
+
+    def test_get_all_tasks_with_unknown_field(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="fields=title,secret")
+
+        self.assert_error_response(response, 400, ProjectionErrorCode.INVALID_FIELDS)
+
+    def test_get_all_tasks_with_cursor_pagination(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        response1 = self.make_authenticated_request("GET", account.id, token, query_params="cursor=&size=2")
+
+        assert response1.status_code == 200
+        assert len(response1.json["items"]) == 2
+        assert response1.json["next_cursor"]
+        assert "total_count" not in response1.json
+
+        response2 = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"cursor={response1.json['next_cursor']}&size=2"
+        )
+
+        assert response2.status_code == 200
+        assert [item["title"] for item in response2.json["items"]] == ["Task 1"]
+        assert response2.json["next_cursor"] is None
+
+    def test_get_all_tasks_with_invalid_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="cursor=invalid")
+
+        self.assert_error_response(response, 400, PaginationErrorCode.INVALID_CURSOR)
+
+    def test_get_all_tasks_with_embedded_comments(self) -> None:
+        self.addCleanup(CommentRepository.collection().delete_many, {})
+        account, token = self.create_account_and_get_token()
+        first_task, second_task = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        for content in ("First", "Second", "Third"):
+            CommentService.create_comment(
+                params=CreateCommentParams(account_id=account.id, task_id=first_task.id, content=content)
+            )
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, query_params="embed=comments:2&fields=title"
+        )
+        cursor_response = self.make_authenticated_request(
+            "GET", account.id, token, query_params="cursor=&size=1&embed=comments:1"
+        )
+
+        assert response.status_code == 200
+        self.assert_pagination_response(response.json, expected_items_count=2, expected_total_count=2)
+        assert response.json["items"][0] == {"title": second_task.title, "comments": []}
+        assert [comment["content"] for comment in response.json["items"][1]["comments"]] == ["Third", "Second"]
+        assert cursor_response.status_code == 200
+        assert cursor_response.json["items"][0]["id"] == second_task.id
+        assert cursor_response.json["items"][0]["comments"] == []
+        assert cursor_response.json["next_cursor"]
+
+    def test_get_all_tasks_with_invalid_embed(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        for embed in ("comments", "comments:0", "comments:1000", "account:1"):
+            response = self.make_authenticated_request("GET", account.id, token, query_params=f"embed={embed}")
+
+            self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_sorted_and_filtered(self) -> None:
+        account, token = self.create_account_and_get_token()
+        first_task, second_task, third_task = self.create_multiple_test_tasks(account_id=account.id, count=3)
+        time.sleep(0.01)
+        updated_since = datetime.now()
+        updated_since = updated_since.replace(microsecond=updated_since.microsecond // 1000 * 1000)
+        self.make_authenticated_request(
+            "PATCH", account.id, token, task_id=first_task.id, data={"title": "Updated", "description": "Updated"}
+        )
+
+        updated_response = self.make_authenticated_request("GET", account.id, token, query_params="sort=updated_at")
+        ascending_response = self.make_authenticated_request("GET", account.id, token, query_params="order=asc")
+        filtered_response = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"updated_since={updated_since.isoformat()}"
+        )
+        first_page = self.make_authenticated_request(
+            "GET", account.id, token, query_params="cursor=&size=2&sort=updated_at&order=asc"
+        )
+        second_page = self.make_authenticated_request(
+            "GET",
+            account.id,
+            token,
+            query_params=f"cursor={first_page.json['next_cursor']}&size=2&sort=updated_at&order=asc",
+        )
+
+        assert [item["id"] for item in updated_response.json["items"]] == [first_task.id, third_task.id, second_task.id]
+        assert [item["id"] for item in ascending_response.json["items"]] == [
+            first_task.id,
+            second_task.id,
+            third_task.id,
+        ]
+        assert [item["id"] for item in filtered_response.json["items"]] == [first_task.id]
+        assert filtered_response.json["total_count"] == 1
+        assert [item["id"] for item in first_page.json["items"] + second_page.json["items"]] == [
+            second_task.id,
+            third_task.id,
+            first_task.id,
+        ]
+        assert second_page.json["next_cursor"] is None
+
+    def test_get_all_tasks_filtered_by_creation_time(self) -> None:
+        account, token = self.create_account_and_get_token()
+        first_task = self.create_test_task(account_id=account.id, title="First")
+        time.sleep(0.01)
+        created_after = datetime.now()
+        created_after = created_after.replace(microsecond=created_after.microsecond // 1000 * 1000)
+        time.sleep(0.01)
+        second_task = self.create_test_task(account_id=account.id, title="Second")
+
+        after_response = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"created_after={created_after.isoformat()}"
+        )
+        before_response = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"cursor=&created_before={created_after.isoformat()}"
+        )
+
+        assert [item["id"] for item in after_response.json["items"]] == [second_task.id]
+        assert [item["id"] for item in before_response.json["items"]] == [first_task.id]
+
+    def test_get_all_tasks_with_invalid_sort_or_filter(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=2)
+        default_cursor = self.make_authenticated_request("GET", account.id, token, query_params="cursor=&size=1").json[
+            "next_cursor"
+        ]
+
+        for query_params in ("sort=title", "sort=created_at&order=sideways"):
+            response = self.make_authenticated_request("GET", account.id, token, query_params=query_params)
+            self.assert_error_response(response, 400, SortErrorCode.INVALID_SORT)
+
+        for query_params in (
+            "created_after=yesterday",
+            "created_after=2024-01-02T00:00:00&created_before=2024-01-01T00:00:00",
+        ):
+            response = self.make_authenticated_request("GET", account.id, token, query_params=query_params)
+            self.assert_error_response(response, 400, FilterErrorCode.INVALID_FILTER)
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"cursor={default_cursor}&sort=updated_at"
+        )
+        self.assert_error_response(response, 400, PaginationErrorCode.INVALID_CURSOR)
+
     def test_get_all_tasks_no_auth(self) -> None:
         account, _ = self.create_account_and_get_token()
 
@@ -216,6 +451,30 @@ class TestTaskApi(BaseTestTask):
         get_response = self.make_authenticated_request("GET", account.id, token, task_id=created_task.id)
         assert get_response.status_code == 404
 
+    def test_delete_task_enqueues_comment_deletion(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        get_value = ConfigService.get_value
+
+        with (
+            mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    True if key == "tasks.cascade_comment_deletion_enabled" else get_value(key, default)
+                ),
+            ),
+            mock.patch.object(
+                ApplicationService,
+                "run_worker_immediately",
+                side_effect=WorkerClientConnectionError(server_address="localhost:7233"),
+            ) as mock_run_worker_immediately,
+        ):
+            response = self.make_authenticated_request("DELETE", account.id, token, task_id=task.id)
+
+        assert response.status_code == 204
+        mock_run_worker_immediately.assert_called_once_with(cls=TaskCommentsDeletionWorker, arguments=(task.id,))
+
     def test_delete_task_not_found(self) -> None:
         account, token = self.create_account_and_get_token()
         non_existent_task_id = "507f1f77bcf86cd799439011"
@@ -266,3 +525,497 @@ class TestTaskApi(BaseTestTask):
             )
 
         assert response.status_code == 400
+
+    def test_create_tasks_batch(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks_data = [{"title": f"Task {i}", "description": f"Description {i}"} for i in range(3)]
+
+        with app.test_client() as client:
+            response = client.post(
+                self.get_task_batch_api_url(account.id),
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({"tasks": tasks_data, "ordered": False}),
+            )
+
+        assert response.status_code == 201
+        assert response.json["created_count"] == 3
+        assert response.json["failed_count"] == 0
+        assert [item["index"] for item in response.json["items"]] == [0, 1, 2]
+        assert all(item["success"] for item in response.json["items"])
+        assert [item["task"]["title"] for item in response.json["items"]] == ["Task 0", "Task 1", "Task 2"]
+
+        list_response = self.make_authenticated_request("GET", account.id, token)
+        assert list_response.json["total_count"] == 3
+
+    def test_create_tasks_batch_rejects_invalid_item(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks_data = [{"title": "Task 0", "description": "Description 0"}, {"title": "Task 1"}]
+
+        with app.test_client() as client:
+            response = client.post(
+                self.get_task_batch_api_url(account.id),
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({"tasks": tasks_data}),
+            )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+        assert "index 1" in response.json["message"]
+
+        list_response = self.make_authenticated_request("GET", account.id, token)
+        assert list_response.json["total_count"] == 0
+
+    def test_import_tasks_writes_valid_lines_in_batches(self) -> None:
+        account, token = self.create_account_and_get_token()
+        lines = [json.dumps({"title": f"Task {i}", "description": f"Description {i}"}) for i in range(5)]
+        lines[1:1] = ["", "not json", json.dumps({"description": "No title"}), json.dumps(["a list"])]
+        get_value = ConfigService.get_value
+
+        with (
+            mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    {"tasks.import_batch_size": 2, "tasks.import_chunk_size": 7}.get(key) or get_value(key, default)
+                ),
+            ),
+            app.test_client() as client,
+        ):
+            response = client.post(
+                self.get_task_import_api_url(account.id),
+                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/x-ndjson"},
+                data="\r\n".join(lines).encode(),
+            )
+
+        assert response.status_code == 207
+        assert response.json["line_count"] == 9
+        assert response.json["imported_count"] == 5
+        assert response.json["failed_count"] == 3
+        assert response.json["errors"] == [
+            {"line": 3, "message": "Line is not valid JSON"},
+            {"line": 4, "message": "Title is required"},
+            {"line": 5, "message": "Line must be a JSON object"},
+        ]
+
+        list_response = self.make_authenticated_request("GET", account.id, token)
+        assert list_response.json["total_count"] == 5
+        assert sorted(task["title"] for task in list_response.json["items"]) == [f"Task {i}" for i in range(5)]
+
+    def test_import_tasks_rejects_long_lines(self) -> None:
+        account, token = self.create_account_and_get_token()
+        get_value = ConfigService.get_value
+        body = f'{json.dumps({"title": "Short", "description": "Fits"})}\n{json.dumps({"title": "x" * 100, "description": "Too long"})}'
+
+        with (
+            mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    {"tasks.import_max_line_bytes": 64}.get(key) or get_value(key, default)
+                ),
+            ),
+            app.test_client() as client,
+        ):
+            response = client.post(
+                self.get_task_import_api_url(account.id),
+                headers={"Authorization": f"Bearer {token}"},
+                data=body.encode(),
+            )
+
+        assert response.status_code == 207
+        assert response.json["imported_count"] == 1
+        assert response.json["errors"] == [{"line": 2, "message": "Line is longer than 64 bytes"}]
+
+    def test_import_tasks_stages_large_uploads_for_the_worker(self) -> None:
+        account, token = self.create_account_and_get_token()
+        body = "\n".join(json.dumps({"title": f"Task {i}", "description": f"Description {i}"}) for i in range(5))
+        get_value = ConfigService.get_value
+        config_overrides = {
+            "tasks.import_inline_max_bytes": 16,
+            "tasks.import_chunk_size": 10,
+            "tasks.import_batch_size": 2,
+        }
+
+        with (
+            mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: config_overrides.get(key) or get_value(key, default),
+            ),
+            mock.patch.object(ApplicationService, "run_worker_immediately") as mock_run_worker_immediately,
+            app.test_client() as client,
+        ):
+            response = client.post(
+                self.get_task_import_api_url(account.id),
+                headers={"Authorization": f"Bearer {token}"},
+                data=body.encode(),
+            )
+            import_id = response.json["id"]
+            mock_run_worker_immediately.assert_called_once_with(cls=TaskImportWorker, arguments=(import_id,))
+            assert TaskImportChunkRepository.collection().count_documents({"import_id": import_id}) > 1
+            asyncio.run(TaskImportWorker.execute(import_id))
+
+        assert response.status_code == 202
+        assert response.json["status"] == "PENDING"
+        assert response.headers["Location"].endswith(f"/tasks:import/{import_id}")
+
+        with app.test_client() as client:
+            status_response = client.get(response.headers["Location"], headers={"Authorization": f"Bearer {token}"})
+            other_account, other_token = self.create_account_and_get_token(username="other@example.com")
+            other_status_response = client.get(
+                f"{self.get_task_import_api_url(other_account.id)}/{import_id}",
+                headers={"Authorization": f"Bearer {other_token}"},
+            )
+
+        assert status_response.status_code == 200
+        assert status_response.json["status"] == "COMPLETED"
+        assert status_response.json["result"] == {"line_count": 5, "imported_count": 5, "failed_count": 0, "errors": []}
+        assert TaskImportChunkRepository.collection().count_documents({"import_id": import_id}) == 0
+        assert self.make_authenticated_request("GET", account.id, token).json["total_count"] == 5
+        self.assert_error_response(other_status_response, 404, TaskErrorCode.IMPORT_NOT_FOUND)
+
+    def test_task_import_worker_resumes_after_the_last_recorded_batch(self) -> None:
+        account, token = self.create_account_and_get_token()
+        body = "\n".join(json.dumps({"title": f"Task {i}", "description": f"Description {i}"}) for i in range(4))
+
+        with mock.patch.object(ApplicationService, "run_worker_immediately"), app.test_client() as client:
+            response = client.post(
+                self.get_task_import_api_url(account.id),
+                headers={"Authorization": f"Bearer {token}", "Transfer-Encoding": "chunked"},
+                input_stream=io.BytesIO(body.encode()),
+                environ_overrides={"wsgi.input_terminated": True},
+            )
+        import_id = response.json["id"]
+        # As left by an attempt that wrote the first two tasks and died
+        TaskImportRepository.collection().update_one(
+            {"_id": ObjectId(import_id)}, {"$set": {"status": "RUNNING", "line_count": 2, "imported_count": 2}}
+        )
+
+        asyncio.run(TaskImportWorker.execute(import_id))
+        asyncio.run(TaskImportWorker.execute(import_id))
+
+        task_import = TaskService.get_task_import(
+            params=GetTaskImportParams(account_id=account.id, import_id=import_id)
+        )
+        assert response.status_code == 202
+        assert task_import.status == "COMPLETED"
+        assert task_import.result.line_count == 4
+        assert task_import.result.imported_count == 4
+        list_response = self.make_authenticated_request("GET", account.id, token)
+        assert sorted(task["title"] for task in list_response.json["items"]) == ["Task 2", "Task 3"]
+
+    def test_task_import_worker_stops_an_attempt_it_superseded(self) -> None:
+        account, token = self.create_account_and_get_token()
+        body = "\n".join(json.dumps({"title": f"Task {i}", "description": f"Description {i}"}) for i in range(4))
+        get_value = ConfigService.get_value
+
+        with (
+            mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    2 if key == "tasks.import_batch_size" else get_value(key, default)
+                ),
+            ),
+            mock.patch.object(ApplicationService, "run_worker_immediately"),
+            app.test_client() as client,
+        ):
+            response = client.post(
+                self.get_task_import_api_url(account.id),
+                headers={"Authorization": f"Bearer {token}", "Transfer-Encoding": "chunked"},
+                input_stream=io.BytesIO(body.encode()),
+                environ_overrides={"wsgi.input_terminated": True},
+            )
+            import_id = response.json["id"]
+            # An attempt still alive when the activity is retried, for instance after missing its heartbeats
+            superseded_run = TaskService.run_task_import(import_id=import_id)
+            superseded_progress = next(superseded_run)
+            asyncio.run(TaskImportWorker.execute(import_id))
+            superseded_progress_after_retry = list(superseded_run)
+
+        task_import = TaskService.get_task_import(
+            params=GetTaskImportParams(account_id=account.id, import_id=import_id)
+        )
+        assert superseded_progress.result.line_count == 2
+        assert superseded_progress_after_retry == []
+        assert task_import.status == "COMPLETED"
+        assert task_import.result.line_count == 4
+        assert task_import.result.imported_count == 4
+        assert self.make_authenticated_request("GET", account.id, token).json["total_count"] == 4
+
+    def test_stale_task_imports_worker_fails_imports_left_running(self) -> None:
+        account, token = self.create_account_and_get_token()
+        body = "\n".join(json.dumps({"title": f"Task {i}", "description": f"Description {i}"}) for i in range(4))
+        get_value = ConfigService.get_value
+
+        with (
+            mock.patch.object(
+                ConfigService,
+                "get_value",
+                side_effect=lambda key, default=None: (
+                    2 if key == "tasks.import_batch_size" else get_value(key, default)
+                ),
+            ),
+            mock.patch.object(ApplicationService, "run_worker_immediately"),
+            app.test_client() as client,
+        ):
+            import_ids = [
+                client.post(
+                    self.get_task_import_api_url(account.id),
+                    headers={"Authorization": f"Bearer {token}", "Transfer-Encoding": "chunked"},
+                    input_stream=io.BytesIO(body.encode()),
+                    environ_overrides={"wsgi.input_terminated": True},
+                ).json["id"]
+                for _ in range(2)
+            ]
+            # The first attempt wrote a batch and was then killed by a timeout on the last retry
+            stale_run = TaskService.run_task_import(import_id=import_ids[0])
+            next(stale_run)
+            TaskImportRepository.collection().update_one(
+                {"_id": ObjectId(import_ids[0])}, {"$set": {"updated_at": datetime.now() - timedelta(hours=1)}}
+            )
+            TaskImportRepository.collection().update_one(
+                {"_id": ObjectId(import_ids[1])}, {"$set": {"status": "RUNNING"}}
+            )
+
+            asyncio.run(StaleTaskImportsWorker.execute())
+            stale_run_progress = list(stale_run)
+
+        stale_import, running_import = [
+            TaskService.get_task_import(params=GetTaskImportParams(account_id=account.id, import_id=import_id))
+            for import_id in import_ids
+        ]
+        assert stale_import.status == "FAILED"
+        assert stale_import.result.line_count == 2
+        assert stale_run_progress == []
+        assert TaskImportChunkRepository.collection().count_documents({"import_id": import_ids[0]}) == 0
+        assert running_import.status == "RUNNING"
+        assert TaskImportChunkRepository.collection().count_documents({"import_id": import_ids[1]}) > 0
+        assert TaskService.fail_stale_task_imports() == 0
+
+    def test_import_tasks_fails_the_import_when_the_worker_cannot_start(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        with (
+            mock.patch.object(
+                ApplicationService,
+                "run_worker_immediately",
+                side_effect=WorkerClientConnectionError(server_address="localhost:7233"),
+            ),
+            app.test_client() as client,
+        ):
+            response = client.post(
+                self.get_task_import_api_url(account.id),
+                headers={"Authorization": f"Bearer {token}", "Transfer-Encoding": "chunked"},
+                input_stream=io.BytesIO(json.dumps({"title": "Task", "description": "Description"}).encode()),
+                environ_overrides={"wsgi.input_terminated": True},
+            )
+
+        self.assert_error_response(response, 500, WorkerErrorCode.WORKER_CLIENT_CONNECTION_ERROR)
+        task_import_bson = TaskImportRepository.collection().find_one({"account_id": account.id})
+        assert task_import_bson["status"] == "FAILED"
+        assert TaskImportChunkRepository.collection().count_documents({}) == 0
+
+    def test_export_tasks_streams_tasks_and_comments(self) -> None:
+        account, token = self.create_account_and_get_token()
+        other_account, _ = self.create_account_and_get_token(username="other@example.com")
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=3)
+        self.create_test_task(account_id=other_account.id)
+        self.make_authenticated_request("DELETE", account.id, token, task_id=tasks[2].id)
+        for content in ("First", "Second"):
+            CommentService.create_comment(
+                params=CreateCommentParams(account_id=account.id, task_id=tasks[0].id, content=content)
+            )
+
+        with app.test_client() as client:
+            response = client.get(
+                self.get_task_export_api_url(account.id), headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [line["type"] for line in lines] == ["task", "comment", "comment", "task"]
+        assert [line["comment"]["content"] for line in lines if line["type"] == "comment"] == ["First", "Second"]
+        assert [line["task"]["id"] for line in lines if line["type"] == "task"] == [tasks[0].id, tasks[1].id]
+        assert lines[-1]["task"] == self.make_authenticated_request("GET", account.id, token, task_id=tasks[1].id).json
+
+    def test_export_tasks_resumes_after_task(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_export_api_url(account.id)}?after={tasks[0].id}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            invalid_response = client.get(
+                f"{self.get_task_export_api_url(account.id)}?after=last", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert [json.loads(line)["task"]["id"] for line in response.get_data(as_text=True).splitlines()] == [
+            tasks[1].id,
+            tasks[2].id,
+        ]
+        self.assert_error_response(invalid_response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_create_task_round_trips(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task_data = {"title": self.DEFAULT_TASK_TITLE, "description": self.DEFAULT_TASK_DESCRIPTION}
+
+        with DATABASE_COMMAND_COUNTER.record() as commands:
+            response = self.make_authenticated_request("POST", account.id, token, data=task_data)
+
+        # Until the first listing seeds the count, the counter update misses and only the listing version is bumped
+        assert response.status_code == 201
+        assert commands == [("insert", "tasks"), ("update", "task_counts"), ("update", "task_counts")]
+        get_response = self.make_authenticated_request("GET", account.id, token, task_id=response.json["id"])
+        assert get_response.json == response.json
+
+        self.make_authenticated_request("GET", account.id, token)
+        with DATABASE_COMMAND_COUNTER.record() as commands:
+            response = self.make_authenticated_request("POST", account.id, token, data=task_data)
+
+        assert response.status_code == 201
+        assert commands == [("insert", "tasks"), ("update", "task_counts")]
+
+    def test_delete_task_round_trips(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_task = self.create_test_task(account_id=account.id)
+        self.make_authenticated_request("GET", account.id, token)
+
+        with DATABASE_COMMAND_COUNTER.record() as commands:
+            response = self.make_authenticated_request("DELETE", account.id, token, task_id=created_task.id)
+
+        assert response.status_code == 204
+        assert commands == [("update", "tasks"), ("update", "task_counts")]
+
+        with DATABASE_COMMAND_COUNTER.record() as commands:
+            response = self.make_authenticated_request("DELETE", account.id, token, task_id=created_task.id)
+
+        self.assert_error_response(response, 404, TaskErrorCode.NOT_FOUND)
+        assert commands == [("update", "tasks")]
+
+    def test_task_reads_accept_the_consistency_token_of_a_write(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task_data = {"title": self.DEFAULT_TASK_TITLE, "description": self.DEFAULT_TASK_DESCRIPTION}
+
+        response = self.make_authenticated_request("POST", account.id, token, data=task_data)
+        consistency_token = response.headers.get(CONSISTENCY_TOKEN_HEADER)
+
+        # Standalone servers report no cluster time and so issue no token
+        if consistency_token is None:
+            self.skipTest("causal consistency tokens need a replica set")
+
+        with app.test_client() as client:
+            get_response = client.get(
+                self.get_task_by_id_api_url(account.id, response.json["id"]),
+                headers={"Authorization": f"Bearer {token}", CONSISTENCY_TOKEN_HEADER: consistency_token},
+            )
+
+        assert get_response.status_code == 200
+        assert get_response.json == response.json
+        assert get_response.headers.get(CONSISTENCY_TOKEN_HEADER)
+
+    def test_get_tasks_rejects_invalid_consistency_token(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        with app.test_client() as client:
+            response = client.get(
+                self.get_task_api_url(account.id),
+                headers={"Authorization": f"Bearer {token}", CONSISTENCY_TOKEN_HEADER: "not-a-token"},
+            )
+
+        self.assert_error_response(response, 400, ReadConsistencyErrorCode.INVALID_CONSISTENCY_TOKEN)
+
+    def test_get_task_answers_matching_if_none_match_with_304(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        task_url = self.get_task_by_id_api_url(account.id, task.id)
+
+        with app.test_client() as client:
+            response = client.get(task_url, headers={"Authorization": f"Bearer {token}"})
+            etag = response.headers.get("ETag")
+
+            assert response.status_code == 200
+            assert etag
+            assert response.headers.get("Cache-Control") == "private, no-cache"
+
+            not_modified_response = client.get(
+                task_url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag}
+            )
+            assert not_modified_response.status_code == 304
+            assert not_modified_response.data == b""
+            assert not_modified_response.headers.get("ETag") == etag
+
+            fields_response = client.get(
+                f"{task_url}?fields=title", headers={"Authorization": f"Bearer {token}", "If-None-Match": etag}
+            )
+            assert fields_response.status_code == 200
+            assert fields_response.headers.get("ETag") != etag
+
+            time.sleep(0.01)
+            self.make_authenticated_request(
+                "PATCH",
+                account.id,
+                token,
+                task_id=task.id,
+                data={"title": "Updated", "description": "Updated description"},
+            )
+            modified_response = client.get(
+                task_url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag}
+            )
+            assert modified_response.status_code == 200
+            assert modified_response.json["title"] == "Updated"
+
+    def test_get_all_tasks_etag_changes_with_tasks_and_comments(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        tasks_url = self.get_task_api_url(account.id)
+
+        def get_tasks(etag: str = "") -> object:
+            with app.test_client() as client:
+                return client.get(tasks_url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag})
+
+        etag = get_tasks().headers.get("ETag")
+        assert get_tasks(etag).status_code == 304
+
+        CommentService.create_comment(
+            params=CreateCommentParams(account_id=account.id, task_id=task.id, content="Comment")
+        )
+        response = get_tasks(etag)
+        assert response.status_code == 200
+        assert response.json["items"][0]["comment_count"] == 1
+
+        etag = response.headers.get("ETag")
+        self.create_test_task(account_id=account.id)
+        response = get_tasks(etag)
+        assert response.status_code == 200
+        assert response.json["total_count"] == 2
+
+    def test_get_specific_task_not_found_has_no_etag(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, task_id="507f1f77bcf86cd799439011")
+
+        self.assert_error_response(response, 404, TaskErrorCode.NOT_FOUND)
+        assert response.headers.get("ETag") is None
+
+    def test_get_all_tasks_compressed_and_revalidated_with_weak_etag(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=20)
+        headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"}
+
+        with app.test_client() as client:
+            response = client.get(self.get_task_api_url(account.id), headers=headers)
+            etag = response.headers["ETag"]
+
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert etag.startswith("W/")
+            assert len(json.loads(gzip.decompress(response.data))["items"]) == 10
+
+            not_modified_response = client.get(
+                self.get_task_api_url(account.id), headers={**headers, "If-None-Match": etag}
+            )
+            assert not_modified_response.status_code == 304
+            assert not_modified_response.headers["ETag"] == etag
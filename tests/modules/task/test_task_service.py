@@ -1,12 +1,29 @@
+import time
 from datetime import datetime
+from unittest import mock
 
-from modules.application.common.types import PaginationParams
+from bson.objectid import ObjectId
+
+from modules.application.common.types import CursorPaginationParams, PaginationParams
+from modules.application.errors import InvalidPaginationCursorError, PaginationErrorCode
+from modules.comment.comment_service import CommentService
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import CreateCommentParams, DeleteCommentParams
+from modules.config.config_service import ConfigService
 from modules.task.errors import TaskNotFoundError
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_util import TaskUtil
 from modules.task.task_service import TaskService
 from modules.task.types import (
+    CreateTaskItemParams,
     CreateTaskParams,
+    CreateTasksParams,
     DeleteTaskParams,
+    GetCursorPaginatedTasksParams,
+    GetCursorPaginatedTasksWithCommentsParams,
     GetPaginatedTasksParams,
+    GetPaginatedTasksWithCommentsParams,
     GetTaskParams,
     TaskErrorCode,
     UpdateTaskParams,
@@ -95,6 +112,184 @@ class TestTaskService(BaseTestTask):
         assert result.pagination_params.page == 1
         assert result.pagination_params.size == 1
 
+    def test_create_tasks(self) -> None:
+        create_tasks_params = CreateTasksParams(
+            account_id=self.account.id,
+            tasks=[CreateTaskItemParams(description=f"Description {i}", title=f"Task {i}") for i in range(3)],
+        )
+
+        result = TaskService.create_tasks(params=create_tasks_params)
+
+        assert result.created_count == 3
+        assert result.failed_count == 0
+        for index, item_result in enumerate(result.items):
+            assert item_result.index == index
+            assert item_result.success
+            assert item_result.task.title == f"Task {index}"
+            stored_task = TaskService.get_task(
+                params=GetTaskParams(account_id=self.account.id, task_id=item_result.task.id)
+            )
+            assert stored_task.title == f"Task {index}"
+
+    def test_create_tasks_builds_results_from_the_documents_as_stored(self) -> None:
+        create_tasks_params = CreateTasksParams(
+            account_id=self.account.id,
+            tasks=[CreateTaskItemParams(description=f"Description {i}", title=f"Task {i}") for i in range(2)],
+        )
+
+        with mock.patch.object(
+            TaskUtil, "build_create_tasks_result", wraps=TaskUtil.build_create_tasks_result
+        ) as mock_build_create_tasks_result:
+            TaskService.create_tasks(params=create_tasks_params)
+
+        for task_bson in mock_build_create_tasks_result.call_args.kwargs["tasks_bson"]:
+            assert task_bson == TaskRepository.collection().find_one({"_id": task_bson["_id"]})
+
+    def test_get_paginated_tasks_without_total(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        pagination_params = PaginationParams(page=1, size=2, offset=0)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=pagination_params, include_total=False
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert len(result.items) == 2
+        assert result.total_count is None
+        assert result.total_pages is None
+
+    def test_task_count_follows_create_and_delete(self) -> None:
+        created_tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=created_tasks[0].id))
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=1, size=10, offset=0)
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert result.total_count == 2
+        assert len(result.items) == 2
+
+    def test_reconcile_task_counts_repairs_drift(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        TaskCountRepository.collection().update_one({"_id": self.account.id}, {"$set": {"count": 7}})
+
+        reconciliation_result = TaskService.reconcile_task_counts()
+
+        assert reconciliation_result.repaired_count == 1
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=1, size=10, offset=0)
+        )
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 2
+
+    def test_get_paginated_tasks_counts_tasks_when_counter_is_missing(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        TaskCountRepository.collection().delete_many({"_id": self.account.id})
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=1, size=10, offset=0)
+        )
+
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 2
+        assert TaskCountRepository.collection().find_one({"_id": self.account.id})["count"] == 2
+
+    def test_task_writes_of_an_account_without_counter_leave_the_count_to_the_first_listing(self) -> None:
+        legacy_tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        # As left for an account whose tasks predate the counter
+        TaskCountRepository.collection().delete_many({"_id": self.account.id})
+
+        self.create_test_task(account_id=self.account.id)
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=legacy_tasks[0].id))
+        tasks_version = TaskService.get_tasks_version(account_id=self.account.id)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=1, size=10, offset=0)
+        )
+
+        assert tasks_version == "2"
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 3
+        self.create_test_task(account_id=self.account.id)
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 4
+        assert TaskCountRepository.collection().find_one({"_id": self.account.id})["count"] == 4
+
+    def test_get_cursor_paginated_tasks_walks_all_pages(self) -> None:
+        created_tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+        seen_task_ids = []
+        pagination_cursor = None
+
+        for expected_items_count in [2, 2, 1]:
+            get_params = GetCursorPaginatedTasksParams(
+                account_id=self.account.id, pagination_params=CursorPaginationParams(size=2, cursor=pagination_cursor)
+            )
+            result = TaskService.get_cursor_paginated_tasks(params=get_params)
+
+            assert len(result.items) == expected_items_count
+            seen_task_ids.extend(task.id for task in result.items)
+            pagination_cursor = result.next_cursor
+
+        assert pagination_cursor is None
+        assert seen_task_ids == [task.id for task in reversed(created_tasks)]
+
+    def test_get_cursor_paginated_tasks_invalid_cursor(self) -> None:
+        get_params = GetCursorPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=CursorPaginationParams(size=2, cursor="not-a-cursor")
+        )
+
+        with self.assertRaises(InvalidPaginationCursorError) as context:
+            TaskService.get_cursor_paginated_tasks(params=get_params)
+
+        assert context.exception.code == PaginationErrorCode.INVALID_CURSOR
+
+    def test_get_paginated_tasks_with_comments_embeds_latest_comments(self) -> None:
+        self.addCleanup(CommentRepository.collection().delete_many, {})
+        first_task, second_task, third_task = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        first_task_comments = [
+            CommentService.create_comment(
+                params=CreateCommentParams(account_id=self.account.id, task_id=first_task.id, content=f"Comment {i}")
+            )
+            for i in range(3)
+        ]
+        deleted_comment = CommentService.create_comment(
+            params=CreateCommentParams(account_id=self.account.id, task_id=third_task.id, content="Deleted")
+        )
+        CommentService.delete_comment(
+            params=DeleteCommentParams(account_id=self.account.id, task_id=third_task.id, comment_id=deleted_comment.id)
+        )
+
+        cursor_result = TaskService.get_cursor_paginated_tasks_with_comments(
+            params=GetCursorPaginatedTasksWithCommentsParams(
+                tasks_params=GetCursorPaginatedTasksParams(
+                    account_id=self.account.id, pagination_params=CursorPaginationParams(size=2)
+                ),
+                comments_limit=2,
+            )
+        )
+        offset_result = TaskService.get_paginated_tasks_with_comments(
+            params=GetPaginatedTasksWithCommentsParams(
+                tasks_params=GetPaginatedTasksParams(
+                    account_id=self.account.id, pagination_params=PaginationParams(page=2, size=2, offset=0)
+                ),
+                comments_limit=2,
+            )
+        )
+
+        assert [item.task.id for item in cursor_result.items] == [third_task.id, second_task.id]
+        assert [item.comments for item in cursor_result.items] == [[], []]
+        assert cursor_result.next_cursor is not None
+        assert offset_result.total_count == 3
+        assert [item.task.id for item in offset_result.items] == [first_task.id]
+        assert [(comment.id, comment.content) for comment in offset_result.items[0].comments] == [
+            (comment.id, comment.content) for comment in reversed(first_task_comments[1:])
+        ]
+
+    def test_created_at_is_set_per_task(self) -> None:
+        first_task = self.create_test_task(account_id=self.account.id)
+        time.sleep(0.01)
+        second_task = self.create_test_task(account_id=self.account.id)
+
+        first_task_bson = TaskRepository.collection().find_one({"_id": ObjectId(first_task.id)})
+        second_task_bson = TaskRepository.collection().find_one({"_id": ObjectId(second_task.id)})
+
+        assert first_task_bson["created_at"] < second_task_bson["created_at"]
+
     def test_update_task(self) -> None:
         created_task = self.create_test_task(
             account_id=self.account.id, title="Original Title", description="Original Description"
@@ -0,0 +1,92 @@
+from typing import Any, Iterator, List
+
+from pymongo.database import Database
+
+EXPLAINABLE_COMMAND_NAMES = {"aggregate", "count", "delete", "find", "findAndModify", "update"}
+
+# Fields the driver adds to every command that the explain command does not accept
+DRIVER_COMMAND_FIELDS = {"lsid", "txnNumber", "$db", "$clusterTime", "$readPreference", "readConcern", "writeConcern"}
+
+# Stages that mean a query scans the whole collection or sorts in memory instead of walking an index
+REJECTED_STAGES = {"COLLSCAN", "SORT"}
+
+# A plan may examine at most this many documents per document it returns (or skips) before it counts as a regression
+MAX_DOCS_EXAMINED_PER_RESULT = 3
+
+
+class QueryPlanInspector:
+    """
+    Replays recorded commands through explain with executionStats and reports plans that would not scale.
+    """
+
+    @staticmethod
+    def find_plan_violations(database: Database, command_document: dict[str, Any]) -> List[str]:
+        command_name = next(iter(command_document))
+        if command_name not in EXPLAINABLE_COMMAND_NAMES:
+            return []
+
+        violations = []
+        for explainable_command in QueryPlanInspector._split_statements(command_name, command_document):
+            explain_result = database.command({"explain": explainable_command, "verbosity": "executionStats"})
+            shape = QueryPlanInspector._describe(explainable_command)
+
+            for stage in QueryPlanInspector._winning_plan_stages(explain_result):
+                if stage in REJECTED_STAGES:
+                    violations.append(f"{shape} uses a {stage} stage")
+
+            # Aggregations that group a collection are expected to read every matching document
+            if command_name != "aggregate":
+                docs_examined, docs_returned = QueryPlanInspector._execution_counts(explain_result)
+                allowed_docs = max(docs_returned + explainable_command.get("skip", 0), 1) * MAX_DOCS_EXAMINED_PER_RESULT
+                if docs_examined > allowed_docs:
+                    violations.append(f"{shape} examined {docs_examined} documents to return {docs_returned}")
+
+        return violations
+
+    @staticmethod
+    def _split_statements(command_name: str, command_document: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        command = {name: value for name, value in command_document.items() if name not in DRIVER_COMMAND_FIELDS}
+
+        # explain accepts a single statement per update or delete command
+        statements_field = {"update": "updates", "delete": "deletes"}.get(command_name)
+        if statements_field is None:
+            yield command
+            return
+
+        for statement in command[statements_field]:
+            yield {**command, statements_field: [statement]}
+
+    @staticmethod
+    def _describe(command: dict[str, Any]) -> str:
+        command_name = next(iter(command))
+        details = {
+            name: value
+            for name, value in command.items()
+            if name in ("filter", "sort", "query", "updates", "deletes", "pipeline")
+        }
+        return f"{command_name} on {command[command_name]} {details}"
+
+    @staticmethod
+    def _winning_plan_stages(explain_output: Any) -> Iterator[str]:
+        if isinstance(explain_output, dict):
+            for name, value in explain_output.items():
+                if name in ("rejectedPlans", "allPlansExecution"):
+                    continue
+                if name == "stage" and isinstance(value, str):
+                    yield value
+                else:
+                    yield from QueryPlanInspector._winning_plan_stages(value)
+        elif isinstance(explain_output, list):
+            for item in explain_output:
+                yield from QueryPlanInspector._winning_plan_stages(item)
+
+    @staticmethod
+    def _execution_counts(explain_result: dict[str, Any]) -> tuple[int, int]:
+        execution_stats = explain_result.get("executionStats", {})
+        execution_stages = execution_stats.get("executionStages", {})
+        docs_returned = max(
+            execution_stats.get("nReturned", 0),
+            execution_stages.get("nMatched", 0),
+            execution_stages.get("nWouldDelete", 0),
+        )
+        return execution_stats.get("totalDocsExamined", 0), docs_returned